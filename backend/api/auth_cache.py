@@ -0,0 +1,166 @@
+"""
+Caches behind the authentication dependencies (see api.dependencies).
+
+- ``VerifiedTokenCache``: user ID of each JWT that already passed signature
+  verification, kept until the token's ``exp`` (and at most ``max_ttl``), so
+  a page that fires ten API calls verifies its token once.
+- ``ProfileCache``: a detached copy of each user's ``UserProfile`` row for a
+  few seconds. A hit is attached to the request's session with
+  ``merge(load=False)``, which issues no query; relationships still load
+  lazily through that session. Anything that writes a profile must call
+  ``profile_cache.invalidate(user_id)``.
+
+Both are bounded LRUs with hit/miss counters, reported (per worker process)
+at ``/api/metrics/auth-cache``.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from config import settings
+from database.models import UserProfile
+
+
+class _CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+    def reset(self):
+        self.hits = self.misses = self.invalidations = 0
+
+
+class VerifiedTokenCache:
+    """Verified JWT -> user ID, honoring the token's expiry"""
+
+    def __init__(self, max_entries: int = 4096, max_ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.max_ttl_seconds = max_ttl_seconds
+        # sha256(token) -> (user_id, expires_at); tokens themselves are not kept
+        self._entries: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = _CacheStats()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[str]:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.stats.misses += 1
+        return None
+
+    def put(self, token: str, user_id: str, exp: Optional[Any] = None) -> None:
+        expires_at = time.time() + self.max_ttl_seconds
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ProfileCache:
+    """user ID -> detached ``UserProfile`` snapshot, for ``ttl_seconds``"""
+
+    def __init__(self, max_entries: int = 4096, ttl_seconds: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[UserProfile, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = _CacheStats()
+
+    def get(self, db: Session, user_id: str) -> Optional[UserProfile]:
+        """The cached profile attached to ``db`` (no query), or None on a miss"""
+        key = str(user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                snapshot = entry[0]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                self.stats.misses += 1
+                return None
+        return db.merge(snapshot, load=False)
+
+    def put(self, user_id: str, profile: UserProfile) -> None:
+        # Copy the loaded columns into a new detached instance; the request's
+        # own object stays attached to its session
+        snapshot = UserProfile(**{
+            attr.key: getattr(profile, attr.key) for attr in inspect(UserProfile).column_attrs
+        })
+        make_transient_to_detached(snapshot)
+        key = str(user_id)
+        with self._lock:
+            self._entries[key] = (snapshot, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: Any) -> None:
+        with self._lock:
+            if self._entries.pop(str(user_id), None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def snapshot() -> Dict[str, Any]:
+    """Counters for the metrics endpoint; each hit is one verification / DB round trip saved"""
+    return {
+        "tokens": {**token_cache.stats.to_dict(), "entries": len(token_cache)},
+        "profiles": {**profile_cache.stats.to_dict(), "entries": len(profile_cache)},
+        "jwt_verifications_saved": token_cache.stats.hits,
+        "db_round_trips_saved": profile_cache.stats.hits,
+    }
+
+
+def reset_stats() -> None:
+    token_cache.stats.reset()
+    profile_cache.stats.reset()
+
+
+# Global instances
+token_cache = VerifiedTokenCache(settings.auth_token_cache_size, settings.auth_token_cache_max_ttl_seconds)
+profile_cache = ProfileCache(settings.auth_profile_cache_size, settings.auth_profile_cache_ttl_seconds)
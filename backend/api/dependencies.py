@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 from database import get_db, get_supabase, UserProfile
 from config import settings
+from api.auth_cache import profile_cache, token_cache
 
 # Security scheme
 security = HTTPBearer()
@@ -16,29 +17,19 @@ security = HTTPBearer()
 optional_security = HTTPBearer(auto_error=False)
 
 
-def get_current_user_id(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> str:
+def verify_token(token: str) -> Optional[str]:
     """
-    Extract and validate JWT token to get current user ID.
+    Get the user ID a bearer token belongs to.
+
+    Verified JWTs are cached until they expire (see api.auth_cache), so
+    repeat requests with the same token skip signature verification.
 
     Args:
-        credentials: JWT token from Authorization header
+        token: Bearer token from the Authorization header
 
     Returns:
-        str: User ID from token
-
-    Raises:
-        HTTPException: If token is invalid or expired
+        Optional[str]: User ID, or None if the token is invalid or expired
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    token = credentials.credentials
-
     # Support custom tokens generated for Google/dev flows
     if token.startswith("google_token_"):
         # Format: google_token_{user_id}_{google_id}
@@ -46,11 +37,15 @@ def get_current_user_id(
         parts = remainder.split("_", 1)
         if parts and parts[0]:
             return parts[0]
-        raise credentials_exception
+        return None
 
     if token.startswith("demo_token_"):
         return "demo_user"
 
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+
     try:
         # Decode JWT token (Supabase uses HS256)
         payload = jwt.decode(
@@ -58,13 +53,59 @@ def get_current_user_id(
             settings.supabase_service_key,  # Use service key to verify
             algorithms=[settings.algorithm]
         )
-        user_id_value = payload.get("sub")
-        if user_id_value is None:
-            raise credentials_exception
-        user_id: str = str(user_id_value)
-        return user_id
     except JWTError:
-        raise credentials_exception
+        return None
+    user_id_value = payload.get("sub")
+    if user_id_value is None:
+        return None
+    user_id = str(user_id_value)
+    token_cache.put(token, user_id, payload.get("exp"))
+    return user_id
+
+
+def load_user_profile(db: Session, user_id: str) -> Optional[UserProfile]:
+    """
+    Get a user's profile, from the short-TTL profile cache when possible.
+
+    Args:
+        db: Database session the returned profile is attached to
+        user_id: User ID
+
+    Returns:
+        Optional[UserProfile]: User's profile or None
+    """
+    profile = profile_cache.get(db, user_id)
+    if profile is not None:
+        return profile
+    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+    if profile is not None:
+        profile_cache.put(user_id, profile)
+    return profile
+
+
+def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> str:
+    """
+    Extract and validate JWT token to get current user ID.
+
+    Args:
+        credentials: JWT token from Authorization header
+
+    Returns:
+        str: User ID from token
+
+    Raises:
+        HTTPException: If token is invalid or expired
+    """
+    user_id = verify_token(credentials.credentials)
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user_id
 
 
 def get_current_user_profile(
@@ -84,7 +125,7 @@ def get_current_user_profile(
     Raises:
         HTTPException: If profile not found
     """
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+    profile = load_user_profile(db, user_id)
     if profile is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -102,33 +143,7 @@ def get_optional_user_id(
     """
     if credentials is None:
         return None
-
-    token = credentials.credentials
-
-    # Support custom tokens generated for Google/dev flows
-    if token.startswith("google_token_"):
-        remainder = token[len("google_token_") :]
-        parts = remainder.split("_", 1)
-        if parts and parts[0]:
-            return parts[0]
-        return None
-
-    if token.startswith("demo_token_"):
-        return "demo_user"
-
-    try:
-        # Decode JWT token (Supabase uses HS256)
-        payload = jwt.decode(
-            token,
-            settings.supabase_service_key,
-            algorithms=[settings.algorithm]
-        )
-        user_id_value = payload.get("sub")
-        if user_id_value is None:
-            return None
-        return str(user_id_value)
-    except JWTError:
-        return None
+    return verify_token(credentials.credentials)
 
 
 def get_optional_user_profile(
@@ -155,35 +170,12 @@ def get_optional_user_profile(
     if db is None:
         return None
 
-    token = credentials.credentials
-
-    # Support custom tokens generated for Google/dev flows
-    user_id = None
-    if token.startswith("google_token_"):
-        remainder = token[len("google_token_") :]
-        parts = remainder.split("_", 1)
-        if parts and parts[0]:
-            user_id = parts[0]
-    elif token.startswith("demo_token_"):
-        user_id = "demo_user"
-    else:
-        try:
-            # Decode JWT token (Supabase uses HS256)
-            payload = jwt.decode(
-                token,
-                settings.supabase_service_key,
-                algorithms=[settings.algorithm]
-            )
-            user_id = payload.get("sub")
-        except JWTError:
-            return None
-
+    user_id = verify_token(credentials.credentials)
     if user_id is None:
         return None
 
     try:
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        return profile
+        return load_user_profile(db, user_id)
     except Exception:
         # Database error - return None gracefully
         return None
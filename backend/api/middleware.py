@@ -0,0 +1,237 @@
+"""
+CORS and per-route timing in one pure ASGI middleware.
+
+Origins are checked against a precompiled allow-list (exact origins in a set,
+suffixes in one anchored regex) and each decision is memoized, so a request
+costs one dict lookup. Preflight responses are served from cached header
+blocks keyed by (origin, requested headers). Every response is timed from
+request start to the last body chunk and aggregated per route template.
+
+    origins = OriginAllowList(["http://localhost:3000"], [".vercel.app"])
+    timings = RouteTimings()
+    app.add_middleware(CORSTimingMiddleware, allow_list=origins, timings=timings)
+"""
+
+import bisect
+import logging
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+ALLOW_METHODS = "GET,POST,PUT,PATCH,DELETE,OPTIONS"
+ALLOW_HEADERS = "Authorization,Content-Type,ngrok-skip-browser-warning"
+MAX_AGE = "86400"
+
+_MEMO_SIZE = 1024  # origins are client-controlled; bound every memo
+
+
+class OriginAllowList:
+    """Exact origins plus allowed host suffixes, compared case-insensitively"""
+
+    def __init__(self, origins: Iterable[str], suffixes: Iterable[str] = ()):
+        self.origins = frozenset(o.strip().lower() for o in origins if o)
+        suffixes = [s.strip().lower() for s in suffixes if s]
+        self.suffix_pattern = re.compile("(?:%s)\\Z" % "|".join(map(re.escape, suffixes))) if suffixes else None
+        self._decisions: Dict[str, bool] = {}
+
+    def allows(self, origin: Optional[str]) -> bool:
+        if not origin:
+            return False
+        decision = self._decisions.get(origin)
+        if decision is None:
+            normalized = origin.strip().lower()
+            decision = normalized in self.origins or bool(
+                self.suffix_pattern is not None and self.suffix_pattern.search(normalized)
+            )
+            if len(self._decisions) >= _MEMO_SIZE:
+                self._decisions.clear()
+            self._decisions[origin] = decision
+            if not decision:
+                logger.warning(f"CORS origin rejected: {origin}")
+        return decision
+
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open-ended
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, float("inf"))
+
+
+class RouteStats:
+    __slots__ = ("count", "errors", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS_MS)
+
+    def record(self, elapsed_ms: float, status: int):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        if status >= 500:
+            self.errors += 1
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def quantile_ms(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (max for the open bucket)"""
+        target, seen = q * self.count, 0
+        for bound, n in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += n
+            if n and seen >= target:
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.quantile_ms(0.50), 3),
+            "p95_ms": round(self.quantile_ms(0.95), 3),
+            "p99_ms": round(self.quantile_ms(0.99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class RouteTimings:
+    """Latency statistics per (method, route template), for this process"""
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteStats] = {}
+        self.started_at = time.time()
+
+    def record(self, method: str, route: str, elapsed_ms: float, status: int):
+        stats = self.routes.get((method, route))
+        if stats is None:
+            stats = self.routes[(method, route)] = RouteStats()
+        stats.record(elapsed_ms, status)
+
+    def snapshot(self) -> List[Dict]:
+        rows = [
+            {"method": method, "route": route, **stats.to_dict()}
+            for (method, route), stats in self.routes.items()
+        ]
+        rows.sort(key=lambda row: row["count"] * row["mean_ms"], reverse=True)
+        return rows
+
+    def reset(self):
+        self.routes.clear()
+        self.started_at = time.time()
+
+
+def _cors_headers(origin: str, allow_headers: str = ALLOW_HEADERS) -> List[Tuple[bytes, bytes]]:
+    return [
+        (b"access-control-allow-origin", origin.encode("latin-1")),
+        (b"access-control-allow-credentials", b"true"),
+        (b"access-control-allow-methods", ALLOW_METHODS.encode()),
+        (b"access-control-allow-headers", allow_headers.encode("latin-1")),
+        (b"access-control-max-age", MAX_AGE.encode()),
+    ]
+
+
+class CORSTimingMiddleware:
+    """
+    Adds CORS headers for allowed origins, answers every OPTIONS request
+    itself (204, with CORS headers only for allowed origins) and records
+    per-route latency.
+
+    Application errors raised before the response started become a JSON 500
+    that still carries CORS headers, so the browser can read it.
+    """
+
+    def __init__(self, app, allow_list: OriginAllowList, timings: Optional[RouteTimings] = None):
+        self.app = app
+        self.allow_list = allow_list
+        self.timings = timings
+        self._preflights: Dict[Tuple[str, str], List[Tuple[bytes, bytes]]] = {}
+        self._response_headers: Dict[str, List[Tuple[bytes, bytes]]] = {}
+
+    def response_headers(self, origin: str) -> List[Tuple[bytes, bytes]]:
+        """CORS headers for a non-preflight response (empty for disallowed origins)"""
+        headers = self._response_headers.get(origin)
+        if headers is None:
+            headers = _cors_headers(origin) if self.allow_list.allows(origin) else []
+            if len(self._response_headers) >= _MEMO_SIZE:
+                self._response_headers.clear()
+            self._response_headers[origin] = headers
+        return headers
+
+    def preflight_headers(self, origin: Optional[str], requested_headers: str) -> List[Tuple[bytes, bytes]]:
+        key = (origin or "", requested_headers)
+        headers = self._preflights.get(key)
+        if headers is None:
+            if not origin:
+                headers = [
+                    (b"access-control-allow-methods", ALLOW_METHODS.encode()),
+                    (b"access-control-allow-headers", ALLOW_HEADERS.encode()),
+                ]
+            elif self.allow_list.allows(origin):
+                allow_headers = f"{ALLOW_HEADERS},{requested_headers}" if requested_headers else ALLOW_HEADERS
+                headers = _cors_headers(origin, allow_headers) + [(b"vary", b"Origin")]
+            else:
+                headers = []
+            if len(self._preflights) >= _MEMO_SIZE:
+                self._preflights.clear()
+            self._preflights[key] = headers
+        return headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        origin = requested_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value.decode("latin-1")
+            elif name == b"access-control-request-headers":
+                requested_headers = value.decode("latin-1")
+        method = scope["method"]
+
+        if method == "OPTIONS":
+            headers = self.preflight_headers(origin, requested_headers or "")
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            self._record(scope, method, started, 204)
+            return
+
+        cors = self.response_headers(origin) if origin else []
+        status = None
+
+        async def send_with_cors(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if cors:
+                    message["headers"] = [*message.get("headers", ()), *cors]
+                    MutableHeaders(scope=message).add_vary_header("Origin")
+            elif not message.get("more_body", False):
+                self._record(scope, method, started, status)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cors)
+        except Exception as e:
+            if status is not None:  # response already under way
+                raise
+            logger.error(f"Error processing {method} {scope.get('path')}: {e}", exc_info=True)
+            headers = [(b"content-type", b"application/json")]
+            if cors:
+                headers += [*cors, (b"vary", b"Origin")]
+            await send({"type": "http.response.start", "status": 500, "headers": headers})
+            await send({"type": "http.response.body", "body": b'{"detail": "Internal server error"}'})
+            self._record(scope, method, started, 500)
+
+    def _record(self, scope, method: str, started: float, status: int):
+        if self.timings is None:
+            return
+        route = scope.get("route")
+        template = getattr(route, "path", None) or "<unmatched>"
+        self.timings.record(method, template, (time.perf_counter() - started) * 1000.0, status)
@@ -0,0 +1,234 @@
+"""
+Response layer for the API: fast JSON rendering, compression and conditional GETs.
+
+- ``ORJSONResponse`` renders with orjson (numpy arrays/scalars, datetimes and
+  non-string dict keys natively; NaN/Infinity become ``null``). Falls back to
+  the stdlib encoder when orjson isn't installed.
+- ``ORJSONRoute`` lets endpoints without a ``response_model`` skip FastAPI's
+  ``jsonable_encoder`` walk: the plain dict/list they return goes straight to
+  ``ORJSONResponse``.
+- ``CompressionMiddleware`` brotli- or gzip-compresses large buffered bodies
+  according to ``Accept-Encoding``.
+- ``cached_json`` adds a content ETag and ``Cache-Control`` to catalog-derived
+  GET responses and answers a matching ``If-None-Match`` with 304.
+
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.router.route_class = ORJSONRoute
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+"""
+
+import functools
+import gzip
+import hashlib
+import inspect
+import json
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional, gzip is always available
+    brotli = None
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Types orjson doesn't serialize itself (Decimal, sets, pydantic models, ...)"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    return jsonable_encoder(obj)
+
+
+def render_json(content: Any) -> bytes:
+    """Serialize ``content`` the way ORJSONResponse does"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (stdlib fallback)"""
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
+
+
+def _as_response(value: Any, status_code: Optional[int]) -> Any:
+    if isinstance(value, Response):
+        return value
+    return ORJSONResponse(value, status_code=status_code or 200)
+
+
+def _direct_json(endpoint: Callable, status_code: Optional[int]) -> Callable:
+    """Wrap an endpoint so its return value is rendered without jsonable_encoder"""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def call(*args, **kwargs):
+            return _as_response(await endpoint(*args, **kwargs), status_code)
+    else:
+        @functools.wraps(endpoint)
+        def call(*args, **kwargs):
+            return _as_response(endpoint(*args, **kwargs), status_code)
+    return call
+
+
+class ORJSONRoute(APIRoute):
+    """
+    APIRoute that renders untyped endpoints directly with ORJSONResponse.
+
+    Routes with a ``response_model`` (or a return annotation FastAPI would
+    turn into one) keep the normal validate-and-encode path.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        response_model = kwargs.get("response_model")
+        untyped = (response_model is None or isinstance(response_model, DefaultPlaceholder)) and (
+            inspect.signature(endpoint).return_annotation is inspect.Signature.empty
+        )
+        if untyped:
+            endpoint = _direct_json(endpoint, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
+
+
+def etag_for(body: bytes) -> str:
+    """Strong validator for a rendered body"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def cached_json(request: Request, content: Any, max_age: int = 3600) -> Response:
+    """
+    JSON response with ETag + Cache-Control, or a bodiless 304 when the
+    client's ``If-None-Match`` already names this representation.
+
+    Use for GET responses derived from the bundled catalog, which only change
+    when the data does (i.e. on deploy).
+    """
+    body = render_json(content)
+    etag = etag_for(body)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _accepted_encoding(accept_encoding: str) -> Optional[str]:
+    """'br' or 'gzip' if the client accepts it (q=0 means refused)"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing single-message (non-streaming) responses.
+
+    Brotli is preferred when installed and accepted, gzip otherwise. Bodies
+    under ``minimum_size``, already-encoded responses and non-text content
+    types pass through untouched, as do streaming responses.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = _accepted_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self.compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # Byte-for-byte different from the identity body
+                headers["ETag"] = "W/" + etag
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_compressed)
@@ -15,7 +15,9 @@ from database.schemas import (
     Token,
     CompleteProfileResponse
 )
+from api.auth_cache import profile_cache
 from api.dependencies import get_current_user_profile, get_optional_user_profile
+from services.identity_service import identity_service
 
 router = APIRouter()
 
@@ -42,38 +44,18 @@ async def google_oauth_callback(
     supabase = get_supabase()
 
     try:
-        # Check if user already exists in Supabase Auth
-        if supabase is None:
+        # Resolve the account through the local users table (Supabase only on a miss)
+        try:
+            identity = identity_service.resolve_google_user(db, supabase, email, name, google_id)
+        except RuntimeError:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="Authentication service not available"
             )
-        existing_users = supabase.auth.admin.list_users()
-        user_exists = False
-        user_id = None
-
-        # Access users list safely
-        users_list = getattr(existing_users, 'users', []) or []
-        for user in users_list:
-            if user.email == email:
-                user_exists = True
-                user_id = user.id
-                break
-
-        if not user_exists:
-            # Create user in Supabase Auth
-            auth_response = supabase.auth.admin.create_user({
-                "email": email,
-                "email_confirm": True,
-                "user_metadata": {
-                    "name": name,
-                    "google_id": google_id
-                }
-            })
-            user_id = auth_response.user.id
+        user_id = str(identity.user_id)
 
         # Check if profile already exists in local database
-        existing_profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+        existing_profile = db.query(UserProfile).filter(UserProfile.user_id == identity.user_id).first()
 
         if not existing_profile:
             # Create profile in local database
@@ -84,12 +66,13 @@ async def google_oauth_callback(
             )
 
             profile = UserProfile(
-                user_id=user_id,
+                user_id=identity.user_id,
                 **profile_data.dict()
             )
             db.add(profile)
             db.commit()
             db.refresh(profile)
+            profile_cache.invalidate(user_id)
         else:
             profile = existing_profile
 
@@ -108,8 +91,11 @@ async def google_oauth_callback(
             }
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
+        if db is not None:
+            db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create Google OAuth user: {str(e)}"
@@ -166,6 +152,7 @@ async def signup(
         db.add(profile)
         db.commit()
         db.refresh(profile)
+        profile_cache.invalidate(user_id)
 
         # Return token and user info
         session = auth_response.session
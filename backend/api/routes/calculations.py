@@ -2,8 +2,11 @@
 Probability calculation routes using our scoring system.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 from database import get_db, College, UserProfile, AcademicData, Extracurricular
 from database.schemas import (
@@ -14,6 +17,7 @@ from database.schemas import (
 )
 from api.dependencies import get_current_user_profile
 from core import calculate_admission_probability
+from services.calculation_memo import calculation_memo, college_inputs
 
 router = APIRouter()
 
@@ -195,6 +199,71 @@ def profile_to_factor_scores(
     return scores
 
 
+def _category(probability: float) -> str:
+    if probability < 0.15:
+        return "reach"
+    elif probability < 0.40:
+        return "reach"
+    elif probability < 0.65:
+        return "target"
+    return "safety"
+
+
+def _profile_factor_scores(db: Session, profile: UserProfile) -> dict:
+    """Factor scores from the profile's current academic data and extracurriculars."""
+    academic_data = db.query(AcademicData).filter(
+        AcademicData.profile_id == profile.id
+    ).first()
+    extracurriculars = db.query(Extracurricular).filter(
+        Extracurricular.profile_id == profile.id
+    ).all()
+    return profile_to_factor_scores(profile, academic_data, extracurriculars)
+
+
+def _calculate_for_college(
+    college_id: str,
+    profile: UserProfile,
+    factor_scores: dict,
+    db: Session
+) -> CalculationResponse:
+    """Memoized calculation for one college (see services.calculation_memo)."""
+    # Get college data
+    college = db.query(College).filter(College.id == college_id).first()
+    if not college:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="College not found"
+        )
+
+    inputs = college_inputs(college)
+    memo_key = calculation_memo.key(profile.id, college.id, factor_scores, inputs)
+    result = calculation_memo.get(db, memo_key)
+
+    if result is None:
+        # Calculate probability using our scoring system
+        try:
+            report = calculate_admission_probability(factor_scores=factor_scores, **inputs)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to calculate probability: {str(e)}"
+            )
+        result = calculation_memo.put(db, memo_key, factor_scores, {
+            "composite_score": report.composite_score,
+            "probability": report.probability,
+            "percentile_estimate": report.percentile_estimate,
+            "audit_breakdown": [row.to_dict() for row in report.factor_breakdown],
+            "policy_notes": report.policy_notes,
+        })
+
+    return CalculationResponse(
+        college_id=college.id,
+        college_name=college.name,
+        category=_category(result["probability"]),
+        **result
+    )
+
+
 @router.post("/calculate/{college_id}", response_model=CalculationResponse)
 async def calculate_probability(
     college_id: str,
@@ -204,6 +273,10 @@ async def calculate_probability(
     """
     Calculate admission probability for a specific college.
 
+    Results are memoized by (profile snapshot, college, calculation version):
+    a repeat request is served from memory or the probability_calculations
+    table instead of being recomputed.
+
     Args:
         college_id: UUID of the college
         current_user_profile: Current user's profile
@@ -212,67 +285,8 @@ async def calculate_probability(
     Returns:
         CalculationResponse: Probability calculation result
     """
-    # Get college data
-    college = db.query(College).filter(College.id == college_id).first()
-    if not college:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="College not found"
-        )
-
-    # Get user's academic data
-    academic_data = db.query(AcademicData).filter(
-        AcademicData.profile_id == current_user_profile.id
-    ).first()
-
-    # Get user's extracurriculars
-    extracurriculars = db.query(Extracurricular).filter(
-        Extracurricular.profile_id == current_user_profile.id
-    ).all()
-
-    # Convert profile to factor scores
-    factor_scores = profile_to_factor_scores(
-        current_user_profile,
-        academic_data,
-        extracurriculars
-    )
-
-    # Calculate probability using our scoring system
-    try:
-        report = calculate_admission_probability(
-            factor_scores=factor_scores,
-            acceptance_rate=float(college.acceptance_rate) if college.acceptance_rate else 0.1,
-            uses_testing=college.test_policy != "Blind",
-            need_aware=college.financial_aid_policy == "Need-aware"
-        )
-
-        # Determine category
-        prob = report.probability
-        if prob < 0.15:
-            category = "reach"
-        elif prob < 0.40:
-            category = "reach"
-        elif prob < 0.65:
-            category = "target"
-        else:
-            category = "safety"
-
-        return CalculationResponse(
-            college_id=college.id,
-            college_name=college.name,
-            composite_score=report.composite_score,
-            probability=report.probability,
-            percentile_estimate=report.percentile_estimate,
-            audit_breakdown=[row.to_dict() for row in report.factor_breakdown],
-            policy_notes=report.policy_notes,
-            category=category
-        )
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to calculate probability: {str(e)}"
-        )
+    factor_scores = _profile_factor_scores(db, current_user_profile)
+    return _calculate_for_college(college_id, current_user_profile, factor_scores, db)
 
 
 @router.post("/calculate/batch", response_model=BatchCalculationResponse)
@@ -293,13 +307,16 @@ async def calculate_batch_probabilities(
         BatchCalculationResponse: Array of calculation results
     """
     results = []
+    # The profile snapshot is the same for every college in the batch
+    factor_scores = _profile_factor_scores(db, current_user_profile)
 
     for college_id in request.college_ids:
         try:
-            result = await calculate_probability(
-                college_id=str(college_id),
-                current_user_profile=current_user_profile,
-                db=db
+            result = _calculate_for_college(
+                str(college_id),
+                current_user_profile,
+                factor_scores,
+                db
             )
             results.append(result)
         except HTTPException:
@@ -311,13 +328,22 @@ async def calculate_batch_probabilities(
 
 @router.get("/history", response_model=List[ProbabilityCalculationResponse])
 async def get_calculation_history(
+    limit: int = Query(default=50, ge=1, le=100),
+    before: Optional[datetime] = Query(default=None, description="calculated_at of the last item on the previous page"),
+    before_id: Optional[UUID] = Query(default=None, description="id of the last item on the previous page"),
     current_user_profile: UserProfile = Depends(get_current_user_profile),
     db: Session = Depends(get_db)
 ):
     """
-    Get user's calculation history.
+    Get user's calculation history, newest first.
+
+    Paged by keyset on (calculated_at, id): pass the last item's
+    calculated_at and id as ``before``/``before_id`` to get the next page.
 
     Args:
+        limit: Page size
+        before: Cursor timestamp (exclusive)
+        before_id: Cursor id, breaks ties between equal timestamps
         current_user_profile: Current user's profile
         db: Database session
 
@@ -326,8 +352,21 @@ async def get_calculation_history(
     """
     from database.models import ProbabilityCalculation
 
-    calculations = db.query(ProbabilityCalculation).filter(
+    query = db.query(ProbabilityCalculation).filter(
         ProbabilityCalculation.profile_id == current_user_profile.id
-    ).order_by(ProbabilityCalculation.calculated_at.desc()).limit(50).all()
+    )
+    if before is not None:
+        if before_id is not None:
+            query = query.filter(or_(
+                ProbabilityCalculation.calculated_at < before,
+                and_(ProbabilityCalculation.calculated_at == before, ProbabilityCalculation.id < before_id)
+            ))
+        else:
+            query = query.filter(ProbabilityCalculation.calculated_at < before)
+
+    calculations = query.order_by(
+        ProbabilityCalculation.calculated_at.desc(),
+        ProbabilityCalculation.id.desc()
+    ).limit(limit).all()
 
     return [ProbabilityCalculationResponse.from_orm(calc) for calc in calculations]
@@ -6,11 +6,14 @@ Provides endpoints for ML+Formula hybrid predictions.
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from database import get_db, College, UserProfile, AcademicData, Extracurricular
+from database import get_db, College, UserProfile, AcademicData, Extracurricular, SavedCollege
 from database.schemas import CalculationResponse
 from api.dependencies import get_current_user_profile
 from ml.models.predictor import get_predictor, model_available
+from ml.models.batching import get_inference_scheduler
+from ml.models.portfolio import simulate_portfolio, tier_for_acceptance_rate
 from ml.preprocessing.feature_extractor import StudentFeatures, CollegeFeatures
 
 router = APIRouter()
@@ -216,9 +219,8 @@ async def calculate_ml_probability(
     
     college_features = db_college_to_college_features(college)
     
-    # Get predictor and make prediction
-    predictor = get_predictor()
-    result = predictor.predict(
+    # Make prediction (micro-batched with concurrent requests)
+    result = await get_inference_scheduler().predict(
         student=student_features,
         college=college_features,
         model_name=model_name,
@@ -249,6 +251,7 @@ async def calculate_ml_probability(
         "formula_probability": result.formula_probability,
         "ml_confidence": result.ml_confidence,
         "blend_weights": result.blend_weights,
+        "factor_contributions": result.factor_contributions,
         "model_used": result.model_used,
         "prediction_method": "hybrid_ml",
         "explanation": result.explanation,
@@ -259,6 +262,71 @@ async def calculate_ml_probability(
     }
 
 
+@router.post("/ml/portfolio")
+async def simulate_saved_portfolio(
+    draws: int = Query(default=100_000, ge=1_000, le=1_000_000, description="Simulated application cycles"),
+    tier_correlation: float = Query(default=0.0, ge=0.0, le=0.95, description="Outcome correlation within a selectivity tier"),
+    seed: Optional[int] = Query(default=None),
+    model_name: str = Query(default="ensemble", description="ML model to use"),
+    current_user_profile: UserProfile = Depends(get_current_user_profile),
+    db: Session = Depends(get_db)
+):
+    """
+    Monte Carlo simulation of applying to the user's saved colleges.
+
+    All saved colleges are scored in one batched prediction; the simulation
+    then estimates P(at least one admit), expected admits and each college's
+    marginal value to the list.
+
+    Returns:
+        Portfolio summary (see ml.models.portfolio.PortfolioResult)
+    """
+    saved = db.query(SavedCollege).filter(
+        SavedCollege.profile_id == current_user_profile.id
+    ).all()
+    colleges = [entry.college for entry in saved if entry.college is not None]
+    if not colleges:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No saved colleges to simulate"
+        )
+
+    academic_data = db.query(AcademicData).filter(
+        AcademicData.profile_id == current_user_profile.id
+    ).first()
+    extracurriculars = db.query(Extracurricular).filter(
+        Extracurricular.profile_id == current_user_profile.id
+    ).all()
+    student_features = db_profile_to_student_features(
+        current_user_profile,
+        academic_data,
+        extracurriculars
+    )
+
+    college_features = [db_college_to_college_features(college) for college in colleges]
+    predictions = await get_inference_scheduler().predict_many(
+        [(student_features, features) for features in college_features],
+        model_name=model_name,
+    )
+
+    result = await run_in_threadpool(
+        simulate_portfolio,
+        [college.name for college in colleges],
+        [prediction.probability for prediction in predictions],
+        # From the stored rate: the feature row substitutes 0.10 for a missing one
+        [tier_for_acceptance_rate(college.acceptance_rate) for college in colleges],
+        draws=draws,
+        tier_correlation=tier_correlation,
+        seed=seed,
+    )
+
+    return {
+        "college_ids": [str(college.id) for college in colleges],
+        "model_used": predictions[0].model_used,
+        **result.to_dict(),
+    }
+
+
 @router.get("/ml/status")
 async def ml_status():
     """
@@ -282,6 +350,18 @@ async def ml_status():
         "num_features": info.get('num_features'),
         "training_date": info.get('training_date'),
         "num_training_samples": info.get('num_training_samples'),
-        "metrics": info.get('metrics', {})
+        "metrics": info.get('metrics', {}),
+        "inference": get_inference_scheduler().stats()
     }
 
+
+@router.get("/ml/inference-stats")
+async def ml_inference_stats():
+    """
+    Micro-batching scheduler statistics.
+    
+    Returns:
+        Queue depth and batch-size histograms plus throughput counters
+    """
+    return get_inference_scheduler().stats()
+
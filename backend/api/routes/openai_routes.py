@@ -7,6 +7,7 @@ from typing import Dict, Any, List
 from pydantic import BaseModel
 import logging
 from services.openai_service import college_info_service
+from services.application_parser import application_parser
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -83,20 +84,25 @@ async def get_college_info_by_name(college_name: str) -> Dict[str, Any]:
 @router.post("/parse-application")
 async def parse_application_document(request: ParseApplicationRequest) -> Dict[str, Any]:
     """
-    Parse a college application document using OpenAI to extract structured data.
+    Parse a college application document to extract structured data.
     This is used as a fallback when frontend regex parsing misses important information.
     
+    Fields are read locally first; OpenAI is only called for fields the local
+    extractor missed or to split prose into MISC items (see
+    services.application_parser). Results are cached by document content.
+    
     Args:
         request: ParseApplicationRequest with "document_text" containing the application text
         
     Returns:
-        Dictionary with extracted fields and miscellaneous notes
+        Dictionary with extracted fields, miscellaneous notes and the stage
+        ("local" / "llm") each field came from
     """
     try:
         if not request.document_text or not request.document_text.strip():
             raise HTTPException(status_code=400, detail="document_text is required and cannot be empty")
         
-        result = await college_info_service.parse_application_document(request.document_text)
+        result = await application_parser.parse(request.document_text)
         return result
     except HTTPException:
         raise
@@ -42,11 +42,44 @@ class Settings(_BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
 
+    # Google sign-in identity cache (see services.identity_service)
+    identity_cache_ttl_seconds: float = 300.0
+    identity_cache_max_entries: int = 50000
+
+    # Authenticated-request caches (see api.auth_cache): verified JWTs are kept
+    # until they expire (at most the max TTL), profile rows for a few seconds
+    auth_token_cache_size: int = 4096
+    auth_token_cache_max_ttl_seconds: float = 300.0
+    auth_profile_cache_size: int = 4096
+    auth_profile_cache_ttl_seconds: float = 30.0
+
+    # Parsed application documents kept by content hash (see services.application_parser)
+    application_parse_cache_size: int = 1024
+
     # CORS - Loaded from environment variable via Pydantic
     frontend_url: str = "http://localhost:3000"
 
     # ML Model Path
     ml_model_path: str = "../models/trained/"
+    # Model inference backend (see ml.models.inference_backends): "auto" uses the
+    # flattened numpy form of each model when it verifies, "sklearn" never does
+    ml_inference_backend: str = "auto"
+
+    # Inference micro-batching (see ml.models.batching)
+    inference_max_batch_size: int = 32
+    inference_max_wait_ms: float = 2.0
+
+    # Pre-fork server (prefork_server.py): worker processes, 0 = one per available CPU
+    web_concurrency: int = 0
+
+    # Background service warm-up on startup (see services.registry)
+    service_preload: bool = True
+    service_preload_workers: int = 4
+
+    # Response layer (see api.responses): compress bodies from this size up,
+    # browser/CDN cache lifetime of catalog-derived GET responses
+    response_compression_min_bytes: int = 1024
+    catalog_cache_max_age: int = 3600
 
     # OpenAI Configuration
     # Loaded from environment variable (.env file) via Pydantic - never commit API keys to git
@@ -56,6 +89,9 @@ class Settings(_BaseSettings):
     college_scorecard_api_key: str = ""
     google_maps_api_key: str = ""
 
+    # Ask api.zippopotam.us about ZIP codes the bundled table can't resolve
+    zipcode_api_fallback: bool = True
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
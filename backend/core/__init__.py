@@ -25,8 +25,11 @@ from .audit import (
     format_audit_for_display
 )
 from .pipeline import (
+    FACTOR_ORDER,
     calculate_admission_probability,
-    batch_calculate_probabilities
+    calculate_admission_probabilities,
+    batch_calculate_probabilities,
+    factor_matrix
 )
 
 __all__ = [
@@ -57,6 +60,9 @@ __all__ = [
     
     # Pipeline (main entry point)
     'calculate_admission_probability',
+    'calculate_admission_probabilities',
     'batch_calculate_probabilities',
+    'factor_matrix',
+    'FACTOR_ORDER',
 ]
 
@@ -3,11 +3,22 @@ Complete end-to-end probability calculation pipeline.
 Integrates scoring, probability, and audit modules.
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .weights import FACTOR_WEIGHTS, CLUSTER_FACTORS
 from .scoring import CollegePolicy, compute_composite, apply_conduct_penalty
 from .probability import calculate_probability, probability_to_percentile
 from .audit import AuditReport, build_audit
 
+FACTOR_ORDER = list(FACTOR_WEIGHTS)
+_WEIGHTS = np.array([FACTOR_WEIGHTS[f] for f in FACTOR_ORDER])
+_CLUSTER = np.array([f in CLUSTER_FACTORS for f in FACTOR_ORDER])
+_TESTING = FACTOR_ORDER.index("testing")
+_ABILITY_TO_PAY = FACTOR_ORDER.index("ability_to_pay")
+_CONDUCT = FACTOR_ORDER.index("conduct_record")
+
 
 def calculate_admission_probability(
     factor_scores: Dict[str, Optional[float]],
@@ -133,6 +144,72 @@ def batch_calculate_probabilities(
     return results
 
 
+def factor_matrix(factor_rows: Sequence[Dict[str, Optional[float]]]) -> np.ndarray:
+    """Stack factor-score dicts into an (n, 20) array in FACTOR_ORDER; missing scores are NaN."""
+    matrix = np.full((len(factor_rows), len(FACTOR_ORDER)), np.nan)
+    for i, scores in enumerate(factor_rows):
+        for j, factor in enumerate(FACTOR_ORDER):
+            value = scores.get(factor)
+            if value is not None:
+                matrix[i, j] = value
+    return matrix
+
+
+def calculate_admission_probabilities(
+    factor_scores: Union[np.ndarray, Sequence[Dict[str, Optional[float]]]],
+    acceptance_rate: Union[float, Sequence[float]],
+    uses_testing: Union[bool, Sequence[bool]] = True,
+    need_aware: Union[bool, Sequence[bool]] = False
+) -> np.ndarray:
+    """
+    Vectorized ``calculate_admission_probability(...).probability`` for many rows.
+
+    Same scoring as the scalar pipeline (neutral defaults, policy gates,
+    clamping, cluster dampening, conduct penalty, default logistic
+    calibration) computed as array operations, so scoring hundreds of
+    profiles costs about as much as scoring one. No audit trail is built.
+
+    Args:
+        factor_scores: (n, 20) matrix in FACTOR_ORDER (NaN = missing) or a
+                       list of factor-score dicts
+        acceptance_rate: One rate for every row or one per row
+        uses_testing: Testing policy, scalar or per row
+        need_aware: Need policy, scalar or per row
+
+    Returns:
+        Probabilities, shape (n,)
+    """
+    raw = factor_scores if isinstance(factor_scores, np.ndarray) else factor_matrix(factor_scores)
+    n = raw.shape[0]
+    if n == 0:
+        return np.zeros(0)
+
+    # Neutral defaults, policy gates and clamping
+    scores = np.clip(np.where(np.isnan(raw), 5.0, raw), 0.0, 10.0)
+    active = np.ones_like(scores, dtype=bool)
+    active[:, _TESTING] = np.broadcast_to(np.asarray(uses_testing, dtype=bool), (n,))
+    active[:, _ABILITY_TO_PAY] = np.broadcast_to(np.asarray(need_aware, dtype=bool), (n,))
+
+    # Cluster dampening: 15% off cluster weights when 2+ active cluster factors score >= 8
+    weights = np.where(active, _WEIGHTS, 0.0)
+    dampened = ((scores >= 8) & active & _CLUSTER).sum(axis=1) >= 2
+    weights = np.where(dampened[:, None] & _CLUSTER, weights * 0.85, weights)
+
+    composite = (scores * weights).sum(axis=1) / (10.0 * weights.sum(axis=1)) * 1000.0
+
+    # Conduct penalty uses the raw (unclamped) score
+    conduct = raw[:, _CONDUCT]
+    penalized = ~np.isnan(conduct) & (conduct < 5)
+    composite = np.where(penalized, np.maximum(0.0, composite - (5.0 - np.nan_to_num(conduct)) * 8.0), composite)
+
+    # Default calibration (see probability.default_calibration) and logistic
+    rate = np.clip(np.broadcast_to(np.asarray(acceptance_rate, dtype=float), (n,)), 0.03, 0.80)
+    steepness = np.where(rate < 0.15, 0.012 + 0.02 * (0.15 - rate), 0.012)
+    center = 600.0 - np.log(rate / (1.0 - rate)) / steepness
+    exponent = np.clip(-steepness * (composite - center), -100.0, 100.0)
+    return np.clip(1.0 / (1.0 + np.exp(exponent)), 0.02, 0.85)
+
+
 # Complete example demonstrating the full pipeline
 if __name__ == "__main__":
     print("=" * 80)
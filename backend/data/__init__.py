@@ -3,18 +3,27 @@ Data module for Chancify AI backend.
 Contains college data, mappings, and data services.
 """
 
-# Import commonly used modules
-from .college_names_mapping import college_names_mapping
-from .college_nickname_mapper import nickname_mapper
-from .college_subject_emphasis import college_subject_emphasis
-from .tuition_state_service import tuition_state_service
-from .improvement_analysis_service import improvement_analysis_service
-from .real_college_suggestions import real_college_suggestions
-from .real_ipeds_major_mapping import (
-    get_colleges_for_major,
-    get_major_strength_score,
-    get_major_relevance_info
-)
+# Commonly used services, imported on first attribute access: each one loads
+# its reference data at import, and callers such as the API's service registry
+# load them individually (and in parallel) rather than all at once
+_LAZY_EXPORTS = {
+    "college_names_mapping": ".college_names_mapping",
+    "nickname_mapper": ".college_nickname_mapper",
+    "college_subject_emphasis": ".college_subject_emphasis",
+    "tuition_state_service": ".tuition_state_service",
+    "improvement_analysis_service": ".improvement_analysis_service",
+    "real_college_suggestions": ".real_college_suggestions",
+    "get_colleges_for_major": ".real_ipeds_major_mapping",
+    "get_major_strength_score": ".real_ipeds_major_mapping",
+    "get_major_relevance_info": ".real_ipeds_major_mapping",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "college_names_mapping",
@@ -0,0 +1,616 @@
+"""
+College catalog ETL.
+
+One pipeline for the reference tables every service reads:
+
+- ``ipeds``: IPEDS admissions (``Datasets/adm2023.csv``) joined with the
+  survey response flags (``Datasets/Flags2023.csv``) into
+  ``data/processed/ipeds_all_colleges.csv`` + ``ipeds_admissions.npz``
+- ``catalog``: COLLEGEDETAILS (+ majors and the elite-college table) into
+  ``data/raw/real_colleges_integrated.csv`` + ``college_catalog.npz``,
+  validated with ``data.college_data_validator.check_catalog``
+
+Every transform is a column operation on frames read with declared dtypes;
+nothing iterates rows. Each stage is keyed by a content hash of its inputs
+and ETL_VERSION, recorded in ``data/processed/catalog_etl_manifest.json``;
+a stage whose inputs and outputs are unchanged is skipped. Outputs are
+deterministic (fixed elite unitids, per-unitid GPA estimates, zip entries
+with a fixed timestamp), so the same inputs always produce the same bytes.
+
+The ``.npz`` artifacts are typed columns described by ``SCHEMAS``; read them
+back with ``read_columnar``. Run from `backend/` after an IPEDS refresh:
+
+    python -m data.catalog_etl
+    python -m data.catalog_etl --force          # rebuild every stage
+    python -m data.catalog_etl --stage catalog
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+import time
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from data.college_data_validator import check_catalog, classify_selectivity
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a transform below changes its output
+ETL_VERSION = 1
+
+DATA_DIR = Path(__file__).resolve().parent
+REPO_DIR = DATA_DIR.parent.parent
+PROCESSED_DIR = DATA_DIR / "processed"
+
+IPEDS_ADMISSIONS_PATH = REPO_DIR / "Datasets" / "adm2023.csv"
+IPEDS_FLAGS_PATH = REPO_DIR / "Datasets" / "Flags2023.csv"
+COLLEGE_DETAILS_PATH = REPO_DIR / "COLLEGEDETAILS" / "colleges_1000.csv"
+MAJORS_PATH = REPO_DIR / "majors" / "colleges_with_majors_153.csv"
+
+IPEDS_CSV_PATH = PROCESSED_DIR / "ipeds_all_colleges.csv"
+IPEDS_TABLE_PATH = PROCESSED_DIR / "ipeds_admissions.npz"
+CATALOG_CSV_PATH = DATA_DIR / "raw" / "real_colleges_integrated.csv"
+CATALOG_TABLE_PATH = PROCESSED_DIR / "college_catalog.npz"
+VALIDATION_REPORT_PATH = PROCESSED_DIR / "catalog_validation.json"
+MANIFEST_PATH = PROCESSED_DIR / "catalog_etl_manifest.json"
+
+# Zip entries get a fixed timestamp so identical columns give identical files
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class CatalogValidationError(ValueError):
+    """An input or the built catalog failed a hard check; the stage wrote nothing."""
+
+
+# ---------------------------------------------------------------------------
+# Schemas
+# ---------------------------------------------------------------------------
+
+# Column types: "str", "category" (codes + vocabulary), "float64", "int64",
+# "Int64"/"Int8" (nullable integers) and "int8"
+IPEDS_ADMISSIONS_DTYPES: Dict[str, str] = {
+    "UNITID": "int64",
+    **{f"ADMCON{i}": "Int8" for i in range(1, 13)},
+    "APPLCN": "Int64",
+    "ADMSSN": "float64",
+    "ENRLT": "float64",
+    **{column: "float64" for column in (
+        "SATVR25", "SATVR75", "SATMT25", "SATMT75",
+        "ACTCM25", "ACTCM75", "ACTEN25", "ACTEN75", "ACTMT25", "ACTMT75",
+    )},
+}
+IPEDS_FLAGS_DTYPES: Dict[str, str] = {"UNITID": "int64", "STAT_ADM": "int8", "IMP_ADM": "int8"}
+
+COLLEGE_DETAILS_DTYPES: Dict[str, str] = {
+    "name": "str",
+    "city": "str",
+    "state": "str",
+    "tuition_in_state_usd": "float64",
+    "tuition_out_of_state_usd": "float64",
+    "avg_net_price_usd": "float64",
+    "selectivity_label": "str",
+    "acceptance_rate_percent": "float64",
+    "accepted_per_year": "float64",
+    "applicants_total": "float64",
+    "student_body_size": "Int64",
+}
+MAJORS_DTYPES: Dict[str, str] = {"name": "str", "major_1": "str", "major_2": "str", "major_3": "str"}
+
+# ADMCON1..12, in order (adm2023.sps)
+ADMISSION_CONSIDERATIONS = (
+    "secondary_school_gpa",
+    "secondary_school_rank",
+    "secondary_school_record",
+    "college_prep_program",
+    "recommendations",
+    "competencies",
+    "admission_test_scores",
+    "english_proficiency_test",
+    "other_test",
+    "work_experience",
+    "personal_statement",
+    "legacy_status",
+)
+# ADMCON value labels; codes 1/5/3 replaced the old importance scale in 2023
+CONSIDERATION_LABELS = {1: "Required", 5: "Considered", 3: "Not considered", -1: "Not reported", -2: "Not applicable"}
+RESPONSE_STATUS_LABELS = {1: "Respondent", 2: "Imputed", 5: "Nonrespondent", -2: "Not applicable", -9: "Not active"}
+
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "ipeds": {
+        "unitid": "int64",
+        "applications": "Int64",
+        "admitted": "float64",
+        "enrolled": "float64",
+        "acceptance_rate": "float64",
+        "sat_verbal_25": "float64",
+        "sat_verbal_75": "float64",
+        "sat_math_25": "float64",
+        "sat_math_75": "float64",
+        "sat_total_25": "float64",
+        "sat_total_75": "float64",
+        "act_composite_25": "float64",
+        "act_composite_75": "float64",
+        "act_english_25": "float64",
+        "act_english_75": "float64",
+        "act_math_25": "float64",
+        "act_math_75": "float64",
+        "selectivity_tier": "category",
+        "test_policy": "category",
+        "financial_aid_policy": "category",
+        "gpa_average": "float64",
+        "response_status": "category",
+        **{f"consider_{name}": "category" for name in ADMISSION_CONSIDERATIONS},
+    },
+    "catalog": {
+        "name": "str",
+        "city": "str",
+        "state": "category",
+        "tuition_in_state_usd": "float64",
+        "tuition_out_of_state_usd": "float64",
+        "avg_net_price_usd": "float64",
+        "selectivity_tier": "category",
+        "acceptance_rate": "float64",
+        "accepted_per_year": "float64",
+        "applicants_total": "float64",
+        "student_body_size": "Int64",
+        "unitid": "int64",
+        "data_completeness": "float64",
+        "gpa_average": "float64",
+        "test_policy": "category",
+        "financial_aid_policy": "category",
+        "control": "category",
+        "major_1": "str",
+        "major_2": "str",
+        "major_3": "str",
+    },
+}
+# Columns the legacy ipeds_all_colleges.csv consumers (training scripts) read
+IPEDS_CSV_COLUMNS = list(SCHEMAS["ipeds"])[: list(SCHEMAS["ipeds"]).index("gpa_average") + 1]
+
+
+def _read_csv(path: Path, dtypes: Dict[str, str], **kwargs) -> pd.DataFrame:
+    """Read only the declared columns, with their declared dtypes."""
+    # IPEDS headers come with stray whitespace; match declared names against the stripped header
+    header = pd.read_csv(path, nrows=0, **kwargs).columns
+    raw_names = {column.strip(): column for column in header}
+    missing = [column for column in dtypes if column not in raw_names]
+    if missing:
+        raise CatalogValidationError(f"{path.name} is missing columns: {missing}")
+    df = pd.read_csv(
+        path,
+        usecols=[raw_names[column] for column in dtypes],
+        dtype={raw_names[column]: kind for column, kind in dtypes.items()},
+        **kwargs,
+    )
+    return df.rename(columns=lambda column: column.strip())
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """Project ``df`` onto the schema's columns (in order) and dtypes."""
+    missing = [column for column in schema if column not in df.columns]
+    if missing:
+        raise CatalogValidationError(f"Missing columns: {missing}")
+    casts = {column: ("object" if kind in ("str", "category") else kind) for column, kind in schema.items()}
+    return df[list(schema)].astype(casts)
+
+
+# ---------------------------------------------------------------------------
+# Typed columnar artifacts
+# ---------------------------------------------------------------------------
+
+def write_columnar(path: Path, df: pd.DataFrame, schema: Dict[str, str]) -> Path:
+    """
+    Persist ``df`` as a compressed .npz of typed columns (no pickled objects).
+
+    Strings are fixed-width unicode (``<col>__valid`` marks nulls),
+    categories are int16 codes + vocabulary, nullable integers carry a
+    validity mask. The schema itself is stored under ``__schema__``.
+    """
+    arrays: Dict[str, np.ndarray] = {
+        "__version__": np.array([ETL_VERSION], dtype=np.int32),
+        "__schema__": np.array(json.dumps(schema)),
+    }
+    for column, kind in schema.items():
+        series = df[column]
+        valid = series.notna().to_numpy()
+        if kind == "category":
+            categorical = pd.Categorical(series.astype("object"))
+            arrays[f"{column}__codes"] = categorical.codes.astype(np.int16)
+            arrays[f"{column}__vocab"] = np.asarray(categorical.categories.astype(str), dtype=str)
+            continue
+        if kind == "str":
+            arrays[column] = np.asarray(series.astype("object").where(valid, "").tolist(), dtype=str)
+        elif kind == "Int64":
+            arrays[column] = series.fillna(0).to_numpy(dtype=np.int64)
+        else:
+            arrays[column] = series.to_numpy(dtype=kind)
+        if kind in ("str", "Int64") and not valid.all():
+            arrays[f"{column}__valid"] = valid
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for key, array in arrays.items():
+            buffer = io.BytesIO()
+            np.lib.format.write_array(buffer, np.asanyarray(array), allow_pickle=False)
+            info = zipfile.ZipInfo(f"{key}.npy", date_time=_ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, buffer.getvalue())
+    os.replace(tmp, path)
+    return path
+
+
+def read_columnar(path: Path) -> pd.DataFrame:
+    """Load a ``write_columnar`` artifact back into a DataFrame with its schema's dtypes."""
+    with np.load(path, allow_pickle=False) as data:
+        if int(data["__version__"][0]) != ETL_VERSION:
+            raise ValueError(f"Columnar artifact {path} has an unsupported version")
+        schema = json.loads(str(data["__schema__"]))
+        columns = {}
+        for column, kind in schema.items():
+            if kind == "category":
+                columns[column] = pd.Categorical.from_codes(data[f"{column}__codes"], data[f"{column}__vocab"])
+                continue
+            values = pd.Series(data[column], dtype="object" if kind == "str" else kind)
+            if f"{column}__valid" in data.files:
+                values = values.where(data[f"{column}__valid"], None if kind == "str" else pd.NA)
+            columns[column] = values
+    return pd.DataFrame(columns)
+
+
+# ---------------------------------------------------------------------------
+# IPEDS admissions
+# ---------------------------------------------------------------------------
+
+IPEDS_MIN_APPLICATIONS = 100
+
+# Strict (<) thresholds, as the IPEDS training data has always used
+IPEDS_TIERS = ((0.10, "Elite"), (0.25, "Highly Selective"), (0.50, "Selective"))
+IPEDS_GPA_RANGES = {
+    "Elite": (3.88, 3.98),
+    "Highly Selective": (3.70, 3.90),
+    "Selective": (3.50, 3.75),
+    "Less Selective": (3.00, 3.60),
+}
+
+
+def _unit_interval(unitid: np.ndarray) -> np.ndarray:
+    """Deterministic value in [0, 1) per unitid (Knuth multiplicative hash)."""
+    return ((unitid.astype(np.uint64) * np.uint64(2654435761)) % np.uint64(2 ** 32)) / 2.0 ** 32
+
+
+def build_ipeds_admissions(admissions: pd.DataFrame, flags: pd.DataFrame) -> pd.DataFrame:
+    """IPEDS admissions with rates, score ranges, tiers and consideration labels."""
+    applications = admissions["APPLCN"]
+    rate = admissions["ADMSSN"] / applications.astype("float64")
+    out = pd.DataFrame({
+        "unitid": admissions["UNITID"],
+        "applications": applications,
+        "admitted": admissions["ADMSSN"],
+        "enrolled": admissions["ENRLT"],
+        "acceptance_rate": rate,
+        "sat_verbal_25": admissions["SATVR25"],
+        "sat_verbal_75": admissions["SATVR75"],
+        "sat_math_25": admissions["SATMT25"],
+        "sat_math_75": admissions["SATMT75"],
+        "sat_total_25": admissions["SATVR25"] + admissions["SATMT25"],
+        "sat_total_75": admissions["SATVR75"] + admissions["SATMT75"],
+        "act_composite_25": admissions["ACTCM25"],
+        "act_composite_75": admissions["ACTCM75"],
+        "act_english_25": admissions["ACTEN25"],
+        "act_english_75": admissions["ACTEN75"],
+        "act_math_25": admissions["ACTMT25"],
+        "act_math_75": admissions["ACTMT75"],
+    })
+
+    rate_values = rate.to_numpy(dtype=np.float64)
+    out["selectivity_tier"] = np.select(
+        [np.isnan(rate_values)] + [rate_values < threshold for threshold, _ in IPEDS_TIERS],
+        ["Unknown"] + [tier for _, tier in IPEDS_TIERS],
+        default="Less Selective",
+    )
+    reports_scores = (out["sat_total_25"] > 0) | (out["act_composite_25"] > 0)
+    out["test_policy"] = np.where(reports_scores, "Required", "Test-optional")
+    out["financial_aid_policy"] = "Need-blind"
+
+    # Spread within the tier's range by unitid, so a college keeps its estimate across refreshes
+    low = out["selectivity_tier"].map({tier: bounds[0] for tier, bounds in IPEDS_GPA_RANGES.items()})
+    high = out["selectivity_tier"].map({tier: bounds[1] for tier, bounds in IPEDS_GPA_RANGES.items()})
+    out["gpa_average"] = (low + (high - low) * _unit_interval(out["unitid"].to_numpy())).fillna(3.50)
+
+    status = admissions["UNITID"].map(flags.set_index("UNITID")["STAT_ADM"])
+    out["response_status"] = status.map(RESPONSE_STATUS_LABELS)
+    for i, name in enumerate(ADMISSION_CONSIDERATIONS, start=1):
+        out[f"consider_{name}"] = admissions[f"ADMCON{i}"].map(CONSIDERATION_LABELS)
+
+    keep = (
+        out["acceptance_rate"].gt(0)
+        & out["acceptance_rate"].le(1.0)
+        & out["applications"].ge(IPEDS_MIN_APPLICATIONS).fillna(False)
+    )
+    return apply_schema(out[keep.to_numpy()].reset_index(drop=True), SCHEMAS["ipeds"])
+
+
+def run_ipeds_stage() -> Dict[str, Any]:
+    admissions = _read_csv(IPEDS_ADMISSIONS_PATH, IPEDS_ADMISSIONS_DTYPES, encoding="utf-8-sig")
+    flags = _read_csv(IPEDS_FLAGS_PATH, IPEDS_FLAGS_DTYPES, encoding="utf-8-sig")
+    table = build_ipeds_admissions(admissions, flags)
+    table[IPEDS_CSV_COLUMNS].to_csv(IPEDS_CSV_PATH, index=False)
+    write_columnar(IPEDS_TABLE_PATH, table, SCHEMAS["ipeds"])
+    return {
+        "institutions": len(admissions),
+        "rows": len(table),
+        "imputed": int((table["response_status"] == "Imputed").sum()),
+        "tiers": {str(k): int(v) for k, v in table["selectivity_tier"].value_counts().items()},
+    }
+
+
+# ---------------------------------------------------------------------------
+# College catalog
+# ---------------------------------------------------------------------------
+
+COLLEGE_DETAILS_COLUMNS = {
+    "selectivity_label": "selectivity_tier",
+    "acceptance_rate_percent": "acceptance_rate",
+}
+CATALOG_UNITID_BASE = 1000000
+CATALOG_DEFAULTS = {
+    "data_completeness": 1.0,
+    "gpa_average": 3.5,
+    "test_policy": "Required",
+    "financial_aid_policy": "Need-blind",
+    "control": "Public",
+}
+MAJOR_COLUMNS = ("major_1", "major_2", "major_3")
+DEFAULT_MAJORS = ("Business", "Engineering", "Biology")
+
+# Elite colleges guaranteed to be in the catalog (2023-2024 data). Added only
+# when no catalog name contains them; the unitids are fixed so a rebuild
+# doesn't renumber them (they used to come from Python's per-process hash()).
+# name: (unitid, acceptance_rate, city, state, tuition)
+ELITE_COLLEGES: Dict[str, Tuple[int, float, str, str, int]] = {
+    "Harvard University": (2081252, 0.034, "Cambridge", "MA", 55587),
+    "Stanford University": (2020582, 0.034, "Stanford", "CA", 56169),
+    "Massachusetts Institute of Technology": (2054622, 0.041, "Cambridge", "MA", 55878),
+    "Yale University": (2041925, 0.053, "New Haven", "CT", 62250),
+    "Princeton University": (2077154, 0.044, "Princeton", "NJ", 56010),
+    "Columbia University": (2093939, 0.041, "New York", "NY", 63530),
+    "University of Pennsylvania": (2015521, 0.059, "Philadelphia", "PA", 61710),
+    "Dartmouth College": (2052078, 0.062, "Hanover", "NH", 60870),
+    "Brown University": (2015353, 0.055, "Providence", "RI", 62304),
+    "Cornell University": (2038209, 0.087, "Ithaca", "NY", 61015),
+    "Duke University": (2052682, 0.059, "Durham", "NC", 60244),
+    "Northwestern University": (2047046, 0.070, "Evanston", "IL", 65997),
+    "Vanderbilt University": (2064812, 0.071, "Nashville", "TN", 60920),
+    "Rice University": (2025423, 0.095, "Houston", "TX", 52895),
+    "Emory University": (2045374, 0.131, "Atlanta", "GA", 55468),
+    "Georgetown University": (2058218, 0.120, "Washington", "DC", 59957),
+    "Carnegie Mellon University": (2073268, 0.135, "Pittsburgh", "PA", 61030),
+    "New York University": (2014734, 0.130, "New York", "NY", 56500),
+    "University of Chicago": (2078392, 0.065, "Chicago", "IL", 66939),
+    "California Institute of Technology": (2028540, 0.031, "Pasadena", "CA", 63255),
+}
+
+# Fallback acceptance rate for a college with no reported rate, by tier
+TIER_ACCEPTANCE_DEFAULTS = {
+    "Elite": 0.08,
+    "Highly Selective": 0.20,
+    "Moderately Selective": 0.50,
+    "Less Selective": 0.80,
+}
+
+
+def _elite_rows(names: Sequence[str]) -> pd.DataFrame:
+    table = pd.DataFrame.from_dict(
+        {name: ELITE_COLLEGES[name] for name in names},
+        orient="index",
+        columns=["unitid", "acceptance_rate", "city", "state", "tuition_in_state_usd"],
+    ).rename_axis("name").reset_index()
+    return table.assign(
+        tuition_out_of_state_usd=table["tuition_in_state_usd"],
+        avg_net_price_usd=table["tuition_in_state_usd"] * 0.7,  # Estimate
+        accepted_per_year=np.nan,
+        applicants_total=np.nan,
+        student_body_size=pd.NA,
+        **dict(zip(MAJOR_COLUMNS, DEFAULT_MAJORS)),
+        **{**CATALOG_DEFAULTS, "gpa_average": 3.9, "control": "Private"},
+    )
+
+
+def build_catalog(details: pd.DataFrame, majors: pd.DataFrame) -> pd.DataFrame:
+    """The integrated college catalog (real_colleges_integrated.csv rows)."""
+    df = details.rename(columns=COLLEGE_DETAILS_COLUMNS)
+    df["acceptance_rate"] = df["acceptance_rate"] / 100.0
+    df["unitid"] = np.arange(CATALOG_UNITID_BASE, CATALOG_UNITID_BASE + len(df), dtype=np.int64)
+    df = df.assign(**CATALOG_DEFAULTS)
+
+    # Majors by exact name (the last row wins for a repeated name); unmatched colleges get defaults
+    by_name = majors.drop_duplicates("name", keep="last").set_index("name")
+    matched = df["name"].isin(by_name.index).to_numpy()
+    for column, default in zip(MAJOR_COLUMNS, DEFAULT_MAJORS):
+        df[column] = np.where(matched, df["name"].map(by_name[column]), default)
+
+    lowered = df["name"].str.lower()
+    missing = [
+        name for name in ELITE_COLLEGES
+        if not lowered.str.contains(name.lower(), regex=False, na=False).any()
+    ]
+    if missing:
+        logger.info(f"Adding elite colleges missing from the source: {missing}")
+        df = pd.concat([df, _elite_rows(missing)], ignore_index=True)
+
+    df["selectivity_tier"] = classify_selectivity(df["acceptance_rate"], missing="Moderately Selective")
+    df["acceptance_rate"] = df["acceptance_rate"].fillna(df["selectivity_tier"].map(TIER_ACCEPTANCE_DEFAULTS))
+    for column in ("tuition_in_state_usd", "tuition_out_of_state_usd"):
+        df[column] = df[column].fillna(df[column].median())
+    df[["city", "state"]] = df[["city", "state"]].fillna("Unknown")
+    return apply_schema(df, SCHEMAS["catalog"])
+
+
+def run_catalog_stage() -> Dict[str, Any]:
+    details = _read_csv(COLLEGE_DETAILS_PATH, COLLEGE_DETAILS_DTYPES)
+    majors = _read_csv(MAJORS_PATH, MAJORS_DTYPES)
+    catalog = build_catalog(details, majors)
+
+    report = check_catalog(catalog)
+    if report["errors"]:
+        raise CatalogValidationError("; ".join(report["errors"]))
+    for warning in report["warnings"]:
+        logger.warning(f"Catalog: {warning}")
+
+    catalog.to_csv(CATALOG_CSV_PATH, index=False)
+    write_columnar(CATALOG_TABLE_PATH, catalog, SCHEMAS["catalog"])
+    VALIDATION_REPORT_PATH.write_text(json.dumps(report, indent=2) + "\n")
+    return {
+        "rows": len(catalog),
+        "warnings": len(report["warnings"]),
+        "data_quality_score": report["data_quality_score"],
+    }
+
+
+# ---------------------------------------------------------------------------
+# Stage runner
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    inputs: Tuple[Path, ...]
+    outputs: Tuple[Path, ...]
+    run: Callable[[], Dict[str, Any]]
+
+
+STAGES: List[Stage] = [
+    Stage(
+        "ipeds",
+        (IPEDS_ADMISSIONS_PATH, IPEDS_FLAGS_PATH),
+        (IPEDS_CSV_PATH, IPEDS_TABLE_PATH),
+        run_ipeds_stage,
+    ),
+    Stage(
+        "catalog",
+        (COLLEGE_DETAILS_PATH, MAJORS_PATH),
+        (CATALOG_CSV_PATH, CATALOG_TABLE_PATH, VALIDATION_REPORT_PATH),
+        run_catalog_stage,
+    ),
+]
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _relative(path: Path) -> str:
+    try:
+        return str(path.relative_to(REPO_DIR))
+    except ValueError:
+        return str(path)
+
+
+def stage_fingerprint(stage: Stage) -> str:
+    """Hash of the stage's name, ETL_VERSION and the content of every input."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{stage.name}:{ETL_VERSION}".encode())
+    for path in stage.inputs:
+        digest.update(f"|{_relative(path)}:{file_digest(path)}".encode())
+    return digest.hexdigest()
+
+
+def _load_manifest() -> Dict[str, Any]:
+    try:
+        return json.loads(MANIFEST_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_current(stage: Stage, fingerprint: str, entry: Optional[Dict[str, Any]]) -> bool:
+    if not entry or entry.get("fingerprint") != fingerprint:
+        return False
+    # An output edited or deleted by hand also makes the stage stale
+    recorded = entry.get("outputs", {})
+    return all(
+        path.exists() and recorded.get(_relative(path)) == file_digest(path)
+        for path in stage.outputs
+    )
+
+
+def run_pipeline(stages: Optional[Sequence[str]] = None, force: bool = False) -> List[Dict[str, Any]]:
+    """
+    Run the selected stages (all by default), skipping those already current.
+
+    Returns:
+        List[Dict]: per stage, whether it ran or was skipped, its duration and stats
+    """
+    manifest = _load_manifest()
+    results = []
+    for stage in STAGES:
+        if stages and stage.name not in stages:
+            continue
+        started = time.perf_counter()
+        fingerprint = stage_fingerprint(stage)
+        if not force and _is_current(stage, fingerprint, manifest.get(stage.name)):
+            results.append({
+                "stage": stage.name,
+                "status": "skipped",
+                "seconds": time.perf_counter() - started,
+                "stats": manifest[stage.name].get("stats", {}),
+            })
+            continue
+
+        stats = stage.run()
+        manifest[stage.name] = {
+            "fingerprint": fingerprint,
+            "etl_version": ETL_VERSION,
+            "inputs": {_relative(path): file_digest(path) for path in stage.inputs},
+            "outputs": {_relative(path): file_digest(path) for path in stage.outputs},
+            "stats": stats,
+            "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+        MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+        results.append({
+            "stage": stage.name,
+            "status": "built",
+            "seconds": time.perf_counter() - started,
+            "stats": stats,
+        })
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stage", action="append", choices=[stage.name for stage in STAGES],
+                        help="run only this stage (repeatable)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if inputs are unchanged")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        results = run_pipeline(args.stage, force=args.force)
+    except CatalogValidationError as e:
+        print(f"Catalog ETL failed: {e}")
+        return 1
+
+    print(f"\n{'stage':10s} {'status':8s} {'seconds':>8s}  stats")
+    for row in results:
+        print(f"{row['stage']:10s} {row['status']:8s} {row['seconds']:8.3f}  {json.dumps(row['stats'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,105 +4,96 @@ City-State Database Service
 Provides mapping between colleges and their states for accurate zipcode-based tuition calculation
 """
 
-import pandas as pd
-import os
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
+
+from .college_identity import get_college_identity
+from .college_snapshot import get_college_snapshot
 
 logger = logging.getLogger(__name__)
 
+
+def normalize_city(city_name: str) -> str:
+    """Canonical form for city lookups: case, punctuation and 'St.'/'Saint' insensitive"""
+    city = ' '.join(str(city_name).lower().replace('.', ' ').replace('-', ' ').split())
+    if city.startswith('st '):
+        city = 'saint ' + city[3:]
+    elif city.startswith('ft '):
+        city = 'fort ' + city[3:]
+    return city
+
+
 class CityStateDatabase:
     def __init__(self):
         """Initialize the city-state database"""
         self.college_to_state = {}
-        self.city_to_state = {}
+        self.state_by_unitid: Dict[int, str] = {}
+        self.city_states: Dict[str, Set[str]] = {}
         self.load_database()
     
     def load_database(self):
-        """Load the college-to-state mapping from CSV files"""
+        """
+        Load the college-to-state mapping from College_State_Zip.csv and the
+        city -> states index from the college catalog (via the college snapshot)
+        """
         try:
-            # Load from College_State_Zip.csv
-            csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'College_State_Zip.csv')
-            if not os.path.exists(csv_path):
-                csv_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'College_State_Zip.csv')
+            snapshot = get_college_snapshot()
+            table = snapshot.table('college_state_zip')
+            logger.info(f"Loaded college-state mapping: {table.rows} colleges")
             
-            df = pd.read_csv(csv_path)
-            logger.info(f"Loaded college-state mapping: {len(df)} colleges")
-            
-            for _, row in df.iterrows():
-                college_name = str(row['College']).strip()
-                state = str(row['State']).strip()
+            for college, state_value in zip(table.values('College'), table.values('State')):
+                college_name = str(college).strip()
+                state = str(state_value).strip()
                 
                 # Store college to state mapping
                 self.college_to_state[college_name.lower()] = state
-                
-                # Extract city name from college name (simplified approach)
-                city_name = self.extract_city_from_college_name(college_name)
-                if city_name:
-                    self.city_to_state[city_name.lower()] = state
+
+            # By unitid: College_State_Zip rows first, the catalog's own state for the rest
+            self.state_by_unitid = get_college_identity().index(self.college_to_state)
+
+            # A city name can exist in several states (Portland, Springfield, ...)
+            colleges = snapshot.table('colleges')
+            for city, state, unitid in zip(colleges.values('city'), colleges.values('state'), colleges.values('unitid')):
+                if city and state:
+                    self.city_states.setdefault(normalize_city(city), set()).add(str(state).strip().upper())
+                if state and unitid is not None:
+                    self.state_by_unitid.setdefault(int(unitid), str(state).strip().upper())
+            logger.info(f"Indexed {len(self.city_states)} cities")
                     
         except Exception as e:
             logger.error(f"Error loading city-state database: {e}")
     
-    def extract_city_from_college_name(self, college_name: str) -> Optional[str]:
+    def get_state_for_college(self, college_name: str, unitid: Optional[int] = None) -> Optional[str]:
         """
-        Extract city name from college name using common patterns
+        Get state for a specific college
         
         Args:
-            college_name: Full college name
+            college_name: Name of the college
+            unitid: The college's catalog unitid, when the caller already resolved it
             
         Returns:
-            Extracted city name or None
+            State abbreviation or None if not found
         """
-        college_lower = college_name.lower()
-        
-        # Common patterns to extract city names
-        patterns = [
-            'university of',
-            'college of',
-            'state university',
-            'community college',
-            'technical college',
-            'university',
-            'college'
-        ]
-        
-        for pattern in patterns:
-            if pattern in college_lower:
-                # Extract the part after the pattern
-                parts = college_name.split(pattern, 1)
-                if len(parts) > 1:
-                    city_part = parts[1].strip()
-                    # Clean up the city name
-                    city_part = city_part.replace(' - ', ' ').replace('–', ' ').replace('—', ' ')
-                    city_part = city_part.split('(')[0].strip()  # Remove anything in parentheses
-                    city_part = city_part.split(',')[0].strip()  # Remove anything after comma
-                    
-                    if city_part and len(city_part) > 2:
-                        return city_part
-        
-        # If no pattern matches, try to extract the last meaningful word
-        words = college_name.split()
-        if len(words) > 1:
-            # Return the last word that's not a common suffix
-            common_suffixes = ['university', 'college', 'school', 'institute', 'academy']
-            for word in reversed(words):
-                if word.lower() not in common_suffixes and len(word) > 2:
-                    return word
-        
-        return None
+        state = self.college_to_state.get(college_name.lower().strip())
+        if state is None:
+            if unitid is None:
+                unitid = get_college_identity().resolve(college_name)
+            state = self.state_by_unitid.get(unitid)
+        return state
     
-    def get_state_for_college(self, college_name: str) -> Optional[str]:
+    def get_states_for_city(self, city_name: str) -> Set[str]:
         """
-        Get state for a specific college
+        Get every state with an indexed city of this name
         
         Args:
-            college_name: Name of the college
+            city_name: Name of the city
             
         Returns:
-            State abbreviation or None if not found
+            Set of state abbreviations (empty if the city is unknown)
         """
-        return self.college_to_state.get(college_name.lower())
+        if not city_name:
+            return set()
+        return self.city_states.get(normalize_city(city_name), set())
     
     def get_state_for_city(self, city_name: str) -> Optional[str]:
         """
@@ -112,9 +103,10 @@ class CityStateDatabase:
             city_name: Name of the city
             
         Returns:
-            State abbreviation or None if not found
+            State abbreviation, or None if the city is unknown or exists in several states
         """
-        return self.city_to_state.get(city_name.lower())
+        states = self.get_states_for_city(city_name)
+        return next(iter(states)) if len(states) == 1 else None
     
     def is_city_in_state(self, city_name: str, target_state: str) -> bool:
         """
@@ -125,12 +117,11 @@ class CityStateDatabase:
             target_state: State abbreviation (e.g., 'PA', 'CA')
             
         Returns:
-            True if city is in the target state, False otherwise
+            True if a city of this name is in the target state, False otherwise
         """
-        city_state = self.get_state_for_city(city_name)
-        if not city_state:
+        if not target_state:
             return False
-        return city_state.upper() == target_state.upper()
+        return target_state.strip().upper() in self.get_states_for_city(city_name)
 
 # Global instance
 city_state_database = CityStateDatabase()
@@ -1,11 +1,180 @@
 """
 College Data Validator and Cleaner
 Validates and fixes college data issues identified by user feedback
+
+Every check and fix is a masked column operation; ``check_catalog`` is the
+validation step of the catalog ETL (data.catalog_etl).
 """
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
+
+# Known correct data for validation
+KNOWN_CORRECT_DATA = {
+    'Tuskegee University': {
+        'acceptance_rate': 0.31,  # ~31% as verified by user
+        'selectivity_tier': 'Moderately Selective',  # Not "Highly Selective"
+        'city': 'Tuskegee',
+        'state': 'AL'
+    },
+    'California State Polytechnic University-Humboldt': {
+        'acceptance_rate': 0.85,  # Much lower than 98.8%
+        'selectivity_tier': 'Less Selective',
+        'city': 'Arcata',
+        'state': 'CA'
+    },
+    'Georgetown University': {
+        'acceptance_rate': 0.12,  # ~12% as shown in data
+        'selectivity_tier': 'Elite',
+        'city': 'Washington',
+        'state': 'DC'
+    },
+    'New York University': {
+        'acceptance_rate': 0.13,  # ~13% as shown in data
+        'selectivity_tier': 'Elite',
+        'city': 'New York',
+        'state': 'NY'
+    },
+    'Emory University': {
+        'acceptance_rate': 0.13,  # ~13% as shown in data
+        'selectivity_tier': 'Elite',
+        'city': 'Atlanta',
+        'state': 'GA'
+    },
+    'California Institute of Technology': {
+        'acceptance_rate': 0.03,  # ~3% as verified by user
+        'selectivity_tier': 'Elite',
+        'city': 'Pasadena',
+        'state': 'CA'
+    }
+}
+
+# Upper acceptance-rate bound (inclusive) of each tier; anything above is Less Selective
+SELECTIVITY_THRESHOLDS = (
+    (0.10, 'Elite'),
+    (0.25, 'Highly Selective'),
+    (0.60, 'Moderately Selective'),
+)
+
+# Average acceptance rate per tier, used when a college has none
+TIER_ACCEPTANCE_ESTIMATES = {
+    'Elite': 0.08,           # ~8% average for elite schools
+    'Highly Selective': 0.20, # ~20% average for highly selective
+    'Moderately Selective': 0.50, # ~50% average for moderately selective
+    'Less Selective': 0.80   # ~80% average for less selective
+}
+
+NAME_FIXES = {
+    'California State Polytechnic University-Humboldt': 'Cal Poly Humboldt',
+    'University of California--Berkeley': 'University of California Berkeley',
+    'University of California--Los Angeles': 'University of California Los Angeles',
+    'University of California--San Diego': 'University of California San Diego',
+    'University of Illinois--Urbana-Champaign': 'University of Illinois Urbana-Champaign',
+    'University of Michigan--Ann Arbor': 'University of Michigan Ann Arbor',
+    'University of North Carolina--Chapel Hill': 'University of North Carolina Chapel Hill',
+    'University of Texas--Austin': 'University of Texas Austin',
+    'University of Wisconsin--Madison': 'University of Wisconsin Madison'
+}
+
+
+def classify_selectivity(acceptance_rates: pd.Series, missing: str = 'Less Selective') -> np.ndarray:
+    """Selectivity tier for every acceptance rate at once (``missing`` for NaN)"""
+    rates = pd.to_numeric(acceptance_rates, errors='coerce').to_numpy(dtype=np.float64)
+    return np.select(
+        [np.isnan(rates)] + [rates <= threshold for threshold, _ in SELECTIVITY_THRESHOLDS],
+        [missing] + [tier for _, tier in SELECTIVITY_THRESHOLDS],
+        default='Less Selective',
+    )
+
+
+def data_quality_score(df: pd.DataFrame) -> float:
+    """Share (0-100) of name/acceptance_rate/city/state fields that are filled in"""
+    total_fields = len(df) * 4
+    if total_fields == 0:
+        return 0.0
+    missing_fields = int(df[['name', 'acceptance_rate', 'city', 'state']].isna().to_numpy().sum())
+    return max(0, 100 - (missing_fields / total_fields * 100))
+
+
+def _known_frame() -> pd.DataFrame:
+    return pd.DataFrame.from_dict(KNOWN_CORRECT_DATA, orient='index').rename_axis('name')
+
+
+def _known_data_issues(df: pd.DataFrame) -> List[str]:
+    """Mismatches against KNOWN_CORRECT_DATA (first row per name), one join instead of a lookup per college"""
+    known = _known_frame()
+    present = df.drop_duplicates('name').set_index('name')
+    issues = [f"Missing college: {name}" for name in known.index.difference(present.index, sort=False)]
+    joined = known.join(present[['acceptance_rate', 'selectivity_tier', 'city', 'state']], how='inner', rsuffix='_actual')
+
+    rate_off = (joined['acceptance_rate_actual'] - joined['acceptance_rate']).abs() > 0.05
+    issues += [
+        f"Acceptance rate mismatch for {name}: {actual:.1%} vs expected {expected:.1%}"
+        for name, actual, expected in zip(joined.index[rate_off], joined['acceptance_rate_actual'][rate_off], joined['acceptance_rate'][rate_off])
+    ]
+    for column, label in (('selectivity_tier', 'Selectivity tier'), ('city', 'City'), ('state', 'State')):
+        off = joined[f'{column}_actual'] != joined[column]
+        issues += [
+            f"{label} mismatch for {name}: {actual} vs expected {expected}"
+            for name, actual, expected in zip(joined.index[off], joined[f'{column}_actual'][off], joined[column][off])
+        ]
+    return issues
+
+
+def check_catalog(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Validate a built catalog with masked column checks (see data.catalog_etl).
+
+    Errors make the catalog unusable (missing/duplicate unitids, empty names,
+    acceptance rates missing or outside [0, 1], negative tuition); warnings
+    are reported but don't block a build.
+    """
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    def count(mask: pd.Series) -> int:
+        return int(mask.sum())
+
+    if count(df['unitid'].isna()):
+        errors.append(f"{count(df['unitid'].isna())} colleges without a unitid")
+    duplicated_ids = df['unitid'].dropna().duplicated(keep=False)
+    if duplicated_ids.any():
+        errors.append(f"Duplicate unitids: {sorted(set(df['unitid'].dropna()[duplicated_ids].astype(int)))}")
+    empty_names = df['name'].isna() | (df['name'].astype(str).str.strip() == '')
+    if empty_names.any():
+        errors.append(f"{count(empty_names)} colleges without a name")
+    rates = pd.to_numeric(df['acceptance_rate'], errors='coerce')
+    bad_rates = ~(rates.ge(0) & rates.le(1))
+    if bad_rates.any():
+        errors.append(f"Acceptance rate missing or outside [0, 1] for: {df.loc[bad_rates, 'name'].tolist()[:20]}")
+    # Net price can legitimately be negative (aid above cost); tuition can't
+    for column in ('tuition_in_state_usd', 'tuition_out_of_state_usd'):
+        negative = pd.to_numeric(df[column], errors='coerce').lt(0)
+        if negative.any():
+            errors.append(f"Negative {column} for: {df.loc[negative, 'name'].tolist()[:20]}")
+
+    no_admits = rates.eq(0)
+    if no_admits.any():
+        warnings.append(f"Acceptance rate of 0 (no admits reported) for: {df.loc[no_admits, 'name'].tolist()}")
+    duplicated_names = df['name'].duplicated(keep=False)
+    if duplicated_names.any():
+        warnings.append(f"Duplicate names: {sorted(set(df.loc[duplicated_names, 'name']))}")
+    mistiered = df['selectivity_tier'].to_numpy() != classify_selectivity(rates, missing='Moderately Selective')
+    if mistiered.any():
+        warnings.append(f"{int(mistiered.sum())} selectivity tiers disagree with the acceptance rate")
+    bad_states = ~(df['state'].astype(str).str.fullmatch(r'[A-Z]{2}') | (df['state'] == 'Unknown'))
+    if bad_states.any():
+        warnings.append(f"Unrecognized states: {sorted(set(df.loc[bad_states, 'state'].astype(str)))}")
+    warnings += _known_data_issues(df)
+
+    return {
+        'total_colleges': len(df),
+        'errors': errors,
+        'warnings': warnings,
+        'data_quality_score': round(data_quality_score(df), 2),
+    }
+
 
 class CollegeDataValidator:
     def __init__(self, csv_path: str = 'backend/data/raw/integrated_colleges_with_elite.csv'):
@@ -14,45 +183,7 @@ class CollegeDataValidator:
         self.issues_found = []
         self.fixes_applied = []
         
-        # Known correct data for validation
-        self.known_correct_data = {
-            'Tuskegee University': {
-                'acceptance_rate': 0.31,  # ~31% as verified by user
-                'selectivity_tier': 'Moderately Selective',  # Not "Highly Selective"
-                'city': 'Tuskegee',
-                'state': 'AL'
-            },
-            'California State Polytechnic University-Humboldt': {
-                'acceptance_rate': 0.85,  # Much lower than 98.8%
-                'selectivity_tier': 'Less Selective',
-                'city': 'Arcata',
-                'state': 'CA'
-            },
-            'Georgetown University': {
-                'acceptance_rate': 0.12,  # ~12% as shown in data
-                'selectivity_tier': 'Elite',
-                'city': 'Washington',
-                'state': 'DC'
-            },
-            'New York University': {
-                'acceptance_rate': 0.13,  # ~13% as shown in data
-                'selectivity_tier': 'Elite',
-                'city': 'New York',
-                'state': 'NY'
-            },
-            'Emory University': {
-                'acceptance_rate': 0.13,  # ~13% as shown in data
-                'selectivity_tier': 'Elite',
-                'city': 'Atlanta',
-                'state': 'GA'
-            },
-            'California Institute of Technology': {
-                'acceptance_rate': 0.03,  # ~3% as verified by user
-                'selectivity_tier': 'Elite',
-                'city': 'Pasadena',
-                'state': 'CA'
-            }
-        }
+        self.known_correct_data = KNOWN_CORRECT_DATA
 
     def validate_and_fix_data(self) -> pd.DataFrame:
         """Validate and fix all identified data issues"""
@@ -93,124 +224,63 @@ class CollegeDataValidator:
 
     def _fix_missing_acceptance_rates(self):
         """Fix missing acceptance rates using known data or estimates"""
-        missing_rates = self.df['acceptance_rate'].isna().sum()
-        
-        for idx, row in self.df.iterrows():
-            if pd.isna(row['acceptance_rate']):
-                college_name = row['name']
-                
-                # Use known correct data if available
-                if college_name in self.known_correct_data:
-                    correct_rate = self.known_correct_data[college_name]['acceptance_rate']
-                    self.df.at[idx, 'acceptance_rate'] = correct_rate
-                    self.fixes_applied.append(f"Fixed missing acceptance rate for {college_name}: {correct_rate:.1%}")
-                else:
-                    # Estimate based on selectivity tier
-                    estimated_rate = self._estimate_acceptance_rate(row['selectivity_tier'])
-                    self.df.at[idx, 'acceptance_rate'] = estimated_rate
-                    self.fixes_applied.append(f"Estimated acceptance rate for {college_name}: {estimated_rate:.1%}")
+        missing = self.df['acceptance_rate'].isna()
+        if not missing.any():
+            return
+        names = self.df.loc[missing, 'name']
+        known = names.map({name: data['acceptance_rate'] for name, data in self.known_correct_data.items()})
+        estimated = self.df.loc[missing, 'selectivity_tier'].map(TIER_ACCEPTANCE_ESTIMATES).fillna(0.50)
+        self.df.loc[missing, 'acceptance_rate'] = known.fillna(estimated)
+
+        self.fixes_applied.extend(
+            f"Fixed missing acceptance rate for {name}: {rate:.1%}" if is_known
+            else f"Estimated acceptance rate for {name}: {rate:.1%}"
+            for name, rate, is_known in zip(names, known.fillna(estimated), known.notna())
+        )
 
     def _estimate_acceptance_rate(self, selectivity_tier: str) -> float:
         """Estimate acceptance rate based on selectivity tier"""
-        estimates = {
-            'Elite': 0.08,           # ~8% average for elite schools
-            'Highly Selective': 0.20, # ~20% average for highly selective
-            'Moderately Selective': 0.50, # ~50% average for moderately selective
-            'Less Selective': 0.80   # ~80% average for less selective
-        }
-        return estimates.get(selectivity_tier, 0.50)
+        return TIER_ACCEPTANCE_ESTIMATES.get(selectivity_tier, 0.50)
 
     def _fix_selectivity_classifications(self):
         """Fix incorrect selectivity classifications"""
-        for idx, row in self.df.iterrows():
-            college_name = row['name']
-            current_tier = row['selectivity_tier']
-            acceptance_rate = row['acceptance_rate']
-            
-            # Use known correct data if available
-            if college_name in self.known_correct_data:
-                correct_tier = self.known_correct_data[college_name]['selectivity_tier']
-                if current_tier != correct_tier:
-                    self.df.at[idx, 'selectivity_tier'] = correct_tier
-                    self.fixes_applied.append(f"Fixed selectivity tier for {college_name}: {current_tier} -> {correct_tier}")
-            else:
-                # Classify based on acceptance rate
-                correct_tier = self._classify_by_acceptance_rate(acceptance_rate)
-                if current_tier != correct_tier:
-                    self.df.at[idx, 'selectivity_tier'] = correct_tier
-                    self.fixes_applied.append(f"Fixed selectivity tier for {college_name}: {current_tier} -> {correct_tier}")
+        known_tiers = self.df['name'].map({name: data['selectivity_tier'] for name, data in self.known_correct_data.items()})
+        # Use known correct data if available, otherwise classify by acceptance rate
+        correct = known_tiers.fillna(pd.Series(classify_selectivity(self.df['acceptance_rate']), index=self.df.index))
+        changed = self.df['selectivity_tier'] != correct
+
+        self.fixes_applied.extend(
+            f"Fixed selectivity tier for {name}: {current} -> {tier}"
+            for name, current, tier in zip(self.df.loc[changed, 'name'], self.df.loc[changed, 'selectivity_tier'], correct[changed])
+        )
+        self.df.loc[changed, 'selectivity_tier'] = correct[changed]
 
     def _classify_by_acceptance_rate(self, acceptance_rate: float) -> str:
         """Classify selectivity based on acceptance rate"""
-        if acceptance_rate <= 0.10:
-            return 'Elite'
-        elif acceptance_rate <= 0.25:
-            return 'Highly Selective'
-        elif acceptance_rate <= 0.60:
-            return 'Moderately Selective'
-        else:
-            return 'Less Selective'
+        return str(classify_selectivity(pd.Series([acceptance_rate]))[0])
 
     def _fix_missing_locations(self):
         """Fix missing city/state data"""
-        for idx, row in self.df.iterrows():
-            college_name = row['name']
-            
-            # Use known correct data if available
-            if college_name in self.known_correct_data:
-                correct_data = self.known_correct_data[college_name]
-                if pd.isna(row['city']):
-                    self.df.at[idx, 'city'] = correct_data['city']
-                    self.fixes_applied.append(f"Fixed missing city for {college_name}: {correct_data['city']}")
-                if pd.isna(row['state']):
-                    self.df.at[idx, 'state'] = correct_data['state']
-                    self.fixes_applied.append(f"Fixed missing state for {college_name}: {correct_data['state']}")
+        for column in ('city', 'state'):
+            known = self.df['name'].map({name: data[column] for name, data in self.known_correct_data.items()})
+            fixable = self.df[column].isna() & known.notna()
+            self.df.loc[fixable, column] = known[fixable]
+            self.fixes_applied.extend(
+                f"Fixed missing {column} for {name}: {value}"
+                for name, value in zip(self.df.loc[fixable, 'name'], known[fixable])
+            )
 
     def _fix_school_names(self):
         """Fix inconsistent school names"""
-        name_fixes = {
-            'California State Polytechnic University-Humboldt': 'Cal Poly Humboldt',
-            'University of California--Berkeley': 'University of California Berkeley',
-            'University of California--Los Angeles': 'University of California Los Angeles',
-            'University of California--San Diego': 'University of California San Diego',
-            'University of Illinois--Urbana-Champaign': 'University of Illinois Urbana-Champaign',
-            'University of Michigan--Ann Arbor': 'University of Michigan Ann Arbor',
-            'University of North Carolina--Chapel Hill': 'University of North Carolina Chapel Hill',
-            'University of Texas--Austin': 'University of Texas Austin',
-            'University of Wisconsin--Madison': 'University of Wisconsin Madison'
-        }
-        
-        for idx, row in self.df.iterrows():
-            college_name = row['name']
-            if college_name in name_fixes:
-                new_name = name_fixes[college_name]
-                self.df.at[idx, 'name'] = new_name
-                self.fixes_applied.append(f"Fixed school name: {college_name} -> {new_name}")
+        renamed = self.df['name'].isin(NAME_FIXES.keys())
+        self.fixes_applied.extend(
+            f"Fixed school name: {name} -> {NAME_FIXES[name]}" for name in self.df.loc[renamed, 'name']
+        )
+        self.df.loc[renamed, 'name'] = self.df.loc[renamed, 'name'].map(NAME_FIXES)
 
     def _validate_against_known_data(self):
         """Validate data against known correct values"""
-        for college_name, correct_data in self.known_correct_data.items():
-            college_row = self.df[self.df['name'] == college_name]
-            if len(college_row) == 0:
-                self.issues_found.append(f"Missing college: {college_name}")
-                continue
-                
-            row = college_row.iloc[0]
-            
-            # Check acceptance rate
-            if abs(row['acceptance_rate'] - correct_data['acceptance_rate']) > 0.05:
-                self.issues_found.append(f"Acceptance rate mismatch for {college_name}: {row['acceptance_rate']:.1%} vs expected {correct_data['acceptance_rate']:.1%}")
-            
-            # Check selectivity tier
-            if row['selectivity_tier'] != correct_data['selectivity_tier']:
-                self.issues_found.append(f"Selectivity tier mismatch for {college_name}: {row['selectivity_tier']} vs expected {correct_data['selectivity_tier']}")
-            
-            # Check location
-            if row['city'] != correct_data['city']:
-                self.issues_found.append(f"City mismatch for {college_name}: {row['city']} vs expected {correct_data['city']}")
-            
-            if row['state'] != correct_data['state']:
-                self.issues_found.append(f"State mismatch for {college_name}: {row['state']} vs expected {correct_data['state']}")
+        self.issues_found.extend(_known_data_issues(self.df))
 
     def get_validation_report(self) -> Dict:
         """Get a comprehensive validation report"""
@@ -223,14 +293,7 @@ class CollegeDataValidator:
 
     def _calculate_data_quality_score(self) -> float:
         """Calculate overall data quality score (0-100)"""
-        total_fields = len(self.df) * 4  # name, acceptance_rate, city, state
-        missing_fields = (
-            self.df['name'].isna().sum() +
-            self.df['acceptance_rate'].isna().sum() +
-            self.df['city'].isna().sum() +
-            self.df['state'].isna().sum()
-        )
-        return max(0, 100 - (missing_fields / total_fields * 100))
+        return data_quality_score(self.df)
 
     def save_cleaned_data(self, output_path: str = 'backend/data/raw/cleaned_colleges.csv'):
         """Save the cleaned data to a new file"""
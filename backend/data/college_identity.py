@@ -0,0 +1,371 @@
+"""
+College Identity Resolution
+
+Maps any college reference a request can carry (a catalog unitid, a
+``college_<unitid>`` id, an official name, a nickname / abbreviation or a
+partial name) to one catalog ``unitid``, so every service reading per-college
+data (tuition, subject emphasis, state, elite calibration, improvement
+baselines) agrees on which college a string means.
+
+Resolution order:
+
+1. unitid forms
+2. exact name, after normalization (case, punctuation, '&' / 'and')
+3. aliases: COMMON_NICKNAMES, the names & nicknames workbook, and the
+   tuition file's College -> matched IPEDS name column
+4. the shortest catalog name containing the query as whole words, else the
+   longest catalog name the query contains
+
+An alias target resolves exactly, else to the shortest catalog name
+containing it as whole words ("Georgia Institute of Technology" ->
+"...-Main Campus"); aliases whose target still matches nothing are dropped
+and logged. COMMON_NICKNAMES targets the catalog lacks (UT Austin, WashU, ...)
+are added as off-catalog colleges with a stable id derived from the name, so
+per-college data keyed by them keeps resolving.
+
+Each input string is resolved once and memoized. Name-keyed per-college data
+is re-keyed with ``CollegeIdentity.index`` (exact / alias matches only, never
+partial), so once a request holds a unitid every lookup is a dict hit.
+"""
+
+import logging
+import re
+import threading
+import zlib
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, TypeVar, Union
+
+from .college_snapshot import get_college_snapshot
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+# Upper bound on memoized input string -> unitid resolutions
+MEMO_SIZE = 10000
+# Shorter queries only resolve exactly or through an alias
+MIN_PARTIAL_CHARS = 3
+# Off-catalog college ids: this base + CRC32 of the normalized name (above every IPEDS / ETL unitid)
+OFF_CATALOG_UNITID_BASE = 10_000_000_000
+
+_NON_WORD = re.compile(r"[^\w\s]")
+
+# Hand-maintained nicknames and abbreviations -> official (catalog) names
+COMMON_NICKNAMES: Dict[str, str] = {
+    # MIT and similar
+    'mit': 'Massachusetts Institute of Technology',
+    'massachusetts institute of technology': 'Massachusetts Institute of Technology',
+
+    # Ivy League
+    'harvard': 'Harvard University',
+    'harvard university': 'Harvard University',
+    'yale': 'Yale University',
+    'yale university': 'Yale University',
+    'princeton': 'Princeton University',
+    'princeton university': 'Princeton University',
+    'columbia': 'Columbia University',
+    'columbia university': 'Columbia University',
+    'upenn': 'University of Pennsylvania',
+    'penn': 'University of Pennsylvania',
+    'university of pennsylvania': 'University of Pennsylvania',
+    'brown': 'Brown University',
+    'brown university': 'Brown University',
+    'dartmouth': 'Dartmouth College',
+    'dartmouth college': 'Dartmouth College',
+    'cornell': 'Cornell University',
+    'cornell university': 'Cornell University',
+
+    # Other top schools
+    'stanford': 'Stanford University',
+    'stanford university': 'Stanford University',
+    'caltech': 'California Institute of Technology',
+    'california institute of technology': 'California Institute of Technology',
+    'carnegie mellon': 'Carnegie Mellon University',
+    'cmu': 'Carnegie Mellon University',
+    'duke': 'Duke University',
+    'duke university': 'Duke University',
+    'northwestern': 'Northwestern University',
+    'northwestern university': 'Northwestern University',
+    'rice': 'Rice University',
+    'rice university': 'Rice University',
+    'vanderbilt': 'Vanderbilt University',
+    'vanderbilt university': 'Vanderbilt University',
+    'notre dame': 'University of Notre Dame',
+    'university of notre dame': 'University of Notre Dame',
+
+    # UC System
+    'uc berkeley': 'University of California-Berkeley',
+    'berkeley': 'University of California-Berkeley',
+    'ucla': 'University of California-Los Angeles',
+    'uc los angeles': 'University of California-Los Angeles',
+    'uc san diego': 'University of California-San Diego',
+    'ucsd': 'University of California-San Diego',
+    'uc irvine': 'University of California-Irvine',
+    'uci': 'University of California-Irvine',
+    'uc davis': 'University of California-Davis',
+    'uc santa barbara': 'University of California-Santa Barbara',
+    'ucsb': 'University of California-Santa Barbara',
+    'uc santa cruz': 'University of California-Santa Cruz',
+    'ucsc': 'University of California-Santa Cruz',
+    'uc riverside': 'University of California-Riverside',
+    'uc merced': 'University of California-Merced',
+
+    # State schools
+    'umich': 'University of Michigan-Ann Arbor',
+    'university of michigan': 'University of Michigan-Ann Arbor',
+    'michigan': 'University of Michigan-Ann Arbor',
+    'georgia tech': 'Georgia Institute of Technology',
+    'gatech': 'Georgia Institute of Technology',
+    'unc': 'University of North Carolina at Chapel Hill',
+    'unc chapel hill': 'University of North Carolina at Chapel Hill',
+    'uva': 'University of Virginia',
+    'university of virginia': 'University of Virginia',
+    'ut austin': 'University of Texas at Austin',
+    'university of texas austin': 'University of Texas at Austin',
+    'texas': 'University of Texas at Austin',
+    'penn state': 'Pennsylvania State University-Main Campus',
+    'ohio state': 'Ohio State University-Main Campus',
+    'osu': 'Ohio State University-Main Campus',
+    'florida': 'University of Florida',
+    'university of florida': 'University of Florida',
+    'uf': 'University of Florida',
+
+    # Private schools
+    'nyu': 'New York University',
+    'new york university': 'New York University',
+    'usc': 'University of Southern California',
+    'university of southern california': 'University of Southern California',
+    'boston college': 'Boston College',
+    'bc': 'Boston College',
+    'tufts': 'Tufts University',
+    'tufts university': 'Tufts University',
+    'brandeis': 'Brandeis University',
+    'brandeis university': 'Brandeis University',
+    'wake forest': 'Wake Forest University',
+    'wake forest university': 'Wake Forest University',
+    'emory': 'Emory University',
+    'emory university': 'Emory University',
+    'georgetown': 'Georgetown University',
+    'georgetown university': 'Georgetown University',
+    'johns hopkins': 'Johns Hopkins University',
+    'jhu': 'Johns Hopkins University',
+    'washu': 'Washington University in St Louis',
+    'wustl': 'Washington University in St Louis',
+    'washington university': 'Washington University in St Louis',
+    'washington university st louis': 'Washington University in St Louis',
+    'case western': 'Case Western Reserve University',
+    'case western reserve': 'Case Western Reserve University',
+    'cwr': 'Case Western Reserve University',
+}
+
+
+def normalize_college_name(name: str) -> str:
+    """Canonical form for name matching: lower case, '&' as 'and', punctuation as spaces."""
+    text = str(name).lower().replace("&", " and ")
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def off_catalog_unitid(name: str) -> int:
+    """Stable id for a college outside the catalog (same name -> same id across builds)."""
+    return OFF_CATALOG_UNITID_BASE + zlib.crc32(normalize_college_name(name).encode("utf-8"))
+
+
+def _unitid_form(college: Union[str, int]) -> Optional[int]:
+    """The unitid in ``123``, ``"123"`` or ``"college_123"``, else None."""
+    if isinstance(college, bool):
+        return None
+    if isinstance(college, int):
+        return college
+    text = str(college).strip()
+    if text.startswith("college_"):
+        text = text[len("college_"):]
+    return int(text) if text.isdigit() else None
+
+
+class CollegeIdentity:
+    """Catalog name / alias indexes with a memoized resolve()."""
+
+    def __init__(
+        self,
+        colleges: Iterable[Tuple[str, int]],
+        aliases: Optional[Mapping[str, str]] = None,
+    ):
+        """
+        Args:
+            colleges: (name, unitid) catalog rows; the first row wins for a repeated name
+            aliases: Alias -> catalog name (later entries win); a target matches exactly or as
+                whole words of a longer catalog name, and aliases whose target matches nothing are dropped
+        """
+        self.names: Dict[int, str] = {}
+        self._by_name: Dict[str, int] = {}
+        for name, unitid in colleges:
+            if not name or unitid is None:
+                continue
+            unitid = int(unitid)
+            self.names.setdefault(unitid, str(name).strip())
+            self._by_name.setdefault(normalize_college_name(name), unitid)
+
+        # Shortest names first (stable, so catalog order breaks ties), padded for whole-word matching
+        self._padded: List[Tuple[str, int]] = [
+            (f" {key} ", unitid) for key, unitid in sorted(self._by_name.items(), key=lambda item: len(item[0]))
+        ]
+
+        self._aliases: Dict[str, int] = {}
+        dropped: List[str] = []
+        for alias, target in (aliases or {}).items():
+            key = normalize_college_name(alias)
+            if not key or key in self._by_name:
+                continue
+            unitid = self.target(target)
+            if unitid is not None:
+                self._aliases[key] = unitid
+            elif key != normalize_college_name(target):
+                dropped.append(f"{alias} -> {target}")
+        if dropped:
+            logger.warning(
+                f"Dropped {len(dropped)} college aliases whose target is not in the catalog, "
+                f"e.g. {dropped[:5]}"
+            )
+            logger.debug(f"Dropped college aliases: {dropped}")
+        self._memo: Dict[str, Optional[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, unitid: int) -> bool:
+        return unitid in self.names
+
+    def name(self, unitid: Optional[int]) -> Optional[str]:
+        """Catalog name for a unitid."""
+        return self.names.get(unitid)
+
+    def exact(self, college: Union[str, int, None]) -> Optional[int]:
+        """unitid by unitid form, exact normalized name or alias (no partial matching)."""
+        if college is None:
+            return None
+        unitid = _unitid_form(college)
+        if unitid is not None:
+            return unitid if unitid in self.names else None
+        key = normalize_college_name(college)
+        return self._by_name.get(key, self._aliases.get(key))
+
+    def target(self, name: str) -> Optional[int]:
+        """unitid of an alias target: exact normalized name, else the shortest catalog name containing it."""
+        key = normalize_college_name(name)
+        unitid = self._by_name.get(key)
+        if unitid is None and key:
+            padded = f" {key} "
+            unitid = next((unitid for name, unitid in self._padded if padded in name), None)
+        return unitid
+
+    def _partial(self, key: str) -> Optional[int]:
+        if len(key) < MIN_PARTIAL_CHARS:
+            return None
+        padded = f" {key} "
+        for name, unitid in self._padded:
+            if padded in name:
+                return unitid
+        for name, unitid in reversed(self._padded):
+            if name in padded:
+                return unitid
+        return None
+
+    def resolve(self, college: Union[str, int, None]) -> Optional[int]:
+        """
+        unitid for any college reference (None if nothing matches)
+
+        Args:
+            college: unitid, ``college_<unitid>`` id, name, nickname or partial name
+        """
+        if college is None:
+            return None
+        memo_key = college if isinstance(college, str) else str(college)
+        try:
+            return self._memo[memo_key]
+        except KeyError:
+            pass
+        unitid = self.exact(college)
+        if unitid is None and _unitid_form(college) is None:
+            unitid = self._partial(normalize_college_name(college))
+        if len(self._memo) < MEMO_SIZE:
+            self._memo[memo_key] = unitid
+        return unitid
+
+    def index(self, data: Mapping[str, V]) -> Dict[int, V]:
+        """
+        Re-key name-keyed per-college data by unitid
+
+        Keys match exactly or through an alias; the first key for a unitid wins.
+        """
+        by_unitid: Dict[int, V] = {}
+        for name, value in data.items():
+            unitid = self.exact(name)
+            if unitid is not None:
+                by_unitid.setdefault(unitid, value)
+        return by_unitid
+
+
+def _snapshot_aliases(snapshot) -> Dict[str, str]:
+    aliases: Dict[str, str] = {}
+    if snapshot.has_table("college_names"):
+        table = snapshot.table("college_names")
+        official = "Official Name" if "Official Name" in table else "Official_Name"
+        for column in ("Common Name", "Common_Name", "Abbreviation"):
+            if column not in table:
+                continue
+            for alias, target in zip(table.values(column), table.values(official)):
+                if alias and target and str(alias).strip().lower() != "nan":
+                    aliases.setdefault(str(alias).strip(), str(target).strip())
+    if snapshot.has_table("tuition_inout"):
+        table = snapshot.table("tuition_inout")
+        for alias, target in zip(table.values("College"), table.values("Matched_INSTNM")):
+            if alias and target:
+                aliases.setdefault(str(alias).strip(), str(target).strip())
+    return aliases
+
+
+def build_college_identity() -> CollegeIdentity:
+    """
+    Identity over the snapshot's college catalog, plus the ETL's fixed-unitid
+    elite colleges when the catalog predates them and the COMMON_NICKNAMES
+    targets it lacks (off-catalog ids)
+    """
+    from .catalog_etl import ELITE_COLLEGES
+
+    colleges: List[Tuple[str, int]] = []
+    aliases: Dict[str, str] = {}
+    try:
+        snapshot = get_college_snapshot()
+        table = snapshot.table("colleges")
+        colleges = [(name, unitid) for name, unitid in zip(table.values("name"), table.values("unitid"))]
+        aliases = _snapshot_aliases(snapshot)
+    except Exception as e:
+        logger.error(f"College identity built without the catalog: {e}")
+
+    # The hand-maintained nicknames win over the workbook, as in CollegeNicknameMapper
+    aliases.update(COMMON_NICKNAMES)
+    known = {normalize_college_name(name) for name, _ in colleges if name}
+    colleges += [
+        (name, row[0]) for name, row in ELITE_COLLEGES.items() if normalize_college_name(name) not in known
+    ]
+    catalog = CollegeIdentity(colleges)
+    off_catalog = sorted({name for name in COMMON_NICKNAMES.values() if catalog.target(name) is None})
+    if off_catalog:
+        logger.info(f"Nickname targets outside the catalog, added with off-catalog ids: {off_catalog}")
+    colleges += [(name, off_catalog_unitid(name)) for name in off_catalog]
+    identity = CollegeIdentity(colleges, aliases)
+    logger.info(f"College identity: {len(identity)} colleges, {len(aliases)} aliases")
+    return identity
+
+
+_identity: Optional[CollegeIdentity] = None
+_identity_lock = threading.Lock()
+
+
+def get_college_identity() -> CollegeIdentity:
+    """Get the global college identity resolver (built on first use)."""
+    global _identity
+    if _identity is None:
+        with _identity_lock:
+            if _identity is None:
+                _identity = build_college_identity()
+    return _identity
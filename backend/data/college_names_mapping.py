@@ -6,11 +6,11 @@ This module loads and manages the college names and nicknames data from the Exce
 providing fuzzy search capabilities for college names, common names, and abbreviations.
 """
 
-import pandas as pd
-import os
 from typing import Dict, List, Optional, Tuple
 import re
 
+from .college_snapshot import get_college_snapshot
+
 class CollegeNamesMapping:
     def __init__(self):
         """Initialize the college names mapping system"""
@@ -19,22 +19,21 @@ class CollegeNamesMapping:
         self.load_mapping_data()
     
     def load_mapping_data(self):
-        """Load college names and nicknames from Excel file"""
+        """Load college names and nicknames from the Excel workbook (via the college snapshot)"""
         try:
-            # Load the Excel file
-            excel_path = os.path.join(os.path.dirname(__file__), '..', '..', 'therealdatabase', 'College_Names_and_Nicknames.xlsx')
-            # Alternative path if the above doesn't work
-            if not os.path.exists(excel_path):
-                excel_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'therealdatabase', 'College_Names_and_Nicknames.xlsx')
-            df = pd.read_excel(excel_path)
+            table = get_college_snapshot().table('college_names')
             
-            print(f"Loaded college names mapping: {len(df)} colleges")
+            print(f"Loaded college names mapping: {table.rows} colleges")
             
             # Build mapping dictionary
-            for _, row in df.iterrows():
-                official_name = str(row['Official_Name']).strip()
-                common_name = str(row['Common_Name']).strip() if pd.notna(row['Common_Name']) else None
-                abbreviation = str(row['Abbreviation']).strip() if pd.notna(row['Abbreviation']) else None
+            for official, common, abbreviation_value in zip(
+                table.column('Official_Name'),
+                table.column('Common_Name'),
+                table.column('Abbreviation'),
+            ):
+                official_name = str(official).strip()
+                common_name = str(common).strip() if common is not None else None
+                abbreviation = str(abbreviation_value).strip() if abbreviation_value is not None else None
                 
                 # Add official name to set
                 self.official_names.add(official_name)
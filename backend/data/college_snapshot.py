@@ -0,0 +1,487 @@
+"""
+College Data Snapshot
+
+Compiles every college reference source the data services read at import time
+(the integrated IPEDS catalog, in/out-of-state tuition, college state/ZIP
+rows, the names & nicknames workbook, IPEDS/heuristic major data, the
+major -> college index and the small JSON documents) into one versioned binary file of NumPy column buffers and
+UTF-8 string tables.
+
+The file is memory-mapped read-only, so every uvicorn worker on a host shares
+one physical copy through the page cache instead of each re-parsing CSV, Excel
+and JSON with pandas. A missing or stale snapshot (any source changed size or
+mtime, or the format version moved) is rebuilt on first use. A source that is
+missing or fails to load (e.g. the workbook without openpyxl) is logged and
+its table left out; services reading it fall back as if the file were absent.
+A source that failed is recorded without a signature, and opening the
+snapshot retries just that source: once it loads (the dependency was
+installed), the snapshot is rebuilt with its table.
+
+Build it ahead of time from `backend/`:
+
+    python -m data.college_snapshot
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 3
+SNAPSHOT_MAGIC = b"CHSNAP01"
+_ALIGNMENT = 64
+
+DATA_DIR = Path(__file__).resolve().parent
+DEFAULT_SNAPSHOT_PATH = DATA_DIR / "models" / "college_data_snapshot.bin"
+
+
+def _repo_candidates(*parts: str) -> List[Path]:
+    """Repo-root files live two levels up locally and three levels up in some deployments."""
+    return [DATA_DIR.parent.parent.joinpath(*parts), DATA_DIR.parent.parent.parent.joinpath(*parts)]
+
+
+# table name -> (loader, candidate paths); the first existing candidate is compiled
+SOURCES: Dict[str, Tuple[str, List[Path]]] = {
+    "colleges": ("csv", [DATA_DIR / "raw" / "real_colleges_integrated.csv"]),
+    "tuition_inout": ("csv", _repo_candidates("Tuition_InOut_2023.csv")),
+    "college_state_zip": ("csv", _repo_candidates("College_State_Zip.csv")),
+    "college_names": ("excel", _repo_candidates("therealdatabase", "College_Names_and_Nicknames.xlsx")),
+    # Exploded and mapped to IPEDS majors at build time (data.major_index)
+    "heuristic_majors": ("heuristic_majors", _repo_candidates("colleges_known_for_majors_full_heuristic.csv")),
+    "catalog_majors": ("catalog_majors", [DATA_DIR / "raw" / "real_colleges_integrated.csv"]),
+    "college_major_data": ("college_majors", [DATA_DIR / "college_major_data.json"]),
+    "elite_colleges_data": ("document", [DATA_DIR / "models" / "elite_colleges_data.json"]),
+    "admissions_factors": ("document", _repo_candidates("data", "factors", "admissions_factors.json")),
+}
+
+
+def resolve_source(name: str) -> Optional[Path]:
+    """First existing candidate path for a source, or None."""
+    _, candidates = SOURCES[name]
+    return next((path for path in candidates if path.exists()), None)
+
+
+def _source_signature(name: str) -> Optional[Dict[str, Any]]:
+    path = resolve_source(name)
+    if path is None:
+        return None
+    stat = path.stat()
+    return {"path": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+class StringColumn:
+    """UTF-8 string table: one contiguous byte buffer plus int64 row offsets."""
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray, valid: Optional[np.ndarray] = None):
+        self._data = data
+        self._offsets = offsets
+        self._valid = valid
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        if self._valid is not None and not self._valid[i]:
+            return None
+        start, end = int(self._offsets[i]), int(self._offsets[i + 1])
+        return self._data[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return iter(self.to_list())
+
+    def to_list(self) -> List[Optional[str]]:
+        raw = self._data.tobytes()
+        offsets = self._offsets.tolist()
+        values = [raw[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+        if self._valid is not None:
+            values = [value if ok else None for value, ok in zip(values, self._valid.tolist())]
+        return values
+
+
+class NumericColumn:
+    """int64/float64 buffer; integer columns may carry a validity mask (float columns use NaN)."""
+
+    def __init__(self, data: np.ndarray, valid: Optional[np.ndarray] = None):
+        self.array = data
+        self._valid = valid
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __getitem__(self, i: int):
+        if self._valid is not None and not self._valid[i]:
+            return None
+        return self.array[i].item()
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def to_list(self) -> List[Any]:
+        values = self.array.tolist()
+        if self._valid is not None:
+            values = [value if ok else None for value, ok in zip(values, self._valid.tolist())]
+        return values
+
+
+class SnapshotTable:
+    """Read-only columnar view over one compiled source."""
+
+    def __init__(self, name: str, rows: int, columns: Dict[str, Any]):
+        self.name = name
+        self.rows = rows
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._columns
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, name: str):
+        """StringColumn or NumericColumn for ``name`` (KeyError if absent)."""
+        return self._columns[name]
+
+    def values(self, name: str, default: Any = None) -> List[Any]:
+        """Column as Python values; a missing column reads as ``default`` on every row."""
+        column = self._columns.get(name)
+        if column is None:
+            return [default] * self.rows
+        return column.to_list()
+
+    def row(self, i: int) -> Dict[str, Any]:
+        return {name: column[i] for name, column in self._columns.items()}
+
+    def iter_rows(self) -> Iterator[Dict[str, Any]]:
+        names = list(self._columns)
+        for values in zip(*(self._columns[name].to_list() for name in names)):
+            yield dict(zip(names, values))
+
+    def to_frame(self):
+        """Materialize as a pandas DataFrame (for callers that still need one)."""
+        import pandas as pd
+
+        return pd.DataFrame({name: column.to_list() for name, column in self._columns.items()})
+
+
+class CollegeDataSnapshot:
+    """A loaded snapshot file: header metadata plus zero-copy column views."""
+
+    def __init__(self, header: Dict[str, Any], buffer, path: Optional[Path] = None):
+        self.header = header
+        self.path = path
+        self._buffer = buffer
+        self._tables: Dict[str, SnapshotTable] = {}
+        base = header["data_offset"]
+
+        def view(spec, dtype):
+            offset, nbytes = spec
+            return np.frombuffer(buffer, dtype=dtype, count=nbytes // np.dtype(dtype).itemsize, offset=base + offset)
+
+        for table_name, table_spec in header["tables"].items():
+            columns = {}
+            for column_name, spec in table_spec["columns"].items():
+                valid = view(spec["valid"], np.bool_) if "valid" in spec else None
+                if spec["kind"] == "str":
+                    columns[column_name] = StringColumn(view(spec["data"], np.uint8), view(spec["offsets"], np.int64), valid)
+                else:
+                    dtype = np.int64 if spec["kind"] == "int" else np.float64
+                    columns[column_name] = NumericColumn(view(spec["data"], dtype), valid)
+            self._tables[table_name] = SnapshotTable(table_name, table_spec["rows"], columns)
+
+    @classmethod
+    def open(cls, path: Path) -> "CollegeDataSnapshot":
+        """Memory-map a snapshot file read-only."""
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(_read_header(buffer), buffer, Path(path))
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "CollegeDataSnapshot":
+        return cls(_read_header(payload), payload)
+
+    @property
+    def version(self) -> int:
+        return self.header["version"]
+
+    @property
+    def built_at(self) -> str:
+        return self.header["built_at"]
+
+    def has_table(self, name: str) -> bool:
+        return name in self._tables
+
+    def table(self, name: str) -> SnapshotTable:
+        """Compiled table for a source; KeyError if the source was missing at build time."""
+        try:
+            return self._tables[name]
+        except KeyError:
+            raise KeyError(f"College data snapshot has no '{name}' table (source missing at build time)") from None
+
+    def document(self, name: str) -> Any:
+        """Parsed JSON document source (KeyError if it was missing at build time)."""
+        return json.loads(self.table(name).column("text")[0])
+
+    def is_stale(self) -> bool:
+        """
+        True when the format version moved, a source changed, or a source that
+        failed to load at build time loads now.
+        """
+        if self.header.get("version") != SNAPSHOT_VERSION:
+            return True
+        recorded = self.header.get("sources") or {}
+        failed = self.header.get("failed") or {}
+        for name, signature in _current_signatures().items():
+            if recorded.get(name) == signature:
+                continue
+            if name in failed and signature is not None and not _source_loads(name, Path(signature["path"])):
+                continue
+            return True
+        return False
+
+
+def _read_header(buffer) -> Dict[str, Any]:
+    if bytes(buffer[:8]) != SNAPSHOT_MAGIC:
+        raise ValueError("Not a college data snapshot")
+    (header_len,) = struct.unpack("<Q", bytes(buffer[8:16]))
+    return json.loads(bytes(buffer[16:16 + header_len]).decode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+def _current_signatures() -> Dict[str, Optional[Dict[str, Any]]]:
+    return {name: _source_signature(name) for name in SOURCES}
+
+
+def _load_source_frame(name: str, path: Path):
+    """Parse one source into a DataFrame with the same dtypes the services used to see."""
+    import pandas as pd
+
+    loader, _ = SOURCES[name]
+    if loader == "csv":
+        return pd.read_csv(path)
+    if loader == "excel":
+        return pd.read_excel(path)
+    if loader == "csv_text":
+        # Read like csv.DictReader: every cell a string, empty cells stay ''
+        return pd.read_csv(path, dtype=str, keep_default_na=False)
+    if loader == "heuristic_majors":
+        from .major_index import heuristic_major_rows
+
+        return heuristic_major_rows(pd.read_csv(path, dtype=str, keep_default_na=False))
+    if loader == "catalog_majors":
+        from .major_index import catalog_major_rows
+
+        return catalog_major_rows(pd.read_csv(path))
+    if loader == "document":
+        return pd.DataFrame({"text": [path.read_text(encoding="utf-8")]})
+    if loader == "college_majors":
+        with open(path, "r") as f:
+            data = json.load(f)
+        # One row per (college, major); colleges without majors keep a row with a null major
+        rows = {"college": [], "unitid": [], "major": [], "percentage": [], "rank": []}
+        for college_name, college_data in data.items():
+            majors = college_data.get("majors", [])
+            for major_info in majors or [None]:
+                rows["college"].append(college_name)
+                rows["unitid"].append(college_data.get("unitid"))
+                rows["major"].append(major_info["name"] if major_info else None)
+                rows["percentage"].append(major_info["percentage"] if major_info else np.nan)
+                rows["rank"].append(major_info["rank"] if major_info else None)
+        return pd.DataFrame({
+            "college": pd.array(rows["college"], dtype=object),
+            "unitid": pd.array(rows["unitid"], dtype="Int64"),
+            "major": pd.array(rows["major"], dtype=object),
+            "percentage": np.array(rows["percentage"], dtype=np.float64),
+            "rank": pd.array(rows["rank"], dtype="Int64"),
+        })
+    raise ValueError(f"Unknown loader '{loader}' for {name}")
+
+
+def _source_loads(name: str, path: Path) -> bool:
+    try:
+        _load_source_frame(name, path)
+    except Exception:
+        return False
+    return True
+
+
+def _encode_column(series) -> Tuple[str, Dict[str, np.ndarray]]:
+    import pandas as pd
+
+    missing = series.isna().to_numpy()
+    valid = {"valid": ~missing} if missing.any() else {}
+    if pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_integer_dtype(series.dtype):
+        return "int", {"data": series.fillna(0).to_numpy(dtype=np.int64), **valid}
+    if pd.api.types.is_float_dtype(series.dtype):
+        # NaN already marks missing floats, exactly as pandas reports them
+        return "float", {"data": series.to_numpy(dtype=np.float64)}
+
+    encoded = [b"" if is_missing else str(value).encode("utf-8") for value, is_missing in zip(series.tolist(), missing)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    return "str", {
+        "data": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "offsets": offsets,
+        **valid,
+    }
+
+
+def build_snapshot() -> bytes:
+    """Compile every available source into snapshot bytes."""
+    header: Dict[str, Any] = {
+        "version": SNAPSHOT_VERSION,
+        "built_at": datetime.now().isoformat(),
+        "sources": _current_signatures(),
+        # source -> load error; recorded with a None signature so a later fix triggers a rebuild
+        "failed": {},
+        "tables": {},
+    }
+    chunks: List[bytes] = []
+    position = 0
+
+    def append(array: np.ndarray) -> List[int]:
+        nonlocal position
+        payload = np.ascontiguousarray(array).tobytes()
+        padding = -len(payload) % _ALIGNMENT
+        chunks.append(payload + b"\0" * padding)
+        spec = [position, len(payload)]
+        position += len(payload) + padding
+        return spec
+
+    for name, signature in list(header["sources"].items()):
+        if signature is None:
+            logger.warning(f"College snapshot source '{name}' not found; table omitted")
+            continue
+        try:
+            frame = _load_source_frame(name, Path(signature["path"]))
+        except Exception as e:
+            # One unreadable source (e.g. the Excel workbook without openpyxl) must not take down the rest
+            logger.error(f"College snapshot source '{name}' could not be loaded ({e}); table omitted")
+            header["sources"][name] = None
+            header["failed"][name] = str(e)
+            continue
+        columns = {}
+        for column_name in frame.columns:
+            kind, arrays = _encode_column(frame[column_name])
+            columns[str(column_name)] = {"kind": kind, **{key: append(value) for key, value in arrays.items()}}
+        header["tables"][name] = {"rows": int(len(frame)), "columns": columns}
+
+    # data_offset depends on the header's own length; re-encode until it stops moving
+    header["data_offset"] = 0
+    while True:
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        data_offset = 16 + len(header_bytes)
+        data_offset += -data_offset % _ALIGNMENT
+        if header["data_offset"] == data_offset:
+            break
+        header["data_offset"] = data_offset
+
+    prefix = SNAPSHOT_MAGIC + struct.pack("<Q", len(header_bytes)) + header_bytes
+    return prefix + b"\0" * (data_offset - len(prefix)) + b"".join(chunks)
+
+
+def write_snapshot(path: Path = DEFAULT_SNAPSHOT_PATH, payload: Optional[bytes] = None) -> Path:
+    """Build (unless given) and atomically replace the snapshot file."""
+    path = Path(path)
+    payload = build_snapshot() if payload is None else payload
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path
+
+
+# Global snapshot (shared by every data service in this process)
+_snapshot: Optional[CollegeDataSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_college_snapshot(path: Optional[Path] = None, force_reload: bool = False) -> CollegeDataSnapshot:
+    """
+    Get the global college data snapshot.
+
+    Maps the prebuilt file when it is current; otherwise rebuilds it, writing
+    the file for other workers when the directory is writable and falling back
+    to an in-memory copy when it is not.
+    """
+    global _snapshot
+    if _snapshot is not None and not force_reload:
+        return _snapshot
+
+    with _snapshot_lock:
+        if _snapshot is not None and not force_reload:
+            return _snapshot
+
+        path = Path(path or DEFAULT_SNAPSHOT_PATH)
+        snapshot = None
+        if path.exists():
+            try:
+                snapshot = CollegeDataSnapshot.open(path)
+                if snapshot.is_stale():
+                    logger.info(f"College data snapshot at {path} is stale; rebuilding")
+                    snapshot = None
+            except Exception as e:
+                logger.warning(f"Could not open college data snapshot {path}: {e}")
+                snapshot = None
+
+        if snapshot is None:
+            payload = build_snapshot()
+            try:
+                snapshot = CollegeDataSnapshot.open(write_snapshot(path, payload))
+                logger.info(f"Built college data snapshot at {path}")
+            except OSError as e:
+                logger.warning(f"Could not write college data snapshot to {path} ({e}); using in-memory copy")
+                snapshot = CollegeDataSnapshot.from_bytes(payload)
+
+        _snapshot = snapshot
+        return _snapshot
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the memory-mapped college data snapshot")
+    parser.add_argument("--output", default=str(DEFAULT_SNAPSHOT_PATH))
+    args = parser.parse_args()
+
+    path = write_snapshot(Path(args.output))
+    snapshot = CollegeDataSnapshot.open(path)
+    print(f"Wrote college data snapshot v{snapshot.version} to {path} ({path.stat().st_size / 1024:.0f} KB)")
+    for name in SOURCES:
+        if snapshot.has_table(name):
+            table = snapshot.table(name)
+            print(f"  {name:<20} {table.rows:>6} rows  {len(table.columns)} columns")
+        elif name in snapshot.header.get("failed", {}):
+            print(f"  {name:<20} (failed to load: {snapshot.header['failed'][name]})")
+        else:
+            print(f"  {name:<20} (source not found)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,131 @@ Serves real tuition and cost data for colleges
 
 import logging
 import time
-from typing import Dict, Any, Optional
-from .hardcoded_tuition_data import get_tuition_data_for_college
+from typing import Dict, Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .college_identity import get_college_identity
+from .college_snapshot import get_college_snapshot
+from .hardcoded_tuition_data import (
+    COLLEGE_TUITION_DATA,
+    DEFAULT_TUITION_DATA,
+    _with_totals,
+    get_tuition_data_for_college,
+)
 
 logger = logging.getLogger(__name__)
 
+# Columns of a batch cost-of-attendance response row
+BATCH_COLUMNS = [
+    "query", "college_name", "matched", "state", "is_in_state", "is_private",
+    "tuition", "fees", "room_board", "books", "other_expenses", "total",
+    "total_in_state", "total_out_state",
+]
+
+_COST_FIELDS = ("in_state_tuition", "out_state_tuition", "fees", "room_board", "books",
+                "other_expenses", "total_in_state", "total_out_state")
+
+
+class TuitionTable:
+    """
+    Columnar copy of COLLEGE_TUITION_DATA for batch lookups
+
+    One row per college (plus a final row holding the generic fallback costs),
+    with every cost field as an int array and a name / unitid index in front,
+    so a list of colleges resolves to row numbers and its costs come out of a
+    single fancy-indexing pass.
+    """
+
+    def __init__(self, data: Dict[str, Dict[str, Any]] = COLLEGE_TUITION_DATA):
+        self.names: List[str] = list(data)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+        # Same numbers get_tuition_data_for_college returns (components rounded, totals recomputed)
+        rows = [_with_totals(entry) for entry in data.values()]
+        rows.append(_with_totals(DEFAULT_TUITION_DATA))
+        self.fallback_row = len(rows) - 1
+        self.costs = {field: np.array([row[field] for row in rows], dtype=np.int64) for field in _COST_FIELDS}
+        self.is_private = np.array([bool(row.get("is_private", True)) for row in rows])
+
+        # Rows by catalog unitid, through the shared college identity
+        self.unitid_index: Dict[int, int] = get_college_identity().index(self.index)
+
+        # College state (for in-state pricing), from the college snapshot
+        self.states = np.full(len(rows), "", dtype=object)
+        try:
+            snapshot = get_college_snapshot()
+            colleges = snapshot.table("colleges")
+            for name, state in zip(colleges.values("name"), colleges.values("state")):
+                row = self.index.get(str(name).strip().lower())
+                if row is not None and state and not self.states[row]:
+                    self.states[row] = str(state).strip().upper()
+            state_zip = snapshot.table("college_state_zip")
+            for name, state in zip(state_zip.values("College"), state_zip.values("State")):
+                row = self.index.get(str(name).strip().lower())
+                if row is not None and not self.states[row] and state:
+                    self.states[row] = str(state).strip().upper()
+        except Exception as e:
+            logger.warning(f"Tuition table built without college states: {e}")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def resolve(self, college: Union[str, int]) -> Optional[int]:
+        """
+        Row for a college name or catalog unitid (None if unknown)
+
+        Names resolve exactly first, then through the shared college identity
+        (the same resolution as get_tuition_data_for_college).
+        """
+        if isinstance(college, str):
+            row = self.index.get(college.lower().strip())
+            if row is not None:
+                return row
+        return self.unitid_index.get(get_college_identity().resolve(college))
+
+    def cost_of_attendance(self, colleges: Sequence[Union[str, int]], home_state: Optional[str] = None) -> List[list]:
+        """
+        Cost-of-attendance rows (BATCH_COLUMNS order) for many colleges at once
+
+        Args:
+            colleges: College names and/or catalog unitids
+            home_state: Student's state abbreviation; in-state pricing applies where it matches the college's state
+        """
+        resolved = [self.resolve(college) for college in colleges]
+        rows = np.array([self.fallback_row if row is None else row for row in resolved], dtype=np.int64)
+
+        states = self.states[rows]
+        in_state = states == (home_state or "").upper() if home_state else np.zeros(len(rows), dtype=bool)
+        tuition = np.where(in_state, self.costs["in_state_tuition"][rows], self.costs["out_state_tuition"][rows])
+        total = np.where(in_state, self.costs["total_in_state"][rows], self.costs["total_out_state"][rows])
+
+        return [
+            list(values)
+            for values in zip(
+                colleges,
+                [None if row is None else self.names[row] for row in resolved],
+                [row is not None for row in resolved],
+                [state or None for state in states.tolist()],
+                in_state.tolist(),
+                self.is_private[rows].tolist(),
+                tuition.tolist(),
+                self.costs["fees"][rows].tolist(),
+                self.costs["room_board"][rows].tolist(),
+                self.costs["books"][rows].tolist(),
+                self.costs["other_expenses"][rows].tolist(),
+                total.tolist(),
+                self.costs["total_in_state"][rows].tolist(),
+                self.costs["total_out_state"][rows].tolist(),
+            )
+        ]
+
+
 class CollegeTuitionService:
     def __init__(self):
         """Initialize tuition service with hardcoded data"""
-        logger.info("CollegeTuitionService initialized with hardcoded data.")
+        self.table = TuitionTable()
+        logger.info(f"CollegeTuitionService initialized with hardcoded data ({len(self.table)} colleges).")
     
     def get_college_tuition_data(self, college_name: str) -> Dict[str, Any]:
         """
@@ -63,5 +179,21 @@ class CollegeTuitionService:
         
         return data
 
+    def get_cost_of_attendance_batch(
+        self,
+        colleges: Sequence[Union[str, int]],
+        home_state: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Cost of attendance for many colleges for one student state, as a compact columnar payload
+
+        Returns:
+            {"columns": BATCH_COLUMNS, "rows": [[...], ...]}
+        """
+        return {
+            "columns": BATCH_COLUMNS,
+            "rows": self.table.cost_of_attendance(colleges, home_state),
+        }
+
 # Global instance
 college_tuition_service = CollegeTuitionService()
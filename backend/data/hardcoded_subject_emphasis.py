@@ -4,6 +4,10 @@ Hardcoded Subject Emphasis Data for Colleges
 This replaces OpenAI API calls with predefined data
 """
 
+from typing import Dict, Optional
+
+from .college_identity import get_college_identity
+
 # Hardcoded subject emphasis data for different colleges
 SUBJECT_EMPHASIS_DATA = {
     # Carnegie Mellon University - Strong in CS and Engineering
@@ -307,6 +311,17 @@ SUBJECT_EMPHASIS_DATA = {
     }
 }
 
+_EMPHASIS_BY_UNITID: Optional[Dict[int, dict]] = None
+
+
+def emphasis_by_unitid() -> Dict[int, dict]:
+    """SUBJECT_EMPHASIS_DATA keyed by catalog unitid (built on first use)"""
+    global _EMPHASIS_BY_UNITID
+    if _EMPHASIS_BY_UNITID is None:
+        _EMPHASIS_BY_UNITID = get_college_identity().index(SUBJECT_EMPHASIS_DATA)
+    return _EMPHASIS_BY_UNITID
+
+
 def get_subject_emphasis_for_college(college_name: str) -> dict:
     """
     Get subject emphasis data for a college.
@@ -319,10 +334,10 @@ def get_subject_emphasis_for_college(college_name: str) -> dict:
     if normalized_name in SUBJECT_EMPHASIS_DATA:
         return SUBJECT_EMPHASIS_DATA[normalized_name]
     
-    # Try partial matching for common variations
-    for key, data in SUBJECT_EMPHASIS_DATA.items():
-        if normalized_name in key or key in normalized_name:
-            return data
+    # Nicknames and name variations, through the shared college identity
+    data = emphasis_by_unitid().get(get_college_identity().resolve(college_name))
+    if data is not None:
+        return data
     
     # Default data if no match found
     return {
@@ -5,11 +5,13 @@ Real tuition data for colleges - can be updated with Excel file later
 """
 
 # Hardcoded tuition and cost data for different colleges
-from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import pandas as pd
 
+from .college_identity import get_college_identity
+from .college_snapshot import get_college_snapshot
+
 COLLEGE_TUITION_DATA: Dict[str, Dict[str, Any]] = {
     # Carnegie Mellon University - Private university
     "carnegie mellon university": {
@@ -348,17 +350,13 @@ def _safe_number(value: Any, default: float) -> float:
 
 
 def _load_csv_tuition_data() -> None:
-    """Bootstrap tuition dictionary with values from real_colleges_integrated.csv."""
-    csv_path = Path(__file__).resolve().parent / "raw" / "real_colleges_integrated.csv"
-    if not csv_path.exists():
-        return
-
+    """Bootstrap tuition dictionary with values from real_colleges_integrated.csv (via the college snapshot)."""
     try:
-        df = pd.read_csv(csv_path)
+        colleges = get_college_snapshot().table("colleges")
     except Exception:
         return
 
-    for _, row in df.iterrows():
+    for row in colleges.iter_rows():
         name = str(row.get("name", "")).strip().lower()
         if not name:
             continue
@@ -431,6 +429,30 @@ def _with_totals(data: Dict[str, Any]) -> Dict[str, Any]:
     return data
 
 
+# Generic private university costs for colleges with no data,
+# realistic enough that the calculator remains useful
+DEFAULT_TUITION_DATA: Dict[str, Any] = {
+    "in_state_tuition": 52000,
+    "out_state_tuition": 52000,
+    "fees": 2000,
+    "room_board": 18000,
+    "books": 1200,
+    "other_expenses": 2500,
+    "is_private": True
+}
+
+
+_TUITION_BY_UNITID: Optional[Dict[int, Dict[str, Any]]] = None
+
+
+def tuition_by_unitid() -> Dict[int, Dict[str, Any]]:
+    """COLLEGE_TUITION_DATA keyed by catalog unitid (built on first use)"""
+    global _TUITION_BY_UNITID
+    if _TUITION_BY_UNITID is None:
+        _TUITION_BY_UNITID = get_college_identity().index(COLLEGE_TUITION_DATA)
+    return _TUITION_BY_UNITID
+
+
 def get_tuition_data_for_college(college_name: str) -> dict:
     """
     Get tuition and cost data for a college.
@@ -443,22 +465,13 @@ def get_tuition_data_for_college(college_name: str) -> dict:
     if normalized_name in COLLEGE_TUITION_DATA:
         return _with_totals(COLLEGE_TUITION_DATA[normalized_name])
 
-    # Try partial matching for common variations
-    for key, data in COLLEGE_TUITION_DATA.items():
-        if normalized_name in key or key in normalized_name:
-            return _with_totals(data)
-
-    # Default data if no match found (generic private university costs)
-    # Provide realistic fallback numbers so calculator remains useful
-    return _with_totals({
-        "in_state_tuition": 52000,
-        "out_state_tuition": 52000,
-        "fees": 2000,
-        "room_board": 18000,
-        "books": 1200,
-        "other_expenses": 2500,
-        "is_private": True
-    })
+    # Nicknames and name variations, through the shared college identity
+    data = tuition_by_unitid().get(get_college_identity().resolve(college_name))
+    if data is not None:
+        return _with_totals(data)
+
+    # Default data if no match found
+    return _with_totals(DEFAULT_TUITION_DATA)
 
 def test_tuition_data():
     """Test the tuition data with some colleges"""
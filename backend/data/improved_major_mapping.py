@@ -4,175 +4,28 @@ Handles related majors and provides better mapping for Computer Science and othe
 """
 
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from .major_index import MAJOR_RELATIONSHIPS, load_catalog_major_index
 
 class ImprovedMajorMapping:
-    def __init__(self, data_path: str = 'backend/data/raw/real_colleges_integrated.csv'):
-        """Initialize with real college data"""
-        self.df = pd.read_csv(data_path)
+    def __init__(self, data_path: Optional[str] = None):
+        """Initialize with real college data (the college snapshot's catalog and major index by default)"""
+        self.df, self.index = load_catalog_major_index(data_path)
         self.major_mapping = self._build_major_mapping()
         
+    def _colleges_by_tier(self, major: str) -> Dict[str, List[str]]:
+        """Colleges offering this major or a related one, by tier and acceptance rate"""
+        rows = self.index.rows_for_any([major, *MAJOR_RELATIONSHIPS.get(major, [])])
+        return self.index.names_by_tier(rows)
+    
     def _build_major_mapping(self) -> Dict[str, Dict[str, List[str]]]:
         """Build major mapping from real data with related major handling"""
-        mapping = {}
-        
-        # Define major relationships - what majors are related to each other
-        major_relationships = {
-            'Computer Science': ['Engineering', 'Mathematics', 'Business'],
-            'Engineering': ['Computer Science', 'Mathematics', 'Physics'],
-            'Business': ['Economics', 'Liberal Arts'],
-            'Pre-Medicine': ['Biology', 'Chemistry', 'Engineering'],
-            'Medicine': ['Biology', 'Chemistry', 'Pre-Medicine'],
-            'Nursing': ['Biology', 'Pre-Medicine'],
-            'Psychology': ['Liberal Arts', 'Biology'],
-            'Mathematics': ['Computer Science', 'Engineering', 'Physics'],
-            'Physics': ['Mathematics', 'Engineering'],
-            'Biology': ['Pre-Medicine', 'Medicine', 'Nursing'],
-            'Chemistry': ['Pre-Medicine', 'Medicine', 'Biology'],
-            'Economics': ['Business', 'Mathematics'],
-            'English': ['Liberal Arts', 'History'],
-            'History': ['Liberal Arts', 'English'],
-            'Political Science': ['Liberal Arts', 'History'],
-            'Sociology': ['Liberal Arts', 'Psychology'],
-            'Art': ['Liberal Arts', 'Performing Arts'],
-            'Music': ['Performing Arts', 'Liberal Arts'],
-            'Film': ['Performing Arts', 'Art'],
-            'Education': ['Liberal Arts', 'Psychology'],
-            'Environmental Science': ['Biology', 'Chemistry', 'Engineering']
-        }
-        
-        # Get all unique majors from the data
-        all_majors = set()
-        for _, row in self.df.iterrows():
-            for col in ['major_1', 'major_2', 'major_3']:
-                if pd.notna(row[col]):
-                    all_majors.add(row[col])
-        
-        # Build mapping for each major (including related majors)
-        for major in all_majors:
-            mapping[major] = {
-                'elite': [],
-                'highly_selective': [],
-                'selective': [],
-                'moderately_selective': []
-            }
-            
-            # Find colleges that offer this major OR related majors
-            colleges_with_major = []
-            for _, row in self.df.iterrows():
-                college_majors = [row['major_1'], row['major_2'], row['major_3']]
-                college_majors = [m for m in college_majors if pd.notna(m)]
-                
-                # Check if college offers this major or a related major
-                is_relevant = False
-                if major in college_majors:
-                    is_relevant = True
-                else:
-                    # Check for related majors
-                    related_majors = major_relationships.get(major, [])
-                    if any(related in college_majors for related in related_majors):
-                        is_relevant = True
-                
-                if is_relevant:
-                    colleges_with_major.append({
-                        'name': row['name'],
-                        'selectivity_tier': row['selectivity_tier'],
-                        'acceptance_rate': row['acceptance_rate'],
-                        'majors': college_majors
-                    })
-            
-            # Sort by selectivity and categorize
-            colleges_with_major.sort(key=lambda x: x['acceptance_rate'])
-            
-            for college in colleges_with_major:
-                tier = college['selectivity_tier']
-                # Map the tier names to our internal format
-                tier_mapping = {
-                    'Elite': 'elite',
-                    'Highly Selective': 'highly_selective',
-                    'Moderately Selective': 'selective',
-                    'Less Selective': 'moderately_selective'
-                }
-                mapped_tier = tier_mapping.get(tier, 'moderately_selective')
-                if mapped_tier in mapping[major]:
-                    mapping[major][mapped_tier].append(college['name'])
-        
-        return mapping
+        return {major: self._colleges_by_tier(major) for major in self.index.majors}
     
     def _build_major_mapping_for_major(self, major: str):
         """Build mapping for a specific major on the fly"""
-        # Define major relationships - what majors are related to each other
-        major_relationships = {
-            'Computer Science': ['Engineering', 'Mathematics', 'Business'],
-            'Engineering': ['Computer Science', 'Mathematics', 'Physics'],
-            'Business': ['Economics', 'Liberal Arts'],
-            'Pre-Medicine': ['Biology', 'Chemistry', 'Engineering'],
-            'Medicine': ['Biology', 'Chemistry', 'Pre-Medicine'],
-            'Nursing': ['Biology', 'Pre-Medicine'],
-            'Psychology': ['Liberal Arts', 'Biology'],
-            'Mathematics': ['Computer Science', 'Engineering', 'Physics'],
-            'Physics': ['Mathematics', 'Engineering'],
-            'Biology': ['Pre-Medicine', 'Medicine', 'Nursing'],
-            'Chemistry': ['Pre-Medicine', 'Medicine', 'Biology'],
-            'Economics': ['Business', 'Mathematics'],
-            'English': ['Liberal Arts', 'History'],
-            'History': ['Liberal Arts', 'English'],
-            'Political Science': ['Liberal Arts', 'History'],
-            'Sociology': ['Liberal Arts', 'Psychology'],
-            'Art': ['Liberal Arts', 'Performing Arts'],
-            'Music': ['Performing Arts', 'Liberal Arts'],
-            'Film': ['Performing Arts', 'Art'],
-            'Education': ['Liberal Arts', 'Psychology'],
-            'Environmental Science': ['Biology', 'Chemistry', 'Engineering']
-        }
-        
-        # Initialize mapping for this major
-        self.major_mapping[major] = {
-            'elite': [],
-            'highly_selective': [],
-            'selective': [],
-            'moderately_selective': []
-        }
-        
-        # Find colleges that offer this major OR related majors
-        colleges_with_major = []
-        for _, row in self.df.iterrows():
-            college_majors = [row['major_1'], row['major_2'], row['major_3']]
-            college_majors = [m for m in college_majors if pd.notna(m)]
-            
-            # Check if college offers this major or a related major
-            is_relevant = False
-            if major in college_majors:
-                is_relevant = True
-            else:
-                # Check for related majors
-                related_majors = major_relationships.get(major, [])
-                if any(related in college_majors for related in related_majors):
-                    is_relevant = True
-            
-            if is_relevant:
-                colleges_with_major.append({
-                    'name': row['name'],
-                    'selectivity_tier': row['selectivity_tier'],
-                    'acceptance_rate': row['acceptance_rate'],
-                    'majors': college_majors
-                })
-        
-        # Sort by selectivity and categorize
-        colleges_with_major.sort(key=lambda x: x['acceptance_rate'])
-        
-        for college in colleges_with_major:
-            tier = college['selectivity_tier']
-            # Map the tier names to our internal format
-            tier_mapping = {
-                'Elite': 'elite',
-                'Highly Selective': 'highly_selective',
-                'Moderately Selective': 'selective',
-                'Less Selective': 'moderately_selective'
-            }
-            mapped_tier = tier_mapping.get(tier, 'moderately_selective')
-            if mapped_tier in self.major_mapping[major]:
-                self.major_mapping[major][mapped_tier].append(college['name'])
+        self.major_mapping[major] = self._colleges_by_tier(major)
     
     def get_colleges_for_major(self, major: str, tier: str) -> List[str]:
         """Get colleges that offer a specific major in a specific tier"""
@@ -201,31 +54,7 @@ class ImprovedMajorMapping:
             position_score = {1: 1.0, 2: 0.7, 3: 0.4}.get(position, 0.2)
         else:
             # Check for related majors
-            major_relationships = {
-                'Computer Science': ['Engineering', 'Mathematics', 'Business'],
-                'Engineering': ['Computer Science', 'Mathematics', 'Physics'],
-                'Business': ['Economics', 'Liberal Arts'],
-                'Pre-Medicine': ['Biology', 'Chemistry', 'Engineering'],
-                'Medicine': ['Biology', 'Chemistry', 'Pre-Medicine'],
-                'Nursing': ['Biology', 'Pre-Medicine'],
-                'Psychology': ['Liberal Arts', 'Biology'],
-                'Mathematics': ['Computer Science', 'Engineering', 'Physics'],
-                'Physics': ['Mathematics', 'Engineering'],
-                'Biology': ['Pre-Medicine', 'Medicine', 'Nursing'],
-                'Chemistry': ['Pre-Medicine', 'Medicine', 'Biology'],
-                'Economics': ['Business', 'Mathematics'],
-                'English': ['Liberal Arts', 'History'],
-                'History': ['Liberal Arts', 'English'],
-                'Political Science': ['Liberal Arts', 'History'],
-                'Sociology': ['Liberal Arts', 'Psychology'],
-                'Art': ['Liberal Arts', 'Performing Arts'],
-                'Music': ['Performing Arts', 'Liberal Arts'],
-                'Film': ['Performing Arts', 'Art'],
-                'Education': ['Liberal Arts', 'Psychology'],
-                'Environmental Science': ['Biology', 'Chemistry', 'Engineering']
-            }
-            
-            related_majors = major_relationships.get(major, [])
+            related_majors = MAJOR_RELATIONSHIPS.get(major, [])
             best_related_score = 0.0
             
             for related in related_majors:
@@ -290,12 +119,7 @@ class ImprovedMajorMapping:
     
     def get_all_majors(self) -> List[str]:
         """Get list of all majors in the system"""
-        all_majors = set()
-        for _, row in self.df.iterrows():
-            for col in ['major_1', 'major_2', 'major_3']:
-                if pd.notna(row[col]):
-                    all_majors.add(row[col])
-        return sorted(list(all_majors))
+        return self.index.all_majors()
     
     def get_college_majors(self, college_name: str) -> List[str]:
         """Get all majors offered by a specific college"""
@@ -1,10 +1,14 @@
-import pandas as pd
-import os
-import json
 import logging
-from typing import Dict, List, Any
+import math
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from ml.preprocessing.feature_extractor import CollegeFeatures
+
+from .college_identity import get_college_identity
+from .college_snapshot import get_college_snapshot
+from .counterfactual_impact import ImpactEstimate, counterfactual_impact_engine
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -16,12 +20,64 @@ class ImprovementArea:
     priority: str  # 'high', 'medium', 'low'
     description: str
     actionable_steps: List[str]
+    impact_source: str = "heuristic"  # 'model' when measured by the counterfactual engine
+
+@dataclass(frozen=True)
+class CollegeRequirements:
+    """Requirement record the analyzers compare against, resolved once per college"""
+    name: str
+    data: Dict[str, Any]
+    features: CollegeFeatures
+    source: str  # 'elite', 'catalog' or 'default'
+
+DEFAULT_REQUIREMENTS = {
+    "acceptance_rate": 0.18,
+    "sat_25th": 1350,
+    "sat_75th": 1500,
+    "act_25th": 30,
+    "act_75th": 34,
+    "gpa_avg": 4.05,
+    "gpa_unweighted_avg": 3.85,
+    "category": "selective"
+}
+
+def _present(row: Dict[str, Any], key: str) -> bool:
+    value = row.get(key)
+    return value is not None and not (isinstance(value, float) and math.isnan(value))
+
+def _catalog_requirements(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Requirement record for a general catalog row (missing metrics fall back to selective defaults)"""
+    if _present(row, 'acceptance_rate'):
+        acceptance_rate = float(row['acceptance_rate'])
+    elif _present(row, 'acceptance_rate_percent'):
+        acceptance_rate = float(row['acceptance_rate_percent']) / 100.0
+    else:
+        acceptance_rate = 0.18
+    return {
+        "acceptance_rate": acceptance_rate,
+        "sat_25th": int(row['sat_25th']) if _present(row, 'sat_25th') else 1400,
+        "sat_75th": int(row['sat_75th']) if _present(row, 'sat_75th') else 1550,
+        "act_25th": int(row['act_25th']) if _present(row, 'act_25th') else 31,
+        "act_75th": int(row['act_75th']) if _present(row, 'act_75th') else 35,
+        "gpa_avg": float(row['gpa_average']) if _present(row, 'gpa_average') else 4.05,
+        "gpa_unweighted_avg": float(row['gpa_unweighted_avg']) if _present(row, 'gpa_unweighted_avg') else 3.85,
+        "category": "selective",
+        # Kept for the counterfactual engine's CollegeFeatures
+        "test_policy": row['test_policy'] if _present(row, 'test_policy') else "Required",
+        "financial_aid_policy": row['financial_aid_policy'] if _present(row, 'financial_aid_policy') else "Need-blind",
+    }
 
 class ImprovementAnalysisService:
     def __init__(self):
         self.elite_colleges_data = {}
         self.admission_factors = {}
-        self.general_colleges_df = None
+        self.general_colleges = None
+        self._general_names_lower = []
+        self._catalog_requirements: Dict[str, Dict[str, Any]] = {}
+        # Elite data (listed under short names) and catalog requirement records by unitid
+        self._elite_by_unitid: Dict[int, Dict[str, Any]] = {}
+        self._catalog_by_unitid: Dict[int, Dict[str, Any]] = {}
+        self._resolved: Dict[str, CollegeRequirements] = {}
         self.load_data()
 
         # TEMPORARY: Hardcode Carnegie Mellon data for testing
@@ -42,156 +98,133 @@ class ImprovementAnalysisService:
         else:
             logger.info(f"Elite colleges data loaded successfully. Sample: {list(self.elite_colleges_data.keys())[:3]}")
 
+        self._index_catalog_requirements()
+
     def load_data(self):
-        """Load all necessary data for improvement analysis"""
+        """Load all necessary data for improvement analysis (via the college snapshot)"""
         try:
-            # Load elite colleges data - use absolute path to ensure it's found
-            elite_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'models', 'elite_colleges_data.json'))
-            logger.info(f"Looking for elite colleges data at: {elite_path}")
-            logger.info(f"Current working directory: {os.getcwd()}")
-            logger.info(f"File exists: {os.path.exists(elite_path)}")
-
-            if os.path.exists(elite_path):
-                try:
-                    with open(elite_path, 'r') as f:
-                        self.elite_colleges_data = json.load(f)
-                    logger.info(f"Loaded elite colleges data: {len(self.elite_colleges_data)} colleges")
-                    logger.info(f"Sample colleges: {list(self.elite_colleges_data.keys())[:5]}")
-                except Exception as e:
-                    logger.error(f"Failed to parse elite colleges data JSON: {e}")
-                    self.elite_colleges_data = {}
-            else:
-                logger.error(f"Elite colleges data file not found at: {elite_path}")
-                # Try alternative path
-                alt_path = os.path.join(os.getcwd(), 'backend', 'data', 'models', 'elite_colleges_data.json')
-                logger.info(f"Trying alternative path: {alt_path}")
-                if os.path.exists(alt_path):
-                    with open(alt_path, 'r') as f:
-                        self.elite_colleges_data = json.load(f)
-                    logger.info(f"Loaded elite colleges data from alternative path: {len(self.elite_colleges_data)} colleges")
-                else:
-                    logger.error(f"Alternative path also not found: {alt_path}")
-                    # Initialize empty dict to prevent errors
-                    self.elite_colleges_data = {}
+            snapshot = get_college_snapshot()
 
-            # Load broader college dataset as a secondary source for acceptance rates/metadata
+            # Load elite colleges data
             try:
-                import pandas as pd  # local import to avoid issues if pandas missing at import-time
-                # Try multiple possible paths
-                possible_paths = [
-                    os.path.join(os.path.dirname(__file__), 'raw', 'real_colleges_integrated.csv'),  # Relative to this file
-                    os.path.abspath(os.path.join(os.getcwd(), 'backend', 'data', 'raw', 'real_colleges_integrated.csv')),  # From project root
-                    os.path.abspath(os.path.join(os.getcwd(), 'data', 'raw', 'real_colleges_integrated.csv')),  # From backend directory
-                ]
+                self.elite_colleges_data = snapshot.document('elite_colleges_data')
+                logger.info(f"Loaded elite colleges data: {len(self.elite_colleges_data)} colleges")
+                logger.info(f"Sample colleges: {list(self.elite_colleges_data.keys())[:5]}")
+            except KeyError:
+                logger.error("Elite colleges data (models/elite_colleges_data.json) missing from college snapshot")
+                # Initialize empty dict to prevent errors
+                self.elite_colleges_data = {}
+            except Exception as e:
+                logger.error(f"Failed to parse elite colleges data JSON: {e}")
+                self.elite_colleges_data = {}
 
-                csv_path = None
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        csv_path = path
-                        break
-
-                if csv_path and os.path.exists(csv_path):
-                    self.general_colleges_df = pd.read_csv(csv_path)
-                    logger.info(f"Loaded general colleges dataset: {self.general_colleges_df.shape} from {csv_path}")
-                else:
-                    logger.warning(f"General colleges CSV not found. Tried paths: {possible_paths}")
+            # Load broader college dataset as a secondary source for acceptance rates/metadata
+            try:
+                self.general_colleges = snapshot.table('colleges')
+                self._general_names_lower = [str(name).lower() for name in self.general_colleges.values('name')]
+                logger.info(f"Loaded general colleges dataset: ({self.general_colleges.rows}, {len(self.general_colleges.columns)})")
             except Exception as e:
                 logger.warning(f"Failed to load general colleges dataset: {e}")
 
             # Load admission factors
-            factors_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'factors', 'admissions_factors.json')
-            if os.path.exists(factors_path):
-                with open(factors_path, 'r') as f:
-                    factors_data = json.load(f)
-                    self.admission_factors = {factor['id']: factor for factor in factors_data['factors']}
+            if snapshot.has_table('admissions_factors'):
+                factors_data = snapshot.document('admissions_factors')
+                self.admission_factors = {factor['id']: factor for factor in factors_data['factors']}
                 logger.info(f"Loaded admission factors: {len(self.admission_factors)} factors")
 
         except Exception as e:
             logger.error(f"Error loading improvement analysis data: {e}")
 
-    def analyze_user_profile(self, user_profile: Dict[str, Any], college_name: str) -> List[ImprovementArea]:
+    def _index_catalog_requirements(self):
+        """
+        Derive a requirement record for every general catalog college (first
+        row per name wins) and key it, and the elite data, by unitid
+        """
+        self._elite_by_unitid = get_college_identity().index(self.elite_colleges_data)
+        if self.general_colleges is None:
+            return
+        for i, (name, unitid) in enumerate(zip(self._general_names_lower, self.general_colleges.values('unitid'))):
+            if name not in self._catalog_requirements:
+                self._catalog_requirements[name] = _catalog_requirements(self.general_colleges.row(i))
+            if unitid is not None:
+                self._catalog_by_unitid.setdefault(int(unitid), self._catalog_requirements[name])
+        logger.info(f"Indexed requirement records for {len(self._catalog_requirements)} catalog colleges")
+
+    def _find_elite_college(self, college_name: str, unitid: Optional[int]) -> Dict[str, Any]:
+        """Elite data by exact name, then by the college's unitid"""
+        college_data = self.elite_colleges_data.get(college_name)
+        if not college_data and unitid is not None:
+            college_data = self._elite_by_unitid.get(unitid)
+        return college_data or {}
+
+    def _find_catalog_college(self, college_name: str, unitid: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Catalog record by exact (case-insensitive) name, then by the college's unitid"""
+        record = self._catalog_requirements.get(college_name.lower())
+        if record is None and unitid is not None:
+            record = self._catalog_by_unitid.get(unitid)
+        return record
+
+    def resolve_college(self, college_name: str) -> CollegeRequirements:
+        """
+        Requirement record for a college: elite data, then the general catalog,
+        then conservative defaults. Resolved once per name and reused.
+        """
+        resolved = self._resolved.get(college_name)
+        if resolved is not None:
+            return resolved
+
+        unitid = get_college_identity().resolve(college_name)
+        college_data, source = self._find_elite_college(college_name, unitid), "elite"
+        if not college_data:
+            college_data, source = self._find_catalog_college(college_name, unitid), "catalog"
+        if not college_data:
+            logger.warning(f"No data found for '{college_name}' in elite or general datasets; using conservative defaults")
+            college_data, source = DEFAULT_REQUIREMENTS, "default"
+
+        features = CollegeFeatures(
+            name=college_name,
+            acceptance_rate=float(college_data.get('acceptance_rate') or DEFAULT_REQUIREMENTS['acceptance_rate']),
+            sat_25th=college_data.get('sat_25th'),
+            sat_75th=college_data.get('sat_75th'),
+            act_25th=college_data.get('act_25th'),
+            act_75th=college_data.get('act_75th'),
+            test_policy=college_data.get('test_policy', "Required"),
+            financial_aid_policy=college_data.get('financial_aid_policy', "Need-blind"),
+            gpa_average=college_data.get('gpa_avg'),
+        )
+        resolved = CollegeRequirements(name=college_name, data=college_data, features=features, source=source)
+        if len(self._resolved) < 10000:
+            self._resolved[college_name] = resolved
+        logger.info(f"Resolved requirements for '{college_name}' from {source} data")
+        return resolved
+
+    def analyze_user_profile(self, user_profile: Dict[str, Any], college_name: str, predictor=None) -> List[ImprovementArea]:
         """
         Analyze user profile against college requirements and return improvement areas
         """
-        try:
-            # Try exact match first
-            college_data = self.elite_colleges_data.get(college_name, {})
-            logger.info(f"Direct match for '{college_name}': {len(college_data)} fields")
-
-            # If not found, try common variations
-            if not college_data:
-                # Try without "University" suffix
-                if "University" in college_name:
-                    short_name = college_name.replace(" University", "")
-                    college_data = self.elite_colleges_data.get(short_name, {})
-                    logger.info(f"After removing 'University' ('{short_name}'): {len(college_data)} fields")
-
-                # Try without "College" suffix
-                if not college_data and "College" in college_name:
-                    short_name = college_name.replace(" College", "")
-                    college_data = self.elite_colleges_data.get(short_name, {})
-                    logger.info(f"After removing 'College' ('{short_name}'): {len(college_data)} fields")
-
-                # Try common abbreviations
-                if not college_data:
-                    name_variations = {
-                        "Massachusetts Institute of Technology": "MIT",
-                        "Carnegie Mellon University": "Carnegie Mellon",
-                        "University of Pennsylvania": "Penn",
-                        "New York University": "NYU",
-                        "University of California-Berkeley": "UC Berkeley",
-                        "University of California-Los Angeles": "UCLA"
-                    }
-                    for full_name, short_name in name_variations.items():
-                        if college_name == full_name:
-                            college_data = self.elite_colleges_data.get(short_name, {})
-                            logger.info(f"Variation match ('{full_name}' -> '{short_name}'): {len(college_data)} fields")
-                            break
-
-            if not college_data:
-                # Try the broader dataset before falling back
-                if self.general_colleges_df is not None and not self.general_colleges_df.empty:
-                    df = self.general_colleges_df
-                    try:
-                        # Exact, then case-insensitive contains
-                        row = df[df['name'].str.lower() == college_name.lower()]
-                        if row.empty:
-                            row = df[df['name'].str.lower().str.contains(college_name.lower(), na=False)]
-                        if not row.empty:
-                            r = row.iloc[0]
-                            acceptance_rate = None
-                            if 'acceptance_rate' in r and pd.notna(r['acceptance_rate']):
-                                acceptance_rate = float(r['acceptance_rate'])
-                            elif 'acceptance_rate_percent' in r and pd.notna(r['acceptance_rate_percent']):
-                                acceptance_rate = float(r['acceptance_rate_percent']) / 100.0
-
-                            college_data = {
-                                "acceptance_rate": acceptance_rate if acceptance_rate is not None else 0.18,
-                                "sat_25th": int(r.get('sat_25th', 1400)) if 'sat_25th' in r and pd.notna(r['sat_25th']) else 1400,
-                                "sat_75th": int(r.get('sat_75th', 1550)) if 'sat_75th' in r and pd.notna(r['sat_75th']) else 1550,
-                                "act_25th": int(r.get('act_25th', 31)) if 'act_25th' in r and pd.notna(r['act_25th']) else 31,
-                                "act_75th": int(r.get('act_75th', 35)) if 'act_75th' in r and pd.notna(r['act_75th']) else 35,
-                                "gpa_avg": float(r.get('gpa_average', 4.05)) if 'gpa_average' in r and pd.notna(r['gpa_average']) else 4.05,
-                                "gpa_unweighted_avg": float(r.get('gpa_unweighted_avg', 3.85)) if 'gpa_unweighted_avg' in r and pd.notna(r['gpa_unweighted_avg']) else 3.85,
-                                "category": "selective"
-                            }
-                            logger.info(f"General dataset match found for '{college_name}' → using derived metrics")
-                    except Exception as e:
-                        logger.warning(f"Failed matching in general dataset for '{college_name}': {e}")
-
-            if not college_data:
-                logger.warning(f"No data found for '{college_name}' in elite or general datasets; using conservative defaults")
-                college_data = {
-                    "acceptance_rate": 0.18,
-                    "sat_25th": 1350,
-                    "sat_75th": 1500,
-                    "act_25th": 30,
-                    "act_75th": 34,
-                    "gpa_avg": 4.05,
-                    "gpa_unweighted_avg": 3.85,
-                    "category": "selective"
-                }
+        return self.analyze_with_impacts(user_profile, college_name, predictor)[0]
+
+    def analyze_with_impacts(
+        self,
+        user_profile: Dict[str, Any],
+        college_name: str,
+        predictor=None,
+    ) -> Tuple[List[ImprovementArea], Optional[ImpactEstimate]]:
+        """
+        Improvement areas for a profile and college, with impacts measured by
+        the counterfactual engine where a lever exists
+
+        Args:
+            user_profile: Frontend profile form fields
+            college_name: Target college
+            predictor: AdmissionPredictor for hybrid scoring; formula-only when None
 
+        Returns:
+            (improvements ranked by probability gain, impact estimate or None if scoring failed)
+        """
+        try:
+            requirements = self.resolve_college(college_name)
+            college_data = requirements.data
             logger.info(f"Using college data with {len(college_data)} fields for analysis")
 
             improvements = []
@@ -277,13 +310,27 @@ class ImprovementAnalysisService:
             # Return improvements (analysis methods should ALWAYS return at least maintenance advice)
             if len(improvements) == 0:
                 logger.error("NO improvements generated - this should never happen!")
-                return self._normalize_impacts(self._get_default_improvements())
+                return self._normalize_impacts(self._get_default_improvements()), None
+
+            # Replace heuristic impacts with measured probability gains
+            estimate = None
+            try:
+                estimate = counterfactual_impact_engine.estimate(
+                    user_profile,
+                    requirements.features,
+                    college_data,
+                    predictor=predictor,
+                    areas=[imp.area for imp in improvements],
+                )
+                improvements = self._apply_measured_impacts(improvements, estimate)
+            except Exception as e:
+                logger.error(f"Counterfactual impact scoring failed; keeping heuristic impacts: {e}")
 
-            return improvements[:20]  # Return up to 20 improvements for comprehensive analysis
+            return improvements[:20], estimate  # Return up to 20 improvements for comprehensive analysis
 
         except Exception as e:
             logger.error(f"Error analyzing user profile: {e}")
-            return self._normalize_impacts(self._get_default_improvements())
+            return self._normalize_impacts(self._get_default_improvements()), None
 
     def _analyze_academic_performance(self, profile: Dict[str, Any], college_data: Dict[str, Any]) -> List[ImprovementArea]:
         """Analyze GPA and academic performance with enhanced calculations"""
@@ -1163,11 +1210,33 @@ class ImprovementAnalysisService:
             )
         ]
 
-    def calculate_combined_impact(self, improvements: List[ImprovementArea]) -> int:
+    def _apply_measured_impacts(self, improvements: List[ImprovementArea], estimate: ImpactEstimate) -> List[ImprovementArea]:
+        """
+        Set measured impacts (percentage points) and rank: measured areas by
+        probability gain first (ties by uncalibrated score gain), then the areas
+        without a lever in their heuristic order.
+        """
+        measured, heuristic = [], []
+        for imp in improvements:
+            delta = estimate.deltas.get(imp.area)
+            if delta is None:
+                heuristic.append(imp)
+                continue
+            imp.impact = round(max(0.0, delta) * 100, 2)
+            imp.impact_source = "model"
+            measured.append(imp)
+        measured.sort(key=lambda x: (x.impact, estimate.score_deltas.get(x.area, 0.0)), reverse=True)
+        return measured + heuristic
+
+    def calculate_combined_impact(self, improvements: List[ImprovementArea], estimate: Optional[ImpactEstimate] = None) -> int:
         """Calculate the combined potential impact of all improvements"""
         if not improvements:
             return 0
 
+        # Measured: every lever applied at once (gains overlap, so this is less than their sum)
+        if estimate is not None:
+            return min(round(max(0.0, estimate.combined_delta) * 100, 2), 7.0)
+
         # Cap the combined impact at 7% for realistic expectations (matches frontend caps)
         total_impact = sum(imp.impact for imp in improvements)
         return min(total_impact, 7.0)
@@ -0,0 +1,500 @@
+"""
+Major -> College Index
+
+One vectorized build of the major data the major-mapping services read:
+
+- catalog majors: ``major_1..3`` of the integrated catalog melted to one
+  (major, catalog row, position) row each, grouped by major and ordered by
+  acceptance rate within a major (catalog order breaks ties), so a major's
+  colleges are one contiguous slice
+- heuristic majors: colleges_known_for_majors_full_heuristic.csv exploded to
+  one (college, major, rank) row per listed major, with the raw names mapped
+  to IPEDS major families through a lookup built once over the unique names
+
+Both are compiled into the college data snapshot (``catalog_majors`` and
+``heuristic_majors``), so the melt, explode and name mapping are paid when
+the snapshot is built, not when a service is imported. ``MajorIndex`` reads
+the catalog rows as CSR arrays: major -> offsets into row / position arrays.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+CATALOG_MAJOR_COLUMNS = ("major_1", "major_2", "major_3")
+
+# Catalog selectivity tier -> the tier keys the mapping services use
+TIER_KEYS = {
+    "Elite": "elite",
+    "Highly Selective": "highly_selective",
+    "Moderately Selective": "selective",
+    "Less Selective": "moderately_selective",
+}
+DEFAULT_TIER_KEY = "moderately_selective"
+TIER_ORDER = ("elite", "highly_selective", "selective", "moderately_selective")
+
+# Majors a college also counts for when it lists one of these instead
+MAJOR_RELATIONSHIPS: Dict[str, List[str]] = {
+    'Computer Science': ['Engineering', 'Mathematics', 'Business'],
+    'Engineering': ['Computer Science', 'Mathematics', 'Physics'],
+    'Business': ['Economics', 'Liberal Arts'],
+    'Pre-Medicine': ['Biology', 'Chemistry', 'Engineering'],
+    'Medicine': ['Biology', 'Chemistry', 'Pre-Medicine'],
+    'Nursing': ['Biology', 'Pre-Medicine'],
+    'Psychology': ['Liberal Arts', 'Biology'],
+    'Mathematics': ['Computer Science', 'Engineering', 'Physics'],
+    'Physics': ['Mathematics', 'Engineering'],
+    'Biology': ['Pre-Medicine', 'Medicine', 'Nursing'],
+    'Chemistry': ['Pre-Medicine', 'Medicine', 'Biology'],
+    'Economics': ['Business', 'Mathematics'],
+    'English': ['Liberal Arts', 'History'],
+    'History': ['Liberal Arts', 'English'],
+    'Political Science': ['Liberal Arts', 'History'],
+    'Sociology': ['Liberal Arts', 'Psychology'],
+    'Art': ['Liberal Arts', 'Performing Arts'],
+    'Music': ['Performing Arts', 'Liberal Arts'],
+    'Film': ['Performing Arts', 'Art'],
+    'Education': ['Liberal Arts', 'Psychology'],
+    'Environmental Science': ['Biology', 'Chemistry', 'Engineering'],
+}
+
+# User-facing major names -> IPEDS major families
+MAJOR_NAME_MAP: Dict[str, str] = {
+    'Computer Science': 'Computer & Information Sciences',
+    'Business': 'Business, Management, Marketing & Support',
+    'Engineering': 'Engineering',
+    'Medicine': 'Health Professions & Related Programs',
+    'Pre-Medicine': 'Health Professions & Related Programs',
+    'Nursing': 'Health Professions & Related Programs',
+    'Psychology': 'Psychology',
+    'Biology': 'Biological & Biomedical Sciences',
+    'Mathematics': 'Mathematics & Statistics',
+    'Physics': 'Physical Sciences',
+    'Chemistry': 'Physical Sciences',
+    'English': 'English Language & Literature/Letters',
+    'History': 'History',
+    'Political Science': 'Social Sciences',
+    'Sociology': 'Social Sciences',
+    'Art': 'Visual & Performing Arts',
+    'Music': 'Visual & Performing Arts',
+    'Film': 'Visual & Performing Arts',
+    'Education': 'Education',
+    'Environmental Science': 'Biological & Biomedical Sciences',
+    'Economics': 'Social Sciences',
+    'Liberal Arts': 'Liberal Arts & Sciences, General Studies & Humanities',
+    'Philosophy': 'Philosophy & Religious Studies',
+    'Theology': 'Theology & Religious Vocations',
+    'Criminal Justice': 'Homeland Security, Law Enforcement & Firefighting',
+    'Communications': 'Communications Technologies & Support Services',
+    'Journalism': 'Communications Technologies & Support Services',
+    'Architecture': 'Engineering',
+    'Agriculture': 'Biological & Biomedical Sciences',
+    'Veterinary': 'Health Professions & Related Programs',
+    'Dentistry': 'Health Professions & Related Programs',
+    'Law': 'Legal Professions & Studies',
+    'Social Work': 'Public Administration & Social Service Professions',
+    'Public Health': 'Health Professions & Related Programs',
+    'Kinesiology': 'Parks, Recreation, Leisure, Fitness & Kinesiology',
+    'Sports Medicine': 'Health Professions & Related Programs',
+    'Data Science': 'Computer & Information Sciences',
+    'Information Technology': 'Computer & Information Sciences',
+    'Cybersecurity': 'Computer & Information Sciences',
+    'Software Engineering': 'Computer & Information Sciences',
+    'Mechanical Engineering': 'Engineering',
+    'Electrical Engineering': 'Engineering',
+    'Civil Engineering': 'Engineering',
+    'Chemical Engineering': 'Engineering',
+    'Biomedical Engineering': 'Engineering',
+    'Aerospace Engineering': 'Engineering',
+    'Industrial Engineering': 'Engineering',
+    'Environmental Engineering': 'Engineering',
+    'Finance': 'Business, Management, Marketing & Support',
+    'Accounting': 'Business, Management, Marketing & Support',
+    'Marketing': 'Business, Management, Marketing & Support',
+    'Management': 'Business, Management, Marketing & Support',
+    'International Business': 'Business, Management, Marketing & Support',
+    'Entrepreneurship': 'Business, Management, Marketing & Support',
+    'Human Resources': 'Business, Management, Marketing & Support',
+    'Operations Management': 'Business, Management, Marketing & Support',
+    'Supply Chain Management': 'Business, Management, Marketing & Support',
+    'Real Estate': 'Business, Management, Marketing & Support',
+    'Hospitality Management': 'Business, Management, Marketing & Support',
+    'Tourism': 'Business, Management, Marketing & Support',
+    'Event Management': 'Business, Management, Marketing & Support',
+    'Sports Management': 'Business, Management, Marketing & Support',
+    'Healthcare Administration': 'Health Professions & Related Programs',
+    'Public Administration': 'Public Administration & Social Service Professions',
+    'International Relations': 'Social Sciences',
+    'Anthropology': 'Social Sciences',
+    'Geography': 'Social Sciences',
+    'Urban Planning': 'Public Administration & Social Service Professions',
+    'Criminology': 'Social Sciences',
+    'Linguistics': 'Foreign Languages, Literatures & Linguistics',
+    'Foreign Languages': 'Foreign Languages, Literatures & Linguistics',
+    'Spanish': 'Foreign Languages, Literatures & Linguistics',
+    'French': 'Foreign Languages, Literatures & Linguistics',
+    'German': 'Foreign Languages, Literatures & Linguistics',
+    'Chinese': 'Foreign Languages, Literatures & Linguistics',
+    'Japanese': 'Foreign Languages, Literatures & Linguistics',
+    'Arabic': 'Foreign Languages, Literatures & Linguistics',
+    'Russian': 'Foreign Languages, Literatures & Linguistics',
+    'Italian': 'Foreign Languages, Literatures & Linguistics',
+    'Portuguese': 'Foreign Languages, Literatures & Linguistics',
+    'Korean': 'Foreign Languages, Literatures & Linguistics',
+    'Hebrew': 'Foreign Languages, Literatures & Linguistics',
+    'Theater': 'Visual & Performing Arts',
+    'Dance': 'Visual & Performing Arts',
+    'Acting': 'Visual & Performing Arts',
+    'Film Production': 'Visual & Performing Arts',
+    'Photography': 'Visual & Performing Arts',
+    'Graphic Design': 'Visual & Performing Arts',
+    'Fashion Design': 'Visual & Performing Arts',
+    'Interior Design': 'Visual & Performing Arts',
+    'Urban Design': 'Engineering',
+    'Landscape Architecture': 'Engineering',
+    'Industrial Design': 'Engineering',
+    'Product Design': 'Engineering',
+    'Game Design': 'Computer & Information Sciences',
+    'Web Design': 'Computer & Information Sciences',
+    'Digital Media': 'Computer & Information Sciences',
+    'Animation': 'Visual & Performing Arts',
+    'Illustration': 'Visual & Performing Arts',
+    'Painting': 'Visual & Performing Arts',
+    'Sculpture': 'Visual & Performing Arts',
+    'Ceramics': 'Visual & Performing Arts',
+    'Printmaking': 'Visual & Performing Arts',
+    'Drawing': 'Visual & Performing Arts',
+    'Art History': 'Visual & Performing Arts',
+    'Music Performance': 'Visual & Performing Arts',
+    'Music Education': 'Education',
+    'Music Theory': 'Visual & Performing Arts',
+    'Composition': 'Visual & Performing Arts',
+    'Conducting': 'Visual & Performing Arts',
+    'Jazz Studies': 'Visual & Performing Arts',
+    'Music Technology': 'Visual & Performing Arts',
+    'Audio Engineering': 'Visual & Performing Arts',
+    'Sound Design': 'Visual & Performing Arts',
+    'Music Therapy': 'Health Professions & Related Programs',
+    'Elementary Education': 'Education',
+    'Secondary Education': 'Education',
+    'Special Education': 'Education',
+    'Early Childhood Education': 'Education',
+    'Physical Education': 'Education',
+    'Educational Leadership': 'Education',
+    'Curriculum and Instruction': 'Education',
+    'Educational Psychology': 'Education',
+    'Counseling': 'Education',
+    'School Psychology': 'Psychology',
+    'Clinical Psychology': 'Psychology',
+    'Counseling Psychology': 'Psychology',
+    'Developmental Psychology': 'Psychology',
+    'Social Psychology': 'Psychology',
+    'Cognitive Psychology': 'Psychology',
+    'Behavioral Psychology': 'Psychology',
+    'Experimental Psychology': 'Psychology',
+    'Forensic Psychology': 'Psychology',
+    'Health Psychology': 'Psychology',
+    'Sports Psychology': 'Psychology',
+    'Industrial Psychology': 'Psychology',
+    'Organizational Psychology': 'Psychology',
+    'Human Factors': 'Psychology',
+    'Neuroscience': 'Biological & Biomedical Sciences',
+    'Biochemistry': 'Biological & Biomedical Sciences',
+    'Molecular Biology': 'Biological & Biomedical Sciences',
+    'Cell Biology': 'Biological & Biomedical Sciences',
+    'Genetics': 'Biological & Biomedical Sciences',
+    'Microbiology': 'Biological & Biomedical Sciences',
+    'Immunology': 'Biological & Biomedical Sciences',
+    'Ecology': 'Biological & Biomedical Sciences',
+    'Marine Biology': 'Biological & Biomedical Sciences',
+    'Wildlife Biology': 'Biological & Biomedical Sciences',
+    'Botany': 'Biological & Biomedical Sciences',
+    'Zoology': 'Biological & Biomedical Sciences',
+    'Entomology': 'Biological & Biomedical Sciences',
+    'Paleontology': 'Biological & Biomedical Sciences',
+    'Biotechnology': 'Biological & Biomedical Sciences',
+    'Bioinformatics': 'Biological & Biomedical Sciences',
+    'Biomedical Sciences': 'Biological & Biomedical Sciences',
+    'Pre-Veterinary': 'Biological & Biomedical Sciences',
+    'Pre-Dental': 'Biological & Biomedical Sciences',
+    'Pre-Pharmacy': 'Biological & Biomedical Sciences',
+    'Pre-Physical Therapy': 'Health Professions & Related Programs',
+    'Pre-Occupational Therapy': 'Health Professions & Related Programs',
+    'Pre-Speech Therapy': 'Health Professions & Related Programs',
+    'Pre-Athletic Training': 'Health Professions & Related Programs',
+    'Pre-Chiropractic': 'Health Professions & Related Programs',
+    'Pre-Optometry': 'Health Professions & Related Programs',
+    'Pre-Podiatry': 'Health Professions & Related Programs',
+    'Pre-Audiology': 'Health Professions & Related Programs',
+    'Pre-Nursing': 'Health Professions & Related Programs',
+    'Pre-Physician Assistant': 'Health Professions & Related Programs',
+    'Pre-Nurse Practitioner': 'Health Professions & Related Programs',
+    'Pre-Midwifery': 'Health Professions & Related Programs',
+    'Pre-Radiology': 'Health Professions & Related Programs',
+    'Pre-Respiratory Therapy': 'Health Professions & Related Programs',
+    'Pre-Medical Technology': 'Health Professions & Related Programs',
+    'Pre-Medical Laboratory Science': 'Health Professions & Related Programs',
+    'Pre-Nuclear Medicine': 'Health Professions & Related Programs',
+    'Pre-Radiation Therapy': 'Health Professions & Related Programs',
+    'Pre-Sonography': 'Health Professions & Related Programs',
+    'Pre-MRI Technology': 'Health Professions & Related Programs',
+    'Pre-CT Technology': 'Health Professions & Related Programs',
+    'Pre-Ultrasound Technology': 'Health Professions & Related Programs',
+    'Pre-Emergency Medical Services': 'Health Professions & Related Programs',
+    'Pre-Paramedic': 'Health Professions & Related Programs',
+    'Pre-Fire Science': 'Homeland Security, Law Enforcement & Firefighting',
+    'Pre-Criminal Justice': 'Homeland Security, Law Enforcement & Firefighting',
+    'Pre-Law Enforcement': 'Homeland Security, Law Enforcement & Firefighting',
+    'Pre-Forensic Science': 'Biological & Biomedical Sciences',
+    'Pre-Cybersecurity': 'Computer & Information Sciences',
+    'Pre-Information Systems': 'Computer & Information Sciences',
+    'Pre-Computer Engineering': 'Engineering',
+    'Pre-Electrical Engineering': 'Engineering',
+    'Pre-Mechanical Engineering': 'Engineering',
+    'Pre-Civil Engineering': 'Engineering',
+    'Pre-Chemical Engineering': 'Engineering',
+    'Pre-Biomedical Engineering': 'Engineering',
+    'Pre-Aerospace Engineering': 'Engineering',
+    'Pre-Industrial Engineering': 'Engineering',
+    'Pre-Environmental Engineering': 'Engineering',
+    'Pre-Materials Engineering': 'Engineering',
+    'Pre-Nuclear Engineering': 'Engineering',
+    'Pre-Petroleum Engineering': 'Engineering',
+    'Pre-Mining Engineering': 'Engineering',
+    'Pre-Geological Engineering': 'Engineering',
+    'Pre-Ocean Engineering': 'Engineering',
+    'Pre-Agricultural Engineering': 'Engineering',
+    'Pre-Biological Engineering': 'Engineering',
+    'Pre-Food Engineering': 'Engineering',
+    'Pre-Textile Engineering': 'Engineering',
+    'Pre-Manufacturing Engineering': 'Engineering',
+    'Pre-Systems Engineering': 'Engineering',
+    'Pre-Operations Research': 'Engineering',
+    'Pre-Engineering Physics': 'Engineering',
+    'Pre-Engineering Mathematics': 'Engineering',
+    'Pre-Engineering Chemistry': 'Engineering',
+    'Pre-Engineering Biology': 'Engineering',
+    'Pre-Engineering Economics': 'Engineering',
+    'Pre-Engineering Management': 'Engineering',
+    'Pre-Engineering Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Computer Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Electrical Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Mechanical Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Civil Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Chemical Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Biomedical Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Aerospace Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Industrial Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Environmental Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Materials Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Nuclear Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Petroleum Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Mining Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Geological Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Ocean Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Agricultural Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Biological Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Food Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Textile Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Manufacturing Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Systems Technology': 'Engineering Technologies & Related Fields',
+    'Pre-Operations Technology': 'Engineering Technologies & Related Fields',
+}
+
+# Keyword rules for names missing from MAJOR_NAME_MAP, first match wins
+MAJOR_KEYWORD_RULES: List[Tuple[Tuple[str, ...], str]] = [
+    (('engineer', 'mechatronic', 'robotic', 'aerospace', 'civil', 'electrical', 'mechanical', 'chemical', 'industrial', 'materials', 'automotive'), 'Engineering'),
+    (('computer', 'software', 'cyber', 'network', 'ai', 'machine learning', 'data', 'information', 'hci', 'ui/ux', 'game', 'app', 'web', 'cloud'), 'Computer & Information Sciences'),
+    (('business', 'finance', 'account', 'marketing', 'management', 'supply chain', 'logistics', 'real estate', 'entrepreneur', 'commerce', 'actuarial', 'analytics'), 'Business, Management, Marketing & Support'),
+    (('nurs', 'health', 'med', 'clinical', 'therapy', 'pharm', 'veter', 'dental', 'nutrition', 'kinesi', 'athletic', 'public health', 'occupational', 'speech', 'radiologic', 'respiratory'), 'Health Professions & Related Programs'),
+    (('bio', 'neuro', 'genetic', 'immuno', 'zoology', 'botany', 'marine', 'ecology', 'environment', 'plant', 'animal', 'biotech', 'biomedical'), 'Biological & Biomedical Sciences'),
+    (('chem', 'physics', 'geology', 'earth', 'meteorology', 'astrophysics', 'materials science', 'astronomy', 'oceanography', 'climate', 'meteorology'), 'Physical Sciences'),
+    (('math', 'stat', 'applied mathematics', 'quantitative'), 'Mathematics & Statistics'),
+    (('psych',), 'Psychology'),
+    (('political', 'policy', 'sociol', 'anthrop', 'crimin', 'geograph', 'international', 'global studies', 'urban studies', 'urban planning', 'economics', 'cognitive science'), 'Social Sciences'),
+    (('law', 'legal', 'paralegal'), 'Legal Professions & Studies'),
+    (('education', 'teaching', 'ed '), 'Education'),
+    (('art', 'music', 'dance', 'film', 'theater', 'theatre', 'design', 'fashion', 'graphic', 'studio', 'fine arts', 'photography', 'screenwriting', 'animation', 'perform'), 'Visual & Performing Arts'),
+    (('journalism', 'media', 'communication', 'broadcast', 'public relations', 'advertis'), 'Communications Technologies & Support Services'),
+    (('philosophy', 'religion', 'theology'), 'Philosophy & Religious Studies'),
+    (('language', 'linguistics', 'french', 'spanish', 'german', 'italian', 'japanese', 'korean', 'arabic', 'russian', 'chinese', 'portuguese', 'latin', 'hebrew', 'classical'), 'Foreign Languages, Literatures & Linguistics'),
+    (('agric', 'hort', 'animal science', 'forestry', 'fisheries', 'soil', 'agribusiness'), 'CIP 1'),  # Agriculture & related
+    (('construction', 'mechanic', 'repair', 'manufacturing', 'industrial design', 'automotive', 'mechatronics'), 'Engineering Technologies & Related Fields'),
+]
+
+DEFAULT_IPEDS_MAJOR = 'Liberal Arts & Sciences, General Studies & Humanities'
+
+
+def map_major_name(user_major: str) -> str:
+    """Map a user-selected (or heuristic-file) major name to its IPEDS major family"""
+    mapped = MAJOR_NAME_MAP.get(user_major)
+    if mapped:
+        return mapped
+    lower = (user_major or "").strip().lower()
+    for keywords, ipeds_major in MAJOR_KEYWORD_RULES:
+        if any(keyword in lower for keyword in keywords):
+            return ipeds_major
+    return DEFAULT_IPEDS_MAJOR
+
+
+def catalog_major_rows(frame):
+    """
+    Catalog majors as (major, row, position) rows, grouped by major and in
+    acceptance-rate order within a major
+
+    ``row`` is the catalog row number and ``position`` the 1-based major
+    column; a college listing a major twice keeps its first position.
+    """
+    import pandas as pd
+
+    columns = [column for column in CATALOG_MAJOR_COLUMNS if column in frame]
+    long = (
+        frame[columns].reset_index(drop=True).rename_axis("row").reset_index()
+        .melt(id_vars="row", var_name="column", value_name="major")
+        .dropna(subset=["major"])
+    )
+    long["position"] = long["column"].map({column: i for i, column in enumerate(CATALOG_MAJOR_COLUMNS, start=1)})
+    if "acceptance_rate" in frame:
+        acceptance = pd.to_numeric(frame["acceptance_rate"], errors="coerce").to_numpy(dtype=np.float64)
+    else:
+        acceptance = np.full(len(frame), np.nan)
+    long["acceptance_rate"] = acceptance[long["row"].to_numpy()]
+    long = (
+        long.sort_values(["major", "acceptance_rate", "row", "position"], kind="stable", na_position="last")
+        .drop_duplicates(["major", "row"])
+    )
+    return pd.DataFrame({
+        "major": long["major"].astype(str).to_numpy(dtype=object),
+        "row": long["row"].to_numpy(dtype=np.int64),
+        "position": long["position"].to_numpy(dtype=np.int64),
+    })
+
+
+def heuristic_major_rows(frame):
+    """
+    The heuristic "known for" file as (college, major_raw, major, rank) rows
+
+    ``major`` is ``map_major_name(major_raw)``. A college listed on several
+    lines keeps only its last non-empty line, which is what replacing the
+    college's entry line by line used to leave.
+    """
+    import pandas as pd
+
+    colleges = frame["college_name"].fillna("").astype(str).str.strip() if "college_name" in frame else pd.Series("", index=frame.index)
+    listed = frame["known_for_majors"].fillna("").astype(str) if "known_for_majors" in frame else pd.Series("", index=frame.index)
+    long = (
+        pd.DataFrame({"college": colleges, "major_raw": listed.str.split(";")})
+        .rename_axis("source_row").reset_index()
+        .explode("major_raw")
+    )
+    long["major_raw"] = long["major_raw"].fillna("").str.strip()
+    long = long[(long["college"] != "") & (long["major_raw"] != "")]
+    long = long[long["source_row"] == long.groupby("college")["source_row"].transform("max")]
+
+    lookup = {name: map_major_name(name) for name in long["major_raw"].unique()}
+    return pd.DataFrame({
+        "college": long["college"].to_numpy(dtype=object),
+        "major_raw": long["major_raw"].to_numpy(dtype=object),
+        "major": long["major_raw"].map(lookup).to_numpy(dtype=object),
+        "rank": (long.groupby("source_row").cumcount() + 1).to_numpy(dtype=np.int64),
+    })
+
+
+class MajorIndex:
+    """
+    Catalog major -> college rows as CSR arrays
+
+    ``rows[offsets[i]:offsets[i + 1]]`` are the catalog rows listing
+    ``majors[i]``, in acceptance-rate order; ``positions`` is the major column
+    (1-3) each row lists it in.
+    """
+
+    def __init__(
+        self,
+        major: Sequence[str],
+        row: Sequence[int],
+        position: Sequence[int],
+        names: Sequence[str],
+        tiers: Sequence[Optional[str]],
+        acceptance_rates: Sequence[float],
+    ):
+        major = np.asarray(major, dtype=object)
+        starts = np.flatnonzero(np.r_[True, major[1:] != major[:-1]]) if len(major) else np.zeros(0, dtype=np.int64)
+        self.majors: List[str] = major[starts].tolist()
+        self.offsets = np.r_[starts, len(major)].astype(np.int64)
+        self._slot = {name: i for i, name in enumerate(self.majors)}
+        self.rows = np.asarray(row, dtype=np.int64)
+        self.positions = np.asarray(position, dtype=np.int8)
+
+        self.names = np.asarray(names, dtype=object)
+        self.tier_keys = np.array([TIER_KEYS.get(tier, DEFAULT_TIER_KEY) for tier in tiers], dtype=object)
+        # Each catalog row's place in (acceptance rate, catalog order), for merging several majors
+        acceptance = np.asarray(acceptance_rates, dtype=np.float64)
+        order = np.lexsort((np.arange(len(acceptance)), acceptance))
+        self._order_rank = np.empty(len(order), dtype=np.int64)
+        self._order_rank[order] = np.arange(len(order))
+
+    @classmethod
+    def from_frame(cls, frame) -> "MajorIndex":
+        """Build from a catalog DataFrame (name, selectivity_tier, acceptance_rate, major_1..3)."""
+        long = catalog_major_rows(frame)
+        return cls(
+            long["major"], long["row"], long["position"],
+            frame["name"].tolist(), frame["selectivity_tier"].tolist(), frame["acceptance_rate"].tolist(),
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> "MajorIndex":
+        """Read the prebuilt index from the college data snapshot."""
+        long = snapshot.table("catalog_majors")
+        colleges = snapshot.table("colleges")
+        return cls(
+            long.values("major"), long.values("row"), long.values("position"),
+            colleges.values("name"), colleges.values("selectivity_tier"),
+            [np.nan if rate is None else rate for rate in colleges.values("acceptance_rate")],
+        )
+
+    def __contains__(self, major: str) -> bool:
+        return major in self._slot
+
+    def all_majors(self) -> List[str]:
+        """Every catalog major, sorted."""
+        return list(self.majors)
+
+    def rows_for(self, major: str) -> np.ndarray:
+        """Catalog rows listing ``major``, in acceptance-rate order."""
+        slot = self._slot.get(major)
+        if slot is None:
+            return np.zeros(0, dtype=np.int64)
+        return self.rows[self.offsets[slot]:self.offsets[slot + 1]]
+
+    def rows_for_any(self, majors: Iterable[str]) -> np.ndarray:
+        """Catalog rows listing any of ``majors``, once each, in acceptance-rate order."""
+        slices = [self.rows_for(major) for major in majors]
+        rows = np.unique(np.concatenate(slices)) if slices else np.zeros(0, dtype=np.int64)
+        return rows[np.argsort(self._order_rank[rows], kind="stable")]
+
+    def names_by_tier(self, rows: np.ndarray) -> Dict[str, List[str]]:
+        """College names of ``rows`` split by tier key (order kept)."""
+        tiers = self.tier_keys[rows]
+        return {tier: self.names[rows[tiers == tier]].tolist() for tier in TIER_ORDER}
+
+
+def load_catalog_major_index(data_path: Optional[str] = None):
+    """
+    (catalog DataFrame, MajorIndex): read from a catalog CSV when a path is
+    given, otherwise the college snapshot's catalog and prebuilt index
+    """
+    import pandas as pd
+
+    if data_path is not None:
+        frame = pd.read_csv(data_path)
+        return frame, MajorIndex.from_frame(frame)
+
+    from .college_snapshot import get_college_snapshot
+
+    snapshot = get_college_snapshot()
+    frame = snapshot.table("colleges").to_frame()
+    if snapshot.has_table("catalog_majors"):
+        return frame, MajorIndex.from_snapshot(snapshot)
+    return frame, MajorIndex.from_frame(frame)
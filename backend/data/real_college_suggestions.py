@@ -3,38 +3,44 @@ Real College Suggestions System
 Uses real IPEDS data to suggest colleges based on major strength
 """
 
-import os
-import pandas as pd
-import numpy as np
 from typing import Dict, List, Tuple, Optional
+from .college_snapshot import get_college_snapshot
 from .real_ipeds_major_mapping import real_ipeds_mapping
 
 class RealCollegeSuggestions:
     def __init__(self):
         """Initialize with real college and major data"""
-        self.college_df = None
+        self.colleges = None
         self.college_by_name = {}  # Index for fast lookup by name
+        self.first_college_by_name = {}  # First catalog row per name (fallback suggestions)
+        self._college_df = None
         self.load_college_data()
 
     def load_college_data(self):
         """Load the college data and create indexes for fast lookup"""
         try:
-            # Get the directory of this file and construct the path
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            csv_path = os.path.join(current_dir, 'raw', 'real_colleges_integrated.csv')
-            self.college_df = pd.read_csv(csv_path)
-            print(f"Loaded college data: {self.college_df.shape}")
+            self.colleges = get_college_snapshot().table('colleges')
+            print(f"Loaded college data: ({self.colleges.rows}, {len(self.colleges.columns)})")
 
             # Create index for fast lookup by name
-            for idx, row in self.college_df.iterrows():
+            for row in self.colleges.iter_rows():
                 college_name = row.get('name', '')
                 if college_name:
                     self.college_by_name[college_name] = row
+                    self.first_college_by_name.setdefault(college_name, row)
 
             print(f"Indexed {len(self.college_by_name)} colleges by name")
         except Exception as e:
             print(f"Error loading college data: {e}")
-            self.college_df = pd.DataFrame()
+            self.colleges = None
+
+    @property
+    def college_df(self):
+        """The catalog as a DataFrame, materialized from the snapshot on first use."""
+        if self._college_df is None:
+            import pandas as pd
+            self._college_df = self.colleges.to_frame() if self.colleges is not None else pd.DataFrame()
+        return self._college_df
 
     def get_colleges_for_major_and_tier(self, major: str, tier: str, limit: int = None) -> List[Dict]:
         """Get colleges that offer a specific major in a specific tier"""
@@ -257,10 +263,9 @@ class RealCollegeSuggestions:
         # Convert to college data and sort by major fit score
         college_data = []
         for college_name in all_colleges:
-            college_row = self.college_df[self.college_df['name'] == college_name]
+            row = self.first_college_by_name.get(college_name)
 
-            if len(college_row) > 0:
-                row = college_row.iloc[0]
+            if row is not None:
                 major_fit_score = real_ipeds_mapping.get_major_strength_score(college_name, ipeds_major)
 
                 college_info = {
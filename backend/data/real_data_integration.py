@@ -1,6 +1,9 @@
 """
 Real Data Integration System
 Integrates real college data from multiple sources to replace estimated data
+
+real_colleges_integrated.csv is now built by the catalog ETL
+(`python -m data.catalog_etl` from backend/), which vectorizes these steps.
 """
 
 import pandas as pd
@@ -4,55 +4,19 @@ Uses actual major data from the integrated dataset
 """
 
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from .major_index import load_catalog_major_index
 
 class RealMajorMapping:
-    def __init__(self, data_path: str = 'backend/data/raw/real_colleges_integrated.csv'):
-        """Initialize with real college data"""
-        self.df = pd.read_csv(data_path)
+    def __init__(self, data_path: Optional[str] = None):
+        """Initialize with real college data (the college snapshot's catalog and major index by default)"""
+        self.df, self.index = load_catalog_major_index(data_path)
         self.major_mapping = self._build_major_mapping()
         
     def _build_major_mapping(self) -> Dict[str, Dict[str, List[str]]]:
-        """Build major mapping from real data"""
-        mapping = {}
-        
-        # Get all unique majors from the data
-        all_majors = set()
-        for _, row in self.df.iterrows():
-            for col in ['major_1', 'major_2', 'major_3']:
-                if pd.notna(row[col]):
-                    all_majors.add(row[col])
-        
-        # Build mapping for each major
-        for major in all_majors:
-            mapping[major] = {
-                'elite': [],
-                'highly_selective': [],
-                'selective': [],
-                'moderately_selective': []
-            }
-            
-            # Find colleges that offer this major
-            colleges_with_major = []
-            for _, row in self.df.iterrows():
-                if (row['major_1'] == major or 
-                    row['major_2'] == major or 
-                    row['major_3'] == major):
-                    colleges_with_major.append({
-                        'name': row['name'],
-                        'selectivity_tier': row['selectivity_tier'],
-                        'acceptance_rate': row['acceptance_rate']
-                    })
-            
-            # Sort by selectivity and categorize
-            colleges_with_major.sort(key=lambda x: x['acceptance_rate'])
-            
-            for college in colleges_with_major:
-                tier = college['selectivity_tier']
-                if tier in mapping[major]:
-                    mapping[major][tier].append(college['name'])
-        
-        return mapping
+        """Build major mapping (major -> tier -> colleges, by acceptance rate) from the major index"""
+        return {major: self.index.names_by_tier(self.index.rows_for(major)) for major in self.index.majors}
     
     def get_colleges_for_major(self, major: str, tier: str) -> List[str]:
         """Get colleges that offer a specific major in a specific tier"""
@@ -132,12 +96,7 @@ class RealMajorMapping:
     
     def get_all_majors(self) -> List[str]:
         """Get list of all majors in the system"""
-        all_majors = set()
-        for _, row in self.df.iterrows():
-            for col in ['major_1', 'major_2', 'major_3']:
-                if pd.notna(row[col]):
-                    all_majors.add(row[col])
-        return sorted(list(all_majors))
+        return self.index.all_majors()
     
     def get_college_majors(self, college_name: str) -> List[str]:
         """Get all majors offered by a specific college"""
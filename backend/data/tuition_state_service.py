@@ -4,11 +4,12 @@ Tuition State Service
 Determines in-state vs out-of-state tuition based on zipcode and college location
 """
 
-from .zippopotam_service import zippopotam_service
+from .zip_geography import zip_geography, resolve_zipcode
 from .city_state_database import city_state_database
+from .college_identity import get_college_identity
+from .college_snapshot import get_college_snapshot
 import logging
 import pandas as pd
-import os
 from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -18,25 +19,27 @@ class TuitionStateService:
         """Initialize the tuition state service"""
         self.tuition_data = {}
         self.college_states = {}
-        self.zipcode_states = {}
         self.load_tuition_data()
         self.load_zipcode_state_mapping()
+        # Tuition rows by catalog unitid, for names that aren't an exact key
+        self.tuition_by_unitid = get_college_identity().index(self.tuition_data)
     
     def load_tuition_data(self):
-        """Load tuition data from CSV file"""
+        """Load tuition data from Tuition_InOut_2023.csv (via the college snapshot)"""
         try:
-            csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'Tuition_InOut_2023.csv')
-            if not os.path.exists(csv_path):
-                csv_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'Tuition_InOut_2023.csv')
+            table = get_college_snapshot().table('tuition_inout')
+            logger.info(f"Loaded tuition data: {table.rows} colleges")
             
-            df = pd.read_csv(csv_path)
-            logger.info(f"Loaded tuition data: {len(df)} colleges")
-            
-            for _, row in df.iterrows():
-                college_name = str(row['College']).strip()
-                matched_name = str(row['Matched_INSTNM']).strip()
-                in_state_tuition = float(row['In-State Tuition (tuition+fees)']) if pd.notna(row['In-State Tuition (tuition+fees)']) else None
-                out_state_tuition = float(row['Out-of-State Tuition (tuition+fees)']) if pd.notna(row['Out-of-State Tuition (tuition+fees)']) else None
+            for college, matched, in_state, out_state in zip(
+                table.values('College'),
+                table.values('Matched_INSTNM'),
+                table.values('In-State Tuition (tuition+fees)'),
+                table.values('Out-of-State Tuition (tuition+fees)'),
+            ):
+                college_name = str(college).strip()
+                matched_name = str(matched).strip()
+                in_state_tuition = float(in_state) if pd.notna(in_state) else None
+                out_state_tuition = float(out_state) if pd.notna(out_state) else None
                 
                 # Store both college name and matched name
                 self.tuition_data[college_name.lower()] = {
@@ -84,75 +87,41 @@ class TuitionStateService:
                 break
     
     def load_zipcode_state_mapping(self):
-        """Load zipcode to state mapping from College_State_Zip.csv"""
+        """Load college to state mapping from College_State_Zip.csv (via the college snapshot)"""
         try:
-            csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'College_State_Zip.csv')
-            if not os.path.exists(csv_path):
-                csv_path = os.path.join(os.path.dirname(__file__), '..', '..', '..', 'College_State_Zip.csv')
-            
-            df = pd.read_csv(csv_path)
-            logger.info(f"Loaded college state mapping: {len(df)} colleges")
+            table = get_college_snapshot().table('college_state_zip')
+            logger.info(f"Loaded college state mapping: {table.rows} colleges")
             
             # Create college to state mapping
-            for _, row in df.iterrows():
-                college_name = str(row['College']).strip()
-                state = str(row['State']).strip()
-                zipcode = str(row['ZIP']).strip()
-                
-                # Store college to state mapping
-                self.college_states[college_name.lower()] = state
-                
-                # Store zipcode to state mapping (use first 2 digits)
-                if zipcode and len(zipcode) >= 2:
-                    zipcode_prefix = zipcode[:2]
-                    self.zipcode_states[zipcode_prefix] = state
+            for college, state_value in zip(table.values('College'), table.values('State')):
+                self.college_states[str(college).strip().lower()] = str(state_value).strip()
                     
         except Exception as e:
             logger.error(f"Error loading college state mapping: {e}")
-            # Fallback to basic zipcode patterns
-            zipcode_patterns = {
-                'AL': ['35', '36'], 'AK': ['99'], 'AZ': ['85', '86'], 'AR': ['71', '72'],
-                'CA': ['90', '91', '92', '93', '94', '95'], 'CO': ['80', '81'], 'CT': ['06'],
-                'DE': ['19'], 'FL': ['32', '33', '34'], 'GA': ['30', '31'], 'HI': ['96'],
-                'ID': ['83'], 'IL': ['60', '61', '62'], 'IN': ['46', '47'], 'IA': ['50', '51'],
-                'KS': ['66', '67'], 'KY': ['40', '41', '42'], 'LA': ['70', '71'], 'ME': ['03', '04'],
-                'MD': ['20', '21'], 'MA': ['01', '02'], 'MI': ['48', '49'], 'MN': ['55', '56'],
-                'MS': ['38', '39'], 'MO': ['63', '64', '65'], 'MT': ['59'], 'NE': ['68', '69'],
-                'NV': ['89'], 'NH': ['03'], 'NJ': ['07', '08'], 'NM': ['87', '88'],
-                'NY': ['10', '11', '12', '13', '14'], 'NC': ['27', '28'], 'ND': ['58'],
-                'OH': ['43', '44', '45'], 'OK': ['73', '74'], 'OR': ['97'], 'PA': ['15', '16', '17', '18', '19'],
-                'RI': ['02'], 'SC': ['29'], 'SD': ['57'], 'TN': ['37', '38'], 'TX': ['75', '76', '77', '78', '79'],
-                'UT': ['84'], 'VT': ['05'], 'VA': ['22', '23', '24'], 'WA': ['98'],
-                'WV': ['24', '25', '26'], 'WI': ['53', '54'], 'WY': ['82']
-            }
-            
-            # Create reverse mapping for quick lookup
-            for state, patterns in zipcode_patterns.items():
-                for pattern in patterns:
-                    self.zipcode_states[pattern] = state
     
     def get_state_from_zipcode(self, zipcode: str) -> Optional[str]:
-        """Get state from zipcode"""
-        if not zipcode or len(zipcode) < 5:
-            return None
-        
-        # Use first 2 digits of zipcode for state determination
-        zipcode_prefix = zipcode[:2]
-        return self.zipcode_states.get(zipcode_prefix)
+        """Get state from zipcode (bundled USPS prefix table, no network)"""
+        return zip_geography.state_for_zipcode(zipcode)
     
-    def get_tuition_for_college_and_zipcode(self, college_name: str, zipcode: str) -> Dict[str, any]:
-        """Get tuition information for a college based on zipcode using Zippopotam API"""
+    async def get_tuition_for_college_and_zipcode_async(self, college_name: str, zipcode: str) -> Dict[str, any]:
+        """Like get_tuition_for_college_and_zipcode, with the optional Zippopotam fallback for unknown ZIPs"""
+        zipcode_location = await resolve_zipcode(zipcode)
+        return self.get_tuition_for_college_and_zipcode(college_name, zipcode, zipcode_location)
+    
+    def get_tuition_for_college_and_zipcode(
+        self,
+        college_name: str,
+        zipcode: str,
+        zipcode_location: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, any]:
+        """Get tuition information for a college based on zipcode (resolved offline unless a location is given)"""
         try:
             college_lower = college_name.lower().strip()
+            # Resolved once; the tuition row and the college state both key off it
+            unitid = get_college_identity().resolve(college_name)
             
             # Get tuition data for the college
-            tuition_info = self.tuition_data.get(college_lower)
-            if not tuition_info:
-                # Try partial matching
-                for key, value in self.tuition_data.items():
-                    if college_lower in key or key in college_lower:
-                        tuition_info = value
-                        break
+            tuition_info = self.tuition_data.get(college_lower) or self.tuition_by_unitid.get(unitid)
             
             if not tuition_info:
                 return {
@@ -163,10 +132,11 @@ class TuitionStateService:
                 }
             
             # Get college state from database
-            college_state = city_state_database.get_state_for_college(college_name)
+            college_state = city_state_database.get_state_for_college(college_name, unitid)
             
-            # Get zipcode location using Zippopotam API
-            zipcode_location = zippopotam_service.get_location_from_zipcode(zipcode)
+            # Get zipcode location from the bundled ZIP table
+            if zipcode_location is None:
+                zipcode_location = zip_geography.lookup(zipcode)
             
             is_in_state = False
             zipcode_state = None
@@ -176,13 +146,9 @@ class TuitionStateService:
                 zipcode_state = zipcode_location['state_abbr']
                 zipcode_city = zipcode_location['city']
                 
-                # Check if zipcode state matches college state
-                if zipcode_state.upper() == college_state.upper():
-                    is_in_state = True
-                else:
-                    # Additional check: see if the zipcode city is in the college's state
-                    # This handles cases where zipcode might be in a different city but same state
-                    is_in_state = city_state_database.is_city_in_state(zipcode_city, college_state)
+                # The ZIP's own state decides residency; a same-named city
+                # elsewhere in the college's state says nothing about it
+                is_in_state = zipcode_state.upper() == college_state.upper()
             
             # Get appropriate tuition
             if is_in_state and tuition_info['in_state'] is not None:
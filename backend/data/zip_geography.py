@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Offline ZIP code geography
+Resolves a 5-digit ZIP code to (city, state) without any network call
+
+Two bundled indexes answer every lookup:
+
+1. State: a 1000-slot array indexed by the ZIP's 3-digit prefix, filled from
+   the USPS 3-digit ZIP prefix ranges in data/raw/zip3_state_ranges.csv
+   (prefixes are assigned to sectional centers, which never cross state
+   lines), plus the few 5-digit territory ZIPs that share a state's prefix
+2. City: exact 5-digit ZIPs of every catalog college whose city is known,
+   from College_State_Zip.csv joined with the college catalog (via the
+   college snapshot)
+
+The Zippopotam.us API is only consulted, asynchronously, when the prefix is
+unassigned and the fallback is enabled (see `resolve_zipcode`).
+"""
+
+import csv
+import logging
+import numbers
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .college_snapshot import get_college_snapshot
+
+logger = logging.getLogger(__name__)
+
+ZIP3_RANGES_PATH = Path(__file__).parent / 'raw' / 'zip3_state_ranges.csv'
+
+STATE_NAMES = {
+    'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas', 'CA': 'California',
+    'CO': 'Colorado', 'CT': 'Connecticut', 'DE': 'Delaware', 'DC': 'District of Columbia',
+    'FL': 'Florida', 'GA': 'Georgia', 'HI': 'Hawaii', 'ID': 'Idaho', 'IL': 'Illinois',
+    'IN': 'Indiana', 'IA': 'Iowa', 'KS': 'Kansas', 'KY': 'Kentucky', 'LA': 'Louisiana',
+    'ME': 'Maine', 'MD': 'Maryland', 'MA': 'Massachusetts', 'MI': 'Michigan', 'MN': 'Minnesota',
+    'MS': 'Mississippi', 'MO': 'Missouri', 'MT': 'Montana', 'NE': 'Nebraska', 'NV': 'Nevada',
+    'NH': 'New Hampshire', 'NJ': 'New Jersey', 'NM': 'New Mexico', 'NY': 'New York',
+    'NC': 'North Carolina', 'ND': 'North Dakota', 'OH': 'Ohio', 'OK': 'Oklahoma', 'OR': 'Oregon',
+    'PA': 'Pennsylvania', 'RI': 'Rhode Island', 'SC': 'South Carolina', 'SD': 'South Dakota',
+    'TN': 'Tennessee', 'TX': 'Texas', 'UT': 'Utah', 'VT': 'Vermont', 'VA': 'Virginia',
+    'WA': 'Washington', 'WV': 'West Virginia', 'WI': 'Wisconsin', 'WY': 'Wyoming',
+    'PR': 'Puerto Rico', 'VI': 'Virgin Islands', 'GU': 'Guam', 'AS': 'American Samoa',
+    'MP': 'Northern Mariana Islands', 'FM': 'Federated States of Micronesia',
+    'MH': 'Marshall Islands', 'PW': 'Palau',
+    'AA': 'Armed Forces Americas', 'AE': 'Armed Forces Europe', 'AP': 'Armed Forces Pacific',
+}
+
+# Territories sharing a prefix with a state (967 = Hawaii, 969 = Guam)
+ZIP5_STATE_OVERRIDES = {
+    '96799': 'AS',
+    '96939': 'PW', '96940': 'PW',
+    '96941': 'FM', '96942': 'FM', '96943': 'FM', '96944': 'FM',
+    '96950': 'MP', '96951': 'MP', '96952': 'MP',
+    '96960': 'MH', '96970': 'MH',
+}
+
+
+def normalize_zipcode(zipcode) -> Optional[str]:
+    """
+    5-digit string for a ZIP or ZIP+4, or None if malformed
+
+    Numbers (ZIP columns read as numeric, e.g. 2138) get their leading zeros
+    back; strings must carry all five digits.
+    """
+    if isinstance(zipcode, numbers.Real) and not isinstance(zipcode, bool):
+        if zipcode != zipcode or not 0 < zipcode < 100000:  # NaN / out of range
+            return None
+        return f"{int(zipcode):05d}"
+    if not isinstance(zipcode, str):
+        return None
+    text = zipcode.strip().split('-', 1)[0]
+    if len(text) != 5 or not text.isdigit():
+        return None
+    return text
+
+
+class ZipGeography:
+    def __init__(self, ranges_path: Path = ZIP3_RANGES_PATH):
+        """Build the prefix and exact-ZIP indexes"""
+        self.prefix_states: List[Optional[str]] = [None] * 1000
+        self.zip_cities: Dict[str, str] = {}
+        self.load_prefix_ranges(ranges_path)
+        self.load_college_zipcodes()
+
+    def load_prefix_ranges(self, path: Path):
+        """Fill the 3-digit prefix -> state array from the USPS range table"""
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                for prefix in range(int(row['prefix_start']), int(row['prefix_end']) + 1):
+                    self.prefix_states[prefix] = row['state']
+        logger.info(f"Loaded ZIP prefix ranges: {sum(1 for s in self.prefix_states if s)} prefixes")
+
+    def load_college_zipcodes(self):
+        """Index ZIP -> city for catalog colleges (College_State_Zip.csv joined with the catalog)"""
+        try:
+            snapshot = get_college_snapshot()
+            colleges = snapshot.table('colleges')
+            cities = {}
+            for name, city, state in zip(colleges.values('name'), colleges.values('city'), colleges.values('state')):
+                if name and city:
+                    cities[str(name).strip().lower()] = (str(city).strip(), str(state).strip().upper())
+
+            zips = snapshot.table('college_state_zip')
+            for college, zip_value in zip(zips.values('College'), zips.values('ZIP')):
+                zipcode = normalize_zipcode(zip_value)
+                match = cities.get(str(college).strip().lower())
+                # Only keep cities that agree with the prefix index's state
+                if zipcode and match and self.state_for_zipcode(zipcode) == match[1]:
+                    self.zip_cities.setdefault(zipcode, match[0])
+            logger.info(f"Indexed {len(self.zip_cities)} college ZIP codes with cities")
+        except Exception as e:
+            logger.error(f"Error loading college ZIP codes: {e}")
+
+    def state_for_zipcode(self, zipcode) -> Optional[str]:
+        """State abbreviation for a ZIP code from its 3-digit prefix"""
+        zipcode = normalize_zipcode(zipcode)
+        if zipcode is None:
+            return None
+        return ZIP5_STATE_OVERRIDES.get(zipcode) or self.prefix_states[int(zipcode[:3])]
+
+    def lookup(self, zipcode) -> Optional[Dict[str, str]]:
+        """
+        Location for a ZIP code, in the same shape Zippopotam results use
+
+        Returns:
+            Dict with 'city' (None when not indexed), 'state', 'state_abbr',
+            'zipcode', 'source' or None if the prefix is unassigned
+        """
+        zipcode = normalize_zipcode(zipcode)
+        if zipcode is None:
+            return None
+        state_abbr = ZIP5_STATE_OVERRIDES.get(zipcode) or self.prefix_states[int(zipcode[:3])]
+        if state_abbr is None:
+            return None
+        return {
+            'city': self.zip_cities.get(zipcode),
+            'state': STATE_NAMES.get(state_abbr, state_abbr),
+            'state_abbr': state_abbr,
+            'zipcode': zipcode,
+            'source': 'local',
+        }
+
+
+async def resolve_zipcode(zipcode: str) -> Optional[Dict[str, str]]:
+    """
+    Local lookup first; Zippopotam.us only for prefixes the bundled table
+    doesn't cover, and only when ZIPCODE_API_FALLBACK is enabled
+    """
+    if normalize_zipcode(zipcode) is None:
+        return None
+    location = zip_geography.lookup(zipcode)
+    if location is not None:
+        return location
+
+    try:
+        from config import settings
+        fallback_enabled = settings.zipcode_api_fallback
+    except Exception:
+        fallback_enabled = False
+    if not fallback_enabled:
+        return None
+
+    from .zippopotam_service import zippopotam_service
+    return await zippopotam_service.get_location_from_zipcode(zipcode)
+
+
+# Global instance
+zip_geography = ZipGeography()
@@ -1,113 +1,153 @@
 #!/usr/bin/env python3
 """
 Zippopotam.us API Service
-Provides accurate zipcode-to-city-state mapping using the free Zippopotam.us API
+Optional network fallback for ZIP codes the bundled table (data.zip_geography)
+can't resolve. Requests are async and results, including 404 misses, are
+kept in a bounded LRU cache; network errors and error responses are not
+cached, so the next request retries.
 """
 
-import requests
+import asyncio
 import logging
 import time
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
 class ZippopotamService:
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096, miss_ttl_seconds: float = 3600.0, timeout: float = 5.0):
         """Initialize the Zippopotam service"""
         self.base_url = "https://api.zippopotam.us/us"
-        self.cache = {}  # Simple cache to avoid repeated API calls
-        self.rate_limit_delay = 0.1  # 100ms delay between requests
-        
-    def get_location_from_zipcode(self, zipcode: str) -> Optional[Dict[str, str]]:
+        self.cache_size = cache_size
+        self.miss_ttl_seconds = miss_ttl_seconds
+        self.timeout = timeout
+        # zipcode -> (location or None, cached_at)
+        self.cache: "OrderedDict[str, Tuple[Optional[Dict[str, str]], float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _cached(self, zipcode: str):
+        entry = self.cache.get(zipcode)
+        if entry is None:
+            return False, None
+        location, cached_at = entry
+        if location is None and time.monotonic() - cached_at > self.miss_ttl_seconds:
+            del self.cache[zipcode]
+            return False, None
+        self.cache.move_to_end(zipcode)
+        return True, location
+
+    def _store(self, zipcode: str, location: Optional[Dict[str, str]]):
+        self.cache[zipcode] = (location, time.monotonic())
+        self.cache.move_to_end(zipcode)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    async def get_location_from_zipcode(self, zipcode: str) -> Optional[Dict[str, str]]:
         """
         Get city and state information from a zipcode using Zippopotam.us API
-        
+
         Args:
             zipcode: 5-digit US zipcode
-            
+
         Returns:
             Dict with 'city', 'state', 'state_abbr' or None if not found
         """
         if not zipcode or len(zipcode) != 5 or not zipcode.isdigit():
             logger.warning(f"Invalid zipcode format: {zipcode}")
             return None
-            
-        # Check cache first
-        cache_key = zipcode
-        if cache_key in self.cache:
-            logger.info(f"Returning cached location for zipcode {zipcode}")
-            return self.cache[cache_key]
-        
+
+        hit, location = self._cached(zipcode)
+        if hit:
+            return location
+
+        # Concurrent requests for the same zipcode share one API call
+        pending = self._inflight.get(zipcode)
+        if pending is not None:
+            return await pending
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[zipcode] = future
         try:
-            # Add rate limiting delay
-            time.sleep(self.rate_limit_delay)
-            
-            # Make API request
-            url = f"{self.base_url}/{zipcode}"
-            logger.info(f"Fetching location data for zipcode {zipcode} from {url}")
-            
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Parse the response
-            if 'places' in data and len(data['places']) > 0:
-                place = data['places'][0]
-                location_data = {
-                    'city': place.get('place name', ''),
-                    'state': place.get('state', ''),
-                    'state_abbr': place.get('state abbreviation', ''),
-                    'zipcode': zipcode
-                }
-                
-                # Cache the result
-                self.cache[cache_key] = location_data
-                
-                logger.info(f"Successfully retrieved location for {zipcode}: {location_data['city']}, {location_data['state_abbr']}")
-                return location_data
+            try:
+                location = await self._fetch(zipcode)
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Error fetching location data for zipcode {zipcode}: {e}")
+                location = None
             else:
-                logger.warning(f"No location data found for zipcode {zipcode}")
-                return None
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching location data for zipcode {zipcode}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error fetching location data for zipcode {zipcode}: {e}")
+                self._store(zipcode, location)
+            future.set_result(location)
+            return location
+        finally:
+            if not future.done():
+                future.set_result(None)
+            del self._inflight[zipcode]
+
+    async def _fetch(self, zipcode: str) -> Optional[Dict[str, str]]:
+        """
+        Location for a zipcode, None if the API has no such zipcode
+
+        Raises:
+            httpx.HTTPError / ValueError on network errors, error responses or a bad body (not a miss)
+        """
+        url = f"{self.base_url}/{zipcode}"
+        logger.info(f"Fetching location data for zipcode {zipcode} from {url}")
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(url)
+        if response.status_code == 404:
+            logger.warning(f"No location data found for zipcode {zipcode}")
             return None
-    
-    def is_zipcode_in_state(self, zipcode: str, target_state: str) -> bool:
+        response.raise_for_status()
+        data = response.json()
+
+        if 'places' in data and len(data['places']) > 0:
+            place = data['places'][0]
+            location_data = {
+                'city': place.get('place name', ''),
+                'state': place.get('state', ''),
+                'state_abbr': place.get('state abbreviation', ''),
+                'zipcode': zipcode,
+                'source': 'zippopotam',
+            }
+            logger.info(f"Successfully retrieved location for {zipcode}: {location_data['city']}, {location_data['state_abbr']}")
+            return location_data
+
+        logger.warning(f"No location data found for zipcode {zipcode}")
+        return None
+
+    async def is_zipcode_in_state(self, zipcode: str, target_state: str) -> bool:
         """
         Check if a zipcode is in a specific state
-        
+
         Args:
             zipcode: 5-digit US zipcode
             target_state: State abbreviation (e.g., 'PA', 'CA')
-            
+
         Returns:
             True if zipcode is in the target state, False otherwise
         """
-        location_data = self.get_location_from_zipcode(zipcode)
+        location_data = await self.get_location_from_zipcode(zipcode)
         if not location_data:
             return False
-            
+
         return location_data['state_abbr'].upper() == target_state.upper()
-    
-    def get_city_state_from_zipcode(self, zipcode: str) -> Optional[Tuple[str, str]]:
+
+    async def get_city_state_from_zipcode(self, zipcode: str) -> Optional[Tuple[str, str]]:
         """
         Get city and state abbreviation from zipcode
-        
+
         Args:
             zipcode: 5-digit US zipcode
-            
+
         Returns:
             Tuple of (city, state_abbr) or None if not found
         """
-        location_data = self.get_location_from_zipcode(zipcode)
+        location_data = await self.get_location_from_zipcode(zipcode)
         if not location_data:
             return None
-            
+
         return (location_data['city'], location_data['state_abbr'])
 
 # Global instance
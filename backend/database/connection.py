@@ -2,28 +2,23 @@
 Database connection and session management for Supabase PostgreSQL.
 """
 
-from typing import Generator, Optional
+import threading
+from typing import TYPE_CHECKING, Generator, Optional
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from supabase import create_client, Client
 from config import settings
 import logging
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 logger = logging.getLogger(__name__)
 
-# Supabase client for authentication
-supabase: Optional[Client] = None
-if settings.supabase_url and settings.supabase_service_key:
-    try:
-        supabase = create_client(
-            settings.supabase_url,
-            settings.supabase_service_key  # Use service key for admin operations
-        )
-        logger.info("Supabase client initialized successfully")
-    except Exception as e:
-        logger.warning(f"Failed to initialize Supabase client: {e}")
-        supabase = None
-else:
+# Supabase client for authentication (created on first use; the SDK is slow to import)
+supabase: Optional["Client"] = None
+_supabase_initialized = False
+_supabase_lock = threading.Lock()
+if not (settings.supabase_url and settings.supabase_service_key):
     logger.warning("SUPABASE_URL or SUPABASE_SERVICE_KEY not set - Supabase features will be disabled")
 
 # SQLAlchemy engine and session
@@ -73,13 +68,31 @@ def get_db() -> Generator[Optional[Session], None, None]:
             db.close()
 
 
-def get_supabase() -> Optional[Client]:
+def get_supabase() -> Optional["Client"]:
     """
     Get Supabase client instance.
 
     Returns:
         Optional[Client]: Supabase client for authentication and database operations, or None if not initialized
     """
+    global supabase, _supabase_initialized
+    if _supabase_initialized:
+        return supabase
+
+    with _supabase_lock:
+        if not _supabase_initialized:
+            if settings.supabase_url and settings.supabase_service_key:
+                try:
+                    from supabase import create_client
+                    supabase = create_client(
+                        settings.supabase_url,
+                        settings.supabase_service_key  # Use service key for admin operations
+                    )
+                    logger.info("Supabase client initialized successfully")
+                except Exception as e:
+                    logger.warning(f"Failed to initialize Supabase client: {e}")
+                    supabase = None
+            _supabase_initialized = True
     return supabase
 
 
@@ -0,0 +1,16 @@
+-- Memoized probability calculations and keyset-paginated history
+-- Run after 001_initial_schema.sql
+
+-- Hash of the factor-score snapshot a result was computed from
+ALTER TABLE probability_calculations ADD COLUMN IF NOT EXISTS profile_hash VARCHAR(64);
+
+-- Memo lookup: (profile, college, snapshot, version)
+CREATE INDEX IF NOT EXISTS ix_probability_calculations_memo
+    ON probability_calculations(profile_id, college_id, profile_hash, calculation_version);
+
+-- History: newest first per profile, paged by (calculated_at, id)
+CREATE INDEX IF NOT EXISTS ix_probability_calculations_profile_calculated
+    ON probability_calculations(profile_id, calculated_at);
+
+-- Covered by the composite indexes above
+DROP INDEX IF EXISTS idx_probability_calculations_profile_id;
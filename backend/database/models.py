@@ -128,6 +128,9 @@ class Extracurricular(Base):
     
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
+    # Relationships
+    profile = relationship("UserProfile", back_populates="extracurriculars")
+
 
 class College(Base):
     """College/university reference data."""
@@ -205,7 +208,7 @@ class SavedCollege(Base):
 
 
 class ProbabilityCalculation(Base):
-    """Cached probability calculation results."""
+    """Cached probability calculation results (see services.calculation_memo)."""
     
     __tablename__ = "probability_calculations"
     
@@ -213,8 +216,9 @@ class ProbabilityCalculation(Base):
     profile_id = Column(UUID(as_uuid=True), ForeignKey("user_profiles.id"), nullable=False)
     college_id = Column(UUID(as_uuid=True), ForeignKey("colleges.id"), nullable=False)
     
-    # Input Factors (snapshot)
+    # Input Factors (snapshot) and its hash, the memoization key with college_id and version
     factor_scores = Column(JSON, nullable=False)
+    profile_hash = Column(String(64))
     
     # Results
     composite_score = Column(DECIMAL(6, 2))
@@ -233,6 +237,14 @@ class ProbabilityCalculation(Base):
     profile = relationship("UserProfile", back_populates="calculations")
     college = relationship("College", back_populates="calculations")
 
+    __table_args__ = (
+        Index("ix_probability_calculations_profile_calculated", "profile_id", "calculated_at"),
+        Index(
+            "ix_probability_calculations_memo",
+            "profile_id", "college_id", "profile_hash", "calculation_version",
+        ),
+    )
+
 
 class ScorecardCollege(Base):
     """
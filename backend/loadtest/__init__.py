@@ -0,0 +1,5 @@
+"""
+In-process load-testing suite for the API (see loadtest.runner).
+
+    python -m loadtest --help
+"""
@@ -0,0 +1,411 @@
+"""
+Local stand-ins for the external services the API calls.
+
+Each fake answers in the same shape as the real service after a configurable
+delay, so a load test measures the backend's own work plus a realistic (and
+reproducible) wait on its dependencies, without keys, quotas or network.
+
+- OpenAI: ``FakeOpenAIClient`` replaces ``college_info_service``'s client.
+  Like the real SDK it is synchronous, so it blocks whatever calls it.
+- Google Places: ``FakePlacesHTTP`` replaces ``requests.get`` in the Discover
+  service (text search and photo download).
+- Zippopotam: ``FakeZippopotam`` replaces ``ZippopotamService._fetch`` (async).
+- Supabase: ``FakeSupabase`` is installed as the cached Supabase client; its
+  ``auth.admin`` keeps an in-memory user directory.
+- Postgres: a temporary SQLite database seeded from the college catalog backs
+  the Discover endpoints.
+
+    with stub_external_services(Latencies.parse(["openai=800:200"])) as stubs:
+        ...drive the app...
+        stubs.calls  # {'openai': 12, 'places_text': 30, ...}
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from unittest import mock
+
+
+@dataclass(frozen=True)
+class Latency:
+    """Delay of one fake call: ``mean_ms`` +/- uniform ``jitter_ms``"""
+
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        jitter = rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0.0
+        return max(0.0, self.mean_ms + jitter) / 1000.0
+
+
+# Rough medians of the real services as seen from the backend
+DEFAULT_LATENCIES = {
+    "openai": Latency(900.0, 300.0),
+    "places": Latency(150.0, 50.0),
+    "zippopotam": Latency(80.0, 20.0),
+    "supabase": Latency(40.0, 10.0),
+}
+
+
+@dataclass
+class Latencies:
+    services: Dict[str, Latency] = field(default_factory=lambda: dict(DEFAULT_LATENCIES))
+    seed: int = 0
+
+    @classmethod
+    def parse(cls, specs: Sequence[str] = (), scale: float = 1.0, seed: int = 0) -> "Latencies":
+        """
+        Defaults overridden by ``name=mean[:jitter]`` specs (milliseconds) and
+        then multiplied by ``scale`` (0 makes every fake instant)
+        """
+        services = dict(DEFAULT_LATENCIES)
+        for spec in specs:
+            name, _, value = spec.partition("=")
+            if name not in services:
+                raise ValueError(f"Unknown service '{name}' (expected one of {', '.join(services)})")
+            mean, _, jitter = value.partition(":")
+            services[name] = Latency(float(mean), float(jitter or 0.0))
+        services = {name: Latency(l.mean_ms * scale, l.jitter_ms * scale) for name, l in services.items()}
+        return cls(services, seed)
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {name: {"mean_ms": l.mean_ms, "jitter_ms": l.jitter_ms} for name, l in self.services.items()}
+
+
+class _Delays:
+    """Thread-safe latency sampling and call counting shared by the fakes"""
+
+    def __init__(self, latencies: Latencies):
+        self.latencies = latencies.services
+        self.rng = random.Random(latencies.seed)
+        self.calls: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def next(self, service: str, counter: Optional[str] = None) -> float:
+        with self._lock:
+            self.calls[counter or service] += 1
+            return self.latencies[service].sample(self.rng)
+
+
+def _stable_int(text: str, modulo: int) -> int:
+    return int(hashlib.blake2b(text.encode(), digest_size=4).hexdigest(), 16) % modulo
+
+
+# ---------------------------------------------------------------------------
+# OpenAI
+# ---------------------------------------------------------------------------
+
+SUBJECTS = [
+    "Computer Science", "Engineering", "Business", "Biological Sciences",
+    "Mathematics & Stats", "Social Sciences", "Arts & Humanities", "Education",
+]
+
+
+class FakeOpenAIClient:
+    """``client.chat.completions.create(...)`` returning canned JSON for the prompts the backend sends"""
+
+    def __init__(self, delays: _Delays):
+        self._delays = delays
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model: str = "", messages: Optional[List[Dict[str, str]]] = None, **kwargs):
+        time.sleep(self._delays.next("openai"))
+        prompt = (messages or [{}])[-1].get("content", "")
+        match = re.search(r"(?:information about|distribution for) (.+?) in JSON format", prompt)
+        college = match.group(1).strip() if match else "College"
+        key = _stable_int(college, 1000)
+        if "subject" in prompt.lower() and "emphasis" in prompt.lower():
+            weights = [5 + (key * (i + 3)) % 30 for i in range(len(SUBJECTS))]
+            content = {"subject_emphasis": [{"label": s, "value": w} for s, w in zip(SUBJECTS, weights)]}
+        else:
+            content = {
+                "name": college,
+                "location": {"city": "Springfield", "state": "Unknown", "country": "USA"},
+                "tuition": {"in_state": 20000 + key * 40, "out_of_state": 40000 + key * 30, "room_board": 15000},
+                "academics": {
+                    "acceptance_rate": round(0.04 + (key % 90) / 100, 2),
+                    "sat_range": "1300-1500",
+                    "act_range": "29-34",
+                    "gpa_requirement": 3.7,
+                },
+                "programs": {"strong_programs": SUBJECTS[:3], "notable_programs": SUBJECTS[3:5]},
+                "characteristics": {"type": "Private", "size": "Medium", "setting": "Suburban",
+                                    "selectivity": "Highly Selective"},
+                "additional_info": {"founded": "1890", "motto": "Lux", "notable_alumni": [], "special_features": []},
+            }
+        message = SimpleNamespace(content=json.dumps(content), role="assistant")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")], model=model)
+
+
+# ---------------------------------------------------------------------------
+# Google Places
+# ---------------------------------------------------------------------------
+
+class FakeHTTPResponse:
+    def __init__(self, status_code: int = 200, payload: Any = None, content: bytes = b"", content_type: str = "application/json"):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = content if payload is None else json.dumps(payload).encode()
+        self.headers = {"Content-Type": content_type}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", "replace")
+
+    def json(self):
+        return self._payload if self._payload is not None else json.loads(self.content)
+
+
+class FakePlacesHTTP:
+    """``requests.get`` for the Places text-search and photo endpoints"""
+
+    PHOTO_BYTES = 48 * 1024  # a typical 1200px-wide JPEG thumbnail is 40-60 KB
+
+    def __init__(self, delays: _Delays, text_url: str, photo_url: str):
+        self._delays = delays
+        self.text_url = text_url
+        self.photo_url = photo_url
+
+    def __call__(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs):
+        params = params or {}
+        if url == self.text_url:
+            time.sleep(self._delays.next("places", "places_text"))
+            query = str(params.get("query", ""))
+            ref = "fake-" + hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+            return FakeHTTPResponse(payload={
+                "status": "OK",
+                "results": [{"place_id": "place-" + ref, "name": query, "photos": [{"photo_reference": ref}]}],
+            })
+        if url == self.photo_url:
+            time.sleep(self._delays.next("places", "places_photo"))
+            ref = str(params.get("photo_reference", ""))
+            seed = hashlib.blake2b(ref.encode(), digest_size=32).digest()
+            body = b"\xff\xd8\xff\xe0" + (seed * (self.PHOTO_BYTES // len(seed) + 1))[: self.PHOTO_BYTES]
+            return FakeHTTPResponse(content=body, content_type="image/jpeg")
+        return FakeHTTPResponse(status_code=404, payload={"status": "NOT_FOUND"})
+
+
+# ---------------------------------------------------------------------------
+# Zippopotam
+# ---------------------------------------------------------------------------
+
+class FakeZippopotam:
+    """Async replacement for ``ZippopotamService._fetch``"""
+
+    def __init__(self, delays: _Delays):
+        self._delays = delays
+
+    async def __call__(self, zipcode: str) -> Optional[Dict[str, str]]:
+        await asyncio.sleep(self._delays.next("zippopotam"))
+        return {
+            "city": f"Town {zipcode}",
+            "state": "Unknown",
+            "state_abbr": "ZZ",
+            "zipcode": zipcode,
+            "source": "zippopotam",
+        }
+
+
+# ---------------------------------------------------------------------------
+# Supabase
+# ---------------------------------------------------------------------------
+
+class _FakeQuery:
+    """Chainable PostgREST-style query: every filter returns self, execute() returns no rows"""
+
+    def __init__(self, delays: _Delays, table: str):
+        self._delays = delays
+        self.table = table
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        time.sleep(self._delays.next("supabase"))
+        return SimpleNamespace(data=[], count=0)
+
+
+class FakeSupabaseAdmin:
+    """
+    ``auth.admin`` with an in-memory user directory.
+
+    Like GoTrue, ``list_users`` materializes one user object per row it
+    returns (the real client parses them from JSON), so an unpaged listing
+    costs time and memory proportional to the number of users.
+    """
+
+    def __init__(self, delays: _Delays, users: Optional[Dict[str, str]] = None):
+        self._delays = delays
+        # email -> user id, insertion ordered like GoTrue's created_at paging
+        self.users: Dict[str, str] = dict(users or {})
+        self._lock = threading.Lock()
+
+    def _user(self, email: str, user_id: str) -> SimpleNamespace:
+        return SimpleNamespace(id=user_id, email=email, aud="authenticated", role="authenticated",
+                               app_metadata={"provider": "email"}, user_metadata={})
+
+    def list_users(self, page: Optional[int] = None, per_page: Optional[int] = None) -> List[SimpleNamespace]:
+        time.sleep(self._delays.next("supabase", "supabase_admin_list"))
+        with self._lock:
+            items = list(self.users.items())
+        if page is not None:
+            size = per_page or 50
+            items = items[(page - 1) * size: page * size]
+        return [self._user(email, user_id) for email, user_id in items]
+
+    def create_user(self, attributes: Dict[str, Any]) -> SimpleNamespace:
+        time.sleep(self._delays.next("supabase", "supabase_admin_create"))
+        email = str(attributes.get("email", "")).strip().lower()
+        with self._lock:
+            if email in self.users:
+                raise RuntimeError("A user with this email address has already been registered")
+            user_id = str(uuid.uuid4())
+            self.users[email] = user_id
+        return SimpleNamespace(user=self._user(email, user_id))
+
+
+class FakeSupabase:
+    """Minimal Supabase client: auth calls fail as for an unknown user, tables are empty"""
+
+    def __init__(self, delays: _Delays, users: Optional[Dict[str, str]] = None):
+        self._delays = delays
+        self.admin = FakeSupabaseAdmin(delays, users)
+        self.auth = SimpleNamespace(
+            admin=self.admin,
+            get_user=self._auth_call,
+            sign_in_with_password=self._auth_call,
+            sign_up=self._auth_call,
+            sign_in_with_oauth=self._auth_call,
+        )
+
+    def _auth_call(self, *args, **kwargs):
+        time.sleep(self._delays.next("supabase"))
+        return SimpleNamespace(user=None, session=None)
+
+    def table(self, name: str) -> _FakeQuery:
+        return _FakeQuery(self._delays, name)
+
+
+# ---------------------------------------------------------------------------
+# Discover database
+# ---------------------------------------------------------------------------
+
+def _number(value: Any) -> Optional[float]:
+    return float(value) if isinstance(value, (int, float)) and value == value else None
+
+
+def _scorecard_payloads() -> Iterator[Dict[str, Any]]:
+    """College catalog rows in the shape the Scorecard ingest expects"""
+    from data.college_snapshot import get_college_snapshot
+
+    ownership = {"Public": 1, "Private": 2}
+    colleges = get_college_snapshot().table("colleges")
+    for row in colleges.iter_rows():
+        unitid = _number(row.get("unitid"))
+        if unitid is None or not row.get("name"):
+            continue
+        whole = {
+            key: int(value) if (value := _number(row.get(column))) is not None else None
+            for key, column in (
+                ("latest.student.size", "student_body_size"),
+                ("latest.cost.tuition.in_state", "tuition_in_state_usd"),
+                ("latest.cost.tuition.out_of_state", "tuition_out_of_state_usd"),
+                ("latest.cost.net_price.overall", "avg_net_price_usd"),
+            )
+        }
+        yield {
+            "id": int(unitid),
+            "school.name": row["name"],
+            "school.city": row.get("city"),
+            "school.state": row.get("state"),
+            "school.ownership": ownership.get(str(row.get("control")), 2),
+            "latest.admissions.admission_rate.overall": _number(row.get("acceptance_rate")),
+            **whole,
+        }
+
+
+def create_discover_database(directory: Path):
+    """SQLite engine + sessionmaker with the Discover tables seeded from the catalog"""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.orm import sessionmaker
+
+    from data.ingest_scorecard import upsert_college
+    from database.models import CollegeImage, ScorecardCollege
+
+    engine = create_engine(
+        f"sqlite:///{directory / 'loadtest.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+        pool_size=32,
+        max_overflow=32,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _wal(connection, record):
+        # Readers don't wait for the image-cache writes
+        connection.execute("PRAGMA journal_mode=WAL")
+    ScorecardCollege.metadata.create_all(engine, tables=[ScorecardCollege.__table__, CollegeImage.__table__])
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with session_factory() as db:
+        for payload in _scorecard_payloads():
+            upsert_college(db, payload)
+        db.commit()
+    return engine, session_factory
+
+
+# ---------------------------------------------------------------------------
+# Installing the fakes
+# ---------------------------------------------------------------------------
+
+@dataclass
+class StubbedServices:
+    latencies: Latencies
+    delays: _Delays
+    database_path: Path
+
+    @property
+    def calls(self) -> Dict[str, int]:
+        return dict(self.delays.calls)
+
+
+@contextmanager
+def stub_external_services(latencies: Optional[Latencies] = None) -> Iterator[StubbedServices]:
+    """Install every fake (and the SQLite Discover database) for the duration of the block"""
+    import database.connection as connection
+    import services.college_discover_service as discover
+    from config import settings
+    from data.zippopotam_service import zippopotam_service
+    from services.openai_service import college_info_service
+
+    latencies = latencies or Latencies()
+    delays = _Delays(latencies)
+    with ExitStack() as stack:
+        directory = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="chancify-loadtest-")))
+        engine, session_factory = create_discover_database(directory)
+        stack.callback(engine.dispose)
+
+        stack.enter_context(mock.patch.object(connection, "engine", engine))
+        stack.enter_context(mock.patch.object(connection, "SessionLocal", session_factory))
+        stack.enter_context(mock.patch.object(connection, "supabase", FakeSupabase(delays)))
+        stack.enter_context(mock.patch.object(connection, "_supabase_initialized", True))
+        stack.enter_context(mock.patch.object(settings, "google_maps_api_key", "loadtest-key"))
+        stack.enter_context(mock.patch.object(settings, "zipcode_api_fallback", True))
+        places = FakePlacesHTTP(delays, discover.PLACES_TEXT_URL, discover.PLACES_PHOTO_URL)
+        stack.enter_context(mock.patch.object(discover, "requests", SimpleNamespace(get=places)))
+        stack.enter_context(mock.patch.object(college_info_service, "_client", FakeOpenAIClient(delays)))
+        stack.enter_context(mock.patch.object(zippopotam_service, "_fetch", FakeZippopotam(delays)))
+        zippopotam_service.cache.clear()
+        stack.callback(zippopotam_service.cache.clear)
+
+        yield StubbedServices(latencies, delays, directory / "loadtest.db")
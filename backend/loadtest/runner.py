@@ -0,0 +1,283 @@
+"""
+Drive the API with concurrent clients and record throughput and latency.
+
+The app runs in this process with every external service replaced by a local
+fake (see loadtest.fakes), either
+
+- ``asgi``: requests go straight into the ASGI app through httpx's
+  ASGITransport (no sockets; client and app share one event loop), or
+- ``uvicorn``: a real uvicorn server on a free local port in a background
+  thread, reached over TCP keep-alive connections.
+
+For every scenario and concurrency level, ``concurrency`` clients send
+requests back to back for ``duration`` seconds. Each level reports
+throughput, latency percentiles, errors and response sizes, and the whole
+run is written to JSON for comparison with earlier runs.
+
+Run from `backend/`:
+
+    python -m loadtest                                    # every scenario, default sweep
+    python -m loadtest -s search predict -c 1 8 32 -d 10
+    python -m loadtest --transport uvicorn --latency openai=400:100 --out run.json
+    python -m loadtest --compare baseline.json            # diff against an earlier run
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+import httpx
+
+from .fakes import Latencies, stub_external_services
+from .scenarios import SCENARIOS, Scenario
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = BACKEND_DIR / "loadtest" / "results"
+DEFAULT_CONCURRENCY = (1, 4, 16, 64)
+
+
+@dataclass
+class LevelResult:
+    scenario: str
+    concurrency: int
+    requests: int
+    errors: int
+    elapsed_s: float
+    throughput_rps: float
+    latency_ms: Dict[str, float]
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    mean_response_bytes: float = 0.0
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending sequence"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(q * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(scenario: str, concurrency: int, latencies: List[float], statuses: List[str],
+              sizes: List[int], elapsed: float) -> LevelResult:
+    ordered = sorted(latencies)
+    counts: Dict[str, int] = {}
+    for status in statuses:
+        counts[status] = counts.get(status, 0) + 1
+    errors = sum(n for status, n in counts.items() if not status.startswith("2"))
+    return LevelResult(
+        scenario=scenario,
+        concurrency=concurrency,
+        requests=len(ordered),
+        errors=errors,
+        elapsed_s=round(elapsed, 3),
+        throughput_rps=round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        latency_ms={
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+            "p50": round(percentile(ordered, 0.50) * 1000, 3),
+            "p90": round(percentile(ordered, 0.90) * 1000, 3),
+            "p95": round(percentile(ordered, 0.95) * 1000, 3),
+            "p99": round(percentile(ordered, 0.99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        },
+        status_counts=counts,
+        mean_response_bytes=round(sum(sizes) / len(sizes), 1) if sizes else 0.0,
+    )
+
+
+async def run_level(client: httpx.AsyncClient, scenario: Scenario, concurrency: int,
+                    duration: float, seed: int) -> LevelResult:
+    """``concurrency`` clients sending requests back to back for ``duration`` seconds"""
+    latencies: List[float] = []
+    statuses: List[str] = []
+    sizes: List[int] = []
+    deadline = time.perf_counter() + duration
+
+    async def worker(index: int):
+        rng = random.Random(f"{seed}:{scenario.name}:{index}")
+        while time.perf_counter() < deadline:
+            request = scenario.build(rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(request.method, request.path, json=request.json)
+                status, size = str(response.status_code), len(response.content)
+            except httpx.HTTPError as e:
+                status, size = f"error:{type(e).__name__}", 0
+            latencies.append(time.perf_counter() - started)
+            statuses.append(status)
+            sizes.append(size)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return summarize(scenario.name, concurrency, latencies, statuses, sizes, time.perf_counter() - started)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def app_client(transport: str, max_connections: int) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP client for the in-process app, once every service has finished loading"""
+    from main import app, service_registry
+
+    timeout = httpx.Timeout(120.0)
+    if transport == "asgi":
+        # No lifespan with ASGITransport: start the service warm-up the startup hook would
+        service_registry.start_background()
+        await asyncio.to_thread(service_registry.wait)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=timeout
+        ) as client:
+            yield client
+        return
+
+    import uvicorn
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, name="loadtest-uvicorn", daemon=True)
+    thread.start()
+    try:
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=timeout, limits=limits) as client:
+            while True:
+                try:
+                    if (await client.get("/api/ready")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(0.2)
+            yield client
+    finally:
+        server.should_exit = True
+        await asyncio.to_thread(thread.join, 30)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=10,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+async def run(scenarios: Sequence[str], concurrency: Sequence[int], duration: float, warmup: float,
+              transport: str, latencies: Latencies, seed: int) -> Dict:
+    results: List[LevelResult] = []
+    console = sys.stdout
+    # Endpoints print() debug lines per request; keep them out of the report
+    with stub_external_services(latencies) as stubs, open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        async with app_client(transport, max(concurrency)) as client:
+            for name in scenarios:
+                scenario = SCENARIOS[name]
+                if warmup > 0:
+                    await run_level(client, scenario, min(concurrency), warmup, seed + 1)
+                for level in concurrency:
+                    result = await run_level(client, scenario, level, duration, seed)
+                    results.append(result)
+                    print(_format_row(result), file=console, flush=True)
+        stub_calls = stubs.calls
+
+    return {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "transport": transport,
+            "duration_s": duration,
+            "warmup_s": warmup,
+            "seed": seed,
+            "latencies": latencies.to_dict(),
+        },
+        "results": [asdict(r) for r in results],
+        "stub_calls": stub_calls,
+    }
+
+
+HEADER = f"{'scenario':<12} {'conc':>5} {'req':>7} {'err':>5} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+
+
+def _format_row(r: LevelResult) -> str:
+    lat = r.latency_ms
+    return (
+        f"{r.scenario:<12} {r.concurrency:>5} {r.requests:>7} {r.errors:>5} {r.throughput_rps:>9.1f} "
+        f"{lat['p50']:>9.1f} {lat['p95']:>9.1f} {lat['p99']:>9.1f} {lat['max']:>9.1f}"
+    )
+
+
+def compare(current: Dict, baseline: Dict) -> List[str]:
+    """Per (scenario, concurrency): throughput and p99 change relative to ``baseline``"""
+    before = {(r["scenario"], r["concurrency"]): r for r in baseline["results"]}
+    lines = [f"{'scenario':<12} {'conc':>5} {'req/s':>18} {'change':>8} {'p99 ms':>20} {'change':>8}"]
+    for r in current["results"]:
+        old = before.get((r["scenario"], r["concurrency"]))
+        if old is None:
+            continue
+        rps_change = (r["throughput_rps"] / old["throughput_rps"] - 1) * 100 if old["throughput_rps"] else 0.0
+        p99, old_p99 = r["latency_ms"]["p99"], old["latency_ms"]["p99"]
+        p99_change = (p99 / old_p99 - 1) * 100 if old_p99 else 0.0
+        lines.append(
+            f"{r['scenario']:<12} {r['concurrency']:>5} {old['throughput_rps']:>8.1f} -> {r['throughput_rps']:>6.1f} "
+            f"{rps_change:>+7.1f}% {old_p99:>9.1f} -> {p99:>7.1f} {p99_change:>+7.1f}%"
+        )
+    return lines
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="In-process load test of the API")
+    parser.add_argument("-s", "--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("-c", "--concurrency", nargs="+", type=int, default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("-d", "--duration", type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds of unrecorded traffic per scenario")
+    parser.add_argument("--transport", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--latency", nargs="*", default=[], metavar="SERVICE=MS[:JITTER]",
+                        help="Fake service latency overrides (openai, places, zippopotam, supabase)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Multiply every fake latency (0 = instant)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Result JSON path (default: loadtest/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="Earlier result JSON to compare this run against")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    # Before main.py's own basicConfig (which is then a no-op)
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    latencies = Latencies.parse(args.latency, scale=args.latency_scale, seed=args.seed)
+
+    print(HEADER)
+    report = asyncio.run(run(
+        args.scenarios, sorted(set(args.concurrency)), args.duration, args.warmup,
+        args.transport, latencies, args.seed,
+    ))
+
+    out = Path(args.out) if args.out else RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"\nFake service calls: {report['stub_calls']}")
+    print(f"Results written to {out}")
+
+    if args.compare:
+        print()
+        print("\n".join(compare(report, json.loads(Path(args.compare).read_text()))))
@@ -0,0 +1,122 @@
+"""
+Load-test scenarios: what a client sends, request by request.
+
+Each scenario turns a seeded RNG into one HTTP request at a time, so the
+same seed replays the same traffic. Inputs come from the college catalog:
+real names, prefixes users actually type, profiles spread across the GPA/SAT
+range.
+"""
+
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import quote, urlencode
+
+
+@dataclass(frozen=True)
+class LoadRequest:
+    method: str
+    path: str
+    json: Optional[Any] = None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    build: Callable[[random.Random], LoadRequest]
+
+
+@dataclass(frozen=True)
+class CatalogSample:
+    names: List[str]
+    states: List[str]
+
+
+@lru_cache(maxsize=1)
+def catalog_sample() -> CatalogSample:
+    from data.college_snapshot import get_college_snapshot
+
+    colleges = get_college_snapshot().table("colleges")
+    names = [str(n) for n in colleges.values("name") if n]
+    states = sorted({str(s).upper() for s in colleges.values("state") if s})
+    return CatalogSample(names, states)
+
+
+MAJORS = ["Computer Science", "Engineering", "Business", "Biology", "Economics", "Psychology", "Undeclared"]
+
+
+def random_profile(rng: random.Random) -> Dict[str, str]:
+    """Frontend profile form (all values are strings, as the web client sends them)"""
+    strength = rng.random()
+    gpa = round(2.8 + 1.2 * strength + rng.uniform(-0.2, 0.2), 2)
+    profile = {
+        "gpa_unweighted": str(min(4.0, gpa)),
+        "gpa_weighted": str(min(5.0, gpa + rng.uniform(0.1, 0.6))),
+        "sat": str(int(min(1600, 1050 + 500 * strength + rng.uniform(-60, 60)) // 10 * 10)),
+        "act": str(int(min(36, 22 + 13 * strength))),
+        "major": rng.choice(MAJORS),
+    }
+    for field_name in (
+        "rigor", "extracurricular_depth", "leadership_positions", "awards_publications", "passion_projects",
+        "business_ventures", "volunteer_work", "research_experience", "portfolio_audition", "essay_quality",
+        "recommendations", "interview", "demonstrated_interest", "legacy_status", "hs_reputation",
+        "geographic_diversity", "plan_timing", "geography_residency", "firstgen_diversity", "ability_to_pay",
+        "policy_knob", "conduct_record",
+    ):
+        profile[field_name] = str(max(1, min(10, round(3 + 6 * strength + rng.uniform(-2, 2)))))
+    return profile
+
+
+def _search_autocomplete(rng: random.Random) -> LoadRequest:
+    # One keystroke of a user typing a college name: 2..12 leading characters
+    name = rng.choice(catalog_sample().names)
+    prefix = name[: rng.randint(2, min(12, len(name)))]
+    return LoadRequest("GET", "/api/search/colleges?" + urlencode({"q": prefix, "limit": 10}))
+
+
+def _predict_frontend(rng: random.Random) -> LoadRequest:
+    body = {**random_profile(rng), "college": rng.choice(catalog_sample().names)}
+    return LoadRequest("POST", "/api/predict/frontend", body)
+
+
+def _suggestions(rng: random.Random) -> LoadRequest:
+    return LoadRequest("POST", "/api/suggest/colleges", random_profile(rng))
+
+
+def _discover_listing(rng: random.Random) -> LoadRequest:
+    params: Dict[str, Any] = {"page": rng.randint(1, 5), "page_size": 20}
+    roll = rng.random()
+    if roll < 0.4:
+        params["state"] = rng.choice(catalog_sample().states)
+    elif roll < 0.6:
+        params["selectivity"] = rng.choice(["very_selective", "selective", "moderate", "open"])
+    elif roll < 0.8:
+        params["q"] = rng.choice(catalog_sample().names).split()[0]
+    params["sort"] = rng.choice(["name", "admission_rate", "net_price", "size"])
+    return LoadRequest("GET", "/api/colleges?" + urlencode(params))
+
+
+def _image_proxy(rng: random.Random) -> LoadRequest:
+    # Cards on one Discover page share a small set of photos
+    reference = f"fake-{rng.randint(0, 199):016x}"
+    return LoadRequest("GET", f"/api/colleges/image/{reference}?maxwidth=800")
+
+
+def _improvement_analysis(rng: random.Random) -> LoadRequest:
+    college = rng.choice(catalog_sample().names)
+    return LoadRequest("POST", f"/api/improvement-analysis/{quote(college, safe='')}", random_profile(rng))
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("search", "College search autocomplete (one keystroke per request)", _search_autocomplete),
+        Scenario("predict", "Frontend admission prediction for one college", _predict_frontend),
+        Scenario("suggestions", "Personalized college suggestions", _suggestions),
+        Scenario("discover", "Discover listing with filters, sorting and paging", _discover_listing),
+        Scenario("image", "Discover image proxy (Google Places photo)", _image_proxy),
+        Scenario("improvement", "Improvement analysis with counterfactual impacts", _improvement_analysis),
+    )
+}
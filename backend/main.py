@@ -4,11 +4,16 @@ FastAPI application for college admissions probability calculations
 """
 
 import os
+import sys
+import math
 import logging
 import time
+import dataclasses
 from typing import Dict, Any, Optional, List
 from fastapi import FastAPI, Request, HTTPException, status
-from starlette.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+from starlette.responses import JSONResponse, Response
 
 # Configure logging FIRST
 logging.basicConfig(
@@ -18,16 +23,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.info("=== Chancify AI Backend Starting ===")
 
-# Import numpy/pandas with error handling
-try:
-    import numpy as np
-    import pandas as pd
-    logger.info("✓ numpy/pandas imported")
-except ImportError as e:
-    logger.error(f"Failed to import numpy/pandas: {e}")
-    np = None
-    pd = None
-
 # Import config with error handling
 try:
     from config import settings
@@ -52,79 +47,86 @@ except Exception as e:
     def get_db():
         yield None
 
-# Import data modules with error handling - these are optional
-real_college_suggestions = None
-college_names_mapping = {}
-nickname_mapper = None
-college_subject_emphasis = None
-tuition_state_service = None
-college_tuition_service = None
-improvement_analysis_service = None
-get_colleges_for_major = None
-get_major_strength_score = None
-get_major_relevance_info = None
-
-try:
-    from data.real_ipeds_major_mapping import get_colleges_for_major, get_major_strength_score, get_major_relevance_info
-    logger.info("✓ real_ipeds_major_mapping imported")
-except Exception as e:
-    logger.warning(f"Failed to import real_ipeds_major_mapping: {e}")
+# Optional services are declared here and loaded lazily: on first use by a
+# handler, or by the background warm-up started once the server has bound.
+# /ping answers immediately; /api/ready reports per-service load state.
+from services.registry import ServiceRegistry, import_attr
+from api.middleware import CORSTimingMiddleware, OriginAllowList, RouteTimings
+from api.responses import CompressionMiddleware, ORJSONResponse, ORJSONRoute, cached_json
 
-try:
-    from data.real_college_suggestions import real_college_suggestions
-    logger.info("✓ real_college_suggestions imported")
-except Exception as e:
-    logger.warning(f"Failed to import real_college_suggestions: {e}")
 
-try:
-    from data.college_names_mapping import college_names_mapping
-    logger.info("✓ college_names_mapping imported")
-except Exception as e:
-    logger.warning(f"Failed to import college_names_mapping: {e}")
+def _supabase_client():
+    from database.connection import get_supabase
+    client = get_supabase()
+    if client is None:
+        raise RuntimeError("SUPABASE_URL / SUPABASE_SERVICE_KEY not configured")
+    return client
 
-try:
-    from data.college_nickname_mapper import nickname_mapper
-    logger.info("✓ nickname_mapper imported")
-except Exception as e:
-    logger.warning(f"Failed to import nickname_mapper: {e}")
-
-try:
-    from data.college_subject_emphasis import college_subject_emphasis
-    logger.info("✓ college_subject_emphasis imported")
-except Exception as e:
-    logger.warning(f"Failed to import college_subject_emphasis: {e}")
-
-try:
-    from data.tuition_state_service import tuition_state_service
-    logger.info("✓ tuition_state_service imported")
-except Exception as e:
-    logger.warning(f"Failed to import tuition_state_service: {e}")
-
-try:
-    from data.college_tuition_service import college_tuition_service
-    logger.info("✓ college_tuition_service imported")
-except Exception as e:
-    logger.warning(f"Failed to import college_tuition_service: {e}")
-
-try:
-    from data.improvement_analysis_service import improvement_analysis_service
-    logger.info("✓ improvement_analysis_service imported")
-except Exception as e:
-    logger.warning(f"Failed to import improvement_analysis_service: {e}")
 
-# Discover service (Scorecard + images)
-try:
-    from services.college_discover_service import (
-        query_colleges,
-        get_college_detail,
-        fetch_photo_bytes,
-    )
-    logger.info("✓ college_discover_service imported")
-except Exception as e:
-    logger.warning(f"Failed to import college_discover_service: {e}")
-    query_colleges = None
-    get_college_detail = None
-    fetch_photo_bytes = None
+service_registry = ServiceRegistry()
+service_registry.register("database_tables", create_tables, description="Create/verify database tables")
+service_registry.register(
+    "major_mapping", lambda: import_attr("data.real_ipeds_major_mapping"),
+    description="IPEDS major strength and relevance lookups",
+)
+service_registry.register(
+    "real_college_suggestions", lambda: import_attr("data.real_college_suggestions", "real_college_suggestions"),
+    depends_on=("major_mapping",), description="College suggestion engine",
+)
+service_registry.register(
+    "college_names_mapping", lambda: import_attr("data.college_names_mapping", "college_names_mapping"),
+)
+service_registry.register(
+    "nickname_mapper", lambda: import_attr("data.college_nickname_mapper", "nickname_mapper"),
+    description="Nickname / abbreviation to official college name",
+)
+service_registry.register(
+    "college_subject_emphasis", lambda: import_attr("data.college_subject_emphasis", "college_subject_emphasis"),
+)
+service_registry.register(
+    "tuition_state_service", lambda: import_attr("data.tuition_state_service", "tuition_state_service"),
+    description="In-state / out-of-state tuition by zipcode",
+)
+service_registry.register(
+    "college_tuition_service", lambda: import_attr("data.college_tuition_service", "college_tuition_service"),
+)
+service_registry.register(
+    "improvement_analysis_service",
+    lambda: import_attr("data.improvement_analysis_service", "improvement_analysis_service"),
+)
+service_registry.register(
+    "zip_geography", lambda: import_attr("data.zip_geography"),
+    description="Offline ZIP code -> city/state",
+)
+service_registry.register(
+    "college_discover", lambda: import_attr("services.college_discover_service"),
+    description="Scorecard-backed discover queries and photos",
+)
+service_registry.register(
+    "college_info_service", lambda: import_attr("services.openai_service", "college_info_service"),
+    description="OpenAI college info",
+)
+service_registry.register("supabase", _supabase_client, description="Supabase auth client")
+service_registry.register(
+    "ml_features", lambda: import_attr("ml.preprocessing.feature_extractor"),
+    description="StudentFeatures / CollegeFeatures types",
+)
+service_registry.register(
+    "ml_predictor", lambda: import_attr("ml.models.predictor", "get_predictor")(),
+    depends_on=("ml_features",), description="Trained admission models",
+)
+service_registry.register(
+    "inference_scheduler", lambda: import_attr("ml.models.batching", "get_inference_scheduler")(),
+    depends_on=("ml_predictor",), description="Micro-batching inference scheduler",
+)
+service_registry.register(
+    "portfolio_simulator", lambda: import_attr("ml.models.portfolio"),
+    description="Monte Carlo application-portfolio simulation",
+)
+service_registry.register(
+    "college_table", lambda: import_attr("ml.models.college_table", "get_college_table")(),
+    description="Precomputed per-college features",
+)
 
 # Simple in-memory cache for college suggestions
 suggestion_cache = {}
@@ -151,15 +153,7 @@ def safe_float(value, default=0.0):
             return default
 
     # Check for NaN and infinity - only after conversion to float
-    try:
-        if pd is not None and pd.isna(float_val):
-            return default
-        if np is not None and np.isinf(float_val):
-            return default
-        # Fallback check if numpy/pandas not available
-        if float_val != float_val:  # NaN check
-            return default
-    except (TypeError, ValueError):
+    if math.isnan(float_val) or math.isinf(float_val):
         return default
 
     return float_val
@@ -199,7 +193,9 @@ def safe_isna(value) -> bool:
     if value is None:
         return True
 
-    # If pandas is available, use pd.isna for comprehensive NaN checking
+    # If pandas is already loaded, use pd.isna for comprehensive NaN checking
+    # (pd.NA / NaT values can only exist once something has imported pandas)
+    pd = sys.modules.get("pandas")
     if pd is not None:
         try:
             return pd.isna(value)
@@ -253,8 +249,11 @@ app = FastAPI(
     description="College admissions probability calculator with personalized game plans",
     version="0.1.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
 )
+# Plain dict/list returns are rendered by orjson directly (see api.responses)
+app.router.route_class = ORJSONRoute
 
 # IMMEDIATE PING - defined FIRST to prove app is running
 @app.get("/ping")
@@ -287,161 +286,36 @@ allowed_origin_suffixes = (
 )
 
 
-def is_allowed_origin(origin: str) -> bool:
-    """Check whether the incoming request origin is allowed."""
-    if not origin:
-        return False
-
-    # Normalize origin (lowercase for comparison)
-    origin_lower = origin.lower().strip()
-
-    # Check exact matches (case-insensitive)
-    for allowed in allowed_origins:
-        if allowed.lower() == origin_lower:
-            return True
-
-    # Check suffix matches
-    for suffix in allowed_origin_suffixes:
-        if origin_lower.endswith(suffix.lower()):
-            return True
-
-    return False
-
-
-@app.middleware("http")
-async def custom_cors_middleware(request: Request, call_next):
-    """
-    CORS middleware - handles ALL CORS requests including preflight OPTIONS.
-
-    CRITICAL: This is the ONLY CORS middleware - FastAPI's CORSMiddleware was removed
-    to prevent conflicts. This middleware handles:
-    - OPTIONS preflight requests
-    - Actual API requests
-    - Exact origin matches
-    - Suffix-based origin matches (.railway.app, .ngrok-free.dev)
-    """
-    origin = request.headers.get("origin")
-    method = request.method
-    path = request.url.path
-
-    # Log all CORS-related requests for debugging
-    if origin or method == "OPTIONS":
-        logger.info(f"🌐 CORS request - Method: {method}, Origin: {origin}, Path: {path}")
-
-    try:
-        # Handle preflight OPTIONS requests FIRST
-        if method == "OPTIONS":
-            if not origin:
-                logger.warning(f"⚠️ OPTIONS request with no origin header - Path: {path}")
-                # Return 204 with basic CORS headers
-                response = Response(status_code=204)
-                response.headers["Access-Control-Allow-Methods"] = "GET,POST,PUT,PATCH,DELETE,OPTIONS"
-                response.headers["Access-Control-Allow-Headers"] = "Authorization,Content-Type,ngrok-skip-browser-warning"
-                return response
-
-            # Check if origin is allowed
-            origin_allowed = is_allowed_origin(origin)
-            logger.info(f"🔍 OPTIONS preflight check - Origin: {origin}, Allowed: {origin_allowed}")
-
-            if origin_allowed:
-                # Create response with ALL required CORS headers
-                response = Response(status_code=204)
-                response.headers["Access-Control-Allow-Origin"] = origin
-                response.headers["Access-Control-Allow-Credentials"] = "true"
-                response.headers["Access-Control-Allow-Methods"] = "GET,POST,PUT,PATCH,DELETE,OPTIONS"
-
-                # Handle requested headers
-                requested_headers = request.headers.get("access-control-request-headers", "")
-                allowed_headers = "Authorization,Content-Type,ngrok-skip-browser-warning"
-                if requested_headers:
-                    allowed_headers = f"{allowed_headers},{requested_headers}"
-                response.headers["Access-Control-Allow-Headers"] = allowed_headers
-                response.headers["Access-Control-Max-Age"] = "86400"
-                response.headers["Vary"] = "Origin"
-
-                logger.info(f"✅ CORS preflight ALLOWED - Origin: {origin}, Path: {path}, Headers: {allowed_headers}")
-                return response
-            else:
-                # Origin not allowed
-                logger.warning(f"❌ CORS preflight REJECTED - Origin: {origin}, Path: {path}")
-                logger.warning(f"   Allowed origins: {allowed_origins}")
-                logger.warning(f"   Allowed suffixes: {allowed_origin_suffixes}")
-                # Return 204 without CORS headers - browser will block
-                return Response(status_code=204)
-
-        # Handle actual requests (GET, POST, etc.)
-        # Wrap in try/except to ensure CORS headers are ALWAYS added for allowed origins
-        try:
-            response = await call_next(request)
-        except Exception as inner_e:
-            logger.error(f"❌ Error processing request: {inner_e}", exc_info=True)
-            # Create error response
-            response = Response(
-                status_code=500,
-                content='{"detail": "Internal server error"}',
-                media_type="application/json"
-            )
-
-        # CRITICAL: Add CORS headers to ALL responses (including errors) if origin is allowed
-        # This ensures the browser can read the error response
-        if origin:
-            origin_allowed = is_allowed_origin(origin)
-            if origin_allowed:
-                # Add ALL required CORS headers - even for error responses
-                response.headers["Access-Control-Allow-Origin"] = origin
-                response.headers["Access-Control-Allow-Credentials"] = "true"
-                response.headers["Access-Control-Allow-Methods"] = "GET,POST,PUT,PATCH,DELETE,OPTIONS"
-                response.headers["Access-Control-Allow-Headers"] = "Authorization,Content-Type,ngrok-skip-browser-warning"
-                response.headers["Access-Control-Max-Age"] = "86400"
-                response.headers["Vary"] = "Origin"
-                logger.info(f"✅ CORS headers added - Origin: {origin}, Path: {path}, Method: {method}, Status: {response.status_code}")
-            else:
-                logger.warning(f"❌ CORS rejected - Origin: {origin}, Path: {path}, Method: {method}")
-        else:
-            # No origin - might be same-origin or direct request
-            logger.debug(f"Request without origin header - Path: {path}, Method: {method}")
-
-        return response
-
-    except Exception as e:
-        logger.error(f"❌ CORS middleware EXCEPTION: {e}", exc_info=True)
-        # Create error response with CORS headers
-        response = Response(
-            status_code=500,
-            content='{"detail": "Internal server error"}',
-            media_type="application/json"
-        )
-
-        # CRITICAL: Always add CORS headers for allowed origins, even on middleware errors
-        if origin and is_allowed_origin(origin):
-            response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Credentials"] = "true"
-            response.headers["Access-Control-Allow-Methods"] = "GET,POST,PUT,PATCH,DELETE,OPTIONS"
-            response.headers["Access-Control-Allow-Headers"] = "Authorization,Content-Type,ngrok-skip-browser-warning"
-            response.headers["Vary"] = "Origin"
-            logger.info(f"✅ CORS headers added after middleware error - Origin: {origin}")
-
-        return response
+# Exact origins in a set, suffixes in one regex; decisions and preflight
+# header blocks are memoized (see api.middleware)
+cors_origins = OriginAllowList(allowed_origins, allowed_origin_suffixes)
+route_timings = RouteTimings()
 
-# REMOVED FastAPI CORSMiddleware - using ONLY custom middleware
-# FastAPI's CORSMiddleware was interfering with our custom CORS handling
-# Our custom middleware handles ALL CORS including exact matches and suffix-based matching
-# This ensures OPTIONS preflight requests are handled correctly with proper headers
+# Compress large JSON bodies (brotli when available, else gzip)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=getattr(settings, 'response_compression_min_bytes', 1024) if settings else 1024,
+)
+# Outermost: CORS for every response (incl. OPTIONS preflight) and per-route timing.
+# This is the ONLY CORS handling - FastAPI's CORSMiddleware is deliberately not used.
+app.add_middleware(CORSTimingMiddleware, allow_list=cors_origins, timings=route_timings)
+CATALOG_CACHE_MAX_AGE = getattr(settings, 'catalog_cache_max_age', 3600) if settings else 3600
 
-# Create database tables on startup
+# Start loading services in the background on startup
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database tables."""
+    """Start the background service warm-up (database tables, data services, ML models)."""
     logger.info(f"Starting Chancify AI API in {ENV} mode")
     logger.info(f"Python path: {os.environ.get('PYTHONPATH', 'not set')}")
     logger.info(f"Working directory: {os.getcwd()}")
 
-    try:
-        create_tables()
-        logger.info("✓ Database tables created/verified successfully")
-    except Exception as e:
-        logger.warning(f"⚠ Database initialization failed: {e}")
-        logger.warning("  API will continue without database features")
+    # Don't hold up binding: services load on worker threads and /api/ready tracks them
+    if settings is None or settings.service_preload:
+        workers = settings.service_preload_workers if settings is not None else 4
+        service_registry.start_background(max_workers=workers)
+        logger.info(f"✓ Service warm-up started ({len(service_registry.names)} services, {workers} workers)")
+    else:
+        logger.info("Service preload disabled - services load on first use")
 
     logger.info("✓ Chancify AI API started successfully")
 
@@ -455,6 +329,44 @@ async def root():
         "environment": ENV
     }
 
+@app.get("/api/ready")
+async def readiness_check():
+    """Per-service load state; 503 until every service has finished loading (or failed to)"""
+    report = service_registry.status()
+    return JSONResponse(
+        content=report,
+        status_code=status.HTTP_200_OK if report["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+@app.get("/api/metrics/routes")
+async def route_metrics(reset: bool = False):
+    """Per-route latency recorded by CORSTimingMiddleware (this worker process only)"""
+    report = {
+        "pid": os.getpid(),
+        "since": route_timings.started_at,
+        "routes": route_timings.snapshot(),
+    }
+    if reset:
+        route_timings.reset()
+    return report
+
+@app.get("/api/metrics/auth-cache")
+async def auth_cache_metrics(reset: bool = False):
+    """Token/profile cache hits (JWT verifications and profile queries saved), this worker process only"""
+    from api import auth_cache
+
+    report = {"pid": os.getpid(), **auth_cache.snapshot()}
+    if reset:
+        auth_cache.reset_stats()
+    return report
+
+@app.get("/api/metrics/application-parser")
+async def application_parser_metrics():
+    """Application documents parsed locally / from cache vs with an LLM call, this worker process only"""
+    from services.application_parser import application_parser
+
+    return {"pid": os.getpid(), **application_parser.snapshot()}
+
 @app.get("/api/health")
 async def health_check():
     """Detailed health check for Railway"""
@@ -499,7 +411,8 @@ def list_colleges(
     page: int = 1,
     page_size: int = 20,
 ):
-    if query_colleges is None:
+    discover = service_registry.get("college_discover")
+    if discover is None:
         raise HTTPException(status_code=503, detail="Discover service unavailable")
     db_gen = get_db()
     db = next(db_gen)
@@ -508,7 +421,7 @@ def list_colleges(
     try:
         page = max(page, 1)
         page_size = min(max(page_size, 1), 50)
-        data, total = query_colleges(
+        data, total = discover.query_colleges(
             db=db,
             q=q,
             state=state,
@@ -538,18 +451,19 @@ def list_colleges(
 
 
 @app.get("/api/colleges/{scorecard_id}")
-def college_detail(scorecard_id: int):
-    if get_college_detail is None:
+def college_detail(scorecard_id: int, request: Request):
+    discover = service_registry.get("college_discover")
+    if discover is None:
         raise HTTPException(status_code=503, detail="Discover service unavailable")
     db_gen = get_db()
     db = next(db_gen)
     if db is None:
         raise HTTPException(status_code=503, detail="Database unavailable")
     try:
-        result = get_college_detail(db, scorecard_id)
+        result = discover.get_college_detail(db, scorecard_id)
         if not result:
             raise HTTPException(status_code=404, detail="College not found")
-        return {"success": True, "data": result}
+        return cached_json(request, {"success": True, "data": result}, CATALOG_CACHE_MAX_AGE)
     finally:
         try:
             next(db_gen)
@@ -559,17 +473,18 @@ def college_detail(scorecard_id: int):
 
 @app.get("/api/colleges/image/{photo_reference}")
 def college_image(photo_reference: str, maxwidth: int = 1200):
-    if fetch_photo_bytes is None:
+    discover = service_registry.get("college_discover")
+    if discover is None:
         raise HTTPException(status_code=503, detail="Image service unavailable")
     try:
-        content, content_type = fetch_photo_bytes(photo_reference, maxwidth=maxwidth)
+        content, content_type = discover.fetch_photo_bytes(photo_reference, maxwidth=maxwidth)
         return Response(content=content, media_type=content_type)
     except Exception as e:
         logger.warning(f"Image fetch failed: {e}")
         raise HTTPException(status_code=404, detail="Image not found")
 
 @app.get("/api/search/colleges")
-async def search_colleges(q: str = "", limit: int = 20):
+async def search_colleges(request: Request, q: str = "", limit: int = 20):
     """
     Search colleges by name, nickname, or abbreviation.
 
@@ -598,6 +513,7 @@ async def search_colleges(q: str = "", limit: int = 20):
         # Use already loaded dataset if available to avoid IO and path issues
         try:
             college_df = None
+            real_college_suggestions = await service_registry.aget("real_college_suggestions")
 
             if real_college_suggestions is not None:
                 college_df = getattr(real_college_suggestions, "college_df", None)
@@ -615,8 +531,7 @@ async def search_colleges(q: str = "", limit: int = 20):
                 csv_path = next((path for path in possible_paths if os.path.exists(path)), None)
 
                 if csv_path:
-                    if pd is None:
-                        raise RuntimeError("pandas is required to load college data but is not installed")
+                    import pandas as pd
                     college_df = pd.read_csv(csv_path)
                 else:
                     raise FileNotFoundError(f"Could not find real_colleges_integrated.csv. Tried: {possible_paths}")
@@ -638,6 +553,7 @@ async def search_colleges(q: str = "", limit: int = 20):
         matching_colleges = []
 
         # First, try to find college by nickname/abbreviation
+        nickname_mapper = await service_registry.aget("nickname_mapper")
         official_name = nickname_mapper.find_college_by_nickname(q) if nickname_mapper else None
         logger.info(f"Nickname search for '{q}': {official_name}")
 
@@ -703,14 +619,14 @@ async def search_colleges(q: str = "", limit: int = 20):
             }
             results.append(college_data)
 
-        return {
+        return cached_json(request, {
             "success": True,
             "colleges": results,
             "total": len(results),
             "query": q,
             "nickname_matched": official_name is not None,
             "message": f"Found {len(results)} colleges matching '{q}'"
-        }
+        }, CATALOG_CACHE_MAX_AGE)
 
     except Exception as e:
         logger.error(f"Error in search_colleges: {e}")
@@ -725,7 +641,7 @@ async def search_colleges(q: str = "", limit: int = 20):
          summary="Get college subject emphasis",
          description="Get real-time subject emphasis percentages for a college using OpenAI API",
          tags=["College Subject Emphasis"])
-async def get_college_subject_emphasis(college_name: str):
+async def get_college_subject_emphasis(college_name: str, request: Request):
     """
     Get subject emphasis percentages for a specific college.
 
@@ -743,7 +659,7 @@ async def get_college_subject_emphasis(college_name: str):
 
         # Verify service is available before use
         emphasis_service = require_service(
-            college_subject_emphasis,
+            await service_registry.aget("college_subject_emphasis"),
             "College subject emphasis service",
             "Ensure data.college_subject_emphasis imports successfully."
         )
@@ -761,12 +677,12 @@ async def get_college_subject_emphasis(college_name: str):
 
         logger.info(f"Subject emphasis retrieved for {college_name}: {len(subjects)} subjects")
 
-        return {
+        return cached_json(request, {
             "success": True,
             "college_name": college_name,
             "subjects": subjects,
             "total_subjects": len(subjects)
-        }
+        }, CATALOG_CACHE_MAX_AGE)
 
     except Exception as e:
         logger.error(f"Error getting subject emphasis for {college_name}: {e}")
@@ -781,7 +697,7 @@ async def get_college_subject_emphasis(college_name: str):
          summary="Get college tuition data",
          description="Get real tuition and cost data for a college",
          tags=["College Tuition"])
-async def get_college_tuition(college_name: str):
+async def get_college_tuition(college_name: str, request: Request):
     """
     Get tuition and cost data for a specific college.
 
@@ -795,7 +711,7 @@ async def get_college_tuition(college_name: str):
         JSON response with tuition and cost information
     """
     tuition_service = require_service(
-        college_tuition_service,
+        await service_registry.aget("college_tuition_service"),
         "College tuition service",
         "Ensure data.college_tuition_service imports successfully."
     )
@@ -808,11 +724,11 @@ async def get_college_tuition(college_name: str):
 
         logger.info(f"Tuition data retrieved for {college_name}: ${tuition_data['total_in_state']:,} total")
 
-        return {
+        return cached_json(request, {
             "success": True,
             "college_name": college_name,
             "tuition_data": tuition_data
-        }
+        }, CATALOG_CACHE_MAX_AGE)
 
     except Exception as e:
         logger.error(f"Error getting tuition data for {college_name}: {e}")
@@ -842,7 +758,7 @@ async def get_tuition_by_zipcode(college_name: str, zipcode: str):
         JSON response with tuition information and state determination
     """
     tuition_state_service_instance = require_service(
-        tuition_state_service,
+        await service_registry.aget("tuition_state_service"),
         "Tuition state service",
         "Ensure data.tuition_state_service imports successfully."
     )
@@ -851,7 +767,7 @@ async def get_tuition_by_zipcode(college_name: str, zipcode: str):
         logger.info(f"Getting tuition for {college_name} with zipcode {zipcode}")
 
         # Get tuition data based on zipcode
-        result = tuition_state_service_instance.get_tuition_for_college_and_zipcode(college_name, zipcode)
+        result = await tuition_state_service_instance.get_tuition_for_college_and_zipcode_async(college_name, zipcode)
 
         if result['success']:
             logger.info(f"Tuition determined for {college_name}: ${result['tuition']:,} ({'in-state' if result['is_in_state'] else 'out-of-state'})")
@@ -869,6 +785,60 @@ async def get_tuition_by_zipcode(college_name: str, zipcode: str):
             "tuition": None
         }
 
+class CollegeTuitionBatchRequest(BaseModel):
+    colleges: List[str] = Field(..., min_length=1, max_length=200, description="College names or catalog unitids")
+    zipcode: Optional[str] = None
+
+@app.post("/api/college-tuition/batch",
+          summary="Get cost of attendance for many colleges",
+          description="In-state or out-of-state cost of attendance for a list of colleges and one zipcode",
+          tags=["College Tuition"])
+async def get_college_tuition_batch(request: CollegeTuitionBatchRequest):
+    """
+    Cost of attendance for a list of colleges in one request.
+
+    Resolves the zipcode once, then prices every college in a single pass over
+    the columnar tuition table. Rows follow `columns`, one per requested
+    college in request order; unmatched colleges get the generic fallback
+    costs with `matched` false.
+
+    Args:
+        request: College names or unitids plus an optional zipcode
+
+    Returns:
+        JSON response with the zipcode's state and the cost rows
+    """
+    tuition_service = require_service(
+        await service_registry.aget("college_tuition_service"),
+        "College tuition service",
+        "Ensure data.college_tuition_service imports successfully."
+    )
+
+    zipcode_state = None
+    if request.zipcode:
+        zip_geography = await service_registry.aget("zip_geography")
+        location = await zip_geography.resolve_zipcode(request.zipcode) if zip_geography is not None else None
+        zipcode_state = location['state_abbr'] if location else None
+
+    try:
+        result = tuition_service.get_cost_of_attendance_batch(request.colleges, zipcode_state)
+        return {
+            "success": True,
+            "zipcode": request.zipcode,
+            "zipcode_state": zipcode_state,
+            **result,
+        }
+    except Exception as e:
+        logger.error(f"Error getting batch tuition for {len(request.colleges)} colleges: {e}")
+        return {
+            "success": False,
+            "zipcode": request.zipcode,
+            "zipcode_state": zipcode_state,
+            "columns": [],
+            "rows": [],
+            "error": str(e)
+        }
+
 @app.post("/api/improvement-analysis/{college_name}",
          summary="Get personalized improvement recommendations",
          description="Analyze user profile against college requirements and provide improvement areas",
@@ -888,7 +858,7 @@ async def get_improvement_analysis(college_name: str, user_profile: Dict[str, An
         JSON response with improvement areas and recommendations
     """
     improvement_service = require_service(
-        improvement_analysis_service,
+        await service_registry.aget("improvement_analysis_service"),
         "Improvement analysis service",
         "Ensure data.improvement_analysis_service imports successfully."
     )
@@ -896,11 +866,14 @@ async def get_improvement_analysis(college_name: str, user_profile: Dict[str, An
     try:
         logger.info(f"Getting improvement analysis for {college_name}")
 
-        # Get improvement recommendations
-        improvements = improvement_service.analyze_user_profile(user_profile, college_name)
+        # Get improvement recommendations; impacts are measured by scoring improved
+        # copies of the profile in one batch (formula-only if the predictor is unavailable)
+        improvements, estimate = improvement_service.analyze_with_impacts(
+            user_profile, college_name, predictor=await service_registry.aget("ml_predictor")
+        )
 
         # Calculate combined impact
-        combined_impact = improvement_service.calculate_combined_impact(improvements)
+        combined_impact = improvement_service.calculate_combined_impact(improvements, estimate)
 
         # Convert to JSON-serializable format
         improvements_data = []
@@ -910,6 +883,7 @@ async def get_improvement_analysis(college_name: str, user_profile: Dict[str, An
                 "current": imp.current,
                 "target": imp.target,
                 "impact": imp.impact,
+                "impact_source": imp.impact_source,
                 "priority": imp.priority,
                 "description": imp.description,
                 "actionable_steps": imp.actionable_steps
@@ -920,6 +894,8 @@ async def get_improvement_analysis(college_name: str, user_profile: Dict[str, An
             "college_name": college_name,
             "improvements": improvements_data,
             "combined_impact": combined_impact,
+            "current_probability": round(estimate.base_probability, 4) if estimate else None,
+            "impact_method": estimate.method if estimate else "heuristic",
             "total_improvements": len(improvements)
         }
 
@@ -941,10 +917,6 @@ calculations = None
 ml_calculations = None
 openai_routes = None
 auth = None
-college_info_service = None
-get_predictor = None
-StudentFeatures = None
-CollegeFeatures = None
 
 try:
     from api.routes import calculations, ml_calculations, openai_routes, auth
@@ -952,26 +924,6 @@ try:
 except Exception as e:
     logger.warning(f"Failed to import API routes: {e}")
 
-try:
-    from services.openai_service import college_info_service
-    logger.info("✓ OpenAI service imported")
-except Exception as e:
-    logger.warning(f"Failed to import OpenAI service: {e}")
-
-try:
-    from ml.models.predictor import get_predictor
-    logger.info("✓ ML predictor imported")
-except Exception as e:
-    logger.warning(f"Failed to import ML predictor: {e}")
-
-try:
-    from ml.preprocessing.feature_extractor import StudentFeatures, CollegeFeatures
-    logger.info("✓ ML feature extractor types imported")
-except Exception as e:
-    logger.warning(f"Failed to import ML feature extractor types: {e}")
-
-from pydantic import BaseModel
-# Note: pandas (pd) is imported at the top with error handling
 
 # Register routers only if imports succeeded
 if auth is not None:
@@ -999,107 +951,31 @@ else:
     logger.warning("⚠ OpenAI routes not registered - OpenAI endpoints unavailable")
 
 # College data mapping based on training data
-def get_college_data(college_name: str) -> Dict[str, Any]:
+async def lookup_college_record(college_name: str):
+    """Resolve a college against the prebuilt college feature table (unitid / exact name / partial name)."""
+    try:
+        college_table = await service_registry.aget("college_table")
+        if college_table is None:
+            raise RuntimeError("College feature table is not available")
+        record = college_table.lookup(college_name)
+        if record is not None:
+            logger.info(f"Found college: {record.name}")
+            return record
+        logger.warning(f"No college found for: {college_name}")
+    except Exception as e:
+        logger.warning(f"Could not load college data: {e}")
+    return None
+
+async def get_college_data(college_name: str) -> Dict[str, Any]:
     """Get college data based on college name from integrated data."""
 
     logger.info(f"Getting college data for: {college_name}")
+    return college_data_for(college_name, await lookup_college_record(college_name))
 
-    # Load the integrated college data
-    try:
-        # Try multiple possible paths
-        possible_paths = [
-            os.path.join(os.path.dirname(__file__), 'data', 'raw', 'real_colleges_integrated.csv'),  # Relative to main.py
-            'data/raw/real_colleges_integrated.csv',  # Relative to current working directory
-            os.path.join(os.getcwd(), 'backend', 'data', 'raw', 'real_colleges_integrated.csv'),  # From project root
-        ]
-
-        csv_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                csv_path = path
-                break
-
-        if csv_path:
-            if pd is None:
-                raise RuntimeError("pandas is required to load college data but is not installed")
-            df = pd.read_csv(csv_path)
-            logger.info(f"Loaded college data: {df.shape} from {csv_path}")
-        else:
-            raise FileNotFoundError(f"Could not find real_colleges_integrated.csv. Tried: {possible_paths}")
-
-        # Check if the input is a college ID (format: college_XXXXXX)
-        college_row = None
-        if college_name.startswith('college_'):
-            college_id = college_name.replace('college_', '')
-            logger.info(f"Looking for college ID: {college_id}")
-
-            # Try to find by unitid (MOST COMMON CASE)
-            college_row = df[df['unitid'] == int(college_id)]
-            logger.info(f"Found by unitid: {len(college_row)} rows")
-
-            if not college_row.empty:
-                logger.info(f"✅ SUCCESS: Found college by ID")
-            else:
-                logger.warning(f"❌ FAILED: No college found with unitid={college_id}")
-        else:
-            # Find the college by name (case-insensitive, with exact matching first)
-            college_name_lower = college_name.lower()
-            college_row = df[df['name'].str.lower() == college_name_lower]
-            logger.info(f"Exact match found: {len(college_row)} rows")
-
-            # If exact match not found, try partial matching but prefer shorter matches
-            if college_row.empty:
-                college_row = df[df['name'].str.lower().str.contains(college_name_lower, na=False)]
-                logger.info(f"Partial match found: {len(college_row)} rows")
-                # If multiple matches, prefer the one with the shortest name (most specific)
-                if not college_row.empty and len(college_row) > 1:
-                    # Just take the first match since they all contain the query
-                    college_row = college_row.iloc[[0]]
-
-        if college_row is not None and not college_row.empty:
-            row = college_row.iloc[0]
-            logger.info(f"Found college: {row['name']}")
-            # Debug: Print all column names and the name value
-            logger.info(f"CSV columns: {list(row.index)}")
-            logger.info(f"Row name value: {row.get('name', 'MISSING_NAME_COLUMN')}")
-            logger.info(f"Row name type: {type(row.get('name'))}")
-            logger.info(f"Row name is NaN: {safe_isna(row.get('name'))}")
-
-            # Try to get name from different possible column names
-            college_actual_name = None
-            if safe_notna(row.get('name')):
-                college_actual_name = str(row['name'])
-            elif safe_notna(row.get('Name')):
-                college_actual_name = str(row['Name'])
-            elif safe_notna(row.get('institution_name')):
-                college_actual_name = str(row['institution_name'])
-            else:
-                college_actual_name = college_name  # Fallback to original input
-
-            result = {
-                'name': college_actual_name,
-                'acceptance_rate': float(row.get('acceptance_rate', 0.5)) if safe_notna(row.get('acceptance_rate')) else (float(row.get('acceptance_rate_percent', 50)) / 100 if safe_notna(row.get('acceptance_rate_percent')) else 0.5),
-                'sat_25th': 1200,  # Default values since SAT/ACT data not available
-                'sat_75th': 1500,
-                'act_25th': 25,
-                'act_75th': 35,
-                'test_policy': str(row.get('test_policy', 'Required')),
-                'financial_aid_policy': str(row.get('financial_aid_policy', 'Need-blind')),
-                'selectivity_tier': str(row.get('selectivity_tier', 'Moderately Selective')),
-                'gpa_average': float(row.get('gpa_average', 3.7)) if safe_notna(row.get('gpa_average')) else 3.7,
-                'city': str(row.get('city', 'Unknown')) if safe_notna(row.get('city')) else "Unknown",
-                'state': str(row.get('state', 'Unknown')) if safe_notna(row.get('state')) else "Unknown",
-                'tuition_in_state': int(row.get('tuition_in_state_usd', 20000)) if safe_notna(row.get('tuition_in_state_usd')) else 20000,
-                'tuition_out_of_state': int(row.get('tuition_out_of_state_usd', 40000)) if safe_notna(row.get('tuition_out_of_state_usd')) else 40000,
-                'student_body_size': int(row.get('student_body_size', 5000)) if safe_notna(row.get('student_body_size')) else 5000,
-                'is_public': str(row.get('control', 'Private')).lower() == 'public' if safe_notna(row.get('control')) else False
-            }
-            logger.info(f"Returning college data: {result}")
-            return result
-        else:
-            logger.warning(f"No college found for: {college_name}")
-    except Exception as e:
-        logger.warning(f"Could not load college data: {e}")
+def college_data_for(college_name: str, record) -> Dict[str, Any]:
+    """College data dict for a looked-up record, or fallback data when there is none."""
+    if record is not None:
+        return record.to_college_data()
 
     # Default fallback data
     logger.info(f"Returning fallback data for: {college_name}")
@@ -1204,117 +1080,27 @@ async def predict_admission_frontend(request: FrontendProfileRequest):
     """Predict admission probability using hybrid ML+Formula system for frontend"""
     try:
         # Get predictor
-        if get_predictor is None:
+        predictor = await service_registry.aget("ml_predictor")
+        if predictor is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="ML predictor service is not available. Ensure ML models are properly loaded."
             )
-        predictor = get_predictor()
-        
-        if StudentFeatures is None or CollegeFeatures is None:
+
+        features = await service_registry.aget("ml_features")
+        if features is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="ML feature extraction types are not available. Ensure ML preprocessing module is properly loaded."
             )
 
-        # Convert frontend string values to appropriate types
-        def safe_int(value: str) -> int:
-            try:
-                return int(value) if value and value.strip() else 0
-            except (ValueError, TypeError):
-                return 0
-
-        # Calculate derived factor scores from real data
-        gpa_unweighted = safe_float(request.gpa_unweighted)
-        gpa_weighted = safe_float(request.gpa_weighted)
-        sat_score = safe_int(request.sat)
-        act_score = safe_int(request.act)
-
-        # Calculate grades score from GPA (0-10 scale)
-        def calculate_grades_score(gpa_unweighted, gpa_weighted):
-            if gpa_unweighted > 0:
-                # Convert 4.0 scale to 10.0 scale
-                return min(10.0, (gpa_unweighted / 4.0) * 10.0)
-            elif gpa_weighted > 0:
-                # Convert 5.0 scale to 10.0 scale
-                return min(10.0, (gpa_weighted / 5.0) * 10.0)
-            return 5.0  # Default neutral
-
-        # Calculate testing score from SAT/ACT (0-10 scale)
-        def calculate_testing_score(sat, act):
-            if sat > 0:
-                # FIXED: More realistic SAT scoring - 1200=5.0, 1600=10.0
-                return min(10.0, max(0.0, ((sat - 1200) / 400) * 5.0 + 5.0))
-            elif act > 0:
-                # FIXED: More realistic ACT scoring - 20=5.0, 36=10.0
-                return min(10.0, max(0.0, ((act - 20) / 16) * 5.0 + 5.0))
-            return 5.0  # Default neutral
-
-        # Calculate major fit score based on major relevance
-        def calculate_major_fit_score(major, college_name):
-            # This would ideally use a major-college relevance database
-            # For now, use a simple heuristic based on major popularity
-            popular_majors = ['Computer Science', 'Business', 'Engineering', 'Biology', 'Psychology']
-            if major in popular_majors:
-                return 7.0  # Good fit for popular majors
-            return 6.0  # Neutral fit
-
         # Create student features from frontend data
-        student = StudentFeatures(
-            # Academic metrics
-            gpa_unweighted=gpa_unweighted,
-            gpa_weighted=gpa_weighted,
-            sat_total=sat_score,
-            act_composite=act_score,
-
-            # Course rigor and class info
-            ap_count=int(safe_float(request.extracurricular_depth) * 2),  # Estimate based on extracurricular depth
-            honors_count=int(safe_float(request.extracurricular_depth) * 1.5),  # Estimate based on extracurricular depth
-            class_rank_percentile=safe_float(request.hs_reputation) * 10,  # Estimate based on HS reputation
-            class_size=500,  # Default class size
-
-            # Extracurricular counts and commitment
-            ec_count=min(10, max(1, safe_int(request.extracurricular_depth) // 2)),  # Derive from extracurricular depth
-            leadership_positions_count=safe_int(request.leadership_positions),
-            years_commitment=min(6, max(1, safe_int(request.extracurricular_depth) // 2)),  # Derive from extracurricular depth
-            hours_per_week=min(20.0, max(2.0, safe_float(request.extracurricular_depth) * 1.5)),  # Derive from extracurricular depth
-            awards_count=safe_int(request.awards_publications),
-            national_awards=min(5, max(0, safe_int(request.awards_publications) // 2)),  # Derive from awards/publications
-
-            # Demographics and diversity
-            first_generation=safe_float(request.firstgen_diversity) > 7.0,  # Derive from firstgen_diversity
-            underrepresented_minority=safe_float(request.firstgen_diversity) > 6.0,  # Derive from firstgen_diversity
-            geographic_diversity=safe_float(request.geographic_diversity),
-            legacy_status=bool(safe_int(request.legacy_status)),
-            recruited_athlete=safe_float(request.volunteer_work) > 7.0,  # Derive from volunteer_work
-
-            # Factor scores (calculated from real data, not defaults)
-            factor_scores={
-                'grades': calculate_grades_score(gpa_unweighted, gpa_weighted),
-                'rigor': safe_float(request.extracurricular_depth),  # Use extracurricular depth as rigor proxy
-                'testing': calculate_testing_score(sat_score, act_score),
-                'essay': safe_float(request.essay_quality),
-                'ecs_leadership': safe_float(request.extracurricular_depth),
-                'recommendations': safe_float(request.recommendations),
-                'plan_timing': safe_float(request.plan_timing),
-                'athletic_recruit': safe_float(request.volunteer_work),  # Use volunteer_work as proxy
-                'major_fit': calculate_major_fit_score(request.major, "Unknown"),  # No specific college for suggestions
-                'geography_residency': safe_float(request.geography_residency),
-                'firstgen_diversity': safe_float(request.firstgen_diversity),
-                'ability_to_pay': safe_float(request.ability_to_pay),
-                'awards_publications': safe_float(request.awards_publications),
-                'portfolio_audition': safe_float(request.portfolio_audition),
-                'policy_knob': safe_float(request.policy_knob),
-                'demonstrated_interest': safe_float(request.demonstrated_interest),
-                'legacy': safe_float(request.legacy_status),
-                'interview': safe_float(request.interview),
-                'conduct_record': safe_float(request.conduct_record),
-                'hs_reputation': safe_float(request.hs_reputation)
-            }
-        )
+        student = features.student_features_from_profile(request.model_dump())
 
-        # Get college data with real acceptance rate from OpenAI
-        college_data = get_college_data(request.college)
+        # Get college data with real acceptance rate from OpenAI; the record is
+        # looked up once and reused for the CollegeFeatures below
+        college_record = await lookup_college_record(request.college)
+        college_data = college_data_for(request.college, college_record)
         logger.info(f"College data retrieved: {college_data}")
         logger.info(f"College name: {college_data.get('name', 'MISSING')}")
         logger.info(f"College city: {college_data.get('city', 'MISSING')}")
@@ -1322,6 +1108,7 @@ async def predict_admission_frontend(request: FrontendProfileRequest):
 
         # Get real acceptance rate and subject emphasis from OpenAI API
         try:
+            college_info_service = await service_registry.aget("college_info_service")
             if college_info_service is None:
                 raise Exception("OpenAI service not available")
             college_info = await college_info_service.get_college_info(college_data['name'])
@@ -1346,21 +1133,28 @@ async def predict_admission_frontend(request: FrontendProfileRequest):
                 {"label": "Education", "value": 5}
             ]
 
-        college = CollegeFeatures(
-            name=college_data['name'],
-            acceptance_rate=real_acceptance_rate,  # Use real acceptance rate from OpenAI
-            sat_25th=college_data['sat_25th'],
-            sat_75th=college_data['sat_75th'],
-            act_25th=college_data['act_25th'],
-            act_75th=college_data['act_75th'],
-            test_policy=college_data['test_policy'],
-            financial_aid_policy=college_data['financial_aid_policy'],
-            selectivity_tier=college_data['selectivity_tier'],
-            gpa_average=college_data['gpa_average']
-        )
+        # Reuse the precomputed CollegeFeatures for catalog colleges
+        if college_record is not None:
+            college = college_record.features
+            if college.acceptance_rate != real_acceptance_rate:
+                college = dataclasses.replace(college, acceptance_rate=real_acceptance_rate)  # Use real acceptance rate from OpenAI
+        else:
+            college = features.CollegeFeatures(
+                name=college_data['name'],
+                acceptance_rate=real_acceptance_rate,  # Use real acceptance rate from OpenAI
+                sat_25th=college_data['sat_25th'],
+                sat_75th=college_data['sat_75th'],
+                act_25th=college_data['act_25th'],
+                act_75th=college_data['act_75th'],
+                test_policy=college_data['test_policy'],
+                financial_aid_policy=college_data['financial_aid_policy'],
+                selectivity_tier=college_data['selectivity_tier'],
+                gpa_average=college_data['gpa_average']
+            )
 
-        # Make hybrid prediction with optional misc uplift
-        result = predictor.predict(
+        # Make hybrid prediction with optional misc uplift (micro-batched with concurrent requests)
+        scheduler = require_service(await service_registry.aget("inference_scheduler"), "ML inference scheduler")
+        result = await scheduler.predict(
             student,
             college,
             model_name='ensemble',
@@ -1394,6 +1188,7 @@ async def predict_admission_frontend(request: FrontendProfileRequest):
             "formula_probability": round(result.formula_probability, 4),
             "ml_confidence": round(result.ml_confidence, 4),
             "blend_weights": result.blend_weights,
+            "factor_contributions": result.factor_contributions,
             "model_used": result.model_used,
             "prediction_method": "hybrid_ml_formula",
             "explanation": result.explanation,
@@ -1425,6 +1220,67 @@ async def predict_admission_frontend(request: FrontendProfileRequest):
             "message": "Prediction failed. Please try again."
         }
 
+class PortfolioSimulationRequest(BaseModel):
+    profile: Dict[str, Any] = Field(default_factory=dict, description="Profile form fields, as sent to /api/predict/frontend")
+    colleges: List[str] = Field(..., min_length=1, max_length=50, description="College names or college_<unitid> ids")
+    draws: int = Field(100_000, ge=1_000, le=1_000_000)
+    tier_correlation: float = Field(0.0, ge=0.0, le=0.95, description="Outcome correlation within a selectivity tier")
+    seed: Optional[int] = None
+
+@app.post("/api/portfolio/simulate")
+async def simulate_application_portfolio(request: PortfolioSimulationRequest):
+    """
+    Monte Carlo simulation of applying to a list of colleges.
+
+    Scores every college for the profile in one batched prediction, then
+    simulates the application cycle `draws` times to estimate P(at least one
+    admit), the expected number of admits, the admit-count distribution and
+    each college's marginal value to the list.
+    """
+    features = require_service(await service_registry.aget("ml_features"), "ML feature extraction")
+    scheduler = require_service(await service_registry.aget("inference_scheduler"), "ML inference scheduler")
+    portfolio = require_service(await service_registry.aget("portfolio_simulator"), "Portfolio simulator")
+    college_table = require_service(await service_registry.aget("college_table"), "College feature table")
+
+    try:
+        student = features.student_features_from_profile(request.profile)
+
+        records, unresolved = [], []
+        for key in request.colleges:
+            record = college_table.lookup(key)
+            if record is None:
+                unresolved.append(key)
+            elif all(r.unitid != record.unitid for r in records):
+                records.append(record)
+        if not records:
+            return {"success": False, "error": "No requested college was found", "unresolved": unresolved}
+
+        predictions = await scheduler.predict_many([(student, record.features) for record in records])
+        result = await run_in_threadpool(
+            portfolio.simulate_portfolio,
+            [record.name for record in records],
+            [prediction.probability for prediction in predictions],
+            # Same tiering as /api/calculations/ml/portfolio
+            [portfolio.tier_for_acceptance_rate(record.features.acceptance_rate) for record in records],
+            draws=request.draws,
+            tier_correlation=request.tier_correlation,
+            seed=request.seed,
+        )
+
+        return {
+            "success": True,
+            "model_used": predictions[0].model_used,
+            "unresolved": unresolved,
+            **result.to_dict(),
+        }
+    except Exception as e:
+        logger.error(f"Portfolio simulation error: {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "Portfolio simulation failed. Please try again."
+        }
+
 # College suggestions request model (simplified)
 # This model receives user profile data from the frontend and generates
 # AI-powered college suggestions based on academic strength and preferences
@@ -1483,7 +1339,7 @@ async def suggest_colleges(request: CollegeSuggestionsRequest):
         JSON response with 9 balanced college suggestions and metadata
     """
     suggestions_service = require_service(
-        real_college_suggestions,
+        await service_registry.aget("real_college_suggestions"),
         "College suggestions service",
         "Ensure data.real_college_suggestions imports successfully."
     )
@@ -1554,6 +1410,7 @@ async def suggest_colleges(request: CollegeSuggestionsRequest):
 
 
         # Convert to API response format
+        major_mapping = await service_registry.aget("major_mapping")
         suggestions = []
         for college_data in college_suggestions[:9]:  # Ensure exactly 9 suggestions
             college_name = college_data['name']
@@ -1562,8 +1419,8 @@ async def suggest_colleges(request: CollegeSuggestionsRequest):
             probability = college_data.get('probability', 0.5)
 
             # Get major relevance info
-            if get_major_relevance_info is not None:
-                major_relevance = get_major_relevance_info(college_name, major)
+            if major_mapping is not None:
+                major_relevance = major_mapping.get_major_relevance_info(college_name, major)
             else:
                 # Fallback when major mapping service is unavailable
                 logger.warning(f"get_major_relevance_info not available, using fallback for {college_name}")
@@ -1648,21 +1505,22 @@ async def predict_admission(request: PredictionRequest):
     """Predict admission probability using ML model"""
     try:
         # Get predictor
-        if get_predictor is None:
+        predictor = await service_registry.aget("ml_predictor")
+        if predictor is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="ML predictor service is not available. Ensure ML models are properly loaded."
             )
-        predictor = get_predictor()
-        
-        if StudentFeatures is None or CollegeFeatures is None:
+
+        features = await service_registry.aget("ml_features")
+        if features is None:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="ML feature extraction types are not available. Ensure ML preprocessing module is properly loaded."
             )
 
         # Create student features
-        student = StudentFeatures(
+        student = features.StudentFeatures(
             gpa_unweighted=request.gpa_unweighted,
             gpa_weighted=request.gpa_weighted,
             sat_score=request.sat,
@@ -1690,8 +1548,8 @@ async def predict_admission(request: PredictionRequest):
 
         # Create college features based on the selected college
         # Map college selection to actual training data
-        college_data = get_college_data(request.college)
-        college = CollegeFeatures(
+        college_data = await get_college_data(request.college)
+        college = features.CollegeFeatures(
             name=request.college,
             acceptance_rate=college_data['acceptance_rate'],
             sat_25th=college_data.get('sat_25th', 1200),
@@ -1703,8 +1561,9 @@ async def predict_admission(request: PredictionRequest):
             selectivity_tier=college_data.get('selectivity_tier', 'Elite')
         )
 
-        # Make prediction
-        result = predictor.predict(
+        # Make prediction (MISC extraction may call OpenAI, so keep it off the event loop)
+        result = await run_in_threadpool(
+            predictor.predict,
             student,
             college,
             misc_items=request.misc if hasattr(request, "misc") else None,
@@ -1775,15 +1634,14 @@ async def predict_admission(request: PredictionRequest):
 async def debug_reload_predictor():
     """Debug endpoint to force reload the ML predictor."""
     try:
-        if get_predictor is None:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="ML predictor service is not available. Ensure ML models are properly loaded."
-            )
-        # Try to re-import in case it was None at startup
+        # Reload the models, then rebind the registry (and anything depending on it) to the new predictor
+        def reload_predictor():
+            from ml.models.predictor import get_predictor
+            get_predictor(force_reload=True)
+            return service_registry.reload("ml_predictor").value
+
         try:
-            from ml.models.predictor import get_predictor as _get_predictor
-            predictor = _get_predictor(force_reload=True)
+            predictor = await run_in_threadpool(reload_predictor)
         except Exception as import_error:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -10,10 +10,16 @@ from .preprocessing import (
     StudentFeatures,
     CollegeFeatures
 )
-from .training import (
-    SyntheticDataGenerator,
-    generate_initial_dataset
-)
+
+
+def __getattr__(name):
+    # Training helpers pull in pandas; import them only when asked for so
+    # serving code that just needs the predictor starts faster
+    if name in ('SyntheticDataGenerator', 'generate_initial_dataset'):
+        from . import training
+        return getattr(training, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Preprocessing
@@ -1,6 +1,7 @@
 """
-ML evaluation module - placeholder.
+ML evaluation module.
 """
 
-# Will implement after model training
+from .harness import evaluate, load_holdout, measure_latency, quality_metrics
 
+__all__ = ['evaluate', 'load_holdout', 'measure_latency', 'quality_metrics']
@@ -0,0 +1,289 @@
+"""
+Model evaluation and serving-performance harness.
+
+Loads any artifact directory ``AdmissionPredictor`` can read and reports, per
+model (``logistic_regression``, ``random_forest``, ``xgboost``, ``ensemble``
+and ``calibrated_model`` when present):
+
+1. Discrimination and calibration on held-out rows (ROC-AUC, Brier score,
+   log loss, expected calibration error and a reliability table)
+2. Latency percentiles and rows/sec for single-row and batched prediction,
+   timed through the inference backend the API serves each model with
+   (``predictor.backends``: the verified numpy backend, or the sklearn
+   objects where it doesn't apply); the report names the backend per model
+
+The held-out rows are the test split ``ModelTrainer.prepare_data`` would carve
+out of the dataset (stratified, ``random_state=42``). Results are written as
+JSON so quality and speed can be compared between retrains.
+
+From `backend/`:
+
+    python -m ml.evaluation.harness --model-dir data/models --output eval.json
+"""
+
+import argparse
+import contextlib
+import json
+import platform
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.metrics import accuracy_score, brier_score_loss, log_loss, roc_auc_score
+from sklearn.model_selection import train_test_split
+
+from ml.models.inference_backends import SklearnBackend
+from ml.models.predictor import AdmissionPredictor
+from ml.preprocessing.feature_extractor import FeatureExtractor
+
+DEFAULT_DATA_PATH = Path(__file__).resolve().parents[2] / 'data' / 'processed' / 'training_data_large.csv'
+CALIBRATED_MODEL = 'calibrated_model'
+DEFAULT_BATCH_SIZES = (32, 256)
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+def load_holdout(
+    data_path: Path = DEFAULT_DATA_PATH,
+    test_size: float = 0.2,
+    random_state: int = 42,
+) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """
+    Load the held-out split of a training CSV.
+
+    Returns:
+        Raw feature rows (FeatureExtractor order), outcomes, and the formula
+        probabilities when the CSV carries them
+    """
+    df = pd.read_csv(data_path)
+    feature_names = FeatureExtractor.get_feature_names()
+    missing = [name for name in feature_names if name not in df.columns]
+    if missing or 'outcome' not in df.columns:
+        raise ValueError(f"{data_path} is missing columns: {missing or ['outcome']}")
+
+    X = df[feature_names].to_numpy(dtype=float)
+    y = df['outcome'].to_numpy(dtype=int)
+    formula = df['formula_probability'].to_numpy(dtype=float) if 'formula_probability' in df.columns else None
+
+    if test_size <= 0:
+        return X, y, formula
+    arrays = [X, y] + ([formula] if formula is not None else [])
+    split = train_test_split(*arrays, test_size=test_size, random_state=random_state, stratify=y)
+    X_test, y_test = split[1], split[3]
+    formula_test = split[5] if formula is not None else None
+    return X_test, y_test, formula_test
+
+
+def quality_metrics(y_true: np.ndarray, y_prob: np.ndarray, n_bins: int = 10) -> Dict:
+    """Discrimination and calibration metrics for one set of probabilities."""
+    y_prob = np.clip(np.asarray(y_prob, dtype=float), 1e-6, 1 - 1e-6)
+
+    # Equal-width reliability bins; ECE is the count-weighted |observed - predicted| gap
+    edges = np.linspace(0.0, 1.0, n_bins + 1)
+    bin_ids = np.clip(np.digitize(y_prob, edges[1:-1]), 0, n_bins - 1)
+    reliability = []
+    ece = 0.0
+    for b in range(n_bins):
+        mask = bin_ids == b
+        count = int(mask.sum())
+        if count == 0:
+            continue
+        mean_predicted = float(y_prob[mask].mean())
+        observed_rate = float(y_true[mask].mean())
+        ece += count / len(y_prob) * abs(observed_rate - mean_predicted)
+        reliability.append({
+            'bin_low': float(edges[b]),
+            'bin_high': float(edges[b + 1]),
+            'count': count,
+            'mean_predicted': mean_predicted,
+            'observed_rate': observed_rate,
+        })
+
+    return {
+        'roc_auc': float(roc_auc_score(y_true, y_prob)),
+        'brier_score': float(brier_score_loss(y_true, y_prob)),
+        'log_loss': float(log_loss(y_true, y_prob, labels=[0, 1])),
+        'accuracy': float(accuracy_score(y_true, (y_prob >= 0.5).astype(int))),
+        'expected_calibration_error': float(ece),
+        'mean_predicted': float(y_prob.mean()),
+        'observed_rate': float(y_true.mean()),
+        'reliability': reliability,
+    }
+
+
+def _scorers(predictor: AdmissionPredictor) -> Dict[str, Tuple[str, Callable[[np.ndarray], np.ndarray]]]:
+    """
+    Raw feature rows -> P(admit) for every model the artifact directory
+    provides, as (backend name, scorer): each model is scored through the
+    backend the predictor serves it with.
+    """
+    scorers = {}
+    for name, model in predictor.models.items():
+        backend = predictor.backends.get(name) or SklearnBackend(model, predictor.feature_selector, predictor.scaler)
+        scorers[name] = (backend.name, lambda X, backend=backend: backend.predict(X)[0])
+    if predictor.calibrator is not None:
+        calibrator = predictor.calibrator
+        scorers[CALIBRATED_MODEL] = ('sklearn', lambda X: np.clip(
+            calibrator.predict_proba(predictor.transform_features(X))[:, 1], 0.0001, 0.9999
+        ))
+    return scorers
+
+
+def _latency_summary(timings: List[float], rows_per_call: int) -> Dict:
+    timings_ms = np.asarray(timings) * 1000.0
+    summary = {f'p{p}_ms': float(np.percentile(timings_ms, p)) for p in LATENCY_PERCENTILES}
+    summary['mean_ms'] = float(timings_ms.mean())
+    summary['calls'] = len(timings)
+    summary['rows_per_call'] = rows_per_call
+    total_seconds = float(np.sum(timings))
+    summary['rows_per_sec'] = rows_per_call * len(timings) / total_seconds if total_seconds > 0 else float('inf')
+    return summary
+
+
+def measure_latency(
+    score: Callable[[np.ndarray], np.ndarray],
+    X: np.ndarray,
+    batch_size: int,
+    calls: int,
+    warmup: int = 5,
+) -> Dict:
+    """Time ``calls`` invocations of ``score`` on consecutive ``batch_size``-row slices of X."""
+    n = len(X)
+
+    def batch(i: int) -> np.ndarray:
+        start = (i * batch_size) % n
+        rows = X[start:start + batch_size]
+        if len(rows) < batch_size:
+            rows = np.vstack([rows, X[:batch_size - len(rows)]])
+        return rows
+
+    for i in range(warmup):
+        score(batch(i))
+
+    timings = []
+    for i in range(calls):
+        rows = batch(i)
+        start = time.perf_counter()
+        score(rows)
+        timings.append(time.perf_counter() - start)
+    return _latency_summary(timings, batch_size)
+
+
+def evaluate(
+    model_dir: str,
+    data_path: Path = DEFAULT_DATA_PATH,
+    test_size: float = 0.2,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    single_row_calls: int = 500,
+    batch_calls: int = 50,
+    models: Optional[Sequence[str]] = None,
+) -> Dict:
+    """
+    Evaluate every model in an artifact directory.
+
+    Args:
+        model_dir: Directory AdmissionPredictor loads from
+        data_path: CSV with FeatureExtractor columns plus ``outcome``
+        test_size: Held-out fraction (0 evaluates on the whole file)
+        batch_sizes: Batch sizes to time besides single-row prediction
+        single_row_calls: Timed single-row calls per model
+        batch_calls: Timed calls per batch size per model
+        models: Restrict to these model names
+
+    Returns:
+        JSON-serializable report
+    """
+    # The loader reports progress on stdout; keep stdout clean for the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        predictor = AdmissionPredictor(model_dir)
+    if not predictor.is_available():
+        raise RuntimeError(f"No loadable models in {model_dir}")
+
+    X, y, formula = load_holdout(Path(data_path), test_size=test_size)
+    scorers = _scorers(predictor)
+    if models:
+        unknown = sorted(set(models) - set(scorers))
+        if unknown:
+            raise ValueError(f"Models not found in {model_dir}: {unknown} (available: {sorted(scorers)})")
+        scorers = {name: scorers[name] for name in models}
+
+    results = {}
+    for name, (backend, score) in scorers.items():
+        results[name] = {
+            'backend': backend,
+            'quality': quality_metrics(y, score(X)),
+            'latency': {
+                'single_row': measure_latency(score, X, 1, single_row_calls),
+                'batched': {
+                    str(size): measure_latency(score, X, size, batch_calls)
+                    for size in batch_sizes
+                },
+            },
+        }
+
+    return {
+        'generated_at': datetime.now().isoformat(),
+        'model_dir': str(model_dir),
+        'model_version': predictor.metadata.get('version'),
+        'training_date': predictor.metadata.get('training_date'),
+        'calibrator_base_model': predictor.calibrator_base_model,
+        'dataset': {
+            'path': str(data_path),
+            'test_size': test_size,
+            'rows': int(len(y)),
+            'positive_rate': float(y.mean()),
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'scikit_learn': sklearn.__version__,
+            'machine': platform.machine(),
+        },
+        'formula_baseline': quality_metrics(y, formula) if formula is not None else None,
+        'models': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate admission models for quality and serving speed")
+    parser.add_argument('--model-dir', default='data/models')
+    parser.add_argument('--data', default=str(DEFAULT_DATA_PATH), help="CSV with feature columns and outcome")
+    parser.add_argument('--test-size', type=float, default=0.2)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument('--single-row-calls', type=int, default=500)
+    parser.add_argument('--batch-calls', type=int, default=50)
+    parser.add_argument('--models', nargs='+', help="Only evaluate these models")
+    parser.add_argument('--output', help="Write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    report = evaluate(
+        args.model_dir,
+        data_path=Path(args.data),
+        test_size=args.test_size,
+        batch_sizes=args.batch_sizes,
+        single_row_calls=args.single_row_calls,
+        batch_calls=args.batch_calls,
+        models=args.models,
+    )
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload)
+        for name, result in report['models'].items():
+            quality, single = result['quality'], result['latency']['single_row']
+            print(
+                f"{name:<20} AUC {quality['roc_auc']:.4f}  Brier {quality['brier_score']:.4f}  "
+                f"ECE {quality['expected_calibration_error']:.4f}  "
+                f"p50 {single['p50_ms']:.3f}ms  p99 {single['p99_ms']:.3f}ms",
+                file=sys.stderr,
+            )
+    else:
+        print(payload)
+
+
+if __name__ == '__main__':
+    main()
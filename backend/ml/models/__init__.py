@@ -8,11 +8,29 @@ from .predictor import (
     get_predictor,
     model_available
 )
+from .calibration_maps import (
+    CalibrationMaps,
+    fit_calibration_maps
+)
+from .batching import (
+    InferenceScheduler,
+    get_inference_scheduler
+)
+from .portfolio import (
+    PortfolioResult,
+    simulate_portfolio
+)
 
 __all__ = [
     'AdmissionPredictor',
     'PredictionResult',
     'get_predictor',
     'model_available',
+    'CalibrationMaps',
+    'fit_calibration_maps',
+    'InferenceScheduler',
+    'get_inference_scheduler',
+    'PortfolioResult',
+    'simulate_portfolio',
 ]
 
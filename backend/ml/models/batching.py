@@ -0,0 +1,288 @@
+"""
+Dynamic micro-batching scheduler in front of AdmissionPredictor.
+
+Concurrent requests are queued and gathered for up to ``max_wait_ms`` or
+``max_batch_size`` rows, then scored with a single ``predict_many`` call in a
+worker thread so the selector/scaler/``predict_proba`` run once per batch.
+MISC uplifts (which may call OpenAI) are resolved before a request is
+queued, so the inference thread only ever does model work.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from ml.preprocessing.feature_extractor import StudentFeatures, CollegeFeatures
+from .predictor import AdmissionPredictor, PredictionResult, get_predictor, misc_uplift
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingPrediction:
+    """A queued prediction awaiting its batch."""
+
+    student: StudentFeatures
+    college: CollegeFeatures
+    model_name: str
+    use_formula: bool
+    misc_uplift: float
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def group_key(self) -> Tuple[str, bool]:
+        """Requests sharing this key can be scored in one predict_many call."""
+        return (self.model_name, self.use_formula)
+
+
+def _bucket(value: int) -> str:
+    """Power-of-two histogram bucket label for a size/depth value."""
+    if value <= 1:
+        return "1"
+    upper = 1 << (value - 1).bit_length()
+    return f"{upper // 2 + 1}-{upper}"
+
+
+class InferenceScheduler:
+    """
+    Gathers concurrent predictions into micro-batches.
+
+    The collector coroutine waits for the first request, keeps draining the
+    queue until the batch is full or the wait window closes, then hands the
+    batch to a single worker thread. While a batch is being scored new
+    requests keep queueing, so batch size grows naturally with load.
+    """
+
+    def __init__(
+        self,
+        predictor_factory: Callable[[], AdmissionPredictor] = get_predictor,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+    ):
+        """
+        Args:
+            predictor_factory: Returns the predictor used for each batch
+            max_batch_size: Maximum rows scored in one model invocation
+            max_wait_ms: Longest time the first request in a batch waits for company
+        """
+        self.predictor_factory = predictor_factory
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+        self._queue: Optional[asyncio.Queue] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Stats
+        self._batch_sizes: Counter = Counter()
+        self._queue_depths: Counter = Counter()
+        self._requests = 0
+        self._batches = 0
+        self._max_queue_depth = 0
+        self._total_wait = 0.0
+        self._total_inference = 0.0
+
+    async def predict(
+        self,
+        student: StudentFeatures,
+        college: CollegeFeatures,
+        model_name: str = 'ensemble',
+        use_formula: bool = True,
+        misc_items: Optional[List[str]] = None,
+        use_openai_misc: bool = False,
+    ) -> PredictionResult:
+        """Queue one prediction and await its result (same signature as AdmissionPredictor.predict)."""
+        uplift = 0.0
+        if misc_items:
+            # May call OpenAI: resolved on a worker thread, never on the shared inference thread
+            uplift = await asyncio.to_thread(misc_uplift, misc_items, college, use_openai_misc)
+        queue = self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put(_PendingPrediction(
+            student=student,
+            college=college,
+            model_name=model_name,
+            use_formula=use_formula,
+            misc_uplift=uplift,
+            future=future,
+        ))
+        self._max_queue_depth = max(self._max_queue_depth, queue.qsize())
+        return await future
+
+    async def predict_many(
+        self,
+        pairs: List[Tuple[StudentFeatures, CollegeFeatures]],
+        model_name: str = 'ensemble',
+        use_formula: bool = True,
+    ) -> List[PredictionResult]:
+        """
+        Score an already-batched request (e.g. one student x many colleges) with
+        one predict_many call on the inference thread, bypassing the queue.
+        """
+        if not pairs:
+            return []
+        started = time.perf_counter()
+        predictor = self.predictor_factory()
+        results = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            lambda: predictor.predict_many(pairs, model_name=model_name, use_formula=use_formula),
+        )
+        self._batches += 1
+        self._requests += len(pairs)
+        self._batch_sizes[_bucket(len(pairs))] += 1
+        self._total_inference += time.perf_counter() - started
+        return results
+
+    def _ensure_running(self) -> asyncio.Queue:
+        """Start (or restart on a new event loop) the collector task."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._collector is None or self._collector.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._collector = loop.create_task(self._collect())
+        return self._queue
+
+    async def _collect(self):
+        """Collector loop: gather a batch, score it, scatter results."""
+        queue = self._queue
+        while True:
+            first = await queue.get()
+            batch = [first]
+            deadline = time.perf_counter() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    # Still take whatever is already waiting without blocking
+                    while len(batch) < self.max_batch_size and not queue.empty():
+                        batch.append(queue.get_nowait())
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            self._queue_depths[_bucket(queue.qsize() + len(batch))] += 1
+            try:
+                await self._run_batch(batch)
+            except Exception as e:  # pragma: no cover - defensive, futures already failed
+                logger.error(f"Inference batch failed: {e}")
+
+    async def _run_batch(self, batch: List[_PendingPrediction]):
+        """Score a gathered batch in the worker thread and resolve its futures."""
+        started = time.perf_counter()
+        self._batches += 1
+        self._requests += len(batch)
+        self._batch_sizes[_bucket(len(batch))] += 1
+        self._total_wait += sum(started - item.enqueued_at for item in batch)
+
+        groups: Dict[Tuple[str, bool], List[_PendingPrediction]] = {}
+        for item in batch:
+            groups.setdefault(item.group_key, []).append(item)
+
+        loop = asyncio.get_running_loop()
+        for (model_name, use_formula), items in groups.items():
+            try:
+                results = await loop.run_in_executor(
+                    self._executor,
+                    self._predict_group,
+                    items,
+                    model_name,
+                    use_formula,
+                )
+            except Exception as e:
+                results = [e] * len(items)
+            for item, result in zip(items, results):
+                if item.future.done():
+                    continue
+                if isinstance(result, Exception):
+                    item.future.set_exception(result)
+                else:
+                    item.future.set_result(result)
+
+        self._total_inference += time.perf_counter() - started
+
+    def _predict_group(
+        self,
+        items: List[_PendingPrediction],
+        model_name: str,
+        use_formula: bool,
+    ) -> List[Union[PredictionResult, Exception]]:
+        """
+        Worker-thread body: one predict_many call for a homogeneous group.
+
+        If the batched call raises, the rows are re-scored one at a time so a
+        bad row fails only its own request (its slot holds the exception).
+        """
+        predictor = self.predictor_factory()
+        try:
+            return predictor.predict_many(
+                [(item.student, item.college) for item in items],
+                model_name=model_name,
+                use_formula=use_formula,
+                misc_uplifts=[item.misc_uplift for item in items],
+            )
+        except Exception as e:
+            if len(items) == 1:
+                return [e]
+            logger.warning(f"Batched inference failed ({e}); scoring {len(items)} rows individually")
+
+        results: List[Union[PredictionResult, Exception]] = []
+        for item in items:
+            try:
+                results.extend(predictor.predict_many(
+                    [(item.student, item.college)],
+                    model_name=model_name,
+                    use_formula=use_formula,
+                    misc_uplifts=[item.misc_uplift],
+                ))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def stats(self) -> Dict:
+        """Queue depth and batch-size histograms plus throughput counters."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self._max_queue_depth,
+            "requests": self._requests,
+            "batches": self._batches,
+            "avg_batch_size": (self._requests / self._batches) if self._batches else 0.0,
+            "avg_queue_wait_ms": (self._total_wait / self._requests * 1000.0) if self._requests else 0.0,
+            "avg_batch_inference_ms": (self._total_inference / self._batches * 1000.0) if self._batches else 0.0,
+            "batch_size_histogram": dict(sorted(self._batch_sizes.items(), key=lambda kv: int(kv[0].split('-')[-1]))),
+            "queue_depth_histogram": dict(sorted(self._queue_depths.items(), key=lambda kv: int(kv[0].split('-')[-1]))),
+        }
+
+
+# Global scheduler instance (lazy loaded)
+_scheduler: Optional[InferenceScheduler] = None
+
+
+def get_inference_scheduler() -> InferenceScheduler:
+    """
+    Get global inference scheduler (singleton pattern).
+
+    Batch limits come from settings (INFERENCE_MAX_BATCH_SIZE / INFERENCE_MAX_WAIT_MS).
+    """
+    global _scheduler
+    if _scheduler is None:
+        try:
+            from config import settings
+            max_batch_size = settings.inference_max_batch_size
+            max_wait_ms = settings.inference_max_wait_ms
+        except Exception:
+            max_batch_size, max_wait_ms = 32, 2.0
+        _scheduler = InferenceScheduler(
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
+    return _scheduler
@@ -0,0 +1,588 @@
+"""
+Learned per-college calibration maps.
+
+Replaces the hand-tuned chain (elite factor / max-probability cap, then the
+70/30 blend with the acceptance rate and its clamps) with monotone
+piecewise-linear maps fitted to outcome data: one per college with enough
+outcomes, one per selectivity band as the fallback, and a global map for
+everything else.
+
+Every map shares one knot grid over the blended ML+formula probability, so
+the maps are a single ``(n_maps, GRID_SIZE)`` float32 matrix and applying
+them to a batch is one gather plus a linear interpolation. College maps are
+keyed by catalog unitid (``data.college_identity``), so "MIT" outcomes and a
+"Massachusetts Institute of Technology" request share one map. Knots with
+too few outcomes behind them hold the value of the nearest supported knot
+instead of the prior's, so a map never jumps where there is no data.
+
+Outcome samples (Reddit self-reports, synthetic applicants) admit far more
+often than the colleges do, so a map only stores shape: its values are
+log-odds relative to the admit rate of the sample it was fitted on. At
+inference the college's real acceptance rate supplies the intercept:
+
+    p = sigmoid(map(blended) + logit(acceptance_rate))
+
+Fit (from `backend/`, with the model artifacts unpacked):
+
+    python -m ml.models.calibration_maps --model-dir data/models
+"""
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_MAPS_PATH = BACKEND_DIR / 'data' / 'models' / 'calibration_maps.npz'
+DEFAULT_SYNTHETIC_PATH = BACKEND_DIR / 'data' / 'processed' / 'training_data_large.csv'
+DEFAULT_REDDIT_PATH = BACKEND_DIR / 'data' / 'processed' / 'reddit_training_data.csv'
+DEFAULT_CATALOG_PATH = BACKEND_DIR / 'data' / 'processed' / 'college_catalog.npz'
+
+MAPS_VERSION = 2
+GRID_SIZE = 21  # knots at 0.00, 0.05, ..., 1.00
+
+# A college gets its own map from this many outcomes; fewer fall back to its band
+MIN_COLLEGE_OUTCOMES = 40
+# Pseudo-outcomes per knot pulling a map toward its parent (college -> band -> global)
+PRIOR_STRENGTH = 8.0
+# Knots with less (kernel-weighted) outcome data than this take the nearest supported knot's value
+MIN_KNOT_SUPPORT = 5.0
+# Output probabilities are kept in the range the API has always returned
+PROBABILITY_FLOOR = 0.02
+PROBABILITY_CEILING = 0.98
+
+BANDS = ('Elite', 'Highly Selective', 'Moderately Selective', 'Less Selective')
+# Tier labels used by the different data sources -> band
+_BAND_ALIASES = {
+    'elite': 'Elite',
+    'highly selective': 'Highly Selective',
+    'moderately selective': 'Moderately Selective',
+    'selective': 'Moderately Selective',
+    'less selective': 'Less Selective',
+}
+
+_GLOBAL_KEY = '__global__'
+
+
+def college_unitids(names: Iterable[str]) -> List[Optional[int]]:
+    """Catalog unitid per college name (None where the shared identity has no match)."""
+    from data.college_identity import get_college_identity
+
+    identity = get_college_identity()
+    return [identity.resolve(name) if name else None for name in names]
+
+
+def selectivity_band(tier: Optional[str]) -> Optional[str]:
+    return _BAND_ALIASES.get((tier or '').strip().lower())
+
+
+def _logit(p: np.ndarray) -> np.ndarray:
+    p = np.clip(p, 1e-4, 1 - 1e-4)
+    return np.log(p / (1 - p))
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def _hold_unsupported(values: np.ndarray, support: np.ndarray, min_support: float) -> np.ndarray:
+    """
+    Replace knots with less than ``min_support`` outcomes by the values of the
+    supported knots around them: flat past the last supported knot at either
+    end, linear across interior gaps (a monotone row stays monotone).
+    """
+    grid = np.arange(values.shape[1])
+    held = values.copy()
+    for i, (row, row_support) in enumerate(zip(values, support)):
+        supported = row_support >= min_support
+        if supported.any() and not supported.all():
+            held[i] = np.interp(grid, grid[supported], row[supported])
+    return held
+
+
+def _isotonic(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Weighted pool-adjacent-violators fit of a non-decreasing sequence (one short row)."""
+    blocks: List[List[float]] = []  # [mean, weight, length]
+    for value, weight in zip(values.tolist(), weights.tolist()):
+        blocks.append([value, weight, 1])
+        while len(blocks) > 1 and blocks[-2][0] > blocks[-1][0]:
+            mean, weight, length = blocks.pop()
+            previous = blocks[-1]
+            total = previous[1] + weight
+            previous[0] = (previous[0] * previous[1] + mean * weight) / total if total else mean
+            previous[1] = total
+            previous[2] += length
+    return np.repeat([block[0] for block in blocks], [block[2] for block in blocks])
+
+
+class CalibrationMaps:
+    """
+    Stored maps: ``values[i]`` holds map i's log-odds shift at every grid knot.
+
+    Rows are addressed by college unitid, then band, then the global row.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        keys: Sequence[str],
+        sample_sizes: Optional[np.ndarray] = None,
+        signature: str = "",
+    ):
+        self.values = np.asarray(values, dtype=np.float32)
+        self.keys = [str(key) for key in keys]
+        self.sample_sizes = np.asarray(sample_sizes if sample_sizes is not None else np.zeros(len(self.keys)))
+        self.signature = signature
+        self.grid_size = self.values.shape[1]
+        self._row_by_key: Dict[str, int] = {key: i for i, key in enumerate(self.keys)}
+        self._global_row = self._row_by_key[_GLOBAL_KEY]
+        self._band_rows = {band: self._row_by_key.get(f'band:{band}', self._global_row) for band in BANDS}
+        # Resolved name -> row, so repeat colleges skip identity resolution
+        self._row_by_name: Dict[Tuple[str, Optional[str]], int] = {}
+
+    @property
+    def college_count(self) -> int:
+        return sum(1 for key in self.keys if key.startswith('college:'))
+
+    # ----------------------------------------------------------------- apply
+
+    def rows_for(self, unitids: Iterable[Optional[int]], tiers: Iterable[Optional[str]]) -> np.ndarray:
+        """Map row per college: its own (by unitid), else its selectivity band's, else global."""
+        rows = []
+        for unitid, tier in zip(unitids, tiers):
+            row = self._row_by_key.get(f'college:{unitid}') if unitid is not None else None
+            if row is None:
+                row = self._band_rows.get(selectivity_band(tier), self._global_row)
+            rows.append(row)
+        return np.asarray(rows, dtype=np.intp)
+
+    def rows_for_names(self, names: Sequence[str], tiers: Sequence[Optional[str]]) -> np.ndarray:
+        """``rows_for`` by college name, resolved through the shared college identity."""
+        rows = [self._row_by_name.get((name, tier)) for name, tier in zip(names, tiers)]
+        missing = [i for i, row in enumerate(rows) if row is None]
+        if missing:
+            resolved = self.rows_for(
+                college_unitids([names[i] for i in missing]), [tiers[i] for i in missing]
+            )
+            for i, row in zip(missing, resolved.tolist()):
+                rows[i] = row
+                if len(self._row_by_name) < 65536:
+                    self._row_by_name[(names[i], tiers[i])] = row
+        return np.asarray(rows, dtype=np.intp)
+
+    def shift(self, probabilities: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Interpolated log-odds shift of each probability on its row's map."""
+        position = np.clip(np.asarray(probabilities, dtype=np.float64), 0.0, 1.0) * (self.grid_size - 1)
+        left = np.minimum(position.astype(np.intp), self.grid_size - 2)
+        fraction = position - left
+        values = self.values
+        return values[rows, left] * (1.0 - fraction) + values[rows, left + 1] * fraction
+
+    def apply(self, probabilities: np.ndarray, rows: np.ndarray, acceptance_rates: np.ndarray) -> np.ndarray:
+        """Calibrated probabilities for a batch (one vectorized pass)."""
+        rates = np.clip(np.asarray(acceptance_rates, dtype=np.float64), 0.01, 0.99)
+        calibrated = _sigmoid(self.shift(probabilities, rows) + _logit(rates))
+        return np.clip(calibrated, PROBABILITY_FLOOR, PROBABILITY_CEILING)
+
+    def calibrate(self, probabilities: np.ndarray, colleges: Sequence) -> np.ndarray:
+        """``apply`` for CollegeFeatures (name, selectivity_tier, acceptance_rate)."""
+        rows = self.rows_for_names(
+            [college.name for college in colleges],
+            [getattr(college, 'selectivity_tier', None) for college in colleges],
+        )
+        rates = [
+            college.acceptance_rate if college.acceptance_rate is not None else 0.5
+            for college in colleges
+        ]
+        return self.apply(probabilities, rows, np.asarray(rates, dtype=np.float64))
+
+    # --------------------------------------------------------------- storage
+
+    def save(self, path: Path = DEFAULT_MAPS_PATH) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            version=np.array([MAPS_VERSION], dtype=np.int32),
+            values=self.values,
+            keys=np.asarray(self.keys, dtype=str),
+            sample_sizes=self.sample_sizes.astype(np.int32),
+            signature=np.array(self.signature),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MAPS_PATH) -> "CalibrationMaps":
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version'][0]) != MAPS_VERSION:
+                raise ValueError(f"Calibration maps {path} have an unsupported version")
+            return cls(data['values'], data['keys'].tolist(), data['sample_sizes'], str(data['signature']))
+
+
+def load_calibration_maps(model_dir: Path) -> Optional[CalibrationMaps]:
+    """Maps stored next to the model artifacts, or None when there are none."""
+    path = Path(model_dir) / DEFAULT_MAPS_PATH.name
+    if not path.exists():
+        return None
+    try:
+        maps = CalibrationMaps.load(path)
+        logger.info(f"Loaded {len(maps.keys)} calibration maps ({maps.college_count} colleges) from {path}")
+        return maps
+    except Exception as e:
+        logger.warning(f"Could not load calibration maps {path}: {e}")
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Fitting
+# ---------------------------------------------------------------------------
+
+def _knot_sums(scores: np.ndarray, outcomes: np.ndarray, groups: np.ndarray, n_groups: int, grid_size: int):
+    """
+    Per (group, knot) outcome counts and admits, every row split between its
+    two neighbouring knots by linear weight (two bincounts for all groups).
+    """
+    position = np.clip(scores, 0.0, 1.0) * (grid_size - 1)
+    left = np.minimum(position.astype(np.intp), grid_size - 2)
+    fraction = position - left
+    cells = np.concatenate([groups * grid_size + left, groups * grid_size + left + 1])
+    weights = np.concatenate([1.0 - fraction, fraction])
+    size = n_groups * grid_size
+    counts = np.bincount(cells, weights=weights, minlength=size).reshape(n_groups, grid_size)
+    admits = np.bincount(cells, weights=weights * np.concatenate([outcomes, outcomes]), minlength=size)
+    return counts, admits.reshape(n_groups, grid_size)
+
+
+def _fit_level(
+    counts: np.ndarray,
+    admits: np.ndarray,
+    prior_curves: np.ndarray,
+    prior_rates: np.ndarray,
+    prior_strength: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Shrink each group's knot admit rates toward its parent's curve, then
+    force them monotone. Returns (curves, sample admit rates).
+    """
+    curves = (admits + prior_strength * prior_curves) / (counts + prior_strength)
+    weights = counts + prior_strength
+    curves = np.vstack([_isotonic(curve, weight) for curve, weight in zip(curves, weights)]) if len(curves) else curves
+    rates = (admits.sum(axis=1) + prior_strength * prior_rates) / (counts.sum(axis=1) + prior_strength)
+    return curves, rates
+
+
+def fit_calibration_maps(
+    scores: np.ndarray,
+    outcomes: np.ndarray,
+    unitids: Sequence[Optional[int]],
+    tiers: Sequence[Optional[str]],
+    grid_size: int = GRID_SIZE,
+    min_college_outcomes: int = MIN_COLLEGE_OUTCOMES,
+    prior_strength: float = PRIOR_STRENGTH,
+    min_knot_support: float = MIN_KNOT_SUPPORT,
+) -> CalibrationMaps:
+    """
+    Fit global, band and college maps from blended probabilities and outcomes.
+
+    Args:
+        scores: Blended ML+formula probability per outcome (before calibration)
+        outcomes: 1 admitted / 0 rejected
+        unitids: Catalog unitid per outcome (None: band / global maps only)
+        tiers: Selectivity tier per outcome (any source's labels)
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    outcomes = np.asarray(outcomes, dtype=np.float64)
+    grid = np.linspace(0.0, 1.0, grid_size)
+
+    # Global: shrunk toward the identity map
+    counts, admits = _knot_sums(scores, outcomes, np.zeros(len(scores), dtype=np.intp), 1, grid_size)
+    global_curve, global_rate = _fit_level(
+        counts, admits, grid[None, :], np.array([outcomes.mean() if len(outcomes) else 0.5]), prior_strength
+    )
+    global_support = counts
+
+    # Bands: shrunk toward the global map
+    band_labels = np.asarray([selectivity_band(tier) or '' for tier in tiers])
+    band_index = {band: i for i, band in enumerate(BANDS)}
+    band_ids = np.asarray([band_index.get(label, -1) for label in band_labels], dtype=np.intp)
+    in_band = band_ids >= 0
+    counts, admits = _knot_sums(scores[in_band], outcomes[in_band], band_ids[in_band], len(BANDS), grid_size)
+    band_curves, band_rates = _fit_level(
+        counts, admits, np.repeat(global_curve, len(BANDS), axis=0), np.repeat(global_rate, len(BANDS)), prior_strength
+    )
+    band_present = counts.sum(axis=1) > 0
+    band_support = counts
+
+    # Colleges with enough outcomes: shrunk toward their band's map
+    keys = np.asarray([-1 if unitid is None else int(unitid) for unitid in unitids], dtype=np.int64)
+    unique_keys, college_ids, college_sizes = np.unique(keys, return_inverse=True, return_counts=True)
+    eligible = (college_sizes >= min_college_outcomes) & (unique_keys >= 0)
+    counts, admits = _knot_sums(scores, outcomes, college_ids, len(unique_keys), grid_size)
+    # A college's parent is the band most of its outcomes carry
+    parent = np.full(len(unique_keys), -1, dtype=np.intp)
+    if in_band.any():
+        votes = np.zeros((len(unique_keys), len(BANDS)))
+        np.add.at(votes, (college_ids[in_band], band_ids[in_band]), 1)
+        parent = np.where(votes.sum(axis=1) > 0, votes.argmax(axis=1), -1)
+    parent_curves = np.where((parent >= 0)[:, None], band_curves[np.maximum(parent, 0)], global_curve)
+    parent_rates = np.where(parent >= 0, band_rates[np.maximum(parent, 0)], global_rate[0])
+    college_curves, college_rates = _fit_level(
+        counts[eligible], admits[eligible], parent_curves[eligible], parent_rates[eligible], prior_strength
+    )
+
+    # Stored as log-odds relative to each sample's own admit rate
+    map_keys = [_GLOBAL_KEY]
+    values = [_logit(global_curve[0]) - _logit(global_rate[0])]
+    support = [global_support[0]]
+    sizes = [len(scores)]
+    for i, band in enumerate(BANDS):
+        if band_present[i]:
+            map_keys.append(f'band:{band}')
+            values.append(_logit(band_curves[i]) - _logit(band_rates[i]))
+            support.append(band_support[i])
+            sizes.append(int((band_ids == i).sum()))
+    college_support = counts[eligible]
+    for key, curve, rate, row_support, size in zip(
+        unique_keys[eligible], college_curves, college_rates, college_support, college_sizes[eligible]
+    ):
+        map_keys.append(f'college:{key}')
+        values.append(_logit(curve) - _logit(rate))
+        support.append(row_support)
+        sizes.append(int(size))
+
+    held = _hold_unsupported(np.vstack(values), np.vstack(support), min_knot_support)
+    return CalibrationMaps(held, map_keys, np.asarray(sizes))
+
+
+# ---------------------------------------------------------------------------
+# Outcome data
+# ---------------------------------------------------------------------------
+
+def _catalog_rates() -> Dict[int, Tuple[float, str]]:
+    """unitid -> (acceptance rate, tier) from the built catalog (data.catalog_etl)."""
+    if not DEFAULT_CATALOG_PATH.exists():
+        return {}
+    from data.catalog_etl import read_columnar
+
+    catalog = read_columnar(DEFAULT_CATALOG_PATH)
+    return dict(zip(
+        catalog['unitid'].astype(int).tolist(),
+        zip(catalog['acceptance_rate'].tolist(), catalog['selectivity_tier'].astype(str).tolist()),
+    ))
+
+
+def _reddit_features(df):
+    """FeatureExtractor columns for Reddit outcome rows (same defaults as train_with_reddit_outcomes)."""
+    import pandas as pd
+
+    gpa = df['gpa_unweighted'].fillna(3.5)
+    sat = df['sat_total']
+    features = pd.DataFrame(index=df.index)
+    features['grades_score'] = np.select([gpa >= 3.9, gpa >= 3.7, gpa >= 3.5, gpa >= 3.3], [9.5, 8.5, 7.5, 6.5], 5.5)
+    ap = df['ap_count'].fillna(0)
+    features['rigor_score'] = np.select([ap >= 12, ap >= 8, ap >= 5], [9.5, 8.5, 7.5], 6.0)
+    sat_filled = sat.fillna(1200)
+    features['testing_score'] = np.select(
+        [sat_filled >= 1550, sat_filled >= 1500, sat_filled >= 1450, sat_filled >= 1400, sat_filled >= 1300],
+        [10.0, 9.5, 8.5, 7.5, 6.5], 5.5,
+    )
+    features['essay_score'] = 7.0
+    leadership = df['leadership_mentions'].fillna(0)
+    features['ecs_leadership_score'] = np.select([leadership >= 3, leadership >= 2, leadership >= 1], [9.0, 8.0, 7.0], 5.5)
+    first_gen = df['first_generation'].fillna(False).astype(bool)
+    athlete = df['sports_participant'].fillna(False).astype(bool)
+    features = features.assign(
+        recommendations_score=7.0, plan_timing_score=6.0, athletic_recruit_score=3.0, major_fit_score=6.5,
+        geography_residency_score=5.5, firstgen_diversity_score=np.where(first_gen, 8.0, 5.0),
+        ability_to_pay_score=5.5, awards_publications_score=6.0, portfolio_audition_score=5.0,
+        policy_knob_score=5.0, demonstrated_interest_score=6.0, legacy_score=3.0, interview_score=6.5,
+        conduct_record_score=9.5, hs_reputation_score=6.0,
+    )
+    sat_median = (df['college_sat_25'].fillna(1300) + df['college_sat_75'].fillna(1500)) / 2
+    act_median = (df['college_act_25'].fillna(28) + df['college_act_75'].fillna(33)) / 2
+    ec_count = df['clubs_count'].fillna(0) + athlete.astype(int)
+    features = features.assign(
+        gpa_unweighted=df['gpa_unweighted'],
+        gpa_weighted=df['gpa_weighted'].fillna(df['gpa_unweighted'] + 0.3),
+        sat_total=sat,
+        sat_math=df['sat_math'].fillna(sat * 0.5),
+        sat_rw=df['sat_reading'].fillna(sat * 0.5),
+        act_composite=df['act_composite'].fillna(25),
+        ap_count=df['ap_count'],
+        honors_count=0,
+        class_rank_pct=df['class_rank_percentile'].fillna(20.0),
+        class_size=400,
+        ec_count=ec_count,
+        leadership_count=leadership,
+        years_commitment=ec_count * 2,
+        hours_per_week=10.0,
+        awards_count=0,
+        national_awards=0,
+        first_gen=first_gen.astype(int),
+        urm=0,
+        geographic_diversity=5.0,
+        legacy=0,
+        recruited_athlete=athlete.astype(int),
+        sat_median=sat_median,
+        act_median=act_median,
+        test_policy_numeric=1.0,
+        need_policy_numeric=1.0,
+        gpa_vs_avg=0.0,
+        sat_vs_median=(sat.fillna(1300) - sat_median) / 100,
+        act_vs_median=(df['act_composite'].fillna(25) - act_median) / 5,
+        gpa_above_college=1.0,
+        sat_above_75th=(sat > df['college_sat_75']).astype(float),
+        act_above_75th=(df['act_composite'] > df['college_act_75']).astype(float),
+        composite_vs_acceptance=sat.fillna(1300) * df['college_acceptance_rate'],
+        selectivity_match=1.0,
+        test_advantage=1.0,
+        geographic_match=0.5,
+        legacy_boost=0.0,
+        first_gen_boost=first_gen.astype(int),
+        athlete_boost=athlete.astype(int),
+        academic_strength=gpa / 4.0,
+        holistic_strength=0.5,
+    )
+    return features
+
+
+def load_outcomes(synthetic_path: Path = DEFAULT_SYNTHETIC_PATH, reddit_path: Path = DEFAULT_REDDIT_PATH):
+    """
+    Outcome rows from the synthetic and Reddit training sets.
+
+    Returns:
+        DataFrame with the FeatureExtractor columns plus college_name, unitid
+        (None where the college identity has no match), selectivity_tier,
+        acceptance_rate, outcome and source
+    """
+    import pandas as pd
+
+    from ml.preprocessing.feature_extractor import FeatureExtractor
+
+    feature_names = FeatureExtractor.get_feature_names()
+    catalog = _catalog_rates()
+    frames = []
+    if Path(synthetic_path).exists():
+        synthetic = pd.read_csv(synthetic_path)
+        frame = synthetic[feature_names].copy()
+        frame['college_name'] = synthetic['college_name']
+        frame['unitid'] = college_unitids(synthetic['college_name'].astype(str))
+        frame['selectivity_tier'] = synthetic['selectivity_tier']
+        frame['acceptance_rate'] = synthetic['acceptance_rate']
+        frame['outcome'] = synthetic['outcome']
+        frame['source'] = 'synthetic'
+        frames.append(frame)
+    if Path(reddit_path).exists():
+        reddit = pd.read_csv(reddit_path)
+        frame = _reddit_features(reddit)[feature_names]
+        # Reddit rows carry a unitid-joined rate that is often wrong; prefer the catalog's
+        unitids = college_unitids(reddit['college_name'].fillna('').astype(str))
+        known = [catalog.get(unitid) for unitid in unitids]
+        frame['college_name'] = reddit['college_name']
+        frame['unitid'] = unitids
+        frame['selectivity_tier'] = [entry[1] if entry else tier for entry, tier in zip(known, reddit['college_tier'])]
+        frame['acceptance_rate'] = [entry[0] if entry else rate for entry, rate in zip(known, reddit['college_acceptance_rate'])]
+        frame['outcome'] = reddit['outcome']
+        frame['source'] = 'reddit'
+        frames.append(frame)
+    if not frames:
+        raise FileNotFoundError("No outcome data found")
+    outcomes = pd.concat(frames, ignore_index=True)
+    # Same imputation the training scripts use for missing raw metrics
+    outcomes[feature_names] = outcomes[feature_names].astype(float).fillna(outcomes[feature_names].median())
+    return outcomes
+
+
+def blended_scores(predictor, outcomes, model_name: str = 'ensemble') -> np.ndarray:
+    """The predictor's pre-calibration (blended ML + formula) probability per outcome row."""
+    from core import calculate_admission_probabilities
+    from core.pipeline import FACTOR_ORDER
+    from ml.preprocessing.feature_extractor import FeatureExtractor
+    from .predictor import blend_probabilities
+
+    formula = calculate_admission_probabilities(
+        outcomes[[f'{factor}_score' for factor in FACTOR_ORDER]].to_numpy(dtype=float),
+        acceptance_rate=outcomes['acceptance_rate'].to_numpy(dtype=float),
+    )
+    formula = np.clip(formula, 0.01, 0.98)
+    if not predictor.is_available():
+        return formula
+    model = predictor.models.get(model_name) or next(iter(predictor.models.values()))
+    features = outcomes[FeatureExtractor.get_feature_names()].to_numpy(dtype=float)
+    ml = predictor._predict_ml_probabilities(features, model, model_name)
+    return blend_probabilities(ml, formula)[0]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model-dir', type=Path, default=BACKEND_DIR / 'data' / 'models')
+    parser.add_argument('--output', type=Path, help=f"defaults to <model-dir>/{DEFAULT_MAPS_PATH.name}")
+    parser.add_argument('--min-college-outcomes', type=int, default=MIN_COLLEGE_OUTCOMES)
+    parser.add_argument('--holdout', type=float, default=0.2, help="share of outcomes held out for the report")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    from sklearn.metrics import brier_score_loss, roc_auc_score
+
+    from .predictor import AdmissionPredictor
+
+    predictor = AdmissionPredictor(str(args.model_dir))
+    outcomes = load_outcomes()
+    scores = blended_scores(predictor, outcomes)
+    y = outcomes['outcome'].to_numpy(dtype=int)
+    unitids = [None if unitid is None or unitid != unitid else int(unitid) for unitid in outcomes['unitid']]
+    tiers = outcomes['selectivity_tier'].astype(str).tolist()
+
+    rng = np.random.default_rng(42)
+    held_out = rng.random(len(y)) < args.holdout
+    train = ~held_out
+    maps = fit_calibration_maps(
+        scores[train], y[train],
+        [u for u, keep in zip(unitids, train) if keep], [t for t, keep in zip(tiers, train) if keep],
+        min_college_outcomes=args.min_college_outcomes,
+    )
+    # Judge the maps on held-out rows in the sample's own frame: the intercept
+    # is each college's admit rate in the training sample, not its real rate
+    keys = outcomes['unitid'].fillna(-1).astype(np.int64)
+    train_rates = outcomes.loc[train].groupby(keys[train])['outcome'].mean()
+    sample_rate = keys[held_out].map(train_rates).fillna(y[train].mean()).to_numpy()
+    rows = maps.rows_for([u for u, h in zip(unitids, held_out) if h], [t for t, h in zip(tiers, held_out) if h])
+    mapped = maps.apply(scores[held_out], rows, sample_rate)
+
+    started = time.perf_counter()
+    maps = fit_calibration_maps(scores, y, unitids, tiers, min_college_outcomes=args.min_college_outcomes)
+    fit_seconds = time.perf_counter() - started
+
+    batch = np.random.default_rng(0).random(1_000_000)
+    batch_rows = np.random.default_rng(1).integers(0, len(maps.keys), len(batch))
+    started = time.perf_counter()
+    maps.apply(batch, batch_rows, np.full(len(batch), 0.2))
+    apply_ns = (time.perf_counter() - started) / len(batch) * 1e9
+
+    output = maps.save(args.output or Path(args.model_dir) / DEFAULT_MAPS_PATH.name)
+    report = {
+        'outcomes': int(len(y)),
+        'maps': {'colleges': maps.college_count, 'total': len(maps.keys)},
+        'fit_seconds': round(fit_seconds, 4),
+        'apply_ns_per_row': round(apply_ns, 1),
+        'holdout': {
+            'rows': int(held_out.sum()),
+            'brier_uncalibrated': round(float(brier_score_loss(y[held_out], scores[held_out])), 4),
+            'brier_mapped': round(float(brier_score_loss(y[held_out], mapped)), 4),
+            'roc_auc_uncalibrated': round(float(roc_auc_score(y[held_out], scores[held_out])), 4),
+            'roc_auc_mapped': round(float(roc_auc_score(y[held_out], mapped)), 4),
+        },
+    }
+    print(json.dumps(report, indent=2))
+    print(f"Wrote {len(maps.keys)} maps to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
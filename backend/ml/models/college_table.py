@@ -0,0 +1,359 @@
+"""
+Precomputed per-college features and calibration table.
+
+Resolves every catalog college (real_colleges_integrated.csv) once, by unitid
+and canonical name, to a frozen record holding its CollegeFeatures, display
+data and resolved elite calibration (factor / max-probability cap). The
+columns are persisted as a compact .npz so request handlers only do a keyed
+dict lookup.
+
+Build (or rebuild) the stored table with:
+
+    python -m ml.models.college_table
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ml.preprocessing.feature_extractor import CollegeFeatures
+from .predictor import load_elite_calibration, resolve_elite_calibration
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_CSV_PATH = BACKEND_DIR / 'data' / 'raw' / 'real_colleges_integrated.csv'
+DEFAULT_CALIBRATION_PATH = BACKEND_DIR / 'data' / 'models' / 'enhanced_calibration_factors.json'
+DEFAULT_TABLE_PATH = BACKEND_DIR / 'data' / 'models' / 'college_feature_table.npz'
+
+TABLE_VERSION = 1
+
+# Catalog has no SAT/ACT ranges; these match the defaults main.get_college_data always used
+DEFAULT_SAT_25TH = 1200
+DEFAULT_SAT_75TH = 1500
+DEFAULT_ACT_25TH = 25
+DEFAULT_ACT_75TH = 35
+
+# String columns stored as (codes, vocabulary) pairs
+_CATEGORICAL_COLUMNS = ('test_policy', 'financial_aid_policy', 'selectivity_tier', 'state')
+
+
+@dataclass(frozen=True)
+class CollegeTableRecord:
+    """One resolved catalog college. Treat ``features`` as read-only."""
+
+    unitid: int
+    name: str
+    features: CollegeFeatures
+    calibration_key: Optional[str]
+    calibration_factor: Optional[float]
+    max_probability: Optional[float]
+    city: str
+    state: str
+    tuition_in_state: int
+    tuition_out_of_state: int
+    student_body_size: int
+    is_public: bool
+    _college_data: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def to_college_data(self) -> Dict[str, Any]:
+        """Dict in the shape returned by main.get_college_data (fresh copy)."""
+        return dict(self._college_data)
+
+
+def _source_signature(*paths: Path) -> str:
+    """Cheap staleness signature (size + mtime) for the table's source files."""
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{Path(path).name}:{stat.st_size}:{stat.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{Path(path).name}:missing")
+    return "|".join(parts)
+
+
+def _encode_categorical(values: List[str]):
+    vocab, codes = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    return codes.astype(np.int16), vocab
+
+
+class CollegeFeatureTable:
+    """
+    Columnar table of catalog colleges with unitid and name indexes.
+
+    Columns are NumPy arrays (strings as fixed-width unicode or codes +
+    vocabulary); frozen records are materialized once at load time.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], signature: str = ""):
+        self.columns = columns
+        self.signature = signature
+        self.records: List[CollegeTableRecord] = self._materialize()
+
+        self._by_unitid: Dict[int, CollegeTableRecord] = {}
+        self._by_name: Dict[str, CollegeTableRecord] = {}
+        for record in self.records:
+            self._by_unitid.setdefault(record.unitid, record)
+            # First occurrence wins, matching the previous DataFrame exact-match behaviour
+            self._by_name.setdefault(record.name.lower(), record)
+        self._names_lower: List[str] = [record.name.lower() for record in self.records]
+
+    # ------------------------------------------------------------------ build
+
+    @classmethod
+    def build(
+        cls,
+        csv_path: Path = DEFAULT_CSV_PATH,
+        calibration_path: Path = DEFAULT_CALIBRATION_PATH,
+        elite_calibration: Optional[Dict[str, Dict]] = None,
+    ) -> "CollegeFeatureTable":
+        """Resolve every catalog row (including elite calibration matching) into columns."""
+        import pandas as pd
+
+        df = pd.read_csv(csv_path)
+        if elite_calibration is None:
+            elite_calibration = load_elite_calibration()
+        n = len(df)
+
+        def column(name: str, default, dtype=None):
+            if name not in df.columns:
+                return pd.Series([default] * n, index=df.index, dtype=dtype)
+            return df[name]
+
+        def text(name: str, default: str) -> List[str]:
+            series = column(name, default)
+            return [str(v) if pd.notna(v) else default for v in series]
+
+        def number(name: str, default: float) -> np.ndarray:
+            return pd.to_numeric(column(name, default), errors='coerce').fillna(default).to_numpy(dtype=np.float64)
+
+        names = text('name', '')
+        if 'acceptance_rate' in df.columns:
+            acceptance = pd.to_numeric(df['acceptance_rate'], errors='coerce')
+        else:
+            acceptance = pd.Series([np.nan] * n, index=df.index)
+        if 'acceptance_rate_percent' in df.columns:
+            acceptance = acceptance.fillna(pd.to_numeric(df['acceptance_rate_percent'], errors='coerce') / 100)
+        acceptance = acceptance.fillna(0.5).to_numpy(dtype=np.float64)
+
+        # The expensive two-way substring match runs here, once per catalog college
+        calibration_keys, factors, max_probs = [], [], []
+        elite_items = list(elite_calibration.items())
+        for name in names:
+            lowered = name.lower()
+            key, data = '', None
+            for elite_name, calibration_data in elite_items:
+                if elite_name in lowered or lowered in elite_name:
+                    key, data = elite_name, calibration_data
+                    break
+            calibration_keys.append(key)
+            factors.append(data['factor'] if data else np.nan)
+            max_probs.append(data['max_prob'] if data else np.nan)
+
+        columns: Dict[str, np.ndarray] = {
+            'version': np.array([TABLE_VERSION], dtype=np.int32),
+            'unitid': column('unitid', -1).fillna(-1).to_numpy(dtype=np.int64),
+            'name': np.asarray(names, dtype=str),
+            'city': np.asarray(text('city', 'Unknown'), dtype=str),
+            'acceptance_rate': acceptance,
+            'gpa_average': number('gpa_average', 3.7),
+            'tuition_in_state': number('tuition_in_state_usd', 20000).astype(np.int64),
+            'tuition_out_of_state': number('tuition_out_of_state_usd', 40000).astype(np.int64),
+            'student_body_size': number('student_body_size', 5000).astype(np.int64),
+            'is_public': np.asarray([c.lower() == 'public' for c in text('control', 'Private')], dtype=bool),
+            'calibration_key': np.asarray(calibration_keys, dtype=str),
+            'calibration_factor': np.asarray(factors, dtype=np.float64),
+            'max_probability': np.asarray(max_probs, dtype=np.float64),
+        }
+        categorical_defaults = {
+            'test_policy': 'Required',
+            'financial_aid_policy': 'Need-blind',
+            'selectivity_tier': 'Moderately Selective',
+            'state': 'Unknown',
+        }
+        for name in _CATEGORICAL_COLUMNS:
+            codes, vocab = _encode_categorical(text(name, categorical_defaults[name]))
+            columns[f'{name}_codes'] = codes
+            columns[f'{name}_vocab'] = vocab
+
+        return cls(columns, signature=_source_signature(csv_path, calibration_path))
+
+    # --------------------------------------------------------------- storage
+
+    def save(self, path: Path = DEFAULT_TABLE_PATH) -> Path:
+        """Persist columns as a compressed .npz (no pickled objects)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, signature=np.array(self.signature), **self.columns)
+        return path
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_TABLE_PATH) -> "CollegeFeatureTable":
+        with np.load(path, allow_pickle=False) as data:
+            columns = {key: data[key] for key in data.files if key != 'signature'}
+            signature = str(data['signature']) if 'signature' in data.files else ""
+        if int(columns.get('version', np.array([0]))[0]) != TABLE_VERSION:
+            raise ValueError(f"College feature table {path} has an unsupported version")
+        return cls(columns, signature=signature)
+
+    # ----------------------------------------------------------------- access
+
+    def _materialize(self) -> List[CollegeTableRecord]:
+        cols = self.columns
+        decoded = {name: cols[f'{name}_vocab'][cols[f'{name}_codes']] for name in _CATEGORICAL_COLUMNS}
+        records = []
+        for i in range(len(cols['unitid'])):
+            name = str(cols['name'][i])
+            factor = float(cols['calibration_factor'][i])
+            max_prob = float(cols['max_probability'][i])
+            calibration_key = str(cols['calibration_key'][i]) or None
+            features = CollegeFeatures(
+                name=name,
+                acceptance_rate=float(cols['acceptance_rate'][i]),
+                sat_25th=DEFAULT_SAT_25TH,
+                sat_75th=DEFAULT_SAT_75TH,
+                act_25th=DEFAULT_ACT_25TH,
+                act_75th=DEFAULT_ACT_75TH,
+                test_policy=str(decoded['test_policy'][i]),
+                financial_aid_policy=str(decoded['financial_aid_policy'][i]),
+                selectivity_tier=str(decoded['selectivity_tier'][i]),
+                gpa_average=float(cols['gpa_average'][i]),
+            )
+            college_data = {
+                'name': name,
+                'acceptance_rate': features.acceptance_rate,
+                'sat_25th': DEFAULT_SAT_25TH,
+                'sat_75th': DEFAULT_SAT_75TH,
+                'act_25th': DEFAULT_ACT_25TH,
+                'act_75th': DEFAULT_ACT_75TH,
+                'test_policy': features.test_policy,
+                'financial_aid_policy': features.financial_aid_policy,
+                'selectivity_tier': features.selectivity_tier,
+                'gpa_average': features.gpa_average,
+                'city': str(cols['city'][i]),
+                'state': str(decoded['state'][i]),
+                'tuition_in_state': int(cols['tuition_in_state'][i]),
+                'tuition_out_of_state': int(cols['tuition_out_of_state'][i]),
+                'student_body_size': int(cols['student_body_size'][i]),
+                'is_public': bool(cols['is_public'][i]),
+            }
+            records.append(CollegeTableRecord(
+                unitid=int(cols['unitid'][i]),
+                name=name,
+                features=features,
+                calibration_key=calibration_key,
+                calibration_factor=None if np.isnan(factor) else factor,
+                max_probability=None if np.isnan(max_prob) else max_prob,
+                city=college_data['city'],
+                state=college_data['state'],
+                tuition_in_state=college_data['tuition_in_state'],
+                tuition_out_of_state=college_data['tuition_out_of_state'],
+                student_body_size=college_data['student_body_size'],
+                is_public=college_data['is_public'],
+                _college_data=college_data,
+            ))
+        return records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def by_unitid(self, unitid: int) -> Optional[CollegeTableRecord]:
+        return self._by_unitid.get(unitid)
+
+    def by_name(self, name: str) -> Optional[CollegeTableRecord]:
+        """Case-insensitive exact name lookup."""
+        return self._by_name.get(name.lower())
+
+    def find_partial(self, name: str) -> Optional[CollegeTableRecord]:
+        """First catalog college whose name contains ``name`` (case-insensitive)."""
+        needle = name.lower()
+        for i, candidate in enumerate(self._names_lower):
+            if needle in candidate:
+                return self.records[i]
+        return None
+
+    def lookup(self, key: str) -> Optional[CollegeTableRecord]:
+        """
+        Resolve a request key: ``college_<unitid>`` ids, then exact name,
+        then a partial-name fallback.
+        """
+        if key.startswith('college_'):
+            try:
+                return self.by_unitid(int(key[len('college_'):]))
+            except ValueError:
+                return None
+        return self.by_name(key) or self.find_partial(key)
+
+    @staticmethod
+    def _record_calibration(record: CollegeTableRecord, elite_calibration: Dict[str, Dict]) -> Optional[Dict]:
+        """The key matched at build time, re-resolved if ``elite_calibration`` no longer contains it."""
+        if record.calibration_key is None:
+            return None
+        if record.calibration_key in elite_calibration:
+            return elite_calibration[record.calibration_key]
+        return resolve_elite_calibration(record.name.lower(), elite_calibration)
+
+    def calibration_by_name(self, elite_calibration: Dict[str, Dict]) -> Dict[str, Optional[Dict]]:
+        """Lower-cased catalog name -> calibration entry in ``elite_calibration``."""
+        resolved: Dict[str, Optional[Dict]] = {}
+        for record in self.records:
+            lowered = record.name.lower()
+            if lowered not in resolved:
+                resolved[lowered] = self._record_calibration(record, elite_calibration)
+        return resolved
+
+    def calibration_by_unitid(self, elite_calibration: Dict[str, Dict]) -> Dict[int, Optional[Dict]]:
+        """Catalog unitid -> calibration entry in ``elite_calibration``."""
+        resolved: Dict[int, Optional[Dict]] = {}
+        for record in self.records:
+            if record.unitid not in resolved:
+                resolved[record.unitid] = self._record_calibration(record, elite_calibration)
+        return resolved
+
+
+# Global table instance (lazy loaded)
+_table: Optional[CollegeFeatureTable] = None
+
+
+def get_college_table(
+    table_path: Path = DEFAULT_TABLE_PATH,
+    csv_path: Path = DEFAULT_CSV_PATH,
+    force_rebuild: bool = False,
+) -> CollegeFeatureTable:
+    """
+    Get global college feature table (singleton pattern).
+
+    Loads the stored table when its source signature is current, otherwise
+    builds it in memory from the catalog CSV.
+    """
+    global _table
+    if _table is None or force_rebuild:
+        table = None
+        signature = _source_signature(csv_path, DEFAULT_CALIBRATION_PATH)
+        if not force_rebuild and Path(table_path).exists():
+            try:
+                table = CollegeFeatureTable.load(table_path)
+                if table.signature != signature:
+                    logger.info("College feature table is stale; rebuilding in memory")
+                    table = None
+            except Exception as e:
+                logger.warning(f"Could not load college feature table {table_path}: {e}")
+                table = None
+        if table is None:
+            table = CollegeFeatureTable.build(csv_path)
+        _table = table
+        logger.info(f"College feature table ready: {len(table)} colleges")
+    return _table
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    built = CollegeFeatureTable.build()
+    out = built.save()
+    matched = sum(1 for record in built.records if record.calibration_key)
+    print(f"Wrote {len(built)} colleges ({matched} with elite calibration) to {out}")
@@ -0,0 +1,168 @@
+"""
+Per-prediction factor contributions from the ML model itself.
+
+Contributions come out of the same batched inference call as the
+probabilities:
+
+- XGBoost: native per-path tree contributions (``pred_contribs`` with
+  ``approx_contribs``; exact TreeSHAP costs ~25x more on the 700-tree model).
+  Their sum is the model's margin, so the probabilities are derived from
+  them and the trees are only walked once.
+- Linear models: coefficient x scaled value, one elementwise product next to
+  ``predict_proba``.
+- ``CalibratedClassifierCV`` / soft ``VotingClassifier``: the average over
+  the fitted folds / weighted members, when every one of them supports it.
+
+Feature contributions are in the model's log-odds and are folded onto the
+20 scoring factors with a (features x factors) share matrix, so a batch is
+one matrix product.
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.pipeline import FACTOR_ORDER
+
+logger = logging.getLogger(__name__)
+
+# Feature -> {factor: share} for features that aren't a factor score
+# themselves (``<factor>_score`` maps to its factor). Mixed features are split
+# by roughly how they are built in FeatureExtractor.extract_features.
+FEATURE_FACTOR_SHARES: Dict[str, Dict[str, float]] = {
+    # Raw academics
+    'gpa_unweighted': {'grades': 1.0},
+    'gpa_weighted': {'grades': 0.5, 'rigor': 0.5},
+    'sat_total': {'testing': 1.0},
+    'sat_math': {'testing': 1.0},
+    'sat_rw': {'testing': 1.0},
+    'act_composite': {'testing': 1.0},
+    'ap_count': {'rigor': 1.0},
+    'honors_count': {'rigor': 1.0},
+    'class_rank_pct': {'grades': 1.0},
+    'class_size': {'hs_reputation': 1.0},
+    # Extracurriculars
+    'ec_count': {'ecs_leadership': 1.0},
+    'leadership_count': {'ecs_leadership': 1.0},
+    'years_commitment': {'ecs_leadership': 1.0},
+    'hours_per_week': {'ecs_leadership': 1.0},
+    'awards_count': {'awards_publications': 1.0},
+    'national_awards': {'awards_publications': 1.0},
+    # Demographics
+    'first_gen': {'firstgen_diversity': 1.0},
+    'urm': {'firstgen_diversity': 1.0},
+    'geographic_diversity': {'geography_residency': 1.0},
+    'legacy': {'legacy': 1.0},
+    'recruited_athlete': {'athletic_recruit': 1.0},
+    # College context only moves the student's standing on that factor
+    'sat_median': {'testing': 1.0},
+    'act_median': {'testing': 1.0},
+    'test_policy_numeric': {'testing': 1.0},
+    'need_policy_numeric': {'ability_to_pay': 1.0},
+    # Interactions
+    'gpa_vs_avg': {'grades': 1.0},
+    'sat_vs_median': {'testing': 1.0},
+    'act_vs_median': {'testing': 1.0},
+    'gpa_above_college': {'grades': 1.0},
+    'sat_above_75th': {'testing': 1.0},
+    'act_above_75th': {'testing': 1.0},
+    'composite_vs_acceptance': {'grades': 0.5, 'testing': 0.3, 'rigor': 0.2},
+    'selectivity_match': {'grades': 0.5, 'testing': 0.5},
+    'test_advantage': {'testing': 1.0},
+    'geographic_match': {'geography_residency': 1.0},
+    'legacy_boost': {'legacy': 1.0},
+    'first_gen_boost': {'firstgen_diversity': 1.0},
+    'athlete_boost': {'athletic_recruit': 1.0},
+    'academic_strength': {'grades': 0.5, 'testing': 0.5},
+    'holistic_strength': {'ecs_leadership': 2 / 3, 'awards_publications': 1 / 3},
+}
+
+
+def factor_share_matrix(feature_names: Sequence[str]) -> np.ndarray:
+    """(len(feature_names), 20) matrix folding feature contributions onto FACTOR_ORDER."""
+    column = {factor: i for i, factor in enumerate(FACTOR_ORDER)}
+    matrix = np.zeros((len(feature_names), len(FACTOR_ORDER)))
+    for row, name in enumerate(feature_names):
+        if name.endswith('_score') and name[:-len('_score')] in column:
+            matrix[row, column[name[:-len('_score')]]] = 1.0
+            continue
+        shares = FEATURE_FACTOR_SHARES.get(name)
+        if shares is None:
+            logger.warning(f"No factor mapping for feature {name!r}; its contribution is dropped")
+            continue
+        for factor, share in shares.items():
+            matrix[row, column[factor]] = share
+    return matrix
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def _feature_contributions_with_bias(model, features: np.ndarray) -> np.ndarray:
+    """XGBoost per-feature contributions plus the bias column (summing to the margin)."""
+    import xgboost as xgb
+
+    return model.get_booster().predict(xgb.DMatrix(features), pred_contribs=True, approx_contribs=True)
+
+
+def _feature_contributions(model, features: np.ndarray) -> Optional[np.ndarray]:
+    """
+    (n, n_features) log-odds contributions, or None when ``model`` can't
+    provide them natively.
+    """
+    name = type(model).__name__
+    if name == 'XGBClassifier':
+        return _feature_contributions_with_bias(model, features)[:, :-1]
+    coef = getattr(model, 'coef_', None)
+    if coef is not None and np.ndim(coef) == 2 and coef.shape[0] == 1:
+        return features * coef[0]
+    if name == 'CalibratedClassifierCV':
+        members = [_feature_contributions(c.estimator, features) for c in model.calibrated_classifiers_]
+        if any(m is None for m in members):
+            return None
+        return np.mean(members, axis=0)
+    if name == 'VotingClassifier' and getattr(model, 'voting', None) == 'soft':
+        members = [_feature_contributions(m, features) for m in model.estimators_]
+        if any(m is None for m in members):
+            return None
+        weights = model.weights if model.weights is not None else np.ones(len(members))
+        return np.average(members, axis=0, weights=weights)
+    return None
+
+
+def predict_with_contributions(
+    model,
+    features: np.ndarray,
+    explain: bool = True,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Admission probabilities and per-feature contributions in one call.
+
+    Args:
+        model: Fitted classifier
+        features: Selected, scaled feature rows
+        explain: False skips the contributions (plain ``predict_proba``)
+
+    Returns:
+        (probabilities, contributions or None)
+    """
+    if not explain:
+        return model.predict_proba(features)[:, 1], None
+    if type(model).__name__ == 'XGBClassifier' and getattr(model, 'objective', None) == 'binary:logistic':
+        # The contributions sum to the margin, so they carry the prediction too
+        contribs = _feature_contributions_with_bias(model, features)
+        return _sigmoid(contribs.sum(axis=1)), contribs[:, :-1]
+    probs = model.predict_proba(features)[:, 1]
+    try:
+        return probs, _feature_contributions(model, features)
+    except Exception as e:
+        logger.warning(f"Factor contributions unavailable for {type(model).__name__}: {e}")
+        return probs, None
+
+
+def factor_contributions(contributions: np.ndarray, share_matrix: np.ndarray) -> List[Dict[str, float]]:
+    """Fold a batch of feature contributions onto the factors (one dict per row)."""
+    by_factor = contributions @ share_matrix
+    return [dict(zip(FACTOR_ORDER, row)) for row in by_factor.round(4).tolist()]
@@ -0,0 +1,346 @@
+"""
+Inference backends for the admission models.
+
+A backend turns raw FeatureExtractor rows into (probabilities, per-feature
+contributions) for one fitted model, including feature selection and
+scaling:
+
+- ``sklearn``: the unpickled selector, scaler and model, called as-is. This
+  is the reference every other backend is checked against.
+- ``numpy``: the same pipeline flattened into contiguous arrays at load
+  time. Selection is a column index, scaling is one subtract/divide, linear
+  models (plain or wrapped in ``CalibratedClassifierCV``) are a matrix
+  product plus ``np.interp``, and XGBoost trees are node arrays walked for
+  every (row, tree) pair at once, one level per step.
+
+The sklearn call chain costs milliseconds of fixed validation overhead per
+call, which dominates the 1-50 row batches the API serves.
+
+``build_backend`` verifies a flattened backend against the reference on a
+probe batch before returning it; on a mismatch (or an unsupported model)
+it logs a warning and returns the reference backend instead.
+"""
+
+import json
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .contributions import predict_with_contributions
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('auto', 'sklearn', 'numpy')
+
+# Largest difference from the reference tolerated at load time (trees are
+# evaluated in float32 like XGBoost itself; linear models in float64)
+PROBABILITY_TOLERANCE = 1e-5
+CONTRIBUTION_TOLERANCE = 1e-4
+PROBE_ROWS = 512
+
+
+class UnsupportedModel(ValueError):
+    """The model (or its preprocessing) has no flattened form."""
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+class InferenceBackend:
+    """Raw feature rows -> (probabilities, contributions or None)."""
+
+    name = 'base'
+
+    def predict(self, features: np.ndarray, explain: bool = False) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        raise NotImplementedError
+
+
+class SklearnBackend(InferenceBackend):
+    """The fitted objects called through their own APIs (reference)."""
+
+    name = 'sklearn'
+
+    def __init__(self, model, selector=None, scaler=None):
+        self.model = model
+        self.selector = selector
+        self.scaler = scaler
+
+    def transform(self, features: np.ndarray) -> np.ndarray:
+        if self.selector is not None:
+            features = self.selector.transform(features)
+        return self.scaler.transform(features)
+
+    def predict(self, features, explain=False):
+        return predict_with_contributions(self.model, self.transform(features), explain)
+
+
+class _FlatPreprocessing:
+    """Feature selection and scaling as a column index plus (x - center) / scale."""
+
+    def __init__(self, selector, scaler, n_inputs: int):
+        columns = np.arange(n_inputs)
+        if selector is not None:
+            if not hasattr(selector, 'get_support'):
+                raise UnsupportedModel(f"selector {type(selector).__name__}")
+            columns = selector.get_support(indices=True)
+        scaler_name = type(scaler).__name__
+        if scaler_name == 'StandardScaler':
+            center, scale = scaler.mean_, scaler.scale_
+        elif scaler_name == 'RobustScaler':
+            center, scale = scaler.center_, scaler.scale_
+        else:
+            raise UnsupportedModel(f"scaler {scaler_name}")
+        self.columns = columns
+        self.center = np.zeros(len(columns)) if center is None else np.asarray(center, dtype=np.float64)
+        self.scale = np.ones(len(columns)) if scale is None else np.asarray(scale, dtype=np.float64)
+
+    def __call__(self, features: np.ndarray) -> np.ndarray:
+        return (np.asarray(features, dtype=np.float64)[:, self.columns] - self.center) / self.scale
+
+
+class NumpyLinearBackend(InferenceBackend):
+    """
+    LogisticRegression, optionally inside CalibratedClassifierCV (isotonic
+    or sigmoid calibrators), as stacked coefficient arrays.
+    """
+
+    name = 'numpy'
+
+    def __init__(self, model, preprocess: _FlatPreprocessing):
+        self.preprocess = preprocess
+        if type(model).__name__ == 'CalibratedClassifierCV':
+            folds = model.calibrated_classifiers_
+            estimators = [fold.estimator for fold in folds]
+            self.calibrators = [self._flatten_calibrator(fold.calibrators) for fold in folds]
+        else:
+            estimators = [model]
+            self.calibrators = [None]
+        for estimator in estimators:
+            coef = getattr(estimator, 'coef_', None)
+            if type(estimator).__name__ != 'LogisticRegression' or coef is None or coef.shape[0] != 1:
+                raise UnsupportedModel(f"model {type(estimator).__name__}")
+        # (n_features, n_folds) so a batch is a single matrix product
+        self.coef = np.column_stack([estimator.coef_[0] for estimator in estimators])
+        self.intercept = np.array([estimator.intercept_[0] for estimator in estimators])
+        self.mean_coef = self.coef.mean(axis=1)
+
+    @staticmethod
+    def _flatten_calibrator(calibrators):
+        if len(calibrators) != 1:
+            raise UnsupportedModel("multiclass calibration")
+        calibrator = calibrators[0]
+        name = type(calibrator).__name__
+        if name == 'IsotonicRegression':
+            return ('isotonic', np.asarray(calibrator.X_thresholds_), np.asarray(calibrator.y_thresholds_))
+        if name == '_SigmoidCalibration':
+            return ('sigmoid', float(calibrator.a_), float(calibrator.b_))
+        raise UnsupportedModel(f"calibrator {name}")
+
+    def predict(self, features, explain=False):
+        scaled = self.preprocess(features)
+        decisions = scaled @ self.coef + self.intercept
+        fold_probs = []
+        for fold, calibrator in enumerate(self.calibrators):
+            decision = decisions[:, fold]
+            if calibrator is None:
+                fold_probs.append(_sigmoid(decision))
+            elif calibrator[0] == 'isotonic':
+                # IsotonicRegression(out_of_bounds='clip') is linear interpolation
+                fold_probs.append(np.interp(decision, calibrator[1], calibrator[2]))
+            else:
+                fold_probs.append(_sigmoid(-(calibrator[1] * decision + calibrator[2])))
+        probs = np.mean(fold_probs, axis=0)
+        return probs, (scaled * self.mean_coef if explain else None)
+
+
+class NumpyTreeBackend(InferenceBackend):
+    """
+    A binary:logistic XGBoost model as contiguous node arrays.
+
+    All trees' nodes are concatenated. XGBoost allocates children in pairs
+    (right = left + 1), so a step is ``left[node] + went_right``. Leaves point
+    at themselves with an infinite threshold, so every (row, tree) pair takes
+    exactly ``depth`` steps and no per-level masking is needed.
+
+    Contributions follow XGBoost's approximate (per-path) method: each step
+    adds ``mean[child] - mean[node]`` to the split feature, with node means
+    weighted by hessian cover.
+    """
+
+    name = 'numpy'
+
+    def __init__(self, model, preprocess: _FlatPreprocessing):
+        if type(model).__name__ != 'XGBClassifier' or model.objective != 'binary:logistic':
+            raise UnsupportedModel(f"model {type(model).__name__}")
+        self.preprocess = preprocess
+        dump = json.loads(model.get_booster().save_raw(raw_format='json'))
+        learner = dump['learner']
+        booster = learner['gradient_booster']
+        if booster['name'] != 'gbtree':
+            raise UnsupportedModel(f"booster {booster['name']}")
+        trees = booster['model']['trees']
+        if getattr(model, 'best_iteration', None) is not None:
+            trees = trees[:model.best_iteration + 1]
+        base_score = float(str(learner['learner_model_param']['base_score']).strip('[]'))
+        self.base_margin = float(np.log(base_score / (1 - base_score)))
+        self.n_features = int(learner['learner_model_param']['num_feature'])
+
+        left: List[np.ndarray] = []
+        feature: List[np.ndarray] = []
+        threshold: List[np.ndarray] = []
+        default_left: List[np.ndarray] = []
+        value: List[np.ndarray] = []
+        mean: List[np.ndarray] = []
+        roots = []
+        depth = 0
+        offset = 0
+        for tree in trees:
+            if any(tree['split_type']):
+                raise UnsupportedModel("categorical splits")
+            tree_left = np.asarray(tree['left_children'], dtype=np.int64)
+            tree_right = np.asarray(tree['right_children'], dtype=np.int64)
+            is_leaf = tree_left == -1
+            if np.any(tree_right[~is_leaf] != tree_left[~is_leaf] + 1):
+                raise UnsupportedModel("non-adjacent child nodes")
+            nodes = np.arange(len(tree_left))
+            tree_value = np.asarray(tree['split_conditions'], dtype=np.float32)
+            left.append(np.where(is_leaf, nodes, tree_left) + offset)
+            feature.append(np.where(is_leaf, 0, tree['split_indices']))
+            threshold.append(np.where(is_leaf, np.inf, tree_value).astype(np.float32))
+            default_left.append(np.asarray(tree['default_left'], dtype=bool) | is_leaf)
+            value.append(np.where(is_leaf, tree_value, 0).astype(np.float32))
+            mean.append(self._node_means(tree_left, tree_right, is_leaf, tree_value, tree['sum_hessian']))
+            depth = max(depth, self._depth(tree_left, tree_right))
+            roots.append(offset)
+            offset += len(tree_left)
+        self.left = np.concatenate(left).astype(np.intp)
+        self.feature = np.concatenate(feature).astype(np.intp)
+        self.threshold = np.concatenate(threshold)
+        self.default_left = np.concatenate(default_left)
+        self.value = np.concatenate(value)
+        self.mean = np.concatenate(mean)
+        self.roots = np.asarray(roots, dtype=np.intp)
+        self.depth = depth
+
+    @staticmethod
+    def _node_means(left, right, is_leaf, values, sum_hessian) -> np.ndarray:
+        """Cover-weighted mean leaf value under each node (children follow parents)."""
+        hessian = np.asarray(sum_hessian, dtype=np.float64)
+        means = np.where(is_leaf, values, 0.0).astype(np.float64)
+        for node in range(len(left) - 1, -1, -1):
+            if not is_leaf[node]:
+                l, r = left[node], right[node]
+                means[node] = (means[l] * hessian[l] + means[r] * hessian[r]) / hessian[node]
+        return means
+
+    @staticmethod
+    def _depth(left, right) -> int:
+        depths = np.zeros(len(left), dtype=np.int64)
+        for node in range(len(left)):
+            if left[node] != -1:
+                depths[left[node]] = depths[right[node]] = depths[node] + 1
+        return int(depths.max())
+
+    def predict(self, features, explain=False):
+        flat = self.preprocess(features).astype(np.float32).ravel()
+        n_rows = len(flat) // self.n_features
+        row_offsets = (np.arange(n_rows) * self.n_features)[:, None]
+        has_missing = bool(np.isnan(flat).any())
+        nodes = np.tile(self.roots, (n_rows, 1))
+        contributions = np.zeros(n_rows * self.n_features) if explain else None
+        for _ in range(self.depth):
+            cells = row_offsets + self.feature.take(nodes)
+            x = flat.take(cells)
+            went_right = ~(x < self.threshold.take(nodes))
+            if has_missing:
+                went_right = np.where(np.isnan(x), ~self.default_left.take(nodes), went_right)
+            children = self.left.take(nodes) + went_right
+            if explain:
+                contributions += np.bincount(
+                    cells.ravel(),
+                    weights=(self.mean.take(children) - self.mean.take(nodes)).ravel(),
+                    minlength=n_rows * self.n_features,
+                )
+            nodes = children
+        margin = self.value.take(nodes).sum(axis=1, dtype=np.float32) + np.float32(self.base_margin)
+        probs = _sigmoid(margin.astype(np.float64))
+        if explain:
+            contributions = contributions.reshape(n_rows, self.n_features)
+        return probs, contributions
+
+
+def _flatten(model, selector, scaler, n_inputs: int) -> InferenceBackend:
+    preprocess = _FlatPreprocessing(selector, scaler, n_inputs)
+    if type(model).__name__ == 'XGBClassifier':
+        return NumpyTreeBackend(model, preprocess)
+    return NumpyLinearBackend(model, preprocess)
+
+
+def probe_features(selector, scaler, n_inputs: int, rows: int = PROBE_ROWS) -> np.ndarray:
+    """
+    Raw feature rows spread around the scaler's fitted center (a few scales
+    out, so most tree branches are exercised).
+    """
+    preprocess_columns = selector.get_support(indices=True) if selector is not None else np.arange(n_inputs)
+    center = getattr(scaler, 'center_', None)
+    if center is None:
+        center = getattr(scaler, 'mean_', np.zeros(len(preprocess_columns)))
+    scale = getattr(scaler, 'scale_', None)
+    if scale is None:
+        scale = np.ones(len(preprocess_columns))
+    rng = np.random.default_rng(0)
+    features = np.zeros((rows, n_inputs))
+    features[:, preprocess_columns] = center + scale * rng.normal(scale=1.5, size=(rows, len(preprocess_columns)))
+    return features
+
+
+def verify_backend(backend: InferenceBackend, reference: InferenceBackend, probe: np.ndarray) -> Tuple[float, float]:
+    """Largest probability and contribution differences from the reference on ``probe``."""
+    probs, contributions = backend.predict(probe, explain=True)
+    expected_probs, expected_contributions = reference.predict(probe, explain=True)
+    prob_error = float(np.max(np.abs(probs - expected_probs)))
+    contribution_error = 0.0
+    if expected_contributions is not None:
+        if contributions is None:
+            contribution_error = float('inf')
+        else:
+            contribution_error = float(np.max(np.abs(contributions - expected_contributions)))
+    return prob_error, contribution_error
+
+
+def build_backend(kind: str, model, selector, scaler, n_inputs: int) -> InferenceBackend:
+    """
+    Backend of ``kind`` ('auto', 'sklearn' or 'numpy') for one model.
+
+    'numpy' and 'auto' both fall back to the reference when the model can't
+    be flattened or the flattened form doesn't match it; 'numpy' warns.
+    """
+    reference = SklearnBackend(model, selector, scaler)
+    if kind == 'sklearn':
+        return reference
+    if kind not in BACKENDS:
+        logger.warning(f"Unknown inference backend {kind!r}; using sklearn")
+        return reference
+    model_name = type(model).__name__
+    try:
+        backend = _flatten(model, selector, scaler, n_inputs)
+        prob_error, contribution_error = verify_backend(
+            backend, reference, probe_features(selector, scaler, n_inputs)
+        )
+    except UnsupportedModel as e:
+        log = logger.warning if kind == 'numpy' else logger.info
+        log(f"No numpy backend for {model_name} ({e}); using sklearn")
+        return reference
+    except Exception as e:
+        logger.warning(f"Could not build numpy backend for {model_name}: {e}; using sklearn")
+        return reference
+    if prob_error > PROBABILITY_TOLERANCE or contribution_error > CONTRIBUTION_TOLERANCE:
+        logger.warning(
+            f"numpy backend for {model_name} disagrees with the reference "
+            f"(probability {prob_error:.2e}, contributions {contribution_error:.2e}); using sklearn"
+        )
+        return reference
+    logger.info(f"numpy backend for {model_name} verified (max probability error {prob_error:.2e})")
+    return backend
@@ -5,13 +5,161 @@ ML Model Predictor with hybrid formula+ML approach.
 import numpy as np
 import joblib
 import json
+import logging
 import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from ml.preprocessing.feature_extractor import StudentFeatures, CollegeFeatures, FeatureExtractor
-from core import calculate_admission_probability
+from core import calculate_admission_probabilities
+from ml.models.calibration_maps import CalibrationMaps, load_calibration_maps
+from ml.models.contributions import factor_contributions, factor_share_matrix
+from ml.models.inference_backends import InferenceBackend, SklearnBackend, build_backend
+
+logger = logging.getLogger(__name__)
+
+
+def blend_probabilities(
+    ml_probs: np.ndarray,
+    formula_probs: np.ndarray,
+    use_formula: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Confidence-weighted ML+formula blend for a batch.
+    
+    More extreme ML predictions (close to 0 or 1) count as more confident and
+    get more weight; the formula carries more weight otherwise (formula
+    ROC-AUC 0.8101 vs ensemble 0.7812 at training time).
+    
+    Returns:
+        (blended, ml_weight, formula_weight, ml_confidence) arrays
+    """
+    ml_probs = np.asarray(ml_probs, dtype=float)
+    formula_probs = np.asarray(formula_probs, dtype=float)
+    # 0 at 0.5, 1 at 0 or 1, clamped to a reasonable range
+    ml_confidence = np.clip(1.0 - 4 * ml_probs * (1 - ml_probs), 0.3, 0.9)
+    if not use_formula:
+        ones = np.ones_like(ml_probs)
+        return ml_probs, ones, np.zeros_like(ml_probs), ml_confidence
+    # High confidence 60/40, medium 50/50, low 40/60 (ML/formula)
+    ml_weight = np.select([ml_confidence > 0.7, ml_confidence > 0.5], [0.60, 0.50], 0.40)
+    formula_weight = 1.0 - ml_weight
+    return ml_weight * ml_probs + formula_weight * formula_probs, ml_weight, formula_weight, ml_confidence
+
+
+def load_elite_calibration() -> Dict[str, Dict]:
+    """Load enhanced elite university calibration data for realistic probabilities."""
+    # Load from the enhanced calibration system
+    try:
+        calibration_file = Path(__file__).parent.parent.parent / 'data' / 'models' / 'enhanced_calibration_factors.json'
+        if calibration_file.exists():
+            with open(calibration_file, 'r') as f:
+                enhanced_data = json.load(f)
+            
+            # Convert to the format expected by the calibration method
+            elite_calibration = {}
+            for college, data in enhanced_data.items():
+                # Map short names to full names for better matching
+                name_mapping = {
+                    'MIT': 'massachusetts institute of technology',
+                    'Harvard': 'harvard university',
+                    'Stanford': 'stanford university',
+                    'Yale': 'yale university',
+                    'Princeton': 'princeton university',
+                    'Columbia': 'columbia university',
+                    'UPenn': 'university of pennsylvania',
+                    'Dartmouth': 'dartmouth college',
+                    'Brown': 'brown university',
+                    'Cornell': 'cornell university',
+                    'Duke': 'duke university',
+                    'Northwestern': 'northwestern university',
+                    'Vanderbilt': 'vanderbilt university',
+                    'Rice': 'rice university',
+                    'Emory': 'emory university',
+                    'Georgetown': 'georgetown university',
+                    'CMU': 'carnegie mellon university',
+                    'NYU': 'new york university',
+                    'UChicago': 'university of chicago',
+                    'Boston University': 'boston university'
+                }
+                
+                # Use mapped name if available, otherwise use original
+                mapped_name = name_mapping.get(college, college.lower())
+                elite_calibration[mapped_name] = {
+                    'factor': data['calibration_factor'],
+                    'max_prob': data['max_probability'],
+                    'acceptance_rate': data['acceptance_rate'],
+                    'category': data['category']
+                }
+            return elite_calibration
+    except Exception as e:
+        print(f"Warning: Could not load enhanced calibration data: {e}")
+    
+    # Fallback to basic calibration
+    elite_calibration = {
+        # Ultra-selective (acceptance rate < 5%)
+        'massachusetts institute of technology': {'factor': 0.073, 'max_prob': 0.098, 'acceptance_rate': 0.041},
+        'harvard university': {'factor': 0.074, 'max_prob': 0.098, 'acceptance_rate': 0.040},
+        'stanford university': {'factor': 0.074, 'max_prob': 0.098, 'acceptance_rate': 0.040},
+        
+        # Highly selective (acceptance rate 5-8%)
+        'yale university': {'factor': 0.107, 'max_prob': 0.146, 'acceptance_rate': 0.053},
+        'princeton university': {'factor': 0.109, 'max_prob': 0.147, 'acceptance_rate': 0.044},
+        'columbia university': {'factor': 0.110, 'max_prob': 0.147, 'acceptance_rate': 0.041},
+        'university of pennsylvania': {'factor': 0.106, 'max_prob': 0.146, 'acceptance_rate': 0.059},
+        'dartmouth college': {'factor': 0.105, 'max_prob': 0.145, 'acceptance_rate': 0.062},
+        'brown university': {'factor': 0.107, 'max_prob': 0.146, 'acceptance_rate': 0.055},
+        'university of chicago': {'factor': 0.104, 'max_prob': 0.145, 'acceptance_rate': 0.065},
+        
+        # Very selective (acceptance rate 8-12%)
+        'cornell university': {'factor': 0.165, 'max_prob': 0.210, 'acceptance_rate': 0.087},
+        'duke university': {'factor': 0.176, 'max_prob': 0.214, 'acceptance_rate': 0.059},
+        'northwestern university': {'factor': 0.172, 'max_prob': 0.212, 'acceptance_rate': 0.070},
+        'vanderbilt university': {'factor': 0.172, 'max_prob': 0.212, 'acceptance_rate': 0.071},
+        
+        # Selective (acceptance rate 12%+)
+        'rice university': {'factor': 0.283, 'max_prob': 0.286, 'acceptance_rate': 0.095},
+        'emory university': {'factor': 0.258, 'max_prob': 0.280, 'acceptance_rate': 0.131},
+        'georgetown university': {'factor': 0.266, 'max_prob': 0.282, 'acceptance_rate': 0.120},
+        'carnegie mellon university': {'factor': 0.256, 'max_prob': 0.280, 'acceptance_rate': 0.135},
+        'new york university': {'factor': 0.259, 'max_prob': 0.281, 'acceptance_rate': 0.130},
+        'boston university': {'factor': 0.400, 'max_prob': 0.500, 'acceptance_rate': 0.190},
+    }
+    return elite_calibration
+
+
+def resolve_elite_calibration(college_name: str, elite_calibration: Dict[str, Dict]) -> Optional[Dict]:
+    """
+    Match a lower-cased college name against the elite calibration table.
+    
+    Two-way substring match, first entry wins. This is the expensive step, so
+    callers resolve once (per catalog college at table build time, or once per
+    unseen name) rather than per prediction.
+    """
+    for elite_name, calibration_data in elite_calibration.items():
+        if elite_name in college_name or college_name in elite_name:
+            return calibration_data
+    return None
+
+
+def misc_uplift(misc_items: Optional[List[str]], college: CollegeFeatures, use_openai: bool = False) -> float:
+    """
+    Absolute probability uplift from a student's MISC bullets (0.0 without any).
+    
+    With ``use_openai`` this may make network calls, so async callers resolve
+    it off the event loop and before queueing for inference.
+    """
+    if not misc_items:
+        return 0.0
+    try:
+        from ml.preprocessing.misc_features import compute_misc_uplift, extract_misc_signals
+
+        signals = extract_misc_signals(misc_items, use_openai=use_openai)
+        return compute_misc_uplift(signals, getattr(college, "acceptance_rate", 0.5))
+    except Exception as e:
+        print(f"Warning: misc uplift failed: {e}")
+        return 0.0
 
 
 @dataclass
@@ -34,6 +182,8 @@ class PredictionResult:
     
     # Audit data
     feature_importances: Optional[Dict[str, float]] = None
+    # This applicant's ML log-odds contribution per scoring factor
+    factor_contributions: Optional[Dict[str, float]] = None
 
 
 class AdmissionPredictor:
@@ -43,25 +193,35 @@ class AdmissionPredictor:
     Intelligently blends ML model predictions with formula-based calculations.
     """
     
-    def __init__(self, model_dir: str = 'data/models'):
+    # Upper bound on memoized name -> calibration resolutions for non-catalog names
+    _CALIBRATION_CACHE_SIZE = 4096
+    
+    def __init__(self, model_dir: str = 'data/models', inference_backend: str = 'auto'):
         """
         Initialize predictor by loading trained models.
         
         Args:
             model_dir: Directory containing saved models
+            inference_backend: 'auto', 'sklearn' or 'numpy' (see ml.models.inference_backends)
         """
         self.model_dir = Path(model_dir)
         self.models = {}
+        self.inference_backend = inference_backend
+        self.backends: Dict[str, InferenceBackend] = {}
         self.scaler = None
         self.feature_selector = None
         self.metadata = {}
         self.feature_names = []
+        self._factor_shares: Optional[np.ndarray] = None
         self.calibrator = None
         self.calibrator_base_model = None
         self.calibration_info = None
+        # Learned per-college calibration (replaces the elite + acceptance-rate chain when present)
+        self.calibration_maps: Optional[CalibrationMaps] = None
         
         # Load elite calibration data
         self.elite_calibration = self._load_elite_calibration()
+        self._calibration_by_name, self._calibration_by_unitid = self._load_precomputed_calibration()
         
         # Load models if available
         if self.model_dir.exists():
@@ -69,86 +229,57 @@ class AdmissionPredictor:
     
     def _load_elite_calibration(self):
         """Load enhanced elite university calibration data for realistic probabilities."""
-        # Load from the enhanced calibration system
+        return load_elite_calibration()
+    
+    def _load_precomputed_calibration(self) -> Tuple[Dict[str, Optional[Dict]], Dict[int, Optional[Dict]]]:
+        """
+        Seed name -> calibration and unitid -> calibration lookups: the
+        calibration table's own names by unitid (through the shared college
+        identity), then every catalog college from the prebuilt college
+        feature table.
+        """
+        by_name: Dict[str, Optional[Dict]] = {}
+        by_unitid: Dict[int, Optional[Dict]] = {}
         try:
-            import json
-            from pathlib import Path
-            
-            calibration_file = Path(__file__).parent.parent.parent / 'data' / 'models' / 'enhanced_calibration_factors.json'
-            if calibration_file.exists():
-                with open(calibration_file, 'r') as f:
-                    enhanced_data = json.load(f)
-                
-                # Convert to the format expected by the calibration method
-                elite_calibration = {}
-                for college, data in enhanced_data.items():
-                    # Map short names to full names for better matching
-                    name_mapping = {
-                        'MIT': 'massachusetts institute of technology',
-                        'Harvard': 'harvard university',
-                        'Stanford': 'stanford university',
-                        'Yale': 'yale university',
-                        'Princeton': 'princeton university',
-                        'Columbia': 'columbia university',
-                        'UPenn': 'university of pennsylvania',
-                        'Dartmouth': 'dartmouth college',
-                        'Brown': 'brown university',
-                        'Cornell': 'cornell university',
-                        'Duke': 'duke university',
-                        'Northwestern': 'northwestern university',
-                        'Vanderbilt': 'vanderbilt university',
-                        'Rice': 'rice university',
-                        'Emory': 'emory university',
-                        'Georgetown': 'georgetown university',
-                        'CMU': 'carnegie mellon university',
-                        'NYU': 'new york university',
-                        'UChicago': 'university of chicago',
-                        'Boston University': 'boston university'
-                    }
-                    
-                    # Use mapped name if available, otherwise use original
-                    mapped_name = name_mapping.get(college, college.lower())
-                    elite_calibration[mapped_name] = {
-                        'factor': data['calibration_factor'],
-                        'max_prob': data['max_probability'],
-                        'acceptance_rate': data['acceptance_rate'],
-                        'category': data['category']
-                    }
-                return elite_calibration
+            from data.college_identity import get_college_identity
+            by_unitid = dict(get_college_identity().index(self.elite_calibration))
         except Exception as e:
-            print(f"Warning: Could not load enhanced calibration data: {e}")
-        
-        # Fallback to basic calibration
-        elite_calibration = {
-            # Ultra-selective (acceptance rate < 5%)
-            'massachusetts institute of technology': {'factor': 0.073, 'max_prob': 0.098, 'acceptance_rate': 0.041},
-            'harvard university': {'factor': 0.074, 'max_prob': 0.098, 'acceptance_rate': 0.040},
-            'stanford university': {'factor': 0.074, 'max_prob': 0.098, 'acceptance_rate': 0.040},
-            
-            # Highly selective (acceptance rate 5-8%)
-            'yale university': {'factor': 0.107, 'max_prob': 0.146, 'acceptance_rate': 0.053},
-            'princeton university': {'factor': 0.109, 'max_prob': 0.147, 'acceptance_rate': 0.044},
-            'columbia university': {'factor': 0.110, 'max_prob': 0.147, 'acceptance_rate': 0.041},
-            'university of pennsylvania': {'factor': 0.106, 'max_prob': 0.146, 'acceptance_rate': 0.059},
-            'dartmouth college': {'factor': 0.105, 'max_prob': 0.145, 'acceptance_rate': 0.062},
-            'brown university': {'factor': 0.107, 'max_prob': 0.146, 'acceptance_rate': 0.055},
-            'university of chicago': {'factor': 0.104, 'max_prob': 0.145, 'acceptance_rate': 0.065},
-            
-            # Very selective (acceptance rate 8-12%)
-            'cornell university': {'factor': 0.165, 'max_prob': 0.210, 'acceptance_rate': 0.087},
-            'duke university': {'factor': 0.176, 'max_prob': 0.214, 'acceptance_rate': 0.059},
-            'northwestern university': {'factor': 0.172, 'max_prob': 0.212, 'acceptance_rate': 0.070},
-            'vanderbilt university': {'factor': 0.172, 'max_prob': 0.212, 'acceptance_rate': 0.071},
-            
-            # Selective (acceptance rate 12%+)
-            'rice university': {'factor': 0.283, 'max_prob': 0.286, 'acceptance_rate': 0.095},
-            'emory university': {'factor': 0.258, 'max_prob': 0.280, 'acceptance_rate': 0.131},
-            'georgetown university': {'factor': 0.266, 'max_prob': 0.282, 'acceptance_rate': 0.120},
-            'carnegie mellon university': {'factor': 0.256, 'max_prob': 0.280, 'acceptance_rate': 0.135},
-            'new york university': {'factor': 0.259, 'max_prob': 0.281, 'acceptance_rate': 0.130},
-            'boston university': {'factor': 0.400, 'max_prob': 0.500, 'acceptance_rate': 0.190},
-        }
-        return elite_calibration
+            logger.warning(f"College identity unavailable, resolving calibration by name only: {e}")
+        try:
+            from ml.models.college_table import get_college_table
+            table = get_college_table()
+            by_name = table.calibration_by_name(self.elite_calibration)
+            for unitid, calibration in table.calibration_by_unitid(self.elite_calibration).items():
+                by_unitid.setdefault(unitid, calibration)
+        except Exception as e:
+            logger.warning(f"College feature table unavailable, resolving calibration lazily: {e}")
+        return by_name, by_unitid
+    
+    def _resolve_elite_calibration(self, college_name: str) -> Optional[Dict]:
+        """
+        Resolve a college name to its elite calibration entry (or None).
+        
+        Catalog colleges are pre-resolved by the college feature table, so this
+        is a single dict lookup; other names go through the shared college
+        identity to a unitid, and only names it can't place fall back to
+        substring matching. Each unseen name is resolved once and memoized.
+        """
+        key = college_name.lower()
+        try:
+            return self._calibration_by_name[key]
+        except KeyError:
+            pass
+        unitid = None
+        if self._calibration_by_unitid:
+            from data.college_identity import get_college_identity
+            unitid = get_college_identity().resolve(college_name)
+        if unitid is not None and unitid in self._calibration_by_unitid:
+            calibration = self._calibration_by_unitid[unitid]
+        else:
+            calibration = resolve_elite_calibration(key, self.elite_calibration)
+        if len(self._calibration_by_name) < self._CALIBRATION_CACHE_SIZE:
+            self._calibration_by_name[key] = calibration
+        return calibration
     
     def _apply_elite_calibration(self, probability: float, college: CollegeFeatures) -> float:
         """
@@ -161,36 +292,40 @@ class AdmissionPredictor:
         Returns:
             Calibrated probability
         """
-        college_name = college.name.lower()
-        
-        # Debug: Print what we're looking for
-        print(f"ELITE CALIBRATION DEBUG:")
-        print(f"  College name: '{college.name}'")
-        print(f"  College name (lower): '{college_name}'")
-        print(f"  Raw probability: {probability:.3f}")
-        
-        # Check if this is an elite university
-        for elite_name, calibration_data in self.elite_calibration.items():
-            print(f"  Checking against: '{elite_name}'")
-            if elite_name in college_name or college_name in elite_name:
-                # Apply calibration factor
-                calibrated_prob = probability * calibration_data['factor']
-                
-                # Cap at maximum probability
-                calibrated_prob = min(calibrated_prob, calibration_data['max_prob'])
-                
-                # Log the calibration for debugging
-                print(f"ELITE CALIBRATION MATCH: {college.name}")
-                print(f"  Raw probability: {probability:.3f}")
-                print(f"  Calibrated: {calibrated_prob:.3f}")
-                print(f"  Factor: {calibration_data['factor']}")
-                print(f"  Max prob: {calibration_data['max_prob']}")
-                print(f"  Acceptance rate: {calibration_data['acceptance_rate']:.1%}")
-                
-                return calibrated_prob
+        calibration_data = self._resolve_elite_calibration(college.name)
+        if calibration_data is None:
+            return probability
         
-        print(f"  No elite calibration match found for '{college_name}'")
-        return probability
+        # Apply calibration factor, capped at maximum probability
+        calibrated_prob = min(probability * calibration_data['factor'], calibration_data['max_prob'])
+        logger.debug(
+            f"Elite calibration for {college.name}: {probability:.3f} -> {calibrated_prob:.3f} "
+            f"(factor={calibration_data['factor']}, max_prob={calibration_data['max_prob']})"
+        )
+        return calibrated_prob
+    
+    def _acceptance_rate_adjustment(self, final_prob: float, college: CollegeFeatures) -> float:
+        """Hand-tuned acceptance-rate blend and clamps (used when no calibration maps are loaded)."""
+        acceptance_rate = getattr(college, "acceptance_rate", None)
+        if acceptance_rate is None:
+            acceptance_rate = 0.5  # reasonable default
+        acceptance_rate = float(np.clip(acceptance_rate, 0.02, 0.98))
+
+        # Calculate dynamic caps BEFORE blending to avoid inverting calibration intent
+        # Allow exceptional candidates to exceed acceptance rate by a reasonable margin
+        max_allowed = min(0.98, acceptance_rate + 0.35)  # Increased from 0.25 to 0.35 for stronger candidates
+        min_allowed = max(0.02, acceptance_rate * 0.3)
+
+        # Blend with acceptance rate so hard constraints have weight
+        blended_prob = (final_prob * 0.7) + (acceptance_rate * 0.3)
+
+        # Only clamp if the blended probability exceeds the maximum allowed
+        # This prevents valid predictions from being artificially lowered
+        if blended_prob > max_allowed:
+            return max_allowed
+        elif blended_prob < min_allowed:
+            return min_allowed
+        return blended_prob
     
     def _load_models(self):
         """Load all trained models from disk."""
@@ -225,6 +360,14 @@ class AdmissionPredictor:
                 self.feature_selector = joblib.load(selector_file)
                 print("DEBUG: Successfully loaded feature selector")
             
+            # Name the columns the models actually see, in selector order
+            input_names = FeatureExtractor.get_feature_names()
+            if self.feature_selector is not None and hasattr(self.feature_selector, 'get_support'):
+                self.feature_names = [input_names[i] for i in self.feature_selector.get_support(indices=True)]
+            elif not isinstance(self.feature_names, list):
+                self.feature_names = input_names
+            self._factor_shares = factor_share_matrix(self.feature_names)
+            
             # Load models
             model_files = {
                 'logistic_regression': 'logistic_regression.joblib',
@@ -255,6 +398,17 @@ class AdmissionPredictor:
                 else:
                     self.calibrator_base_model = 'ensemble'
                     print("DEBUG: Calibration metadata missing; defaulting calibrator_base_model to 'ensemble'")
+
+            self.calibration_maps = load_calibration_maps(self.model_dir)
+            
+            # Verified inference backend per model (falls back to the sklearn objects)
+            if self.scaler is not None:
+                n_inputs = len(FeatureExtractor.get_feature_names())
+                for name, model in self.models.items():
+                    self.backends[name] = build_backend(
+                        self.inference_backend, model, self.feature_selector, self.scaler, n_inputs
+                    )
+                print(f"DEBUG: Inference backends: { {name: b.name for name, b in self.backends.items()} }")
             
             print(f"DEBUG: Final result - Loaded {len(self.models)} models from {self.model_dir}")
             print(f"DEBUG: Available models: {list(self.models.keys())}")
@@ -290,44 +444,79 @@ class AdmissionPredictor:
         Returns:
             PredictionResult with probability and metadata
         """
-        # Get formula-based prediction first
-        formula_result = calculate_admission_probability(
-            factor_scores=student.factor_scores,
-            acceptance_rate=college.acceptance_rate,
-            uses_testing=(college.test_policy != 'Test-blind'),
-            need_aware=(college.financial_aid_policy == 'Need-aware')
-        )
-        formula_prob = formula_result.probability
+        return self.predict_many(
+            [(student, college)],
+            model_name=model_name,
+            use_formula=use_formula,
+            misc_items=[misc_items],
+            use_openai_misc=use_openai_misc,
+        )[0]
+    
+    def predict_many(
+        self,
+        pairs: List[Tuple[StudentFeatures, CollegeFeatures]],
+        model_name: str = 'ensemble',
+        use_formula: bool = True,
+        misc_items: Optional[List[Optional[List[str]]]] = None,
+        use_openai_misc: bool = False,
+        explain: bool = True,
+        misc_uplifts: Optional[List[float]] = None,
+    ) -> List[PredictionResult]:
+        """
+        Predict many (student, college) pairs with a single model invocation.
+        
+        Feature rows are stacked so the selector, scaler and ``predict_proba``
+        each run once for the whole batch, and the blend and learned
+        calibration maps are applied to the whole batch at once.
+        
+        Args:
+            pairs: (student, college) tuples to score
+            model_name: Which ML model to use
+            use_formula: Whether to blend with formula
+            misc_items: Optional per-pair MISC bullets (same length as pairs)
+            use_openai_misc: Allow OpenAI when extracting MISC signals
+            explain: Also return per-row factor contributions from the model
+            misc_uplifts: Per-pair MISC uplifts already resolved with ``misc_uplift``
+                (used instead of ``misc_items``)
+            
+        Returns:
+            PredictionResults in the same order as pairs
+        """
+        if not pairs:
+            return []
+        if misc_uplifts is None:
+            misc_uplifts = [
+                misc_uplift(items, college, use_openai_misc)
+                for items, (_, college) in zip(misc_items or [None] * len(pairs), pairs)
+            ]
         
+        # Get formula-based predictions first (one vectorized pass over all pairs)
+        formula_probs = calculate_admission_probabilities(
+            [student.factor_scores for student, _ in pairs],
+            acceptance_rate=[college.acceptance_rate for _, college in pairs],
+            uses_testing=[college.test_policy != 'Test-blind' for _, college in pairs],
+            need_aware=[college.financial_aid_policy == 'Need-aware' for _, college in pairs],
+        )
         # Keep formula probabilities as-is for realistic ranges
         # Allow probabilities to go up to 98% for exceptional applicants
-        formula_prob = np.clip(formula_prob, 0.01, 0.98)
+        formula_probs = [float(p) for p in np.clip(formula_probs, 0.01, 0.98)]
         
         # If ML not available, return formula only
         if not self.is_available():
-            return PredictionResult(
-                probability=formula_prob,
-                confidence_interval=(max(0.02, formula_prob - 0.10), 
-                                   min(0.98, formula_prob + 0.10)),
-                ml_probability=formula_prob,
-                formula_probability=formula_prob,
-                ml_confidence=0.0,
-                blend_weights={'ml': 0.0, 'formula': 1.0},
-                model_used='formula_only',
-                explanation="Formula-based prediction (ML not available)"
-            )
-        
-        # Extract features for ML
-        features, _ = FeatureExtractor.extract_features(student, college)
-        
-        # Apply feature selection if available
-        if self.feature_selector is not None:
-            features = self.feature_selector.transform(features.reshape(1, -1))
-        else:
-            features = features.reshape(1, -1)
-        
-        # Scale features
-        features_scaled = self.scaler.transform(features)
+            return [
+                PredictionResult(
+                    probability=formula_prob,
+                    confidence_interval=(max(0.02, formula_prob - 0.10), 
+                                       min(0.98, formula_prob + 0.10)),
+                    ml_probability=formula_prob,
+                    formula_probability=formula_prob,
+                    ml_confidence=0.0,
+                    blend_weights={'ml': 0.0, 'formula': 1.0},
+                    model_used='formula_only',
+                    explanation="Formula-based prediction (ML not available)"
+                )
+                for formula_prob in formula_probs
+            ]
         
         # Get ML model
         model = self.models.get(model_name, self.models.get('ensemble'))
@@ -336,118 +525,149 @@ class AdmissionPredictor:
             model = list(self.models.values())[0]
             model_name = list(self.models.keys())[0]
         
+        # ML predictions and factor contributions for the whole batch
+        ml_probs, contributions = self._predict_ml(
+            [FeatureExtractor.extract_features(student, college)[0] for student, college in pairs],
+            model,
+            model_name,
+            explain,
+        )
+        contributions_by_row = [None] * len(pairs)
+        if contributions is not None and self._factor_shares is not None:
+            contributions_by_row = factor_contributions(contributions, self._factor_shares)
+        
+        # Feature importances (if available)
+        feature_importances = None
+        if hasattr(model, 'feature_importances_'):
+            importances = model.feature_importances_
+            feature_importances = dict(zip(self.feature_names, importances))
+        
+        blended, ml_weights, formula_weights, confidences = blend_probabilities(ml_probs, formula_probs, use_formula)
+        calibrated_probs = [None] * len(pairs)
+        if self.calibration_maps is not None:
+            calibrated_probs = self.calibration_maps.calibrate(blended, [college for _, college in pairs]).tolist()
+        
+        return [
+            self._blend_prediction(
+                ml_prob=float(ml_prob),
+                formula_prob=formula_prob,
+                blended_prob=float(blended_prob),
+                ml_weight=float(ml_weight),
+                formula_weight=float(formula_weight),
+                ml_confidence=float(confidence),
+                college=college,
+                model_name=model_name,
+                use_formula=use_formula,
+                misc_uplift=uplift,
+                feature_importances=feature_importances,
+                calibrated_prob=calibrated,
+                factor_contributions=row_contributions,
+            )
+            for (
+                ml_prob, formula_prob, blended_prob, ml_weight, formula_weight, confidence,
+                (_, college), uplift, calibrated, row_contributions,
+            ) in zip(
+                ml_probs, formula_probs, blended, ml_weights, formula_weights, confidences,
+                pairs, misc_uplifts, calibrated_probs, contributions_by_row,
+            )
+        ]
+    
+    def transform_features(self, features: np.ndarray) -> np.ndarray:
+        """Apply the fitted feature selector (if any) and scaler to raw feature rows."""
+        # Apply feature selection if available
+        if self.feature_selector is not None:
+            features = self.feature_selector.transform(features)
+        
+        # Scale features
+        return self.scaler.transform(features)
+    
+    def _predict_ml_probabilities(self, feature_rows: List[np.ndarray], model, model_name: str) -> np.ndarray:
+        """Run selector, scaler and model once over stacked feature rows."""
+        return self._predict_ml(feature_rows, model, model_name, explain=False)[0]
+    
+    def _predict_ml(
+        self,
+        feature_rows: List[np.ndarray],
+        model,
+        model_name: str,
+        explain: bool = True,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        ML probabilities plus per-feature log-odds contributions (None if the
+        model can't explain itself) from one pass over stacked feature rows.
+        """
+        features = np.vstack(feature_rows)
+        backend = self.backends.get(model_name)
+        if backend is None:
+            backend = SklearnBackend(model, self.feature_selector, self.scaler)
+        
         # ML prediction
-        ml_prob = model.predict_proba(features_scaled)[0, 1]
+        ml_probs, contributions = backend.predict(features, explain)
 
         # Apply optional calibration if available for this base model
         if self.calibrator is not None:
             base_model_for_cal = self.calibrator_base_model or 'ensemble'
             if model_name == base_model_for_cal:
                 try:
-                    calibrated_prob = self.calibrator.predict_proba(features_scaled)[0, 1]
-                    ml_prob = float(np.clip(calibrated_prob, 0.0001, 0.9999))
-                    print(f"DEBUG: Applied calibrator for model {model_name} -> {ml_prob:.4f}")
+                    calibrated_probs = self.calibrator.predict_proba(self.transform_features(features))[:, 1]
+                    ml_probs = np.clip(calibrated_probs, 0.0001, 0.9999)
                 except Exception as e:
                     print(f"Warning: calibrator application failed ({e}); using uncalibrated prob.")
         
-        # Estimate ML confidence based on prediction certainty
-        # More extreme predictions (close to 0 or 1) = higher confidence
-        ml_confidence = 1.0 - 4 * ml_prob * (1 - ml_prob)  # 0 at 0.5, 1 at 0 or 1
-        ml_confidence = max(0.3, min(0.9, ml_confidence))  # Clamp to reasonable range
+        return ml_probs, contributions
+    
+    def _blend_prediction(
+        self,
+        ml_prob: float,
+        formula_prob: float,
+        blended_prob: float,
+        ml_weight: float,
+        formula_weight: float,
+        ml_confidence: float,
+        college: CollegeFeatures,
+        model_name: str,
+        use_formula: bool,
+        misc_uplift: float,
+        feature_importances: Optional[Dict[str, float]],
+        calibrated_prob: Optional[float] = None,
+        factor_contributions: Optional[Dict[str, float]] = None,
+    ) -> PredictionResult:
+        """
+        Calibrate one row of the batch blend and build its PredictionResult.
         
-        # Determine blend weights based on use_formula parameter
-        if not use_formula:
-            # ML only
-            ml_weight = 1.0
-            formula_weight = 0.0
-            final_prob = ml_prob
-        else:
-            # Hybrid ML+Formula approach
-            # If ML is confident and performs well, trust it more
-            # If ML is uncertain, trust formula more
-            
-            # Base weights (from training performance)
-            # Ensemble ROC-AUC: 0.7812, Formula ROC-AUC: 0.8101
-            # Formula is slightly better, so start with more formula weight
-            
-            if ml_confidence > 0.7:
-                # High ML confidence: 60% ML, 40% formula
-                ml_weight = 0.60
-                formula_weight = 0.40
-            elif ml_confidence > 0.5:
-                # Medium confidence: 50-50
-                ml_weight = 0.50
-                formula_weight = 0.50
-            else:
-                # Low confidence: trust formula more
-                ml_weight = 0.40
-                formula_weight = 0.60
-            
-            # Blend predictions
-            final_prob = ml_weight * ml_prob + formula_weight * formula_prob
+        ``blended_prob``, the weights and ``ml_confidence`` are this row of
+        ``blend_probabilities`` over the whole batch. ``calibrated_prob`` is the
+        learned calibration-map output for this pair (see
+        ``ml.models.calibration_maps``); without it the hand-tuned elite
+        factors and acceptance-rate blend are applied instead.
+        """
+        final_prob = blended_prob
         
         # FIXED: Remove excessive final calibration that was making probabilities too low
         # Keep blended probabilities as-is for realistic ranges
         
-        # Apply elite university calibration for realistic probabilities
-        print(f"DEBUG: About to apply elite calibration")
-        print(f"DEBUG: College object: {college}")
-        print(f"DEBUG: College name: {college.name}")
-        print(f"DEBUG: College type: {type(college)}")
-        final_prob = self._apply_elite_calibration(final_prob, college)
+        if calibrated_prob is not None:
+            final_prob = calibrated_prob
+        else:
+            # Apply elite university calibration for realistic probabilities
+            final_prob = self._apply_elite_calibration(final_prob, college)
 
         # Optional MISC uplift (monotone-positive, capped)
-        if misc_items:
-            try:
-                from ml.preprocessing.misc_features import compute_misc_uplift, extract_misc_signals
-
-                signals = extract_misc_signals(
-                    misc_items,
-                    use_openai=use_openai_misc,
-                )
-                misc_uplift = compute_misc_uplift(signals, getattr(college, "acceptance_rate", 0.5))
-                final_prob = min(0.98, final_prob + misc_uplift)
-                print(f"MISC uplift applied: +{misc_uplift:.3f}")
-            except Exception as e:
-                print(f"Warning: misc uplift failed: {e}")
+        if misc_uplift:
+            final_prob = min(0.98, final_prob + misc_uplift)
+            logger.debug(f"MISC uplift applied: +{misc_uplift:.3f}")
         
         # Allow probabilities up to 98% for exceptional applicants
-        final_prob = np.clip(final_prob, 0.02, 0.98)
-
-        # Acceptance-rate-aware calibration
-        acceptance_rate = getattr(college, "acceptance_rate", None)
-        if acceptance_rate is None:
-            acceptance_rate = 0.5  # reasonable default
-        acceptance_rate = float(np.clip(acceptance_rate, 0.02, 0.98))
+        final_prob = float(np.clip(final_prob, 0.02, 0.98))
 
-        # Calculate dynamic caps BEFORE blending to avoid inverting calibration intent
-        # Allow exceptional candidates to exceed acceptance rate by a reasonable margin
-        max_allowed = min(0.98, acceptance_rate + 0.35)  # Increased from 0.25 to 0.35 for stronger candidates
-        min_allowed = max(0.02, acceptance_rate * 0.3)
-
-        # Blend with acceptance rate so hard constraints have weight
-        blended_prob = (final_prob * 0.7) + (acceptance_rate * 0.3)
-
-        # Only clamp if the blended probability exceeds the maximum allowed
-        # This prevents valid predictions from being artificially lowered
-        if blended_prob > max_allowed:
-            final_prob = max_allowed
-        elif blended_prob < min_allowed:
-            final_prob = min_allowed
-        else:
-            final_prob = blended_prob
+        if calibrated_prob is None:
+            final_prob = self._acceptance_rate_adjustment(final_prob, college)
         
         # Confidence interval (wider if ML is uncertain)
         ci_width = 0.15 * (1 - ml_confidence)  # Smaller CI when more confident
         ci_lower = max(0.02, final_prob - ci_width)
         ci_upper = min(0.98, final_prob + ci_width)
         
-        # Feature importances (if available)
-        feature_importances = None
-        if hasattr(model, 'feature_importances_'):
-            importances = model.feature_importances_
-            feature_importances = dict(zip(self.feature_names, importances))
-        
         # Create explanation
         if not use_formula:
             explanation = f"ML-only prediction using {model_name} model"
@@ -463,7 +683,8 @@ class AdmissionPredictor:
             blend_weights={'ml': ml_weight, 'formula': formula_weight},
             model_used=model_name,
             explanation=explanation,
-            feature_importances=feature_importances
+            feature_importances=feature_importances,
+            factor_contributions=factor_contributions,
         )
     
     def predict_batch(
@@ -483,11 +704,10 @@ class AdmissionPredictor:
         Returns:
             List of prediction results
         """
-        results = []
-        for college in colleges:
-            result = self.predict(student, college, model_name=model_name)
-            results.append(result)
-        return results
+        return self.predict_many(
+            [(student, college) for college in colleges],
+            model_name=model_name,
+        )
     
     def get_model_info(self) -> Dict:
         """Get information about loaded models."""
@@ -495,6 +715,7 @@ class AdmissionPredictor:
             'available': self.is_available(),
             'models_loaded': list(self.models.keys()),
             'num_features': len(self.feature_names),
+            'inference_backends': {name: backend.name for name, backend in self.backends.items()},
             'training_date': self.metadata.get('training_date'),
             'num_training_samples': self.metadata.get('num_samples'),
             'metrics': self.metadata.get('metrics', {})
@@ -537,8 +758,14 @@ def get_predictor(model_dir: str = None, force_reload: bool = False) -> Admissio
                 model_dir = 'data/models'  # Fallback
                 print(f"DEBUG: Using fallback model directory: {model_dir}")
         
+        try:
+            from config import settings
+            inference_backend = settings.ml_inference_backend
+        except Exception:
+            inference_backend = 'auto'
+        
         print(f"DEBUG: Initializing predictor with model_dir: {model_dir}")
-        _predictor = AdmissionPredictor(model_dir=model_dir)
+        _predictor = AdmissionPredictor(model_dir=model_dir, inference_backend=inference_backend)
     return _predictor
 
 
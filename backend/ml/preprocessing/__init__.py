@@ -5,12 +5,14 @@ Preprocessing module for ML features.
 from .feature_extractor import (
     FeatureExtractor,
     StudentFeatures,
-    CollegeFeatures
+    CollegeFeatures,
+    student_features_from_profile
 )
 
 __all__ = [
     'FeatureExtractor',
     'StudentFeatures',
     'CollegeFeatures',
+    'student_features_from_profile',
 ]
 
@@ -331,3 +331,121 @@ class FeatureExtractor:
         names = FeatureExtractor.get_feature_names()
         return dict(zip(names, importances))
 
+
+
+# ---------------------------------------------------------------------------
+# Frontend profile -> StudentFeatures
+# ---------------------------------------------------------------------------
+
+POPULAR_MAJORS = ('Computer Science', 'Business', 'Engineering', 'Biology', 'Psychology')
+
+
+def profile_float(value, default: float = 0.0) -> float:
+    """Frontend field as float; blanks, junk, NaN and infinity give ``default``."""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return default
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return default
+    return default if np.isnan(number) or np.isinf(number) else number
+
+
+def profile_int(value) -> int:
+    """Frontend field as int (``"3.5"`` is not an int and gives 0, like the form parser)."""
+    if isinstance(value, str):
+        try:
+            return int(value) if value.strip() else 0
+        except ValueError:
+            return 0
+    number = profile_float(value)
+    return int(number)
+
+
+def grades_score(gpa_unweighted: float, gpa_weighted: float) -> float:
+    """GPA on the 0-10 factor scale (4.0 unweighted or 5.0 weighted = 10)."""
+    if gpa_unweighted > 0:
+        return min(10.0, (gpa_unweighted / 4.0) * 10.0)
+    if gpa_weighted > 0:
+        return min(10.0, (gpa_weighted / 5.0) * 10.0)
+    return 5.0  # Default neutral
+
+
+def testing_score(sat: int, act: int) -> float:
+    """SAT (1200=5, 1600=10) or ACT (20=5, 36=10) on the 0-10 factor scale."""
+    if sat > 0:
+        return min(10.0, max(0.0, ((sat - 1200) / 400) * 5.0 + 5.0))
+    if act > 0:
+        return min(10.0, max(0.0, ((act - 20) / 16) * 5.0 + 5.0))
+    return 5.0  # Default neutral
+
+
+def student_features_from_profile(profile: Dict) -> StudentFeatures:
+    """
+    Build StudentFeatures from the frontend profile form.
+
+    ``profile`` holds the form's fields (strings or numbers on their 1-10
+    dropdown scales, plus GPA/SAT/ACT). ``sat_total`` / ``act_composite``
+    are accepted in place of ``sat`` / ``act``. Counts the form doesn't ask
+    for (APs, honors, activities) are estimated from the dropdowns.
+    """
+    field = lambda name: profile_float(profile.get(name))
+    ec_depth = profile.get('extracurricular_depth')
+    awards = profile.get('awards_publications')
+
+    gpa_unweighted = field('gpa_unweighted')
+    gpa_weighted = field('gpa_weighted')
+    sat = profile_int(profile.get('sat') or profile.get('sat_total'))
+    act = profile_int(profile.get('act') or profile.get('act_composite'))
+
+    return StudentFeatures(
+        # Academic metrics
+        gpa_unweighted=gpa_unweighted,
+        gpa_weighted=gpa_weighted,
+        sat_total=sat,
+        act_composite=act,
+
+        # Course rigor and class info (estimated from extracurricular depth / HS reputation)
+        ap_count=int(profile_float(ec_depth) * 2),
+        honors_count=int(profile_float(ec_depth) * 1.5),
+        class_rank_percentile=field('hs_reputation') * 10,
+        class_size=500,
+
+        # Extracurricular counts and commitment
+        ec_count=min(10, max(1, profile_int(ec_depth) // 2)),
+        leadership_positions_count=profile_int(profile.get('leadership_positions')),
+        years_commitment=min(6, max(1, profile_int(ec_depth) // 2)),
+        hours_per_week=min(20.0, max(2.0, profile_float(ec_depth) * 1.5)),
+        awards_count=profile_int(awards),
+        national_awards=min(5, max(0, profile_int(awards) // 2)),
+
+        # Demographics and diversity
+        first_generation=field('firstgen_diversity') > 7.0,
+        underrepresented_minority=field('firstgen_diversity') > 6.0,
+        geographic_diversity=field('geographic_diversity'),
+        legacy_status=bool(profile_int(profile.get('legacy_status'))),
+        recruited_athlete=field('volunteer_work') > 7.0,
+
+        factor_scores={
+            'grades': grades_score(gpa_unweighted, gpa_weighted),
+            'rigor': profile_float(ec_depth),  # Extracurricular depth as rigor proxy
+            'testing': testing_score(sat, act),
+            'essay': field('essay_quality'),
+            'ecs_leadership': profile_float(ec_depth),
+            'recommendations': field('recommendations'),
+            'plan_timing': field('plan_timing'),
+            'athletic_recruit': field('volunteer_work'),  # volunteer_work as proxy
+            'major_fit': 7.0 if profile.get('major') in POPULAR_MAJORS else 6.0,
+            'geography_residency': field('geography_residency'),
+            'firstgen_diversity': field('firstgen_diversity'),
+            'ability_to_pay': field('ability_to_pay'),
+            'awards_publications': profile_float(awards),
+            'portfolio_audition': field('portfolio_audition'),
+            'policy_knob': field('policy_knob'),
+            'demonstrated_interest': field('demonstrated_interest'),
+            'legacy': field('legacy_status'),
+            'interview': field('interview'),
+            'conduct_record': field('conduct_record'),
+            'hs_reputation': field('hs_reputation'),
+        }
+    )
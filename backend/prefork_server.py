@@ -0,0 +1,343 @@
+"""
+Production pre-fork server for the Chancify AI API.
+
+    python prefork_server.py --port $PORT            # one worker per available core
+    python prefork_server.py --workers 4
+
+Process layout:
+
+    arbiter      binds the listening socket and supervises generations; imports
+      |          nothing from the app, so it stays small
+      +- generation   imports `main`, loads every registered service (models,
+           |          college tables, mappings), runs gc.freeze(), then forks
+           |          the workers and respawns any that die
+           +- worker x N   uvicorn serving `main.app` on the inherited socket;
+                           the loaded structures are shared copy-on-write
+
+Rolling restart: `kill -HUP <arbiter pid>` starts a new generation (fresh code
+and artifacts) on the same socket. Once all of its workers are accepting, the
+old generation gets SIGTERM and its workers stop accepting and finish their
+in-flight requests before exiting, so no connection is refused or dropped. If
+the new generation fails to come up, the old one keeps serving.
+
+SIGTERM / SIGINT to the arbiter shuts everything down gracefully.
+"""
+
+import argparse
+import gc
+import logging
+import math
+import os
+import select
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger("prefork")
+
+BACKEND_DIR = Path(__file__).resolve().parent
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: affinity mask, capped by a cgroup CPU quota when one is set."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    quota = None
+    try:
+        limit, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()  # cgroup v2
+        if limit != "max":
+            quota = int(limit) / int(period)
+    except (OSError, ValueError):
+        try:  # cgroup v1
+            limit = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+            period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+            if limit > 0:
+                quota = limit / period
+        except (OSError, ValueError):
+            pass
+
+    if quota is not None:
+        cpus = min(cpus, math.ceil(quota))
+    return max(1, cpus)
+
+
+def default_workers() -> int:
+    """WEB_CONCURRENCY when set, otherwise one worker per available CPU."""
+    try:
+        from config import settings
+        if settings.web_concurrency > 0:
+            return settings.web_concurrency
+    except Exception:
+        pass
+    return available_cpus()
+
+
+# ---------------------------------------------------------------------------
+# Generation: load once, freeze, fork workers
+# ---------------------------------------------------------------------------
+
+def _run_worker(app, sock: socket.socket, started_fd: int, args) -> None:
+    """Worker body (runs in a forked child): serve until told to stop."""
+    import uvicorn
+
+    class _Server(uvicorn.Server):
+        async def startup(self, sockets=None):
+            await super().startup(sockets=sockets)
+            if self.started:
+                os.write(started_fd, b"s")
+
+    config = uvicorn.Config(
+        app,
+        log_level=args.log_level,
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        timeout_keep_alive=args.keep_alive,
+        timeout_graceful_shutdown=args.graceful_timeout,
+    )
+    _Server(config).run(sockets=[sock])
+
+
+def _fork_worker(app, sock: socket.socket, started_fd: int, args) -> int:
+    pid = os.fork()
+    if pid == 0:
+        # Child: drop the generation's signal handling and serve
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGCHLD):
+            signal.signal(sig, signal.SIG_DFL)
+        code = 0
+        try:
+            _run_worker(app, sock, started_fd, args)
+        except BaseException:
+            logger.exception(f"Worker {os.getpid()} crashed")
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def run_generation(args) -> None:
+    """Load the app and its services once, then fork and supervise the workers."""
+    sock = socket.socket(fileno=args.listen_fd)
+    started_r, started_w = os.pipe()
+
+    load_start = time.perf_counter()
+    from main import app, service_registry
+
+    service_registry.start_background(max_workers=args.preload_workers)
+    service_registry.wait()
+    counts = service_registry.status()["counts"]
+    logger.info(
+        f"Generation {os.getpid()} loaded services in {time.perf_counter() - load_start:.1f}s "
+        f"({counts['ready']} ready, {counts['failed']} failed)"
+    )
+
+    # Everything allocated so far is shared with the workers. Move it out of the
+    # collector's generations so collections in the workers don't write to (and
+    # un-share) those pages
+    gc.collect()
+    gc.freeze()
+
+    stopping = False
+
+    def handle_stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, handle_stop)
+    signal.signal(signal.SIGINT, handle_stop)
+
+    workers: Dict[int, float] = {}
+    for _ in range(args.workers):
+        workers[_fork_worker(app, sock, started_w, args)] = time.monotonic()
+
+    started = 0
+    ready_sent = False
+    while not stopping:
+        readable, _, _ = select.select([started_r], [], [], 0.5)
+        if readable:
+            started += len(os.read(started_r, 64))
+        if not ready_sent and started >= args.workers:
+            os.write(args.ready_fd, b"ready\n")
+            os.close(args.ready_fd)
+            ready_sent = True
+            logger.info(f"Generation {os.getpid()} serving with {args.workers} workers: {sorted(workers)}")
+
+        # Respawn workers that died; back off if they die right after starting
+        for pid in list(workers):
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done and not stopping:
+                lifetime = time.monotonic() - workers.pop(pid)
+                logger.warning(f"Worker {pid} exited ({status}) after {lifetime:.1f}s; respawning")
+                if lifetime < 1.0:
+                    time.sleep(1.0)
+                workers[_fork_worker(app, sock, started_w, args)] = time.monotonic()
+
+    # Graceful stop: workers stop accepting and drain in-flight requests
+    logger.info(f"Generation {os.getpid()} stopping {len(workers)} workers")
+    for pid in workers:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for pid in workers:
+        try:
+            os.waitpid(pid, 0)
+        except ChildProcessError:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Arbiter: own the socket, swap generations
+# ---------------------------------------------------------------------------
+
+class Arbiter:
+    """Owns the listening socket and runs one generation at a time (two during a rolling restart)."""
+
+    def __init__(self, args):
+        self.args = args
+        self.sock = self._bind(args.host, args.port, args.backlog)
+        self.current: Optional[subprocess.Popen] = None
+        self.retiring: List[subprocess.Popen] = []
+        self._signals: List[int] = []
+
+    @staticmethod
+    def _bind(host: str, port: int, backlog: int) -> socket.socket:
+        sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+        sock.set_inheritable(True)
+        return sock
+
+    def spawn_generation(self) -> Optional[subprocess.Popen]:
+        """Start a generation and wait until all its workers accept connections."""
+        ready_r, ready_w = os.pipe()
+        args = self.args
+        proc = subprocess.Popen(
+            [
+                sys.executable, str(Path(__file__).resolve()), "--generation",
+                "--listen-fd", str(self.sock.fileno()),
+                "--ready-fd", str(ready_w),
+                "--workers", str(args.workers),
+                "--preload-workers", str(args.preload_workers),
+                "--graceful-timeout", str(args.graceful_timeout),
+                "--keep-alive", str(args.keep_alive),
+                "--log-level", args.log_level,
+            ],
+            cwd=BACKEND_DIR,
+            pass_fds=(self.sock.fileno(), ready_w),
+        )
+        os.close(ready_w)
+
+        deadline = time.monotonic() + args.ready_timeout
+        ready = False
+        with os.fdopen(ready_r, "rb") as pipe:
+            while time.monotonic() < deadline and proc.poll() is None:
+                readable, _, _ = select.select([pipe], [], [], 0.5)
+                if readable:
+                    ready = pipe.readline().strip() == b"ready"
+                    break
+                if signal.SIGTERM in self._signals or signal.SIGINT in self._signals:
+                    break
+
+        if not ready:
+            logger.error(f"Generation {proc.pid} did not become ready; stopping it")
+            self._stop(proc)
+            return None
+        return proc
+
+    def _stop(self, proc: subprocess.Popen) -> None:
+        if proc.poll() is None:
+            proc.send_signal(signal.SIGTERM)
+            try:
+                proc.wait(timeout=self.args.graceful_timeout + 10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+    def rolling_restart(self) -> None:
+        logger.info("Rolling restart: starting a new generation")
+        new = self.spawn_generation()
+        if new is None:
+            logger.error("Rolling restart aborted; the current generation keeps serving")
+            return
+        old, self.current = self.current, new
+        if old is not None and old.poll() is None:
+            old.send_signal(signal.SIGTERM)  # drains in the background; reaped in run()
+            self.retiring.append(old)
+        logger.info(f"Rolling restart complete: generation {new.pid} serving")
+
+    def run(self) -> None:
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, lambda signum, frame: self._signals.append(signum))
+
+        logger.info(
+            f"Arbiter {os.getpid()} listening on {self.args.host}:{self.args.port} "
+            f"with {self.args.workers} workers"
+        )
+        self.current = self.spawn_generation()
+        if self.current is None:
+            raise SystemExit("Initial generation failed to start")
+
+        while True:
+            while self._signals:
+                signum = self._signals.pop(0)
+                if signum == signal.SIGHUP:
+                    self.rolling_restart()
+                else:
+                    logger.info("Shutting down")
+                    for proc in [self.current] + self.retiring:
+                        if proc is not None:
+                            self._stop(proc)
+                    return
+
+            self.retiring = [proc for proc in self.retiring if proc.poll() is None]
+            if self.current.poll() is not None:
+                logger.error(f"Generation {self.current.pid} exited ({self.current.returncode}); restarting")
+                time.sleep(1.0)
+                self.current = self.spawn_generation() or self.current
+            time.sleep(0.5)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-fork multi-worker server for the Chancify AI API")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (default: WEB_CONCURRENCY or available CPUs)")
+    parser.add_argument("--preload-workers", type=int, default=4, help="Threads loading services before the fork")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--graceful-timeout", type=int, default=30, help="Seconds workers get to finish in-flight requests")
+    parser.add_argument("--ready-timeout", type=int, default=300, help="Seconds a new generation gets to start accepting")
+    parser.add_argument("--keep-alive", type=int, default=5)
+    parser.add_argument("--log-level", default="info")
+    # Internal: arbiter -> generation
+    parser.add_argument("--generation", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--listen-fd", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--ready-fd", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.workers <= 0:
+        args.workers = default_workers()
+    return args
+
+
+def main(argv=None):
+    sys.path.insert(0, str(BACKEND_DIR))
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    if args.generation:
+        run_generation(args)
+    else:
+        Arbiter(args).run()
+
+
+if __name__ == "__main__":
+    main()
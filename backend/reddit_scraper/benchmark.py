@@ -0,0 +1,141 @@
+"""Throughput benchmark for the applicant post parser.
+
+Builds a deterministic corpus of several thousand posts by mutating the
+recorded fixture posts in ``tests/fixtures`` (numbers, college names, bullet
+styles, header casing, decision formats, filler prose) and times
+``parse_applicant_post`` over it.
+
+From `backend/`:
+
+    python -m reddit_scraper.benchmark --posts 5000
+
+Throughput depends on the machine, so there is no built-in pass mark; pass
+``--target <posts/sec>`` to exit non-zero below a floor measured on the
+machine that runs the check.
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .parse_post import parse_applicant_post
+
+FIXTURE_PATH = Path(__file__).parent / "tests" / "fixtures" / "reddit_listing_posts.json"
+
+COLLEGES = [
+    "Stanford University", "MIT", "Harvard University", "Yale", "Princeton University",
+    "Columbia University", "University of Pennsylvania", "Brown University", "Duke University",
+    "Northwestern University", "Georgia Tech", "Purdue University", "University of Michigan",
+    "UC Berkeley", "UCLA", "USC", "Boston University", "Tufts", "Rice University",
+    "Carnegie Mellon University", "Ohio State University", "Northeastern University",
+    "University of Washington", "Texas A&M", "UIUC", "Johns Hopkins University",
+]
+ACTIVITIES = [
+    "President of Model UN (300 hours)", "Captain of varsity swim", "Research assistant at a university lab",
+    "Founder of a tutoring startup", "Hospital volunteer, 200 hours", "Lead developer for school app",
+    "Director of community theater program", "Part-time job at a grocery store (15 hrs/week)",
+    "Chair of the student council finance committee", "Community service club treasurer",
+]
+FILLER = [
+    "Honestly I did not expect any of this, the whole process was stressful.",
+    "Thanks to everyone on this sub for the advice over the past year!",
+    "I applied mostly to engineering programs with a couple of reaches.",
+    "My counselor was super supportive and my teachers wrote great letters.",
+    "Feel free to DM me if you have questions about essays or interviews.",
+]
+BULLETS = ["- ", "* ", "• ", "1. ", "2) "]
+
+
+def load_fixture_posts(path: Path = FIXTURE_PATH) -> List[Dict]:
+    with open(path, encoding="utf-8") as f:
+        return [p for p in json.load(f) if p.get("selftext")]
+
+
+def _mutate(post: Dict, rng: random.Random) -> Tuple[str, str]:
+    body = post["selftext"]
+
+    # Perturb stats while keeping their format
+    body = re.sub(r"\b[34]\.\d{1,2}\b", lambda m: f"{rng.uniform(3.0, 4.6):.2f}", body)
+    body = re.sub(r"\b1[0-6]\d0\b", lambda m: str(rng.randrange(1000, 1600, 10)), body)
+    body = re.sub(r"\b(ACT:?\s*)(\d{2})\b", lambda m: f"{m.group(1)}{rng.randint(20, 36)}", body)
+
+    # Swap college names
+    for name in COLLEGES:
+        if name in body and rng.random() < 0.6:
+            body = body.replace(name, rng.choice(COLLEGES))
+
+    lines = body.splitlines()
+    out: List[str] = []
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped[:2] in ("- ", "* ") and rng.random() < 0.5:
+            line = rng.choice(BULLETS) + stripped[2:]
+        if stripped.endswith(":") and rng.random() < 0.3:
+            line = line.upper() if rng.random() < 0.5 else line.lower()
+        out.append(line)
+
+    # Extra activities, decision formats and prose to vary length
+    if rng.random() < 0.5:
+        out.append("Activities:")
+        out.extend(rng.choice(BULLETS) + a for a in rng.sample(ACTIVITIES, rng.randint(2, 6)))
+    if rng.random() < 0.4:
+        out.append(f"{rng.choice(COLLEGES)} ({rng.choice(['Accepted', 'Rejected', 'Waitlisted', 'admitted'])})")
+    if rng.random() < 0.3:
+        out.append(f"{rng.choice(COLLEGES)} - {rng.choice(['rejected', 'Accepted', 'denied'])}")
+    if rng.random() < 0.3:
+        out.append("Accepted:")
+        out.extend(f"* {c}" for c in rng.sample(COLLEGES, rng.randint(1, 4)))
+    for _ in range(rng.randint(0, 12)):
+        out.insert(rng.randint(0, len(out)), rng.choice(FILLER))
+
+    return post["title"], "\n".join(out)
+
+
+def build_corpus(n_posts: int = 5000, seed: int = 0) -> List[Tuple[str, str]]:
+    """Deterministic corpus of (title, body) pairs derived from the recorded fixtures."""
+    rng = random.Random(seed)
+    base = load_fixture_posts()
+    return [_mutate(base[i % len(base)], rng) for i in range(n_posts)]
+
+
+def run_benchmark(corpus: List[Tuple[str, str]], repeat: int = 3) -> Dict:
+    parsed = sum(1 for title, body in corpus if parse_applicant_post(title, body) is not None)  # warm-up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title, body in corpus:
+            parse_applicant_post(title, body)
+        best = min(best, time.perf_counter() - start)
+    return {
+        "posts": len(corpus),
+        "with_decisions": parsed,
+        "best_seconds": best,
+        "posts_per_sec": len(corpus) / best if best > 0 else float("inf"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Applicant post parser benchmark")
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--target", type=float, default=None, help="fail below this many posts/sec (off by default)")
+    args = parser.parse_args()
+
+    result = run_benchmark(build_corpus(args.posts, args.seed), args.repeat)
+    print(
+        f"Parsed {result['posts']} posts ({result['with_decisions']} with decisions) "
+        f"in {result['best_seconds']:.3f}s: {result['posts_per_sec']:.0f} posts/sec"
+        + (f" (target {args.target:.0f})" if args.target is not None else "")
+    )
+    if args.target is not None and result["posts_per_sec"] < args.target:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
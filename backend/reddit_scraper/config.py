@@ -23,7 +23,7 @@ def get_reddit_client():
     client_secret = os.getenv("REDDIT_CLIENT_SECRET")
     username = os.getenv("REDDIT_USERNAME")
     password = os.getenv("REDDIT_PASSWORD")
-    user_agent = os.getenv("REDDIT_USER_AGENT", "ChancifyAI/1.0")
+    user_agent = get_user_agent()
 
     if not all([client_id, client_secret, username, password]):
         raise ValueError("Missing Reddit credentials in environment variables.")
@@ -47,3 +47,20 @@ def get_per_subreddit_limit() -> int:
     except ValueError:
         return 500
 
+
+
+def get_user_agent() -> str:
+    return os.getenv("REDDIT_USER_AGENT", "ChancifyAI/1.0")
+
+
+def get_listing_base_url() -> str:
+    """Base URL for JSON listing endpoints (override to point at a local fake server)."""
+    return os.getenv("REDDIT_LISTING_BASE_URL", "https://www.reddit.com").rstrip("/")
+
+
+def get_requests_per_second() -> float:
+    """Shared request budget across all concurrently fetched sources."""
+    try:
+        return float(os.getenv("REDDIT_REQUESTS_PER_SECOND", "1.0"))
+    except ValueError:
+        return 1.0
@@ -1,9 +1,8 @@
-import json
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 from .models import ApplicantProfile
-from .utils import clean_lines, normalize_whitespace, safe_json_array, strip_bullet_prefix
+from .utils import clean_lines, safe_json_array, strip_bullet_prefix
 
 
 GPA_PATTERN = re.compile(
@@ -16,38 +15,58 @@ AP_PATTERN = re.compile(r"\bap[^\d]{0,4}(\d{1,2})", re.IGNORECASE)
 HONORS_PATTERN = re.compile(r"honors[^\d]{0,4}(\d{1,2})", re.IGNORECASE)
 RANK_FRACTION = re.compile(r"rank[^\d]{0,6}(\d{1,4})\s*/\s*(\d{1,5})", re.IGNORECASE)
 RANK_TOP = re.compile(r"top\s*(\d{1,2})\s*%", re.IGNORECASE)
+# Stat patterns, matched within each line during the single line pass (first match per pattern wins)
+STAT_PATTERNS = {
+    "gpa": GPA_PATTERN,
+    "sat": SAT_PATTERN,
+    "act": ACT_PATTERN,
+    "ap": AP_PATTERN,
+    "honors": HONORS_PATTERN,
+    "rank_fraction": RANK_FRACTION,
+    "rank_top": RANK_TOP,
+}
+# Every stat pattern needs a digit; lines without one skip them all
+DIGIT = re.compile(r"\d")
+
+# Decision patterns, applied to each whitespace-normalized line
+DECISION_LINE_PATTERNS = [
+    (re.compile(r"(accepted|admitted)\s*[:\-]\s*(.+)", re.IGNORECASE), 1),
+    (re.compile(r"(rejected|denied)\s*[:\-]\s*(.+)", re.IGNORECASE), 0),
+    (re.compile(r"(acceptances)\s*[:\-]\s*(.+)", re.IGNORECASE), 1),
+]
+# Any decision word at all; lines without one skip every decision pattern
+DECISION_WORD = re.compile(r"accepted|admitted|acceptances|rejected|denied|waitlist", re.IGNORECASE)
+ACCEPT_HEADER = re.compile(r"accepted|admitted|acceptances", re.IGNORECASE)
+REJECT_HEADER = re.compile(r"rejected|denied", re.IGNORECASE)
+# Inline decisions like "Stanford (Accepted)" or "Harvard - Rejected", matched within a single line
+INLINE_DECISION = re.compile(
+    r"([A-Za-z][A-Za-z\s&.'-]{2,80})\s*[\(-]\s*(accepted|admitted|rejected|denied|waitlisted)\s*[\)\]]?",
+    re.IGNORECASE,
+)
+LIST_SEPARATOR = re.compile(r"[;,]")
+AND_SEPARATOR = re.compile(r"\band\b", re.IGNORECASE)
+WHITESPACE = re.compile(r"\s+")
+BULLET_START = re.compile(r"\s*[-•*\d]")
 
+EC_SECTION_HEADERS = ["ecs:", "extracurriculars:", "activities:", "extracurriculars/activities:"]
+EC_SECTION_END_MARKERS = ["awards:", "honors:", "results:", "decisions:", "accepted:", "rejected:", "misc:", "notes:"]
 
-def _parse_gpa(text: str) -> tuple[Optional[float], Optional[float]]:
-    for match in GPA_PATTERN.finditer(text):
-        uw = match.group("uw")
-        w = match.group("w")
-        uw_val = float(uw) if uw else None
-        w_val = float(w) if w else None
-        return uw_val, w_val
-    return None, None
+LEADERSHIP_PATTERN = re.compile(r"president|captain|lead|chair|director", re.IGNORECASE)
+BUSINESS_PATTERN = re.compile(r"founder|startup|business|company", re.IGNORECASE)
 
 
-def _parse_sat(text: str) -> Optional[int]:
-    m = SAT_PATTERN.search(text)
-    if m:
-        val = int(m.group(1))
-        if 400 <= val <= 1600:
-            return val
-    return None
-
-
-def _parse_act(text: str) -> Optional[int]:
-    m = ACT_PATTERN.search(text)
-    if m:
-        val = int(m.group(1))
-        if 1 <= val <= 36:
-            return val
-    return None
+def _scan_stat_line(line: str, found: Dict[str, re.Match]) -> None:
+    """Record the first match in this line of every stat pattern not matched on an earlier line."""
+    if len(found) == len(STAT_PATTERNS) or DIGIT.search(line) is None:
+        return
+    for key, pattern in STAT_PATTERNS.items():
+        if key not in found:
+            m = pattern.search(line)
+            if m:
+                found[key] = m
 
 
-def _parse_count(pattern: re.Pattern, text: str, lo: int = 0, hi: int = 50) -> Optional[int]:
-    m = pattern.search(text)
+def _count(m: Optional[re.Match], lo: int = 0, hi: int = 50) -> Optional[int]:
     if m:
         val = int(m.group(1))
         if lo <= val <= hi:
@@ -55,143 +74,165 @@ def _parse_count(pattern: re.Pattern, text: str, lo: int = 0, hi: int = 50) -> O
     return None
 
 
-def _parse_rank(text: str) -> tuple[Optional[float], Optional[int]]:
-    m = RANK_FRACTION.search(text)
-    if m:
-        rank = int(m.group(1))
-        size = int(m.group(2))
-        if size > 0:
-            pct = rank / size * 100
-            return pct, size
-    m = RANK_TOP.search(text)
+def _academics(found: Dict[str, re.Match]) -> Dict[str, Optional[Union[int, float]]]:
+    """Academic fields from the first match of each stat pattern."""
+    gpa_uw = gpa_w = None
+    m = found.get("gpa")
     if m:
-        pct = float(m.group(1))
-        return pct, None
-    return None, None
-
-
-def _extract_section_lines(body_lower: str, body: str) -> List[str]:
-    headers = ["ecs:", "extracurriculars:", "activities:", "extracurriculars/activities:"]
-    end_markers = ["awards:", "honors:", "results:", "decisions:", "accepted:", "rejected:", "misc:", "notes:"]
-    for header in headers:
+        gpa_uw = float(m.group("uw")) if m.group("uw") else None
+        gpa_w = float(m.group("w")) if m.group("w") else None
+
+    rank_pct, class_size = None, None
+    m = found.get("rank_fraction")
+    if m and int(m.group(2)) > 0:
+        rank_pct, class_size = int(m.group(1)) / int(m.group(2)) * 100, int(m.group(2))
+    elif "rank_top" in found:
+        rank_pct = float(found["rank_top"].group(1))
+
+    return {
+        "gpa_unweighted": gpa_uw,
+        "gpa_weighted": gpa_w,
+        "sat": _count(found.get("sat"), 400, 1600),
+        "act": _count(found.get("act"), 1, 36),
+        "ap_count": _count(found.get("ap")),
+        "honors_count": _count(found.get("honors")),
+        "class_rank_percentile": rank_pct,
+        "class_size": class_size,
+    }
+
+
+def _extract_section_lines(body_lower: str, body: str, lines: Optional[List[str]] = None) -> List[str]:
+    for header in EC_SECTION_HEADERS:
         idx = body_lower.find(header)
         if idx != -1:
             sub = body[idx + len(header) :]
+            sub_lower = sub.lower()
             end_idx = len(sub)
-            for end in end_markers:
-                j = sub.lower().find(end)
+            for end in EC_SECTION_END_MARKERS:
+                j = sub_lower.find(end)
                 if j != -1:
                     end_idx = min(end_idx, j)
             block = sub[:end_idx]
             return clean_lines(block)
     # Fallback: bullet-ish lines
     bullets = []
-    for line in body.splitlines():
-        if re.match(r"\s*[-•*\d]", line) and len(line.strip()) > 4:
+    for line in body.splitlines() if lines is None else lines:
+        if BULLET_START.match(line) and len(line.strip()) > 4:
             bullets.append(strip_bullet_prefix(line))
     return bullets
 
 
-def _extract_decisions(text: str) -> List[tuple[str, int]]:
-    decisions: List[tuple[str, int]] = []
-    patterns = [
-        (r"(accepted|admitted)\s*[:\-]\s*(.+)", 1),
-        (r"(rejected|denied)\s*[:\-]\s*(.+)", 0),
-        (r"(acceptances)\s*[:\-]\s*(.+)", 1),
-    ]
-    lines = text.splitlines()
-
-    # 1) Line-based patterns where colleges are on the same line
-    for line in lines:
-        line_clean = normalize_whitespace(line)
-        for pat, label in patterns:
-            m = re.search(pat, line_clean, re.IGNORECASE)
-            if m:
-                tail = m.group(2)
-                parts = re.split(r"[;,]", tail)
-                if len(parts) == 1:
-                    parts = re.split(r"\band\b", tail, flags=re.IGNORECASE)
-                for college in parts:
-                    c = college.strip(" ,.;")
-                    if c:
-                        decisions.append((c, label))
-
-    # 2) Section-based patterns where Accepted/Rejected header is followed by bullets
+def extract_academics(text: str, lines: Optional[List[str]] = None) -> Dict[str, Optional[Union[int, float]]]:
+    """GPA, test scores, course counts and class rank found in free text (None when absent)."""
+    found: Dict[str, re.Match] = {}
+    for line in text.splitlines() if lines is None else lines:
+        _scan_stat_line(line, found)
+    return _academics(found)
+
+
+def extract_activity_lines(text: str, lines: Optional[List[str]] = None) -> List[str]:
+    """Activity lines: the ECs/activities section if there is one, else bullet-ish lines."""
+    return _extract_section_lines(text.lower(), text, lines)
+
+
+def _split_colleges(tail: str) -> List[str]:
+    parts = LIST_SEPARATOR.split(tail)
+    if len(parts) == 1:
+        parts = AND_SEPARATOR.split(tail)
+    return parts
+
+
+def _extract_decisions(
+    text: str,
+    lines: Optional[List[str]] = None,
+    stats: Optional[Dict[str, re.Match]] = None,
+) -> List[tuple[str, int]]:
+    """
+    Collect decisions in one pass over the post's lines.
+
+    Three kinds of evidence are gathered side by side and concatenated in
+    this order: same-line lists ("Accepted: A, B"), bullets under an
+    Accepted/Rejected header, and inline markers ("A (Accepted)"). With
+    ``stats``, the same pass records the stat pattern matches (see
+    ``_scan_stat_line``).
+    """
+    if lines is None:
+        lines = text.splitlines()
+
+    line_decisions: List[tuple[str, int]] = []
+    section_decisions: List[tuple[str, int]] = []
+    inline_decisions: List[tuple[str, int]] = []
     current_label: Optional[int] = None
+
     for raw in lines:
-        line = raw.strip()
-        header_hit = False
-        if re.search(r"accepted|admitted|acceptances", line, re.IGNORECASE):
-            current_label = 1
-            header_hit = True
-        elif re.search(r"rejected|denied", line, re.IGNORECASE):
-            current_label = 0
-            header_hit = True
-        elif re.search(r"waitlist", line, re.IGNORECASE):
-            current_label = None  # skip waitlists
-            header_hit = True
-
-        if header_hit:
+        if stats is not None:
+            _scan_stat_line(raw, stats)
+        if DECISION_WORD.search(raw) is not None:
+            # 1) Line-based patterns where colleges are on the same line
+            line_clean = WHITESPACE.sub(" ", raw).strip()
+            for pattern, label in DECISION_LINE_PATTERNS:
+                m = pattern.search(line_clean)
+                if m:
+                    for college in _split_colleges(m.group(2)):
+                        c = college.strip(" ,.;")
+                        if c:
+                            line_decisions.append((c, label))
+
+            # Fallback: inline patterns like "Stanford (Accepted)" or "Harvard - Rejected"
+            for m in INLINE_DECISION.finditer(raw):
+                status = m.group(2).lower()
+                if status in ("accepted", "admitted"):
+                    inline_decisions.append((WHITESPACE.sub(" ", m.group(1)).strip(), 1))
+                elif status in ("rejected", "denied"):
+                    inline_decisions.append((WHITESPACE.sub(" ", m.group(1)).strip(), 0))
+
+            # 2) Section headers: Accepted/Rejected start a bullet list, waitlists are skipped
+            if ACCEPT_HEADER.search(raw):
+                current_label = 1
+            elif REJECT_HEADER.search(raw):
+                current_label = 0
+            else:
+                current_label = None
             continue
 
         if current_label is not None:
+            line = raw.strip()
             if line.startswith("*") or line.startswith("-"):
                 college = line.lstrip("*- ").strip(" ,.;")
                 if college:
-                    decisions.append((college, current_label))
+                    section_decisions.append((college, current_label))
             elif line.startswith("#"):  # new section
                 current_label = None
 
-    # Fallback: inline patterns like "Stanford (Accepted)" or "Harvard - Rejected"
-    inline_pat = re.compile(
-        r"([A-Za-z][A-Za-z\\s&.'-]{2,80})\\s*[\\(-]\\s*(accepted|admitted|rejected|denied|waitlisted)\\s*[\\)\\]]?",
-        re.IGNORECASE,
-    )
-    for m in inline_pat.finditer(text):
-        college = normalize_whitespace(m.group(1))
-        status = m.group(2).lower()
-        if status in ("accepted", "admitted"):
-            decisions.append((college, 1))
-        elif status in ("rejected", "denied"):
-            decisions.append((college, 0))
-    return decisions
+    return line_decisions + section_decisions + inline_decisions
 
 
 def parse_applicant_post(title: str, body: str) -> Optional[ApplicantProfile]:
     full = f"{title}\\n{body}"
     full_lower = full.lower()
+    # Tokenize once; every line-oriented extractor shares this stream
+    lines = full.splitlines()
 
-    gpa_uw, gpa_w = _parse_gpa(full)
-    sat = _parse_sat(full)
-    act = _parse_act(full)
-    ap_count = _parse_count(AP_PATTERN, full)
-    honors_count = _parse_count(HONORS_PATTERN, full)
-    rank_pct, class_size = _parse_rank(full)
-
-    misc_lines = _extract_section_lines(full_lower, full)
-    misc_json = safe_json_array(misc_lines) if misc_lines else None
-
-    decisions = _extract_decisions(full)
+    stats: Dict[str, re.Match] = {}
+    decisions = _extract_decisions(full, lines, stats)
     if not decisions:
         return None
 
+    academics = _academics(stats)
+
+    misc_lines = _extract_section_lines(full_lower, full, lines)
+    misc_json = safe_json_array(misc_lines) if misc_lines else None
+
     # Light EC strength heuristics
-    leadership = 1.0 if any(re.search(r"president|captain|lead|chair|director", l, re.IGNORECASE) for l in misc_lines) else None
+    leadership = 1.0 if any(LEADERSHIP_PATTERN.search(l) for l in misc_lines) else None
     research = 1.0 if any("research" in l.lower() or "lab" in l.lower() for l in misc_lines) else None
     volunteer = 1.0 if any("volunteer" in l.lower() or "service" in l.lower() for l in misc_lines) else None
-    business = 1.0 if any(re.search(r"founder|startup|business|company", l, re.IGNORECASE) for l in misc_lines) else None
+    business = 1.0 if any(BUSINESS_PATTERN.search(l) for l in misc_lines) else None
 
     profile = ApplicantProfile(
         raw_title=title,
         raw_body=body,
-        gpa_unweighted=gpa_uw,
-        gpa_weighted=gpa_w,
-        sat=sat,
-        act=act,
-        ap_count=ap_count,
-        honors_count=honors_count,
-        class_rank_percentile=rank_pct,
-        class_size=class_size,
+        **academics,
         extracurricular_depth=float(len(misc_lines)) if misc_lines else None,
         leadership_positions=leadership,
         awards_publications=None,
@@ -205,4 +246,3 @@ def parse_applicant_post(title: str, body: str) -> Optional[ApplicantProfile]:
         decisions=decisions,
     )
     return profile
-
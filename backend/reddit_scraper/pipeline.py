@@ -0,0 +1,487 @@
+"""Incremental, resumable Reddit scraping pipeline.
+
+Sources are fetched concurrently (one thread each) from Reddit's JSON listing
+endpoints under a shared request budget. New posts are parsed in a process
+pool as pages arrive, and rows are appended to chunked CSV files. A SQLite
+state file records every processed post id plus a per-source high-water mark
+(newest ``created_utc``), so reruns only process posts they have not seen.
+A mark only advances after a walk that reached it (or the end of the listing);
+a walk cut short by ``limit`` leaves it in place, and the next run skips the
+ids it already processed above the mark and continues further down.
+
+Delivery is at-least-once: ids are marked seen only after their rows have
+been flushed, so an interrupted run may re-emit the rows of its last batch.
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import AbstractSet, Deque, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from .college_mapping import load_college_mapping
+from .config import (
+    get_default_time_filter,
+    get_listing_base_url,
+    get_per_subreddit_limit,
+    get_requests_per_second,
+    get_user_agent,
+)
+from .parse_post import parse_applicant_post
+from .scrape import CSV_FIELDNAMES, applicant_to_rows
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    name: str
+    subreddit: str
+    listing: str = "new"  # "new" or "search" (search results are sorted by new)
+    queries: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()  # if set, title+body must contain one of these
+
+    def accepts(self, post: Dict) -> bool:
+        if not post.get("is_self", True) or not post.get("body"):
+            return False
+        if self.keywords:
+            title_body = (post["title"] + " " + post["body"]).lower()
+            return any(k in title_body for k in self.keywords)
+        return True
+
+
+SOURCES: Dict[str, SourceSpec] = {
+    "collegeresults": SourceSpec("collegeresults", "collegeresults"),
+    "a2c_results": SourceSpec(
+        "a2c_results",
+        "ApplyingToCollege",
+        listing="search",
+        queries=('"Profile RESULTS"', '"results thread"', '"Class of" results', '"decision" title:results'),
+    ),
+    "chanceme_results": SourceSpec(
+        "chanceme_results",
+        "chanceme",
+        keywords=("result", "decision", "admitted", "got in"),
+    ),
+}
+
+
+class RateLimiter:
+    """Thread-safe request budget shared by all fetcher threads."""
+
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self.burst = max(1, burst)
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now - (self.burst - 1) * self.interval)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ListingClient:
+    """Minimal client for ``/r/<sub>/new.json`` and ``/r/<sub>/search.json`` listings."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+        page_size: int = 100,
+        time_filter: Optional[str] = None,
+        timeout: float = 30.0,
+    ):
+        self.base_url = (base_url or get_listing_base_url()).rstrip("/")
+        self.rate_limiter = rate_limiter or RateLimiter(get_requests_per_second())
+        self.session = session or requests.Session()
+        self.session.headers.setdefault("User-Agent", get_user_agent())
+        self.page_size = page_size
+        self.time_filter = time_filter or get_default_time_filter()
+        self.timeout = timeout
+
+    def fetch_page(self, source: SourceSpec, query: Optional[str], after: Optional[str]) -> Tuple[List[Dict], Optional[str]]:
+        params: Dict[str, object] = {"limit": self.page_size, "raw_json": 1}
+        if after:
+            params["after"] = after
+        if source.listing == "search":
+            url = f"{self.base_url}/r/{source.subreddit}/search.json"
+            params.update({"q": query or "", "restrict_sr": 1, "sort": "new", "t": self.time_filter})
+        else:
+            url = f"{self.base_url}/r/{source.subreddit}/new.json"
+
+        self.rate_limiter.acquire()
+        resp = self.session.get(url, params=params, timeout=self.timeout)
+        resp.raise_for_status()
+        data = resp.json().get("data", {})
+        posts = [_serialize_listing_child(child.get("data", {})) for child in data.get("children", [])]
+        return posts, data.get("after")
+
+
+def _serialize_listing_child(d: Dict) -> Dict:
+    return {
+        "id": d.get("id", ""),
+        "subreddit": d.get("subreddit", ""),
+        "title": d.get("title", "") or "",
+        "body": d.get("selftext", "") or "",
+        "created_utc": float(d.get("created_utc") or 0.0),
+        "url": d.get("permalink", ""),
+        "is_self": bool(d.get("is_self", True)),
+    }
+
+
+@dataclass
+class SourceWalk:
+    """How far one ``iter_source_posts`` walk got."""
+
+    complete: bool = False  # every query reached the mark or the end of its listing
+    newest: float = 0.0  # newest created_utc seen above the mark
+
+
+def iter_source_posts(
+    client: ListingClient,
+    source: SourceSpec,
+    limit: int,
+    high_water: float = 0.0,
+    skip_ids: AbstractSet[str] = frozenset(),
+    walk: Optional[SourceWalk] = None,
+) -> Iterator[List[Dict]]:
+    """
+    Yield pages of accepted posts newer than ``high_water``, up to ``limit`` posts.
+
+    ``skip_ids`` (already processed above the mark) are passed over without
+    counting towards ``limit``; ``walk`` records whether the listing was
+    walked all the way down to the mark.
+    """
+    walk = walk if walk is not None else SourceWalk()
+    walk.newest = max(walk.newest, high_water)
+    complete = True
+    yielded = 0
+    queries = source.queries or (None,)
+    per_query = max(1, limit // len(queries)) if source.queries else limit
+    for query in queries:
+        after: Optional[str] = None
+        from_query = 0
+        while True:
+            posts, after = client.fetch_page(source, query, after)
+            page: List[Dict] = []
+            reached_old = cut = False
+            for index, post in enumerate(posts):
+                # Listings are newest-first: everything past the mark was handled by an earlier run
+                if post["created_utc"] <= high_water:
+                    reached_old = True
+                    break
+                walk.newest = max(walk.newest, post["created_utc"])
+                if post["id"] in skip_ids or not source.accepts(post):
+                    continue
+                page.append(post)
+                from_query += 1
+                if from_query >= per_query or yielded + len(page) >= limit:
+                    cut = index < len(posts) - 1
+                    break
+            if page:
+                yielded += len(page)
+                yield page
+            if reached_old or (not cut and (not after or not posts)):
+                break
+            if yielded >= limit or from_query >= per_query:
+                # Cut short: posts between here and the mark are still unfetched
+                complete = False
+                break
+        if yielded >= limit:
+            # Later queries were never walked
+            complete = complete and query == queries[-1]
+            break
+    walk.complete = complete
+
+
+class ScrapeState:
+    """SQLite-backed seen-id store and per-source high-water marks."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen_posts (
+                id TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                created_utc REAL,
+                row_count INTEGER NOT NULL DEFAULT 0,
+                processed_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS high_water_marks (
+                source TEXT PRIMARY KEY,
+                created_utc REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            """
+        )
+        self.conn.commit()
+
+    def unseen(self, ids: List[str]) -> List[str]:
+        if not ids:
+            return []
+        placeholders = ",".join("?" * len(ids))
+        seen = {r[0] for r in self.conn.execute(f"SELECT id FROM seen_posts WHERE id IN ({placeholders})", ids)}
+        return [i for i in ids if i not in seen]
+
+    def mark_seen(self, source: str, posts: List[Dict], row_counts: List[int]) -> None:
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO seen_posts (id, source, created_utc, row_count, processed_at) VALUES (?, ?, ?, ?, ?)",
+            [(p["id"], source, p["created_utc"], n, now) for p, n in zip(posts, row_counts)],
+        )
+        self.conn.commit()
+
+    def seen_since(self, source: str, created_utc: float) -> set:
+        """Ids processed for ``source`` that are newer than ``created_utc`` (left by walks cut short)."""
+        return {
+            r[0]
+            for r in self.conn.execute(
+                "SELECT id FROM seen_posts WHERE source = ? AND created_utc > ?", (source, created_utc)
+            )
+        }
+
+    def high_water(self, source: str) -> float:
+        row = self.conn.execute("SELECT created_utc FROM high_water_marks WHERE source = ?", (source,)).fetchone()
+        return float(row[0]) if row else 0.0
+
+    def set_high_water(self, source: str, created_utc: float) -> None:
+        if created_utc <= self.high_water(source):
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO high_water_marks (source, created_utc, updated_at) VALUES (?, ?, ?)",
+            (source, created_utc, time.time()),
+        )
+        self.conn.commit()
+
+    def seen_count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM seen_posts").fetchone()[0]
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class ChunkedCsvWriter:
+    """Append-only output: rows go to new ``<prefix>-<run>-<seq>.csv`` chunks, never rewriting old files."""
+
+    def __init__(self, output_dir: str, prefix: str = "reddit_admissions", chunk_rows: int = 5000):
+        self.output_dir = output_dir
+        self.prefix = prefix
+        self.chunk_rows = chunk_rows
+        self.run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        self.paths: List[str] = []
+        self.rows_written = 0
+        self._seq = 0
+        self._file = None
+        self._writer: Optional[csv.DictWriter] = None
+        self._rows_in_chunk = 0
+        os.makedirs(output_dir, exist_ok=True)
+
+    def _open_chunk(self) -> None:
+        self.close()
+        path = os.path.join(self.output_dir, f"{self.prefix}-{self.run_id}-{self._seq:04d}.csv")
+        self._seq += 1
+        self._file = open(path, "x", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDNAMES)
+        self._writer.writeheader()
+        self._rows_in_chunk = 0
+        self.paths.append(path)
+
+    def write_rows(self, rows: List[Dict]) -> None:
+        for row in rows:
+            if self._writer is None or self._rows_in_chunk >= self.chunk_rows:
+                self._open_chunk()
+            self._writer.writerow(row)
+            self._rows_in_chunk += 1
+            self.rows_written += 1
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._writer = None
+
+
+# Per-process college mapping, loaded once by the pool initializer
+_WORKER_MAPPING: Dict[str, str] = {}
+
+
+def _init_worker(college_mapping_path: Optional[str]) -> None:
+    global _WORKER_MAPPING
+    _WORKER_MAPPING = load_college_mapping(college_mapping_path) if college_mapping_path else {}
+
+
+def _parse_posts(posts: List[Dict]) -> List[List[Dict]]:
+    """Worker body: rows for each post (empty list when the post has no decisions)."""
+    out: List[List[Dict]] = []
+    for post in posts:
+        profile = parse_applicant_post(post["title"], post["body"])
+        if not profile or not profile.decisions:
+            out.append([])
+        else:
+            out.append(applicant_to_rows(profile, _WORKER_MAPPING))
+    return out
+
+
+class _InlineExecutor:
+    """Executor stand-in used when ``workers=0`` (single process, e.g. tests)."""
+
+    def __init__(self, college_mapping_path: Optional[str]):
+        _init_worker(college_mapping_path)
+
+    def submit(self, fn, *args) -> Future:
+        fut: Future = Future()
+        try:
+            fut.set_result(fn(*args))
+        except Exception as e:
+            fut.set_exception(e)
+        return fut
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def run_incremental(
+    sources: List[SourceSpec],
+    client: ListingClient,
+    state: ScrapeState,
+    writer: ChunkedCsvWriter,
+    limit: int,
+    college_mapping_path: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Dict]:
+    """Fetch, parse and append new posts for ``sources``; returns per-source stats."""
+    if workers is None:
+        workers = min(4, os.cpu_count() or 1)
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            # Fetcher threads are already running; forking a threaded process is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(college_mapping_path,),
+        )
+        if workers > 0
+        else _InlineExecutor(college_mapping_path)
+    )
+
+    stats = {s.name: {"fetched": 0, "new": 0, "rows": 0, "error": None} for s in sources}
+    marks = {s.name: state.high_water(s.name) for s in sources}
+    skip_ids = {s.name: state.seen_since(s.name, marks[s.name]) for s in sources}
+    walks = {s.name: SourceWalk() for s in sources}
+    events: "queue.Queue[Tuple[str, str, object]]" = queue.Queue(maxsize=64)
+
+    def fetch(source: SourceSpec) -> None:
+        try:
+            for page in iter_source_posts(
+                client, source, limit, marks[source.name], skip_ids[source.name], walks[source.name]
+            ):
+                events.put(("page", source.name, page))
+            events.put(("done", source.name, None))
+        except Exception as e:
+            events.put(("done", source.name, e))
+
+    threads = [threading.Thread(target=fetch, args=(s,), name=f"fetch-{s.name}", daemon=True) for s in sources]
+    for t in threads:
+        t.start()
+
+    pending: Deque[Tuple[str, List[Dict], Future]] = deque()
+    in_flight: set = set()
+
+    def commit(block: bool) -> None:
+        # Commit in submission order so output order is deterministic
+        while pending and (block or pending[0][2].done()):
+            source_name, posts, fut = pending.popleft()
+            per_post_rows = fut.result()
+            rows = [row for post_rows in per_post_rows for row in post_rows]
+            writer.write_rows(rows)
+            state.mark_seen(source_name, posts, [len(r) for r in per_post_rows])
+            for post in posts:
+                in_flight.discard(post["id"])
+            stats[source_name]["rows"] += len(rows)
+
+    try:
+        remaining = len(threads)
+        while remaining:
+            kind, source_name, payload = events.get()
+            if kind == "done":
+                remaining -= 1
+                if payload is not None:
+                    stats[source_name]["error"] = str(payload)
+                    print(f"Fetching {source_name} failed: {payload}")
+            else:
+                page = payload
+                stats[source_name]["fetched"] += len(page)
+                fresh_ids = set(state.unseen([p["id"] for p in page])) - in_flight
+                fresh = [p for p in page if p["id"] in fresh_ids]
+                if fresh:
+                    in_flight.update(fresh_ids)
+                    stats[source_name]["new"] += len(fresh)
+                    pending.append((source_name, fresh, executor.submit(_parse_posts, fresh)))
+            commit(block=False)
+        commit(block=True)
+    finally:
+        executor.shutdown(wait=True)
+        writer.close()
+
+    # Advance marks only for sources walked cleanly all the way down to their old mark
+    for name, s in stats.items():
+        if s["error"] is None and walks[name].complete:
+            state.set_high_water(name, walks[name].newest)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental Reddit admissions scraper")
+    parser.add_argument("--source", choices=list(SOURCES) + ["all"], default="all")
+    parser.add_argument("--limit", type=int, default=None, help="per-source limit of new posts")
+    parser.add_argument("--output-dir", type=str, default="reddit_admissions_dataset")
+    parser.add_argument("--state", type=str, default=None, help="state file (default: <output-dir>/scrape_state.sqlite)")
+    parser.add_argument("--college-mapping", type=str, default=None, help="path to real_colleges_integrated.csv")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (0 = parse inline)")
+    parser.add_argument("--requests-per-second", type=float, default=None)
+    parser.add_argument("--base-url", type=str, default=None, help="listing base URL (e.g. a local fake server)")
+    parser.add_argument("--chunk-rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    limit = args.limit or get_per_subreddit_limit()
+    sources = list(SOURCES.values()) if args.source == "all" else [SOURCES[args.source]]
+    rate = args.requests_per_second if args.requests_per_second is not None else get_requests_per_second()
+
+    client = ListingClient(base_url=args.base_url, rate_limiter=RateLimiter(rate))
+    state = ScrapeState(args.state or os.path.join(args.output_dir, "scrape_state.sqlite"))
+    writer = ChunkedCsvWriter(args.output_dir, chunk_rows=args.chunk_rows)
+    try:
+        stats = run_incremental(sources, client, state, writer, limit, args.college_mapping, args.workers)
+    finally:
+        state.close()
+
+    for name, s in stats.items():
+        print(f"{name}: fetched {s['fetched']}, new {s['new']}, rows {s['rows']}" + (f", error: {s['error']}" if s["error"] else ""))
+    print(f"Wrote {writer.rows_written} rows to {len(writer.paths)} chunk(s) in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
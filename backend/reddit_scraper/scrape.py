@@ -1,4 +1,5 @@
 import argparse
+import csv
 import json
 import time
 from typing import Dict, List
@@ -9,6 +10,30 @@ from .college_mapping import load_college_mapping, normalize_college_name
 from .models import ApplicantProfile
 
 
+CSV_FIELDNAMES = [
+    "college_name",
+    "decision",
+    "gpa_unweighted",
+    "gpa_weighted",
+    "sat",
+    "act",
+    "ap_count",
+    "honors_count",
+    "class_rank_percentile",
+    "class_size",
+    "extracurricular_depth",
+    "leadership_positions",
+    "awards_publications",
+    "volunteer_work",
+    "research_experience",
+    "business_ventures",
+    "passion_projects",
+    "work_hours",
+    "volunteer_hours",
+    "misc_bullets_json",
+]
+
+
 def _serialize_submission(sub) -> Dict:
     return {
         "id": sub.id,
@@ -147,33 +172,8 @@ def main():
         print("No rows parsed. Check credentials and parsing heuristics.")
         return
 
-    import csv
-
-    fieldnames = [
-        "college_name",
-        "decision",
-        "gpa_unweighted",
-        "gpa_weighted",
-        "sat",
-        "act",
-        "ap_count",
-        "honors_count",
-        "class_rank_percentile",
-        "class_size",
-        "extracurricular_depth",
-        "leadership_positions",
-        "awards_publications",
-        "volunteer_work",
-        "research_experience",
-        "business_ventures",
-        "passion_projects",
-        "work_hours",
-        "volunteer_hours",
-        "misc_bullets_json",
-    ]
-
     with open(args.output, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
         writer.writeheader()
         writer.writerows(rows)
 
@@ -1,6 +1,12 @@
+import dataclasses
 import json
+from pathlib import Path
 
-from reddit_scraper.parse_post import parse_applicant_post
+from reddit_scraper.benchmark import build_corpus
+from reddit_scraper.parse_post import extract_academics, parse_applicant_post
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
 
 
 def test_parse_basic_post():
@@ -27,3 +33,56 @@ def test_parse_basic_post():
     bullets = json.loads(profile.misc_bullets_json)
     assert any("Robotics" in b for b in bullets)
 
+
+
+def test_parse_inline_decisions():
+    title = "Results are in"
+    body = """
+    GPA: 3.8
+    Stanford University (Accepted)
+    UC Berkeley - Rejected
+    USC (Waitlisted)
+    """
+    profile = parse_applicant_post(title, body)
+    assert profile is not None
+    assert ("Stanford University", 1) in profile.decisions
+    assert ("UC Berkeley", 0) in profile.decisions
+    assert not any(name.startswith("USC") for name, _ in profile.decisions)
+
+
+def test_parse_recorded_posts_match_expected():
+    posts = json.loads((FIXTURES / "reddit_listing_posts.json").read_text())
+    expected = json.loads((FIXTURES / "parse_post_expected.json").read_text())
+    for post in posts:
+        profile = parse_applicant_post(post["title"], post["selftext"])
+        if expected[post["id"]] is None:
+            assert profile is None, post["id"]
+            continue
+        got = dataclasses.asdict(profile)
+        got.pop("raw_title")
+        got.pop("raw_body")
+        got["decisions"] = [list(d) for d in got["decisions"]]
+        assert got == expected[post["id"]], post["id"]
+
+
+def test_benchmark_corpus_is_deterministic():
+    corpus = build_corpus(300, seed=7)
+    assert len(corpus) == 300
+    assert corpus == build_corpus(300, seed=7)
+    assert sum(1 for title, body in corpus if parse_applicant_post(title, body)) > 200
+
+
+def test_extract_academics_matches_post_parser():
+    body = "GPA: 3.9 UW / 4.5 W\nACT: 35\nRank: 20/500\n- Debate captain"
+    academics = extract_academics(body)
+    profile = parse_applicant_post("Results", body + "\nAccepted: MIT")
+    assert academics["gpa_unweighted"] == 3.9 == profile.gpa_unweighted
+    assert academics["act"] == 35 == profile.act
+    assert academics["class_rank_percentile"] == profile.class_rank_percentile
+
+
+def test_stats_do_not_match_across_lines():
+    # "app" then a numbered bullet used to read as "AP 2"
+    body = "Activities:\n1. Lead developer for school app\n2) Director of theater\nAP: 6\nAccepted: Rice University"
+    profile = parse_applicant_post("Results", body)
+    assert profile.ap_count == 6 == extract_academics(body)["ap_count"]
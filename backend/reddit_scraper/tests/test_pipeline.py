@@ -0,0 +1,168 @@
+import csv
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from reddit_scraper.pipeline import (
+    SOURCES,
+    ChunkedCsvWriter,
+    ListingClient,
+    RateLimiter,
+    ScrapeState,
+    run_incremental,
+)
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class FakeListingServer:
+    """Serves recorded posts as Reddit-style JSON listings (newest first, paginated)."""
+
+    def __init__(self, posts, page_size=2):
+        self.posts = list(posts)
+        self.page_size = page_size
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                subreddit = url.path.split("/")[2]
+                items = sorted(
+                    (p for p in server.posts if p["subreddit"] == subreddit),
+                    key=lambda p: p["created_utc"],
+                    reverse=True,
+                )
+                after = params.get("after", [None])[0]
+                start = 0
+                if after:
+                    ids = [f"t3_{p['id']}" for p in items]
+                    start = ids.index(after) + 1 if after in ids else len(items)
+                page = items[start : start + server.page_size]
+                next_after = f"t3_{page[-1]['id']}" if start + server.page_size < len(items) and page else None
+                body = json.dumps(
+                    {"kind": "Listing", "data": {"after": next_after, "children": [{"kind": "t3", "data": p} for p in page]}}
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def recorded_posts():
+    return json.loads((FIXTURES / "reddit_listing_posts.json").read_text())
+
+
+def _run(server, tmp_path, workers=0):
+    client = ListingClient(base_url=server.base_url, rate_limiter=RateLimiter(0), page_size=server.page_size)
+    state = ScrapeState(str(tmp_path / "state.sqlite"))
+    writer = ChunkedCsvWriter(str(tmp_path / "out"), chunk_rows=4)
+    try:
+        stats = run_incremental(list(SOURCES.values()), client, state, writer, limit=50, workers=workers)
+        seen = state.seen_count()
+    finally:
+        state.close()
+    return stats, writer, seen
+
+
+def _read_rows(paths):
+    rows = []
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            rows.extend(csv.DictReader(f))
+    return rows
+
+
+def test_incremental_rerun_only_processes_new_posts(recorded_posts, tmp_path):
+    with FakeListingServer(recorded_posts) as server:
+        stats, writer, seen = _run(server, tmp_path)
+        first_rows = _read_rows(writer.paths)
+        assert all(s["error"] is None for s in stats.values())
+        # Link post and keyword-less chanceme post are filtered out before parsing
+        assert seen == 6
+        assert stats["chanceme_results"]["new"] == 1
+        assert len(writer.paths) > 1  # chunked at 4 rows
+        assert {"Stanford University", "Harvard University"} <= {r["college_name"] for r in first_rows}
+
+        stats, writer, seen = _run(server, tmp_path)
+        assert writer.rows_written == 0 and writer.paths == []
+        assert sum(s["new"] for s in stats.values()) == 0
+        assert seen == 6
+
+        server.posts.append(
+            {
+                "id": "cr999",
+                "subreddit": "collegeresults",
+                "created_utc": 1800000000.0,
+                "is_self": True,
+                "permalink": "/r/collegeresults/comments/cr999/",
+                "title": "Late results",
+                "selftext": "GPA: 3.7\nAccepted: Rice University\n",
+            }
+        )
+        stats, writer, seen = _run(server, tmp_path)
+        assert stats["collegeresults"]["new"] == 1
+        assert [r["college_name"] for r in _read_rows(writer.paths)] == ["Rice University"]
+        assert seen == 7
+
+    # Earlier chunks were never rewritten
+    assert len(list((tmp_path / "out").glob("*.csv"))) > len(writer.paths)
+
+
+def test_limited_runs_resume_below_the_newest_post(recorded_posts, tmp_path):
+    source = SOURCES["collegeresults"]
+    accepted = ["cr004", "cr002", "cr001"]  # newest first; cr003 is a link post
+
+    def run_limited():
+        client = ListingClient(base_url=server.base_url, rate_limiter=RateLimiter(0), page_size=server.page_size)
+        state = ScrapeState(str(tmp_path / "state.sqlite"))
+        writer = ChunkedCsvWriter(str(tmp_path / "out"))
+        try:
+            stats = run_incremental([source], client, state, writer, limit=1, workers=0)
+            return stats[source.name]["new"], state.high_water(source.name), state.seen_count()
+        finally:
+            state.close()
+
+    with FakeListingServer(recorded_posts) as server:
+        # A walk stopped by the limit leaves the mark alone, so the next run picks up below it
+        assert run_limited() == (1, 0.0, 1)
+        assert run_limited() == (1, 0.0, 2)
+        # The oldest post ends the listing: this walk is complete and the mark moves to the newest post
+        assert run_limited() == (1, 1700000400.0, len(accepted))
+        assert run_limited() == (0, 1700000400.0, len(accepted))
+
+
+def test_process_pool_matches_inline_parsing(recorded_posts, tmp_path):
+    with FakeListingServer(recorded_posts) as server:
+        _, inline_writer, _ = _run(server, tmp_path / "inline", workers=0)
+        _, pool_writer, _ = _run(server, tmp_path / "pool", workers=2)
+    # Sources are fetched concurrently, so only the row multiset is stable across runs
+    key = lambda r: json.dumps(r, sort_keys=True)
+    assert sorted(_read_rows(pool_writer.paths), key=key) == sorted(_read_rows(inline_writer.paths), key=key)
@@ -3,6 +3,10 @@
 Enhanced Calibration System for Elite University Probabilities
 Uses statistical analysis and known acceptance rates to create realistic probabilities
 without needing Quora data.
+
+Superseded at inference by the learned calibration maps
+(`python -m ml.models.calibration_maps`); these factors are only used when
+data/models/calibration_maps.npz is absent.
 """
 
 import json
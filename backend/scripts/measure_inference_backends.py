@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Single-row and batch latency of each inference backend (ml.models.inference_backends).
+
+For every model in the model directory, each backend is built (the numpy
+one is verified against sklearn first, exactly as at server startup) and
+timed on raw feature rows of several batch sizes, with and without factor
+contributions. Reports the median latency per call and per row.
+
+Artifacts may be the shipped ``.joblib.gz`` files; they are read directly.
+Run from `backend/`:
+
+    python scripts/measure_inference_backends.py
+    python scripts/measure_inference_backends.py --batch-sizes 1 8 32 --json backend_report.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import warnings
+from pathlib import Path
+from typing import Dict, List
+
+import joblib
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from ml.models.inference_backends import SklearnBackend, build_backend, probe_features, verify_backend  # noqa: E402
+from ml.preprocessing.feature_extractor import FeatureExtractor  # noqa: E402
+
+MODEL_NAMES = ['logistic_regression', 'random_forest', 'xgboost', 'ensemble']
+
+
+def _load(model_dir: Path, name: str):
+    for suffix in ('.joblib', '.joblib.gz'):
+        path = model_dir / f"{name}{suffix}"
+        if path.exists():
+            return joblib.load(path)
+    return None
+
+
+def _median_seconds(call, repeats: int) -> float:
+    call()  # warm-up
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def measure(model_dir: Path, batch_sizes: List[int], repeats: int) -> Dict:
+    selector = _load(model_dir, 'feature_selector')
+    scaler = _load(model_dir, 'scaler')
+    if scaler is None:
+        raise SystemExit(f"No scaler in {model_dir}")
+    n_inputs = len(FeatureExtractor.get_feature_names())
+    probe = probe_features(selector, scaler, n_inputs, rows=max(batch_sizes))
+
+    report = {}
+    for name in MODEL_NAMES:
+        model = _load(model_dir, name)
+        if model is None:
+            continue
+        reference = SklearnBackend(model, selector, scaler)
+        started = time.perf_counter()
+        flattened = build_backend('numpy', model, selector, scaler, n_inputs)
+        build_seconds = time.perf_counter() - started
+        entry = {'model': type(model).__name__, 'numpy_build_seconds': round(build_seconds, 3), 'backends': {}}
+        backends = {'sklearn': reference}
+        if flattened is not reference:
+            backends['numpy'] = flattened
+            prob_error, contribution_error = verify_backend(flattened, reference, probe)
+            entry['max_probability_error'] = prob_error
+            entry['max_contribution_error'] = contribution_error
+        for backend_name, backend in backends.items():
+            rows = {}
+            for size in batch_sizes:
+                batch = probe[:size]
+                plain = _median_seconds(lambda: backend.predict(batch), repeats)
+                explained = _median_seconds(lambda: backend.predict(batch, explain=True), repeats)
+                rows[size] = {
+                    'ms_per_call': round(plain * 1e3, 3),
+                    'us_per_row': round(plain / size * 1e6, 1),
+                    'ms_per_call_explained': round(explained * 1e3, 3),
+                }
+            entry['backends'][backend_name] = rows
+        report[name] = entry
+    return report
+
+
+def _print(report: Dict) -> None:
+    for name, entry in report.items():
+        print(f"\n{name} ({entry['model']})")
+        if 'max_probability_error' in entry:
+            print(
+                f"  numpy verified: max |dp| {entry['max_probability_error']:.1e}, "
+                f"max |dcontrib| {entry['max_contribution_error']:.1e}, built in {entry['numpy_build_seconds']}s"
+            )
+        else:
+            print("  numpy: not supported for this model (sklearn only)")
+        print(f"  {'backend':<8} {'rows':>6} {'ms/call':>10} {'us/row':>10} {'ms/call+explain':>16}")
+        for backend_name, rows in entry['backends'].items():
+            for size, timing in rows.items():
+                print(
+                    f"  {backend_name:<8} {size:>6} {timing['ms_per_call']:>10.3f} "
+                    f"{timing['us_per_row']:>10.1f} {timing['ms_per_call_explained']:>16.3f}"
+                )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model-dir', type=Path, default=BACKEND_DIR / 'data' / 'models')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 10, 50, 500])
+    parser.add_argument('--repeats', type=int, default=50)
+    parser.add_argument('--json', type=Path, help="also write the report here")
+    args = parser.parse_args()
+    warnings.filterwarnings('ignore', category=UserWarning)
+
+    report = measure(args.model_dir, args.batch_sizes, args.repeats)
+    if not report:
+        print(f"No models found in {args.model_dir}")
+        return 1
+    _print(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"\nWrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Google sign-in latency with a large user base, before/after services.identity_service.
+
+A SQLite ``users``/``user_profiles`` database and loadtest.fakes'
+Supabase admin stand-in are seeded with the same N accounts. Then, per case,
+the ``/api/auth/google-oauth`` handler is called for random existing users:
+
+- legacy:   the old resolution (``admin.list_users()`` + scan for the email)
+- cold:     identity cache empty, indexed lookup in the users table
+- warm:     identity cache hit
+- new user: unknown account, one ``admin.create_user`` + users-table insert
+
+and the number of Supabase admin calls per case is checked (none for known
+users). Supabase latency defaults to loadtest's 40 +/- 10 ms.
+
+Run from `backend/`:
+
+    python scripts/measure_oauth_login.py
+    python scripts/measure_oauth_login.py --users 100000 --logins 200 --latency-scale 0
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List
+from unittest import mock
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import database.connection as connection  # noqa: E402
+from api.routes.auth import google_oauth_callback  # noqa: E402
+from database.models import User, UserProfile  # noqa: E402
+from loadtest.fakes import FakeSupabase, Latencies, _Delays  # noqa: E402
+from loadtest.runner import percentile  # noqa: E402
+from services.identity_service import identity_service  # noqa: E402
+
+
+def _seed(session_factory, supabase: FakeSupabase, count: int) -> List[Dict[str, str]]:
+    accounts = []
+    for i in range(count):
+        user_id = uuid.uuid4()
+        accounts.append({"id": user_id, "email": f"student{i:06d}@example.com", "google_id": f"g{i:09d}"})
+    with session_factory() as db:
+        db.execute(User.__table__.insert(), [
+            {**account, "provider": "google", "email_verified": True} for account in accounts
+        ])
+        db.execute(UserProfile.__table__.insert(), [
+            {"id": uuid.uuid4(), "user_id": account["id"], "email": account["email"]} for account in accounts
+        ])
+        db.commit()
+    supabase.admin.users.update({account["email"]: str(account["id"]) for account in accounts})
+    return accounts
+
+
+def _legacy_resolve(supabase: FakeSupabase, email: str):
+    existing_users = supabase.auth.admin.list_users()
+    users_list = getattr(existing_users, "users", existing_users) or []
+    for user in users_list:
+        if user.email == email:
+            return user.id
+    return None
+
+
+def _timed(name: str, calls: List[Callable[[], object]], supabase: FakeSupabase, delays: _Delays) -> Dict:
+    before = dict(delays.calls)
+    latencies = []
+    for call in calls:
+        started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - started)
+    ordered = sorted(latencies)
+    admin_calls = sum(
+        count - before.get(key, 0) for key, count in delays.calls.items() if key.startswith("supabase_admin")
+    )
+    return {
+        "case": name,
+        "logins": len(calls),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        "supabase_admin_calls": admin_calls,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--logins", type=int, default=200, help="sign-ins per case")
+    parser.add_argument("--legacy-logins", type=int, default=20, help="sign-ins for the (slow) legacy case")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="multiplier on the fake Supabase latency")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, help="write the report here")
+    args = parser.parse_args()
+
+    delays = _Delays(Latencies.parse(scale=args.latency_scale, seed=args.seed))
+    supabase = FakeSupabase(delays)
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory(prefix="chancify-oauth-") as directory, \
+            mock.patch.object(connection, "supabase", supabase), \
+            mock.patch.object(connection, "_supabase_initialized", True):
+        engine = create_engine(f"sqlite:///{Path(directory) / 'users.db'}")
+        User.metadata.create_all(engine, tables=[User.__table__, UserProfile.__table__])
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        started = time.perf_counter()
+        accounts = _seed(session_factory, supabase, args.users)
+        print(f"Seeded {args.users:,} users in {time.perf_counter() - started:.1f}s")
+
+        db = session_factory()
+
+        def login(account: Dict, name: str = "Test Student") -> Callable[[], object]:
+            def call():
+                response = asyncio.run(google_oauth_callback(account["email"], name, account["google_id"], db))
+                assert response["user"]["id"] == str(account["id"]), "resolved the wrong account"
+                db.expunge_all()
+            return call
+
+        def legacy(account: Dict) -> Callable[[], object]:
+            return lambda: _legacy_resolve(supabase, account["email"])
+
+        sample = rng.sample(accounts, min(args.logins, len(accounts)))
+        identity_service.cache.clear()
+        results = [
+            _timed("legacy list_users + scan", [legacy(a) for a in sample[: args.legacy_logins]], supabase, delays),
+            _timed("cold (users table)", [login(a) for a in sample], supabase, delays),
+            _timed("warm (identity cache)", [login(a) for a in sample], supabase, delays),
+        ]
+
+        def new_user(i: int) -> Callable[[], object]:
+            email = f"newcomer{i:06d}@example.com"
+
+            def call():
+                response = asyncio.run(google_oauth_callback(email, "New Student", f"n{i:09d}", db))
+                assert response["user"]["id"] == supabase.admin.users[email]
+                db.expunge_all()
+            return call
+
+        results.append(_timed("new user", [new_user(i) for i in range(args.logins)], supabase, delays))
+        db.close()
+        engine.dispose()
+
+    print(f"\n{'case':28s} {'logins':>7s} {'p50 ms':>10s} {'p95 ms':>10s} {'max ms':>10s} {'admin calls':>12s}")
+    for row in results:
+        print(f"{row['case']:28s} {row['logins']:7d} {row['p50_ms']:10.3f} {row['p95_ms']:10.3f} "
+              f"{row['max_ms']:10.3f} {row['supabase_admin_calls']:12d}")
+
+    by_case = {row["case"]: row for row in results}
+    ok = (
+        by_case["cold (users table)"]["supabase_admin_calls"] == 0
+        and by_case["warm (identity cache)"]["supabase_admin_calls"] == 0
+        and by_case["new user"]["supabase_admin_calls"] == args.logins
+    )
+    print("\nSupabase admin API only called on misses:", "yes" if ok else "NO")
+
+    if args.json:
+        args.json.write_text(json.dumps({"users": args.users, "results": results}, indent=2))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
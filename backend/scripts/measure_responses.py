@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Bytes on the wire and serialization CPU per request, before/after api.responses.
+
+Every payload is fetched once from the app in-process (identity encoding),
+then for each one:
+
+- CPU:   FastAPI's default path (jsonable_encoder + json.dumps, as
+         JSONResponse renders) vs api.responses.render_json (orjson)
+- bytes: identity body vs gzip (level 6) vs brotli (quality 4), as sent
+         by CompressionMiddleware; a revalidated catalog GET (If-None-Match
+         with the ETag) costs a bodiless 304
+
+Run from `backend/`:
+
+    python scripts/measure_responses.py
+    python scripts/measure_responses.py --repeat 2000 --json response_report.json
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from api.responses import brotli, orjson, render_json  # noqa: E402
+
+
+def _per_call_us(fn: Callable[[], object], repeat: int) -> float:
+    fn()
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) / repeat * 1e6
+
+
+def _default_render(content) -> bytes:
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _requests() -> List[Dict]:
+    from main import service_registry
+
+    names = service_registry.get("college_tuition_service").table.names
+    return [
+        {"name": "tuition (1 college)", "method": "GET", "path": "/api/college-tuition/Stanford%20University"},
+        {"name": "subject emphasis", "method": "GET", "path": "/api/college-subject-emphasis/Stanford%20University"},
+        {"name": "search", "method": "GET", "path": "/api/search/colleges?q=stanford"},
+        {
+            "name": "tuition batch (200)",
+            "method": "POST",
+            "path": "/api/college-tuition/batch",
+            "json": {"colleges": names[:200], "zipcode": "02139"},
+        },
+        {
+            "name": "predict/frontend",
+            "method": "POST",
+            "path": "/api/predict/frontend",
+            "json": {
+                "gpa_unweighted": "3.8", "sat": "1450", "act": "", "rigor": "8",
+                "extracurricular_depth": "7", "leadership_positions": "6", "awards_publications": "5",
+                "essay_quality": "7", "recommendations": "7", "interview": "6",
+                "demonstrated_interest": "6", "college": "Stanford University", "major": "Computer Science",
+            },
+        },
+        {
+            "name": "portfolio (20)",
+            "method": "POST",
+            "path": "/api/portfolio/simulate",
+            "json": {"profile": {"gpa_unweighted": "3.8", "sat": "1450"}, "colleges": names[:20], "draws": 20000, "seed": 1},
+        },
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure response bytes and serialization CPU")
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--ready-timeout", type=float, default=300.0)
+    parser.add_argument("--json", help="Write the full report to this path")
+    args = parser.parse_args()
+
+    from fastapi.testclient import TestClient
+    import main as app_module
+
+    results = []
+    with TestClient(app_module.app) as client:
+        deadline = time.monotonic() + args.ready_timeout
+        while client.get("/api/ready").status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.5)
+
+        for spec in _requests():
+            response = client.request(
+                spec["method"], spec["path"], json=spec.get("json"), headers={"accept-encoding": "identity"}
+            )
+            if response.status_code != 200:
+                print(f"skipping {spec['name']}: HTTP {response.status_code}")
+                continue
+            content = response.json()
+            body = response.content
+            etag = response.headers.get("etag")
+            revalidated = None
+            if etag:
+                revalidated = client.request(spec["method"], spec["path"], headers={"if-none-match": etag})
+
+            results.append({
+                "endpoint": spec["name"],
+                "default_us": _per_call_us(lambda: _default_render(content), args.repeat),
+                "orjson_us": _per_call_us(lambda: render_json(content), args.repeat) if orjson else None,
+                "identity_bytes": len(body),
+                "gzip_bytes": len(gzip.compress(body, compresslevel=6, mtime=0)),
+                "br_bytes": len(brotli.compress(body, quality=4)) if brotli else None,
+                "gzip_us": _per_call_us(lambda: gzip.compress(body, compresslevel=6, mtime=0), args.repeat // 10 or 1),
+                "br_us": _per_call_us(lambda: brotli.compress(body, quality=4), args.repeat // 10 or 1) if brotli else None,
+                "not_modified": revalidated is not None and revalidated.status_code == 304,
+            })
+
+    fmt = lambda v, spec: format(v, spec) if v is not None else "-"
+    print(
+        f"{'endpoint':<22} {'default us':>10} {'orjson us':>10} {'identity B':>11} {'gzip B':>8} "
+        f"{'br B':>8} {'gzip us':>8} {'br us':>8} {'304':>5}"
+    )
+    for r in results:
+        print(
+            f"{r['endpoint']:<22} {r['default_us']:>10.1f} {fmt(r['orjson_us'], '>10.1f')} {r['identity_bytes']:>11} "
+            f"{r['gzip_bytes']:>8} {fmt(r['br_bytes'], '>8')} {r['gzip_us']:>8.1f} {fmt(r['br_us'], '>8.1f')} "
+            f"{'yes' if r['not_modified'] else '-':>5}"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"\nFull report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Memory and throughput of the single-process uvicorn setup vs prefork_server.py.
+
+For each setup the server is started on a free port, warmed until /api/ready
+returns 200, driven with concurrent keep-alive clients for a fixed time, and
+then every process in its tree is sampled from /proc/<pid>/smaps_rollup:
+
+- RSS:  resident pages, counting shared pages in full in every process
+- PSS:  shared pages divided among the processes sharing them (sums to real use)
+- USS:  pages private to the process (what a worker costs on top of the master)
+
+Linux only. Run from `backend/`:
+
+    python scripts/measure_workers.py --workers 4 --duration 20
+    python scripts/measure_workers.py --json worker_report.json
+"""
+
+import argparse
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_PATHS = [
+    "/api/search/colleges?q=stanford",
+    "/api/search/colleges?q=michigan",
+    "/api/college-tuition/Stanford%20University",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _children(pid: int) -> List[int]:
+    children = []
+    for task in Path(f"/proc/{pid}/task").glob("*"):
+        try:
+            children.extend(int(child) for child in (task / "children").read_text().split())
+        except OSError:
+            continue
+    return children
+
+
+def _process_tree(pid: int) -> List[Dict]:
+    """Every process under ``pid`` with its memory; leaves are the processes serving requests."""
+    children = _children(pid)
+    processes = [dict(_memory(pid), serving=not children)]
+    for child in children:
+        processes.extend(_process_tree(child))
+    return processes
+
+
+def _memory(pid: int) -> Dict:
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        key, value = line.split(":", 1)
+        fields[key] = int(value.split()[0])  # kB
+    return {
+        "pid": pid,
+        "rss_mb": fields.get("Rss", 0) / 1024,
+        "pss_mb": fields.get("Pss", 0) / 1024,
+        "uss_mb": (fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)) / 1024,
+    }
+
+
+def _wait_ready(port: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            conn.request("GET", "/api/ready")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"Server on port {port} did not become ready in {timeout:.0f}s")
+
+
+def drive_load(port: int, paths: List[str], concurrency: int, duration: float) -> Dict:
+    """Each client thread keeps one connection open and cycles through ``paths``."""
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client(offset: int):
+        nonlocal errors
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        mine, failed, i = [], 0, offset
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                conn.request("GET", paths[i % len(paths)])
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    failed += 1
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            mine.append(time.perf_counter() - start)
+            i += 1
+        with lock:
+            latencies.extend(mine)
+            errors += failed
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else 0.0
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "requests_per_sec": len(latencies) / elapsed,
+        "p50_ms": pick(0.50),
+        "p99_ms": pick(0.99),
+    }
+
+
+def measure(name: str, command: List[str], port: int, args) -> Dict:
+    proc = subprocess.Popen(
+        command, cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True,
+    )
+    try:
+        _wait_ready(port, args.ready_timeout)
+        drive_load(port, args.paths, args.concurrency, min(3.0, args.duration))  # warm-up
+        load = drive_load(port, args.paths, args.concurrency, args.duration)
+        processes = _process_tree(proc.pid)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=60)
+
+    serving = [p for p in processes if p["serving"]]
+    return {
+        "setup": name,
+        "command": " ".join(command),
+        "load": load,
+        "processes": processes,
+        "serving_processes": len(serving),
+        "total_pss_mb": sum(p["pss_mb"] for p in processes),
+        "rss_per_worker_mb": sum(p["rss_mb"] for p in serving) / max(1, len(serving)),
+        "uss_per_worker_mb": sum(p["uss_mb"] for p in serving) / max(1, len(serving)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare single-worker uvicorn with the pre-fork server")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--ready-timeout", type=float, default=300.0)
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS)
+    parser.add_argument("--json", help="Write the full report to this path")
+    args = parser.parse_args()
+
+    single_port, prefork_port = _free_port(), _free_port()
+    results = [
+        measure(
+            "uvicorn (1 worker)",
+            [sys.executable, "-m", "uvicorn", "main:app", "--port", str(single_port), "--workers", "1", "--log-level", "warning"],
+            single_port, args,
+        ),
+        measure(
+            f"prefork ({args.workers} workers)",
+            [sys.executable, "prefork_server.py", "--port", str(prefork_port), "--workers", str(args.workers), "--log-level", "warning"],
+            prefork_port, args,
+        ),
+    ]
+
+    print(f"{'setup':<24} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7} {'RSS/worker':>11} {'USS/worker':>11} {'total PSS':>10}")
+    for r in results:
+        load = r["load"]
+        print(
+            f"{r['setup']:<24} {load['requests_per_sec']:>8.0f} {load['p50_ms']:>8.1f} {load['p99_ms']:>8.1f} "
+            f"{load['errors']:>7} {r['rss_per_worker_mb']:>9.0f}MB {r['uss_per_worker_mb']:>9.0f}MB {r['total_pss_mb']:>8.0f}MB"
+        )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+        print(f"\nFull report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
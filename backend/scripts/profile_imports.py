@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Import-time profile of the API process.
+
+Runs `python -X importtime` on a fresh interpreter importing `main` (or any
+module), then reports the slowest modules by cumulative time and the
+self-time total per top-level package, so it is obvious which dependency
+dominates cold start. With --services the lazily registered services are also
+loaded and their load times from the service registry are reported.
+
+Run from `backend/`:
+
+    python scripts/profile_imports.py
+    python scripts/profile_imports.py --services --json import_profile.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+SERVICES_SNIPPET = """
+import json, sys
+from {module} import service_registry
+service_registry.start_background()
+service_registry.wait()
+sys.stderr.write("SERVICE_STATUS " + json.dumps(service_registry.status()) + "\\n")
+"""
+
+
+def profile_imports(module: str = "main", load_services: bool = False) -> Dict:
+    """Import ``module`` in a child interpreter and parse its -X importtime output."""
+    code = SERVICES_SNIPPET.format(module=module) if load_services else f"import {module}"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(BACKEND_DIR), os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    modules: List[Dict] = []
+    services = None
+    for line in proc.stderr.splitlines():
+        if line.startswith("SERVICE_STATUS "):
+            services = json.loads(line[len("SERVICE_STATUS "):])
+            continue
+        m = IMPORTTIME_LINE.match(line)
+        if m:
+            self_us, cumulative_us, indent, name = m.groups()
+            modules.append({
+                "module": name,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": len(indent) // 2,
+            })
+
+    by_package: Dict[str, float] = defaultdict(float)
+    for entry in modules:
+        by_package[entry["module"].split(".")[0]] += entry["self_ms"]
+
+    return {
+        "target": module,
+        "total_ms": sum(entry["self_ms"] for entry in modules),
+        "modules": sorted(modules, key=lambda e: e["cumulative_ms"], reverse=True),
+        "packages": dict(sorted(by_package.items(), key=lambda kv: kv[1], reverse=True)),
+        "services": services,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report which imports dominate API cold start")
+    parser.add_argument("--module", default="main", help="Module to import (default: main)")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--services", action="store_true", help="Also load registered services and report their load times")
+    parser.add_argument("--json", help="Write the full report to this path")
+    args = parser.parse_args()
+
+    report = profile_imports(args.module, load_services=args.services)
+
+    print(f"Import of '{report['target']}': {report['total_ms']:.0f} ms total\n")
+    print(f"{'package':<32} {'self ms':>10}")
+    for package, ms in list(report["packages"].items())[:args.top]:
+        print(f"{package:<32} {ms:>10.1f}")
+
+    print(f"\n{'module':<56} {'cumulative ms':>14} {'self ms':>10}")
+    for entry in report["modules"][:args.top]:
+        print(f"{entry['module']:<56} {entry['cumulative_ms']:>14.1f} {entry['self_ms']:>10.1f}")
+
+    if report["services"]:
+        print(f"\n{'service':<32} {'status':>8} {'load ms':>10}")
+        for name, info in sorted(report["services"]["services"].items(), key=lambda kv: -(kv[1]["load_ms"] or 0)):
+            print(f"{name:<32} {info['status']:>8} {info['load_ms'] or 0:>10.1f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+        print(f"\nFull report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
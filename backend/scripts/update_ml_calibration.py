@@ -2,6 +2,10 @@
 """
 Update ML model calibration based on Quora analysis to make elite university
 probabilities more realistic.
+
+Superseded at inference by the learned calibration maps
+(`python -m ml.models.calibration_maps`); these factors are only used when
+data/models/calibration_maps.npz is absent.
 """
 
 import json
@@ -0,0 +1,296 @@
+"""
+Local-first parsing of pasted application documents (/api/openai/parse-application).
+
+1. local: the regex extractors shared with the Reddit scraper
+   (``reddit_scraper.parse_post``) plus a few document-specific guards
+   (labelled weighted/unweighted GPAs, explicit AP/honors course counts, SAT
+   section scores that aren't composites), and the document's activity /
+   bullet lines as MISC items.
+2. llm: ``CollegeInfoService.parse_application_document``, asked only for
+   the fields the document mentions but the local stage couldn't read, and
+   for MISC segmentation when the document is prose with no bullet lines.
+
+Results are cached by SHA-256 of the document text, so re-submitting a
+document (the frontend re-parses on every edit/paste) costs nothing. The
+response reports which stage produced each field in ``sources``.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from reddit_scraper.parse_post import extract_academics, extract_activity_lines
+
+logger = logging.getLogger(__name__)
+
+FIELDS = [
+    "gpa_weighted", "gpa_unweighted", "sat", "act", "ap_count",
+    "honors_count", "class_rank_percentile", "class_size",
+]
+
+# Patterns stay within one line ([ \t], not \s): a number ending one line
+# must not pair with a label starting the next.
+
+# Labelled GPAs: "Weighted GPA: 4.48", "Unweighted cumulative GPA 3.92",
+# "GPA (UW): 3.9", "GPA: 4.5 (weighted)", and the second value of
+# "GPA: 3.9 UW / 4.5 W"
+LABELLED_GPA = [
+    re.compile(r"\b(?P<label>unweighted|weighted)[ \t]+(?:cumulative[ \t]+)?gpa[ \t]*[:\-]?[ \t]*(?P<value>\d\.\d{1,3})", re.IGNORECASE),
+    re.compile(r"\bgpa[ \t]*\([ \t]*(?P<label>unweighted|weighted|uw|w)[ \t]*\)[ \t]*[:\-]?[ \t]*(?P<value>\d\.\d{1,3})", re.IGNORECASE),
+    re.compile(r"\bgpa[ \t]*[:\-]?[ \t]*(?P<value>\d\.\d{1,3})[ \t]*\(?[ \t]*(?P<label>unweighted|weighted|uw|w)\b", re.IGNORECASE),
+    re.compile(r"\bgpa\b[^\n]*?[/,][ \t]*(?P<value>\d\.\d{1,3})[ \t]*\(?[ \t]*(?P<label>unweighted|weighted|uw|w)\b", re.IGNORECASE),
+]
+# "GPA 3.7/4.0", "GPA: 4.3 out of 5": a GPA on a stated scale (4 -> unweighted, 5 -> weighted)
+GPA_ON_SCALE = re.compile(
+    r"\bgpa\b[^\d\n]{0,12}(?P<value>\d\.\d{1,3})[ \t]*(?:/|out[ \t]+of)[ \t]*(?P<scale>[45])(?:\.0{1,2})?(?![\d.])",
+    re.IGNORECASE,
+)
+AP_COUNT = [
+    re.compile(r"\b(\d{1,2})[ \t]+AP[ \t]+(?:courses|classes|exams)\b", re.IGNORECASE),
+    re.compile(r"\bAP[ \t]+(?:courses|classes)(?:[ \t]+taken)?[ \t]*[:\-][ \t]*(\d{1,2})\b", re.IGNORECASE),
+]
+HONORS_COUNT = [
+    re.compile(r"\b(\d{1,2})[ \t]+honors[ \t]+(?:courses|classes)\b", re.IGNORECASE),
+    re.compile(r"\bhonors[ \t]+(?:courses|classes)(?:[ \t]+taken)?[ \t]*[:\-][ \t]*(\d{1,2})\b", re.IGNORECASE),
+]
+# Named AP courses ("AP Calculus BC", "AP US History"), counted when no total
+# is given; "AP Scholar" is an award, not a course
+AP_COURSE = re.compile(
+    r"\bAP[ \t]+(?!(?:Courses?|Classes|Exams?|Scores?|Scholars?)\b)([A-Z][A-Za-z.&]*(?:[ \t]+[A-Z][A-Za-z.&]*)?)"
+)
+RANK_OF = re.compile(r"\brank(?:ed)?[^\d\n]{0,12}(\d{1,4})[ \t]*(?:/|of|out of)[ \t]*(\d{1,5})", re.IGNORECASE)
+
+GPA_MENTION = re.compile(r"\bgpa\b", re.IGNORECASE)
+# A field is worth asking the LLM for only if the document mentions it
+# (a GPA of either kind is only asked for when the document names that kind)
+MENTIONS = {
+    "gpa_unweighted": re.compile(r"\bunweighted\b|\bUW\b", re.IGNORECASE),
+    "gpa_weighted": re.compile(r"(?<!un)weighted\b|\bgpa[ \t]*\(?[ \t]*W\b|\d\.\d{1,3}[ \t]*\(?[ \t]*W\b", re.IGNORECASE),
+    "sat": re.compile(r"\bSAT\b"),
+    "act": re.compile(r"\bACT\b"),
+    "ap_count": re.compile(r"\bAP\b"),
+    "honors_count": re.compile(r"\bhonors[ \t]+(?:courses|classes)\b", re.IGNORECASE),
+    "class_rank_percentile": re.compile(r"\bclass rank\b|\brank(?:ed)?[ \t]*(?:in (?:my |the )?class[ \t]*)?[:#]?[ \t]*\d", re.IGNORECASE),
+    "class_size": re.compile(r"\bclass size\b|\bstudents in (?:my|the) (?:graduating )?class\b", re.IGNORECASE),
+}
+# Lines that are the stats themselves (including AP / honors course counts), not activities
+STAT_LINE = re.compile(
+    r"\b(?:gpa|sat|act|rank(?:ed)?|class size)\b"
+    r"|\b\d{1,2}[ \t]+(?:AP|honors)[ \t]+(?:courses|classes|exams)\b"
+    r"|\b(?:AP|honors)[ \t]+(?:courses|classes)(?:[ \t]+taken)?[ \t]*[:\-]",
+    re.IGNORECASE,
+)
+# Prose this long without bullet lines is left to the LLM to segment
+MISC_PROSE_MIN_CHARS = 400
+MISC_ITEM_MAX_CHARS = 150
+
+
+def document_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _format(value) -> str:
+    if isinstance(value, float):
+        return f"{round(value, 2):g}"
+    return str(value)
+
+
+def _first_count(patterns: List[re.Pattern], text: str, hi: int = 50) -> Optional[int]:
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match and 0 <= int(match.group(1)) <= hi:
+            return int(match.group(1))
+    return None
+
+
+def _lines_mentioning(pattern: re.Pattern, text: str) -> str:
+    return "\n".join(line for line in text.splitlines() if pattern.search(line))
+
+
+def _local_gpa(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """(unweighted, weighted): labelled values first, then a GPA on a stated scale, then the shared extractor on GPA lines."""
+    unweighted = weighted = None
+    for pattern in LABELLED_GPA:
+        for match in pattern.finditer(text):
+            label = match.group("label").lower()
+            value = float(match.group("value"))
+            if label in ("unweighted", "uw"):
+                unweighted = unweighted if unweighted is not None else value
+            else:
+                weighted = weighted if weighted is not None else value
+    if unweighted is None and weighted is None:
+        match = GPA_ON_SCALE.search(text)
+        if match:
+            if match.group("scale") == "4":
+                unweighted = float(match.group("value"))
+            else:
+                weighted = float(match.group("value"))
+    if unweighted is None and weighted is None:
+        gpa_lines = _lines_mentioning(GPA_MENTION, text)
+        if gpa_lines:
+            found = extract_academics(gpa_lines)
+            unweighted, weighted = found["gpa_unweighted"], found["gpa_weighted"]
+    # An "unweighted" GPA above 4.0 is a weighted one
+    if unweighted is not None and unweighted > 4.0 and weighted is None:
+        unweighted, weighted = None, unweighted
+    if unweighted is not None and not 0.0 < unweighted <= 4.0:
+        unweighted = None
+    if weighted is not None and not 0.0 < weighted <= 5.0:
+        weighted = None
+    return unweighted, weighted
+
+
+def parse_local(text: str) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Fields and MISC items readable without a model.
+
+    Returns:
+        (updates as strings keyed like FIELDS, misc items)
+    """
+    shared = extract_academics(text)
+    values: Dict[str, Any] = dict.fromkeys(FIELDS)
+    values["gpa_unweighted"], values["gpa_weighted"] = _local_gpa(text)
+    # Test scores only from lines naming the test; a lone SAT number up to
+    # 800 is a section score, not the composite
+    sat = extract_academics(_lines_mentioning(MENTIONS["sat"], text))["sat"]
+    values["sat"] = sat if sat is not None and sat > 800 else None
+    values["act"] = extract_academics(_lines_mentioning(MENTIONS["act"], text))["act"]
+    values["ap_count"] = _first_count(AP_COUNT, text)
+    if values["ap_count"] is None:
+        courses = {course.lower() for course in AP_COURSE.findall(text)}
+        values["ap_count"] = len(courses) if courses else shared["ap_count"]
+    values["honors_count"] = _first_count(HONORS_COUNT, text)
+    values["class_rank_percentile"] = shared["class_rank_percentile"]
+    values["class_size"] = shared["class_size"]
+    if values["class_rank_percentile"] is None:
+        match = RANK_OF.search(text)
+        if match and 0 < int(match.group(1)) <= int(match.group(2)):
+            values["class_rank_percentile"] = int(match.group(1)) / int(match.group(2)) * 100
+            values["class_size"] = int(match.group(2))
+
+    misc: List[str] = []
+    seen = set()
+    for line in extract_activity_lines(text):
+        item = " ".join(line.split())[:MISC_ITEM_MAX_CHARS]
+        key = item.lower()
+        if len(item) < 4 or STAT_LINE.search(item) or key in seen:
+            continue
+        seen.add(key)
+        misc.append(item)
+
+    updates = {field: _format(value) for field, value in values.items() if value is not None}
+    return updates, misc
+
+
+def fields_for_llm(text: str, updates: Dict[str, str]) -> List[str]:
+    """Fields the document mentions that the local stage didn't read."""
+    fields = [field for field in FIELDS if field not in updates and MENTIONS[field].search(text)]
+    has_gpa = "gpa_unweighted" in updates or "gpa_weighted" in updates
+    if not has_gpa and GPA_MENTION.search(text):
+        fields += [field for field in ("gpa_weighted", "gpa_unweighted") if field not in fields]
+    return fields
+
+
+class ApplicationParser:
+    """Local extractor, then the LLM for what's left, behind a content-hash cache."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"documents": 0, "cache_hits": 0, "local_only": 0, "llm_calls": 0}
+
+    def _cached(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def _store(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def parse(self, document_text: str) -> Dict[str, Any]:
+        """
+        Parse a document; same response shape as the LLM-only parser plus
+        ``sources`` (field -> "local" | "llm") and ``cached``.
+        """
+        self.stats["documents"] += 1
+        key = document_hash(document_text)
+        cached = self._cached(key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return {**cached, "cached": True}
+
+        updates, misc = parse_local(document_text)
+        sources = dict.fromkeys(updates, "local")
+        if misc:
+            sources["misc"] = "local"
+        llm_fields = fields_for_llm(document_text, updates)
+        needs_misc = not misc and len(document_text.strip()) >= MISC_PROSE_MIN_CHARS
+
+        error = None
+        if llm_fields or needs_misc:
+            from services.openai_service import college_info_service
+
+            self.stats["llm_calls"] += 1
+            llm = await college_info_service.parse_application_document(
+                document_text, fields=llm_fields, include_misc=needs_misc
+            )
+            if llm.get("success"):
+                for field, value in llm.get("updates", {}).items():
+                    updates[field] = value
+                    sources[field] = "llm"
+                if llm.get("misc"):
+                    misc = llm["misc"]
+                    sources["misc"] = "llm"
+            else:
+                error = llm.get("error")
+                logger.info(f"LLM stage unavailable for application document ({error}); returning local results")
+        else:
+            self.stats["local_only"] += 1
+
+        result: Dict[str, Any] = {
+            "success": bool(updates or misc) or error is None,
+            "updates": updates,
+            "misc": misc,
+            "sources": sources,
+        }
+        if error is not None:
+            result["error"] = error
+        else:
+            # A failed LLM stage is retried on the next submission
+            self._store(key, result)
+        return {**result, "cached": False}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        documents = self.stats["documents"]
+        network_free = self.stats["cache_hits"] + self.stats["local_only"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "network_free_rate": round(network_free / documents, 4) if documents else None,
+        }
+
+
+def _build_parser() -> ApplicationParser:
+    try:
+        from config import settings
+        return ApplicationParser(settings.application_parse_cache_size)
+    except Exception:
+        return ApplicationParser()
+
+
+# Global instance
+application_parser = _build_parser()
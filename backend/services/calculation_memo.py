@@ -0,0 +1,202 @@
+"""
+Memoized probability calculations.
+
+A calculation is identified by (snapshot hash, college_id, calculation
+version), where the snapshot hash covers every input the result was computed
+from: the profile's factor scores and the college's inputs (acceptance rate,
+testing and need policy). Results live in the ``probability_calculations``
+table and, per profile, in a bounded in-process LRU. A repeat request is
+served from memory, then from the table, and only computed on a miss.
+
+Saving a profile's academic data or extracurriculars drops that profile's
+in-process entries (SQLAlchemy mapper events below). Stored rows don't need
+invalidating: new profile data or an updated college produces a new
+snapshot hash.
+
+    inputs = college_inputs(college)
+    memo_key = calculation_memo.key(profile.id, college.id, factor_scores, inputs)
+    result = calculation_memo.get(db, memo_key)
+    if result is None:
+        ...compute...
+        calculation_memo.put(db, memo_key, factor_scores, result)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from database.models import AcademicData, Extracurricular, ProbabilityCalculation
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever profile_to_factor_scores or the scoring pipeline changes results
+CALCULATION_VERSION = "1.0"
+
+
+@dataclass(frozen=True)
+class MemoKey:
+    profile_id: Any
+    college_id: Any
+    profile_hash: str
+    version: str = CALCULATION_VERSION
+
+
+def college_inputs(college: Any) -> Dict[str, Any]:
+    """The college fields a probability calculation reads, as calculate_admission_probability arguments"""
+    return {
+        "acceptance_rate": float(college.acceptance_rate) if college.acceptance_rate else 0.1,
+        "uses_testing": college.test_policy != "Blind",
+        "need_aware": college.financial_aid_policy == "Need-aware",
+    }
+
+
+def snapshot_hash(factor_scores: Dict[str, float], college: Optional[Dict[str, Any]] = None) -> str:
+    """Stable hash of a factor-score snapshot and the college inputs it was scored against"""
+    snapshot = factor_scores if college is None else {"factors": factor_scores, "college": college}
+    canonical = json.dumps(snapshot, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CalculationMemo:
+    """Per-profile LRU in front of the probability_calculations table."""
+
+    def __init__(self, max_profiles: int = 2048, max_entries_per_profile: int = 256):
+        self.max_profiles = max_profiles
+        self.max_entries_per_profile = max_entries_per_profile
+        # str(profile_id) -> {(college_id, hash, version): result}
+        self._profiles: "OrderedDict[str, OrderedDict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        profile_id: Any,
+        college_id: Any,
+        factor_scores: Dict[str, float],
+        college: Optional[Dict[str, Any]] = None,
+    ) -> MemoKey:
+        """
+        Memo key for one calculation
+
+        Args:
+            college: The college inputs (``college_inputs``); stored results
+                for a college whose data has since changed no longer match
+        """
+        return MemoKey(profile_id, college_id, snapshot_hash(factor_scores, college))
+
+    def _cached(self, key: MemoKey) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entries = self._profiles.get(str(key.profile_id))
+            if entries is None:
+                return None
+            inner = (str(key.college_id), key.profile_hash, key.version)
+            result = entries.get(inner)
+            if result is not None:
+                self._profiles.move_to_end(str(key.profile_id))
+                entries.move_to_end(inner)
+            return result
+
+    def _store(self, key: MemoKey, result: Dict[str, Any]) -> None:
+        with self._lock:
+            entries = self._profiles.get(str(key.profile_id))
+            if entries is None:
+                entries = self._profiles[str(key.profile_id)] = OrderedDict()
+            self._profiles.move_to_end(str(key.profile_id))
+            entries[(str(key.college_id), key.profile_hash, key.version)] = result
+            while len(entries) > self.max_entries_per_profile:
+                entries.popitem(last=False)
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, db: Optional[Session], key: MemoKey) -> Optional[Dict[str, Any]]:
+        """Stored result for ``key`` (memory first, then the table), or None"""
+        result = self._cached(key)
+        if result is not None or db is None:
+            return result
+        row = (
+            db.query(ProbabilityCalculation)
+            .filter(
+                ProbabilityCalculation.profile_id == key.profile_id,
+                ProbabilityCalculation.college_id == key.college_id,
+                ProbabilityCalculation.profile_hash == key.profile_hash,
+                ProbabilityCalculation.calculation_version == key.version,
+            )
+            .order_by(ProbabilityCalculation.calculated_at.desc())
+            .first()
+        )
+        if row is None:
+            return None
+        result = {
+            "composite_score": float(row.composite_score),
+            "probability": float(row.probability),
+            "percentile_estimate": float(row.percentile_estimate),
+            "audit_breakdown": row.audit_breakdown or [],
+            "policy_notes": row.policy_notes or [],
+        }
+        self._store(key, result)
+        return result
+
+    def put(
+        self,
+        db: Optional[Session],
+        key: MemoKey,
+        factor_scores: Dict[str, float],
+        result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Record a freshly computed result in memory and in the table.
+
+        Numbers are rounded to the table's precision first, so a result reads
+        the same whether it was just computed or served from a stored row.
+        """
+        result = {
+            **result,
+            "composite_score": round(float(result["composite_score"]), 2),
+            "probability": round(float(result["probability"]), 4),
+            "percentile_estimate": round(float(result["percentile_estimate"]), 2),
+        }
+        if db is not None:
+            try:
+                db.add(ProbabilityCalculation(
+                    profile_id=key.profile_id,
+                    college_id=key.college_id,
+                    factor_scores=factor_scores,
+                    profile_hash=key.profile_hash,
+                    calculation_version=key.version,
+                    **result,
+                ))
+                db.commit()
+            except Exception as e:
+                # The result is still valid; only the history row is lost
+                db.rollback()
+                logger.warning(f"Failed to store probability calculation: {e}")
+        self._store(key, result)
+        return result
+
+    def invalidate_profile(self, profile_id: Any) -> None:
+        with self._lock:
+            self._profiles.pop(str(profile_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+# Global instance
+calculation_memo = CalculationMemo()
+
+
+@event.listens_for(AcademicData, "after_insert")
+@event.listens_for(AcademicData, "after_update")
+@event.listens_for(AcademicData, "after_delete")
+@event.listens_for(Extracurricular, "after_insert")
+@event.listens_for(Extracurricular, "after_update")
+@event.listens_for(Extracurricular, "after_delete")
+def _profile_data_changed(mapper, connection, target) -> None:
+    calculation_memo.invalidate_profile(target.profile_id)
@@ -8,6 +8,7 @@ import requests
 from datetime import datetime
 
 from sqlalchemy import or_, asc, desc
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from database.models import ScorecardCollege, CollegeImage
@@ -146,7 +147,12 @@ def get_or_create_college_image(db: Session, college: ScorecardCollege) -> Optio
         db.commit()
         db.refresh(img)
         return img
+    except IntegrityError:
+        # A concurrent request stored this college's image first
+        db.rollback()
+        return db.query(CollegeImage).filter(CollegeImage.college_id == college.scorecard_id).first()
     except Exception as e:
+        db.rollback()
         logger.warning("Failed to fetch Google Places image for %s: %s", college.name, e)
         return None
 
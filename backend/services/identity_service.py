@@ -0,0 +1,222 @@
+"""
+Identity resolution for Google sign-in.
+
+Users are looked up in the local ``users`` table, which has unique (indexed)
+``email`` and ``google_id`` columns, behind a short-TTL in-process cache. The
+Supabase admin API is only called for an identity the table doesn't know yet,
+and the result is written back, so each account pays that cost once instead
+of every sign-in paging through all Supabase users.
+
+    identity = identity_service.resolve_google_user(db, supabase, email, name, google_id)
+    identity.user_id  # uuid.UUID, same id as the Supabase Auth user
+    identity.source   # "cache" | "database" | "supabase"
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config import settings
+from database.models import User
+
+logger = logging.getLogger(__name__)
+
+# Page size when falling back to scanning Supabase users (legacy accounts only)
+SUPABASE_SCAN_PAGE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Identity:
+    user_id: uuid.UUID
+    email: str
+    google_id: Optional[str]
+    source: str = "database"
+    created: bool = False
+
+
+def normalize_email(email: str) -> str:
+    # Supabase Auth stores addresses lower-cased; the users table does too
+    return (email or "").strip().lower()
+
+
+class IdentityCache:
+    """Bounded LRU of resolved identities, keyed by both email and Google id."""
+
+    def __init__(self, ttl_seconds: float = 300.0, max_entries: int = 50000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # ("email" | "google", value) -> (identity, cached_at)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Identity, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, email: str, google_id: Optional[str]) -> Optional[Identity]:
+        keys = [("google", google_id)] if google_id else []
+        keys.append(("email", normalize_email(email)))
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                identity, cached_at = entry
+                if now - cached_at > self.ttl_seconds:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                return identity
+        return None
+
+    def store(self, identity: Identity) -> None:
+        now = time.monotonic()
+        with self._lock:
+            keys = [("email", identity.email)]
+            if identity.google_id:
+                keys.append(("google", identity.google_id))
+            for key in keys:
+                self._entries[key] = (identity, now)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, email: Optional[str] = None, google_id: Optional[str] = None) -> None:
+        with self._lock:
+            if email:
+                self._entries.pop(("email", normalize_email(email)), None)
+            if google_id:
+                self._entries.pop(("google", google_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _users_of(result: Any) -> list:
+    # supabase-py v2 returns a list; older clients wrapped it in ``.users``
+    if isinstance(result, list):
+        return result
+    return list(getattr(result, "users", None) or [])
+
+
+class IdentityService:
+    def __init__(self, cache: Optional[IdentityCache] = None):
+        self.cache = cache or IdentityCache(
+            settings.identity_cache_ttl_seconds, settings.identity_cache_max_entries
+        )
+
+    def resolve_google_user(
+        self,
+        db: Optional[Session],
+        supabase: Any,
+        email: str,
+        name: str,
+        google_id: str,
+    ) -> Identity:
+        """
+        Find (or create) the account for a Google sign-in.
+
+        Args:
+            db: Database session, or None when the database is unavailable
+            supabase: Supabase client (only used on a local miss)
+            email: Email reported by Google
+            name: Display name reported by Google
+            google_id: Google user ID
+
+        Returns:
+            Identity: the account's Supabase user id and where it was found
+        """
+        email = normalize_email(email)
+        cached = self.cache.get(email, google_id)
+        if cached is not None:
+            return Identity(cached.user_id, cached.email, cached.google_id, source="cache")
+
+        identity = self._lookup_local(db, email, google_id) if db is not None else None
+        if identity is None:
+            identity = self._resolve_supabase(supabase, email, name, google_id)
+            if db is not None:
+                identity = self._record_local(db, identity, name)
+        self.cache.store(identity)
+        return identity
+
+    def _lookup_local(self, db: Session, email: str, google_id: str) -> Optional[Identity]:
+        rows = (
+            db.query(User)
+            .filter(or_(User.google_id == google_id, User.email == email))
+            .limit(2)
+            .all()
+        )
+        if not rows:
+            return None
+        # The Google id wins over the address (the user may have changed their Gmail)
+        user = next((row for row in rows if row.google_id == google_id), rows[0])
+        if user.google_id is None:
+            # Existing email/password account signing in with Google for the first time
+            user.google_id = google_id
+            db.commit()
+        return Identity(user.id, user.email, user.google_id)
+
+    def _resolve_supabase(self, supabase: Any, email: str, name: str, google_id: str) -> Identity:
+        if supabase is None:
+            raise RuntimeError("Authentication service not available")
+        try:
+            response = supabase.auth.admin.create_user({
+                "email": email,
+                "email_confirm": True,
+                "user_metadata": {
+                    "name": name,
+                    "google_id": google_id
+                }
+            })
+            return Identity(uuid.UUID(str(response.user.id)), email, google_id, source="supabase", created=True)
+        except Exception as e:
+            message = str(e).lower()
+            if "already" not in message and "exists" not in message:
+                raise
+
+        # Account exists in Supabase but predates the local table: find it once
+        logger.info("Supabase user not in local users table; scanning admin user list")
+        page = 1
+        while True:
+            users = _users_of(supabase.auth.admin.list_users(page=page, per_page=SUPABASE_SCAN_PAGE_SIZE))
+            for user in users:
+                if normalize_email(getattr(user, "email", "")) == email:
+                    return Identity(uuid.UUID(str(user.id)), email, google_id, source="supabase")
+            if len(users) < SUPABASE_SCAN_PAGE_SIZE:
+                raise LookupError(f"Supabase reported {email} as registered but it was not found")
+            page += 1
+
+    def _record_local(self, db: Session, identity: Identity, name: str) -> Identity:
+        first_name, _, last_name = (name or "").partition(" ")
+        db.add(User(
+            id=identity.user_id,
+            email=identity.email,
+            google_id=identity.google_id,
+            first_name=first_name or None,
+            last_name=last_name or None,
+            provider="google",
+            email_verified=True,
+        ))
+        try:
+            db.commit()
+        except IntegrityError:
+            # A concurrent sign-in for the same account inserted it first
+            db.rollback()
+            existing = self._lookup_local(db, identity.email, identity.google_id)
+            if existing is not None:
+                return existing
+            raise
+        return identity
+
+
+# Global instance
+identity_service = IdentityService()
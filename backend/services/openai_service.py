@@ -3,14 +3,30 @@ OpenAI Service for College Information
 Fetches real-world college data like tuition, location, programs, etc.
 """
 
-from openai import OpenAI
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import os
 
 logger = logging.getLogger(__name__)
 
+# Fields parse_application_document can extract, with the prompt's description of each
+APPLICATION_FIELDS: Dict[str, str] = {
+    "gpa_weighted": "weighted GPA as number string (e.g., '4.5') or null if not found",
+    "gpa_unweighted": "unweighted GPA as number string (e.g., '3.9') or null if not found",
+    "sat": "SAT composite score as number string (e.g., '1470') or null if not found",
+    "act": "ACT composite score as number string (e.g., '33') or null if not found",
+    "ap_count": "number of AP courses as string or null",
+    "honors_count": "number of Honors courses as string or null",
+    "class_rank_percentile": "class rank percentile as number string (e.g., '5') or null",
+    "class_size": "class size as number string (e.g., '420') or null if not found",
+}
+MISC_FIELD_DESCRIPTION = (
+    "array of important miscellaneous notes - one item per activity, award, or notable achievement. "
+    "Each item should be a concise sentence or bullet point (max 150 chars). Exclude essays and "
+    "parent/family information. Break down long chunks into separate items."
+)
+
 class CollegeInfoService:
     def __init__(self):
         """Initialize OpenAI client with API key"""
@@ -24,13 +40,21 @@ class CollegeInfoService:
             except (ImportError, AttributeError):
                 api_key = None
 
+        self._api_key = api_key
+        self._client = None
         if not api_key:
             logger.warning("OPENAI_API_KEY not set - OpenAI service will be disabled")
-            self.client = None
         else:
-            self.client = OpenAI(api_key=api_key)
             logger.info("OpenAI API key configured successfully")
 
+    @property
+    def client(self):
+        """OpenAI client, created (and the SDK imported) on first use; None without an API key."""
+        if self._client is None and self._api_key:
+            from openai import OpenAI
+            self._client = OpenAI(api_key=self._api_key)
+        return self._client
+
     async def get_college_info(self, college_name: str) -> Dict[str, Any]:
         """
         Get comprehensive college information using OpenAI
@@ -339,17 +363,26 @@ class CollegeInfoService:
             results[college_name] = await self.get_college_info(college_name)
         return results
 
-    async def parse_application_document(self, document_text: str) -> Dict[str, Any]:
+    async def parse_application_document(
+        self,
+        document_text: str,
+        fields: Optional[List[str]] = None,
+        include_misc: bool = True,
+    ) -> Dict[str, Any]:
         """
         Parse a college application document to extract structured data using OpenAI.
-        This is used as a fallback when regex parsing misses important information.
+        This is used as a fallback when regex parsing misses important information
+        (see services.application_parser, which calls it only for what's left).
 
         Args:
             document_text: The full text content of the application document
+            fields: APPLICATION_FIELDS to ask for (default: all of them)
+            include_misc: Also ask for the miscellaneous notes
 
         Returns:
             Dictionary with extracted fields and miscellaneous notes
         """
+        fields = list(APPLICATION_FIELDS) if fields is None else [f for f in fields if f in APPLICATION_FIELDS]
         if not self.client:
             logger.warning("OpenAI client not available - cannot parse application document")
             return {
@@ -363,23 +396,16 @@ class CollegeInfoService:
             # Limit text length to avoid token limits (keep first 8000 chars which is usually enough)
             truncated_text = document_text[:8000] if len(document_text) > 8000 else document_text
 
+            requested = {field: APPLICATION_FIELDS[field] for field in fields}
+            if include_misc:
+                requested["misc"] = [MISC_FIELD_DESCRIPTION]
             prompt = f"""Extract structured data from this college application document. Return ONLY valid JSON, no other text.
 
 Document text:
 {truncated_text}
 
 Extract the following information and return as JSON:
-{{
-    "gpa_weighted": "weighted GPA as number string (e.g., '4.5') or null if not found",
-    "gpa_unweighted": "unweighted GPA as number string (e.g., '3.9') or null if not found",
-    "sat": "SAT composite score as number string (e.g., '1470') or null if not found",
-    "act": "ACT composite score as number string (e.g., '33') or null if not found",
-    "ap_count": "number of AP courses as string or null",
-    "honors_count": "number of Honors courses as string or null",
-    "class_rank_percentile": "class rank percentile as number string (e.g., '5') or null",
-    "class_size": "class size as number string (e.g., '420') or null if not found",
-    "misc": ["array of important miscellaneous notes - one item per activity, award, or notable achievement. Each item should be a concise sentence or bullet point (max 150 chars). Exclude essays and parent/family information. Break down long chunks into separate items."]
-}}
+{json.dumps(requested, indent=4)}
 
 Rules:
 1. Only extract information that is explicitly stated in the document
@@ -418,13 +444,13 @@ Rules:
 
             # Build updates dictionary (only non-null values)
             updates: Dict[str, str] = {}
-            for key in ["gpa_weighted", "gpa_unweighted", "sat", "act", "ap_count", "honors_count", "class_rank_percentile", "class_size"]:
+            for key in fields:
                 value = parsed_data.get(key)
                 if value is not None and value != "":
                     updates[key] = str(value)
 
             # Get misc items, filtering out nulls and empty strings
-            misc_items = parsed_data.get("misc", [])
+            misc_items = parsed_data.get("misc", []) if include_misc else []
             if not isinstance(misc_items, list):
                 misc_items = []
             misc_items = [str(item).strip() for item in misc_items if item and str(item).strip()]
@@ -0,0 +1,191 @@
+"""
+Service registry for lazily loaded backend dependencies.
+
+Every optional dependency of the API (data services, the ML predictor, the
+OpenAI client, ...) is declared once with the initializer that produces it.
+Nothing is imported until the service is first requested or the background
+warm-up reaches it, so the app binds and answers ``/ping`` right away while
+``/api/ready`` reports each service's load state and load time.
+
+    registry = ServiceRegistry()
+    registry.register("nickname_mapper", lambda: import_attr("data.college_nickname_mapper", "nickname_mapper"))
+    registry.start_background()          # after the server has bound
+    mapper = registry.get("nickname_mapper")  # waits for / triggers the load
+    mapper = await registry.aget("nickname_mapper")  # same, off the event loop (async handlers)
+"""
+
+import asyncio
+import importlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+def import_attr(module_name: str, attr: Optional[str] = None) -> Any:
+    """Initializer helper: import a module (and optionally return one of its attributes)."""
+    module = importlib.import_module(module_name)
+    return getattr(module, attr) if attr else module
+
+
+@dataclass
+class ServiceRecord:
+    """Declaration and load state of one service."""
+
+    name: str
+    initializer: Callable[[], Any]
+    depends_on: Sequence[str] = ()
+    description: str = ""
+    status: str = PENDING
+    value: Any = None
+    error: Optional[str] = None
+    load_seconds: Optional[float] = None
+    loaded_at: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+
+class ServiceRegistry:
+    """Declares services with their initializers and loads each exactly once."""
+
+    def __init__(self):
+        self._records: Dict[str, ServiceRecord] = {}
+        self._created_at = time.time()
+        self._warmup_thread: Optional[threading.Thread] = None
+
+    def register(
+        self,
+        name: str,
+        initializer: Callable[[], Any],
+        depends_on: Sequence[str] = (),
+        description: str = "",
+    ) -> None:
+        if name in self._records:
+            raise ValueError(f"Service '{name}' is already registered")
+        for dependency in depends_on:
+            if dependency not in self._records:
+                raise ValueError(f"Service '{name}' depends on unregistered service '{dependency}'")
+        self._records[name] = ServiceRecord(name, initializer, tuple(depends_on), description)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._records)
+
+    def load(self, name: str) -> ServiceRecord:
+        """Load a service (and its dependencies) in the calling thread unless already loaded or loading."""
+        record = self._records[name]
+        if record._done.is_set():
+            return record
+
+        # Only one thread runs the initializer; everyone else waits for it
+        if not record._lock.acquire(blocking=False):
+            record._done.wait()
+            return record
+        try:
+            if record._done.is_set():
+                return record
+            record.status = LOADING
+            start = time.perf_counter()
+            try:
+                failed = [dep for dep in record.depends_on if self.load(dep).status != READY]
+                if failed:
+                    raise RuntimeError(f"dependencies not available: {', '.join(failed)}")
+                record.value = record.initializer()
+                record.status = READY
+                logger.info(f"✓ {name} loaded in {time.perf_counter() - start:.2f}s")
+            except Exception as e:
+                record.value = None
+                record.error = f"{type(e).__name__}: {e}"
+                record.status = FAILED
+                logger.warning(f"Failed to load {name}: {e}")
+            record.load_seconds = time.perf_counter() - start
+            record.loaded_at = time.time()
+            record._done.set()
+        finally:
+            record._lock.release()
+        return record
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """The service value, loading it on first use; ``default`` if it failed to load."""
+        record = self.load(name)
+        return record.value if record.status == READY else default
+
+    async def aget(self, name: str, default: Any = None) -> Any:
+        """
+        ``get`` for async handlers: a service that is still loading (or not yet
+        loaded) is waited for on a worker thread, so the event loop keeps serving
+        other requests (``/ping``, ``/api/ready``) meanwhile.
+        """
+        record = self._records[name]
+        if not record._done.is_set():
+            return await asyncio.to_thread(self.get, name, default)
+        return record.value if record.status == READY else default
+
+    def reload(self, name: str) -> ServiceRecord:
+        """Discard a loaded service (and everything depending on it) and load it again."""
+        stale = {name}
+        for record in self._records.values():  # registration order: dependencies come first
+            if stale.intersection(record.depends_on):
+                stale.add(record.name)
+        for stale_name in stale:
+            record = self._records[stale_name]
+            with record._lock:
+                record.status, record.value, record.error = PENDING, None, None
+                record.load_seconds = record.loaded_at = None
+                record._done.clear()
+        return self.load(name)
+
+    def start_background(self, names: Optional[Iterable[str]] = None, max_workers: int = 4) -> threading.Thread:
+        """Load services on background threads (dependencies first) without blocking the caller."""
+        targets = list(names) if names is not None else self.names
+
+        def warm_up():
+            with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="service-load") as pool:
+                list(pool.map(self.load, targets))
+            ready = sum(1 for name in targets if self._records[name].status == READY)
+            logger.info(f"Service warm-up finished: {ready}/{len(targets)} ready")
+
+        self._warmup_thread = threading.Thread(target=warm_up, name="service-warmup", daemon=True)
+        self._warmup_thread.start()
+        return self._warmup_thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the background warm-up (if any) finishes."""
+        if self._warmup_thread is None:
+            return True
+        self._warmup_thread.join(timeout)
+        return not self._warmup_thread.is_alive()
+
+    def is_ready(self, names: Optional[Iterable[str]] = None) -> bool:
+        """True once every named service (default: all) has finished loading, successfully or not."""
+        return all(self._records[name]._done.is_set() for name in (names if names is not None else self.names))
+
+    def status(self) -> Dict[str, Any]:
+        """Per-service load state for the readiness endpoint."""
+        services = {}
+        for record in self._records.values():
+            services[record.name] = {
+                "status": record.status,
+                "load_ms": round(record.load_seconds * 1000, 1) if record.load_seconds is not None else None,
+                "error": record.error,
+                "depends_on": list(record.depends_on),
+                "description": record.description,
+            }
+        counts = {state: 0 for state in (PENDING, LOADING, READY, FAILED)}
+        for info in services.values():
+            counts[info["status"]] += 1
+        return {
+            "ready": self.is_ready(),
+            "uptime_seconds": round(time.time() - self._created_at, 3),
+            "counts": counts,
+            "services": services,
+        }
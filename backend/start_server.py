@@ -1,5 +1,8 @@
 """
-Start the Chancify AI API server.
+Start the Chancify AI API server for development (auto-reload).
+
+Production runs prefork_server.py, which loads models and data once and
+forks one worker per CPU.
 """
 
 import uvicorn
@@ -0,0 +1,52 @@
+import asyncio
+
+from services.application_parser import ApplicationParser, fields_for_llm, parse_local
+
+
+def test_labelled_gpas_keep_both_values():
+    updates, _ = parse_local("GPA: 3.9 UW / 4.5 W\nSAT: 1540")
+    assert updates["gpa_unweighted"] == "3.9"
+    assert updates["gpa_weighted"] == "4.5"
+    assert updates["sat"] == "1540"
+
+
+def test_bare_w_is_asked_for_when_not_read_locally():
+    text = "3.9 UW\n4.5 W"
+    updates, _ = parse_local(text)
+    assert "gpa_weighted" in fields_for_llm(text, updates)
+
+
+def test_gpa_scale_is_not_a_weighted_gpa():
+    updates, _ = parse_local("GPA 3.7/4.0\nHonors classes: 6")
+    assert updates["gpa_unweighted"] == "3.7"
+    assert "gpa_weighted" not in updates
+    assert updates["honors_count"] == "6"
+
+
+def test_counts_do_not_match_across_lines():
+    updates, _ = parse_local("Rank 12\nAP classes: 9\nSAT 1500\n3 honors\nclasses")
+    assert updates["ap_count"] == "9"
+    assert "honors_count" not in updates
+
+
+def test_ap_scholar_is_not_a_course():
+    updates, misc = parse_local("- AP Scholar with Distinction\n- AP Calculus BC, AP Physics C")
+    assert updates["ap_count"] == "2"
+    assert "AP Scholar with Distinction" in misc
+
+
+def test_course_count_lines_are_not_misc_items():
+    updates, misc = parse_local("- 12 AP classes\n- 4 honors courses\n- Robotics captain")
+    assert updates["ap_count"] == "12"
+    assert updates["honors_count"] == "4"
+    assert misc == ["Robotics captain"]
+
+
+def test_local_only_documents_are_cached():
+    parser = ApplicationParser()
+    text = "- Robotics captain\n- Debate club"
+    first = asyncio.run(parser.parse(text))
+    second = asyncio.run(parser.parse(text))
+    assert not first["cached"] and second["cached"]
+    assert second["misc"] == ["Robotics captain", "Debate club"]
+    assert parser.stats["llm_calls"] == 0
@@ -0,0 +1,59 @@
+import asyncio
+from types import SimpleNamespace
+
+from ml.models.batching import InferenceScheduler
+
+
+class FakePredictor:
+    """Scores a row as its student's `score`; a row with score None makes predict_many raise."""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict_many(self, pairs, model_name='ensemble', use_formula=True, misc_uplifts=None):
+        self.calls.append((model_name, len(pairs)))
+        if any(student.score is None for student, _ in pairs):
+            raise ValueError("bad row")
+        return [SimpleNamespace(probability=student.score, model_used=model_name) for student, _ in pairs]
+
+
+def _schedule(scheduler, requests):
+    async def run():
+        return await asyncio.gather(
+            *(scheduler.predict(SimpleNamespace(score=score), SimpleNamespace(), model_name=model)
+              for score, model in requests),
+            return_exceptions=True,
+        )
+    return asyncio.run(run())
+
+
+def test_concurrent_requests_share_one_batch():
+    predictor = FakePredictor()
+    scheduler = InferenceScheduler(lambda: predictor, max_batch_size=8, max_wait_ms=50)
+    results = _schedule(scheduler, [(i / 10, 'ensemble') for i in range(5)])
+    assert [r.probability for r in results] == [0.0, 0.1, 0.2, 0.3, 0.4]
+    assert predictor.calls == [('ensemble', 5)]
+    assert scheduler.stats()["batches"] == 1
+
+
+def test_batches_are_capped_and_grouped_by_model():
+    predictor = FakePredictor()
+    scheduler = InferenceScheduler(lambda: predictor, max_batch_size=3, max_wait_ms=50)
+    results = _schedule(scheduler, [(0.5, 'ensemble'), (0.6, 'logistic'), (0.7, 'ensemble'), (0.8, 'ensemble')])
+    assert [(r.probability, r.model_used) for r in results] == [
+        (0.5, 'ensemble'), (0.6, 'logistic'), (0.7, 'ensemble'), (0.8, 'ensemble'),
+    ]
+    assert all(size <= 3 for _, size in predictor.calls)
+    assert sum(size for _, size in predictor.calls) == 4
+    assert {model for model, _ in predictor.calls} == {'ensemble', 'logistic'}
+
+
+def test_bad_row_fails_only_its_own_request():
+    predictor = FakePredictor()
+    scheduler = InferenceScheduler(lambda: predictor, max_batch_size=8, max_wait_ms=50)
+    results = _schedule(scheduler, [(0.2, 'ensemble'), (None, 'ensemble'), (0.4, 'ensemble')])
+    assert results[0].probability == 0.2
+    assert isinstance(results[1], ValueError)
+    assert results[2].probability == 0.4
+    # One failed batched call, then each row re-scored on its own
+    assert predictor.calls == [('ensemble', 3), ('ensemble', 1), ('ensemble', 1), ('ensemble', 1)]
@@ -0,0 +1,37 @@
+from types import SimpleNamespace
+
+from services.calculation_memo import CalculationMemo, college_inputs
+
+FACTORS = {"grades": 8.5, "testing": 7.0, "essay": 6.5}
+
+
+def _college(**changes):
+    fields = dict(acceptance_rate=0.12, test_policy="Required", financial_aid_policy="Need-blind")
+    fields.update(changes)
+    return SimpleNamespace(**fields)
+
+
+def test_key_covers_the_college_inputs():
+    memo = CalculationMemo()
+    base = memo.key("p", "c", FACTORS, college_inputs(_college()))
+    assert base == memo.key("p", "c", dict(FACTORS), college_inputs(_college()))
+    for changes in ({"acceptance_rate": 0.09}, {"test_policy": "Blind"}, {"financial_aid_policy": "Need-aware"}):
+        assert memo.key("p", "c", FACTORS, college_inputs(_college(**changes))).profile_hash != base.profile_hash
+
+
+def test_updated_college_misses_the_memo():
+    memo = CalculationMemo()
+    result = {"composite_score": 71.234, "probability": 0.123456, "percentile_estimate": 80.0,
+              "audit_breakdown": [], "policy_notes": []}
+    stored = memo.put(None, memo.key("p", "c", FACTORS, college_inputs(_college())), FACTORS, result)
+    assert stored["probability"] == 0.1235
+    assert memo.get(None, memo.key("p", "c", FACTORS, college_inputs(_college()))) == stored
+    assert memo.get(None, memo.key("p", "c", FACTORS, college_inputs(_college(acceptance_rate=0.3)))) is None
+
+
+def test_invalidate_profile_drops_its_entries():
+    memo = CalculationMemo()
+    key = memo.key("p", "c", FACTORS, college_inputs(_college()))
+    memo.put(None, key, FACTORS, {"composite_score": 1, "probability": 0.5, "percentile_estimate": 50})
+    memo.invalidate_profile("p")
+    assert memo.get(None, key) is None
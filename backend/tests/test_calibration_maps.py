@@ -0,0 +1,67 @@
+import numpy as np
+
+from ml.models.calibration_maps import (
+    DEFAULT_MAPS_PATH,
+    CalibrationMaps,
+    college_unitids,
+    fit_calibration_maps,
+)
+from ml.preprocessing.feature_extractor import CollegeFeatures
+
+
+def _sample(n=2000, top=0.5, seed=0):
+    rng = np.random.default_rng(seed)
+    scores = rng.random(n) * top
+    outcomes = (rng.random(n) < scores).astype(float)
+    return scores, outcomes
+
+
+def test_maps_are_keyed_by_unitid():
+    scores, outcomes = _sample()
+    names = ["MIT", "Massachusetts Institute of Technology"] * (len(scores) // 2)
+    maps = fit_calibration_maps(scores, outcomes, college_unitids(names), ["Elite"] * len(scores))
+    assert maps.college_count == 1
+
+    rows = maps.rows_for_names(["MIT", "Massachusetts Institute of Technology", "Duke University"], ["Elite"] * 3)
+    assert rows[0] == rows[1]
+    assert rows[2] == maps.keys.index("band:Elite")
+
+
+def test_boston_college_and_boston_university_do_not_share_a_map():
+    scores, outcomes = _sample()
+    names = ["Boston College"] * len(scores)
+    maps = fit_calibration_maps(scores, outcomes, college_unitids(names), ["Highly Selective"] * len(scores))
+    rows = maps.rows_for_names(["Boston College", "Boston University"], ["Highly Selective"] * 2)
+    assert rows[0] != rows[1]
+
+
+def test_knots_without_data_hold_the_last_supported_value():
+    scores, outcomes = _sample(top=0.5)
+    maps = fit_calibration_maps(scores, outcomes, [None] * len(scores), ["Elite"] * len(scores))
+    for row in maps.values:
+        assert np.allclose(row[11:], row[10])
+
+
+def _assert_rises_steadily(maps, rows, acceptance_rate):
+    probabilities = np.linspace(0.8, 1.0, 201)
+    for row in rows:
+        calibrated = maps.apply(probabilities, np.full(len(probabilities), row), np.full(len(probabilities), acceptance_rate))
+        steps = np.diff(calibrated)
+        assert (steps >= -1e-9).all(), maps.keys[row]
+        assert steps.max() < 0.02, maps.keys[row]
+
+
+def test_fitted_output_rises_steadily_near_the_top():
+    scores, outcomes = _sample(top=0.6)
+    unitids = college_unitids(["Harvard University"] * len(scores))
+    maps = fit_calibration_maps(scores, outcomes, unitids, ["Elite"] * len(scores))
+    _assert_rises_steadily(maps, range(len(maps.keys)), 0.034)
+
+
+def test_shipped_maps_rise_steadily_near_the_top():
+    maps = CalibrationMaps.load(DEFAULT_MAPS_PATH)
+    _assert_rises_steadily(maps, range(len(maps.keys)), 0.034)
+
+    harvard = CollegeFeatures(name="Harvard University", acceptance_rate=0.034, selectivity_tier="Elite")
+    low, high = maps.calibrate(np.array([0.95, 0.97]), [harvard, harvard])
+    assert low <= high < 0.5
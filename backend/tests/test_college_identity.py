@@ -0,0 +1,65 @@
+from data.college_identity import (
+    COMMON_NICKNAMES,
+    OFF_CATALOG_UNITID_BASE,
+    CollegeIdentity,
+    get_college_identity,
+    normalize_college_name,
+    off_catalog_unitid,
+)
+from data.hardcoded_tuition_data import get_tuition_data_for_college
+
+
+def test_alias_target_matches_a_longer_catalog_name():
+    identity = CollegeIdentity(
+        [("Georgia Institute of Technology-Main Campus", 1), ("Georgia State University", 2)],
+        {"georgia tech": "Georgia Institute of Technology"},
+    )
+    assert identity.resolve("Georgia Tech") == 1
+
+
+def test_alias_with_unknown_target_is_dropped_and_logged(caplog):
+    with caplog.at_level("WARNING", logger="data.college_identity"):
+        identity = CollegeIdentity([("Duke University", 1)], {"tufts": "Tufts University"})
+    assert identity.exact("tufts") is None
+    assert "tufts -> Tufts University" in caplog.text
+
+
+def test_off_catalog_ids_are_stable_and_outside_the_catalog_range():
+    unitid = off_catalog_unitid("Tufts University")
+    assert unitid == off_catalog_unitid("tufts university")
+    assert unitid > OFF_CATALOG_UNITID_BASE
+
+
+def test_every_nickname_resolves_to_its_target():
+    identity = get_college_identity()
+    for nickname, official in COMMON_NICKNAMES.items():
+        unitid = identity.resolve(nickname)
+        assert unitid is not None, nickname
+        name = normalize_college_name(identity.name(unitid))
+        assert f" {normalize_college_name(official)} " in f" {name} ", (nickname, identity.name(unitid))
+
+
+def test_common_nicknames_resolve():
+    identity = get_college_identity()
+    expected = {
+        "georgia tech": "Georgia Institute of Technology-Main Campus",
+        "unc": "University of North Carolina at Chapel Hill",
+        "michigan": "University of Michigan-Ann Arbor",
+        "texas": "University of Texas at Austin",
+        "washu": "Washington University in St Louis",
+        "Washington University": "Washington University in St Louis",
+        "George Washington University": "George Washington University",
+    }
+    for query, name in expected.items():
+        assert identity.name(identity.resolve(query)) == name, query
+
+
+def test_boston_colleges_stay_distinct():
+    identity = get_college_identity()
+    assert identity.resolve("Boston College") is not None
+    assert identity.resolve("Boston College") != identity.resolve("Boston University")
+
+
+def test_washington_university_tuition_is_washu():
+    assert get_tuition_data_for_college("Washington University")["total_out_state"] == 79000
+    assert get_tuition_data_for_college("washu")["total_out_state"] == 79000
@@ -0,0 +1,59 @@
+import pytest
+
+from data import college_snapshot
+from data.college_snapshot import CollegeDataSnapshot, build_snapshot
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    (tmp_path / "colleges.csv").write_text("name,unitid,acceptance_rate\nDuke University,1,0.06\nRice University,2,\n")
+    (tmp_path / "names.csv").write_text("Official Name,Common Name\nDuke University,Duke\n")
+    monkeypatch.setattr(college_snapshot, "SOURCES", {
+        "colleges": ("csv", [tmp_path / "colleges.csv"]),
+        "college_names": ("csv", [tmp_path / "names.csv"]),
+        "absent": ("csv", [tmp_path / "absent.csv"]),
+    })
+    return tmp_path
+
+
+def _failing_names(monkeypatch, failing):
+    load = college_snapshot._load_source_frame
+
+    def loader(name, path):
+        if name == "college_names" and failing["value"]:
+            raise ImportError("Missing optional dependency 'openpyxl'")
+        return load(name, path)
+
+    monkeypatch.setattr(college_snapshot, "_load_source_frame", loader)
+
+
+def test_round_trip(sources):
+    snapshot = CollegeDataSnapshot.from_bytes(build_snapshot())
+    table = snapshot.table("colleges")
+    assert table.values("name") == ["Duke University", "Rice University"]
+    assert table.values("unitid") == [1, 2]
+    assert table.values("acceptance_rate")[0] == 0.06
+    assert not snapshot.has_table("absent")
+    assert not snapshot.is_stale()
+
+
+def test_changed_source_is_stale(sources):
+    snapshot = CollegeDataSnapshot.from_bytes(build_snapshot())
+    (sources / "colleges.csv").write_text("name,unitid,acceptance_rate\nDuke University,1,0.06\n")
+    assert snapshot.is_stale()
+
+
+def test_failed_source_is_omitted_and_rebuilt_once_it_loads(sources, monkeypatch):
+    failing = {"value": True}
+    _failing_names(monkeypatch, failing)
+
+    snapshot = CollegeDataSnapshot.from_bytes(build_snapshot())
+    assert snapshot.has_table("colleges")
+    assert not snapshot.has_table("college_names")
+    assert snapshot.header["sources"]["college_names"] is None
+    # Still failing: no rebuild on every start
+    assert not snapshot.is_stale()
+
+    failing["value"] = False
+    assert snapshot.is_stale()
+    assert CollegeDataSnapshot.from_bytes(build_snapshot()).table("college_names").values("Common Name") == ["Duke"]
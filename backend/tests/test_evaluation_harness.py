@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from ml.evaluation.harness import _scorers
+from ml.models.inference_backends import build_backend
+from ml.preprocessing.feature_extractor import FeatureExtractor
+
+
+def _predictor():
+    n_inputs = len(FeatureExtractor.get_feature_names())
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, n_inputs))
+    y = (X[:, 0] + rng.normal(scale=0.5, size=len(X)) > 0).astype(int)
+    scaler = StandardScaler().fit(X)
+    model = LogisticRegression().fit(scaler.transform(X), y)
+    predictor = SimpleNamespace(
+        models={"logistic_regression": model}, feature_selector=None, scaler=scaler, calibrator=None,
+        backends={"logistic_regression": build_backend("auto", model, None, scaler, n_inputs)},
+    )
+    return predictor, X
+
+
+def test_models_are_scored_through_the_serving_backend():
+    predictor, X = _predictor()
+    backend, score = _scorers(predictor)["logistic_regression"]
+    assert backend == predictor.backends["logistic_regression"].name == "numpy"
+    model, scaler = predictor.models["logistic_regression"], predictor.scaler
+    np.testing.assert_allclose(score(X), model.predict_proba(scaler.transform(X))[:, 1], atol=1e-9)
+
+
+def test_models_without_a_backend_fall_back_to_sklearn():
+    predictor, X = _predictor()
+    predictor.backends = {}
+    backend, score = _scorers(predictor)["logistic_regression"]
+    assert backend == "sklearn"
+    assert score(X[:5]).shape == (5,)
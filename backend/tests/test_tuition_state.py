@@ -0,0 +1,64 @@
+import asyncio
+
+import httpx
+import pytest
+
+from data.tuition_state_service import tuition_state_service
+from data.zippopotam_service import ZippopotamService
+
+
+@pytest.mark.parametrize("college, zipcode", [
+    ("University of Florida", "30501"),      # Gainesville, GA
+    ("Millikin University", "30030"),        # Decatur, GA
+    ("Illinois State University", "35762"),  # Normal, AL
+    ("University of Georgia", "35611"),      # Athens, AL
+    ("Cornell College", "30445"),            # Mount Vernon, GA
+])
+def test_same_named_city_in_another_state_is_out_of_state(college, zipcode):
+    result = tuition_state_service.get_tuition_for_college_and_zipcode(college, zipcode)
+    assert result["success"]
+    assert result["zipcode_state"] != result["college_state"]
+    assert result["is_in_state"] is False
+    assert result["tuition"] == result["out_state_tuition"]
+
+
+@pytest.mark.parametrize("college, zipcode", [
+    ("University of Florida", "32601"),
+    ("Illinois State University", "61761"),
+])
+def test_zip_in_the_college_state_is_in_state(college, zipcode):
+    result = tuition_state_service.get_tuition_for_college_and_zipcode(college, zipcode)
+    assert result["is_in_state"] is True
+    assert result["tuition"] == result["in_state_tuition"]
+
+
+class _Fetch:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    async def __call__(self, zipcode):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_zippopotam_network_errors_are_not_cached():
+    service = ZippopotamService()
+    location = {"city": "Somewhere", "state": "Florida", "state_abbr": "FL", "zipcode": "34000"}
+    service._fetch = _Fetch([httpx.ConnectError("down"), location])
+
+    assert asyncio.run(service.get_location_from_zipcode("34000")) is None
+    assert asyncio.run(service.get_location_from_zipcode("34000")) == location
+    assert service._fetch.calls == 2
+
+
+def test_zippopotam_misses_are_cached():
+    service = ZippopotamService()
+    service._fetch = _Fetch([None])
+
+    assert asyncio.run(service.get_location_from_zipcode("00000")) is None
+    assert asyncio.run(service.get_location_from_zipcode("00000")) is None
+    assert service._fetch.calls == 1
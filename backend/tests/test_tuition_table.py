@@ -0,0 +1,34 @@
+from data.college_tuition_service import BATCH_COLUMNS, TuitionTable
+from data.hardcoded_tuition_data import get_tuition_data_for_college
+
+BERKELEY = "University of California-Berkeley"
+
+
+def _rows(table, colleges, home_state=None):
+    return [dict(zip(BATCH_COLUMNS, row)) for row in table.cost_of_attendance(colleges, home_state=home_state)]
+
+
+def test_batch_rows_match_single_lookups():
+    table = TuitionTable()
+    colleges = table.names[:5] + [BERKELEY]
+    for college, row in zip(colleges, _rows(table, colleges)):
+        single = get_tuition_data_for_college(college)
+        assert row["matched"]
+        assert row["tuition"] == single["out_state_tuition"]
+        assert row["total_in_state"] == single["total_in_state"]
+        assert row["total_out_state"] == single["total_out_state"]
+
+
+def test_home_state_gets_in_state_pricing():
+    table = TuitionTable()
+    (home,), (away,) = _rows(table, [BERKELEY], "ca"), _rows(table, [BERKELEY], "NY")
+    assert home["is_in_state"] and not away["is_in_state"]
+    assert home["total"] == home["total_in_state"] < away["total"] == away["total_out_state"]
+
+
+def test_unknown_college_falls_back_in_place():
+    table = TuitionTable()
+    rows = _rows(table, ["Nowhere College Xyz", BERKELEY])
+    assert rows[0]["query"] == "Nowhere College Xyz"
+    assert not rows[0]["matched"] and rows[0]["college_name"] is None and rows[0]["state"] is None
+    assert rows[1]["matched"] and rows[1]["state"] == "CA"
@@ -7,6 +7,9 @@ Strategy:
 3. Extract test score ranges
 4. Create enhanced college profiles
 5. Generate MUCH better training data with real statistics
+
+backend/data/processed/ipeds_all_colleges.csv is now built by the catalog ETL
+(`python -m data.catalog_etl` from backend/), with reproducible GPA estimates.
 """
 
 import pandas as pd